@@ -0,0 +1,74 @@
+"""Challenge number extraction: precompiled single pass vs per-pattern find.
+
+Usage:
+    python benchmarks/bench_challenge.py [--iterations N]
+"""
+import argparse
+import json
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from moltcli.utils.challenge import NUMBER_MAP, extract_numbers  # noqa: E402
+
+CHALLENGES = [
+    "A lObStEr SwImS aT ThIrTy-TwO mEtErS pEr SeCoNd AnD aCcElErAtEs By FoUr, wHaT iS tHe ToTaL?",
+    "wHaT iS fIfTy MiNuS tWeLvE?",
+    "A cRaB hAs SeVeN lEgS tImEs ThReE cLaWs",
+    "the molt reached 12 plus TwEnTy-OnE points today",
+]
+
+
+def _legacy_patterns():
+    """The old hand-written table: each word in four casings."""
+    patterns = {}
+    for word, value in NUMBER_MAP.items():
+        alt = "".join(c.upper() if i % 2 == 0 else c for i, c in enumerate(word))
+        for variant in (word, word.upper(), alt, alt.swapcase()):
+            patterns[variant] = value
+    return patterns
+
+
+LEGACY = _legacy_patterns()
+
+
+def legacy_extract(text):
+    """Pre-compiled-matcher implementation, for comparison."""
+    sorted_patterns = sorted(LEGACY.items(), key=lambda x: -len(x[0]))
+    numbers = []
+    processed = []
+    for pattern, num in sorted_patterns:
+        start = text.find(pattern)
+        if start != -1:
+            end = start + len(pattern)
+            if all(end <= s or start >= e for s, e in processed):
+                numbers.append(num)
+                processed.append((start, end))
+    numbers.extend(int(n) for n in re.findall(r"\b\d+\b", text))
+    return numbers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = {"iterations": args.iterations, "challenges": len(CHALLENGES)}
+    for name, fn in (("legacy", legacy_extract), ("compiled", extract_numbers)):
+        seconds = timeit.timeit(
+            lambda: [fn(text) for text in CHALLENGES], number=args.iterations
+        )
+        results[name] = {
+            "us_per_challenge": round(seconds / (args.iterations * len(CHALLENGES)) * 1e6, 2)
+        }
+    results["speedup"] = round(
+        results["legacy"]["us_per_challenge"] / results["compiled"]["us_per_challenge"], 1
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Per-request latency: one connection per call vs pooled keep-alive session.
+
+Usage:
+    python benchmarks/bench_client_pool.py [--requests N]
+"""
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from moltcli.utils.api_client import MoltbookClient  # noqa: E402
+
+PAYLOAD = json.dumps({"posts": [{"id": f"post_{i}", "upvotes": i} for i in range(20)]}).encode()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive JSON endpoint."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args):
+        pass
+
+
+def _measure(fn, n: int) -> dict:
+    """Time n calls of fn and return latency stats in milliseconds."""
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "mean_ms": round(statistics.mean(samples), 3),
+        "p50_ms": round(samples[len(samples) // 2], 3),
+        "p99_ms": round(samples[int(len(samples) * 0.99) - 1], 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/api/v1"
+
+    def unpooled():
+        # Baseline: the pre-session behaviour, a new connection every call
+        requests.request("GET", f"{base_url}/feed", params={"sort": "hot"}, timeout=30).json()
+
+    with MoltbookClient("bench", base_url=base_url) as client:
+        results = {
+            "requests": args.requests,
+            "unpooled": _measure(unpooled, args.requests),
+            "pooled": _measure(lambda: client.get("/feed", params={"sort": "hot"}), args.requests),
+        }
+
+    server.shutdown()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
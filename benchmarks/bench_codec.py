@@ -0,0 +1,108 @@
+"""JSON codec throughput: stdlib json vs orjson/ujson (whichever are installed).
+
+Measures decoding and encoding a realistic feed response, and writing then
+scanning a large memory JSONL file through MemoryStore.
+
+Usage:
+    python benchmarks/bench_codec.py [--posts N] [--entries N] [--iterations N]
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from moltcli.utils import codec as codec_mod  # noqa: E402
+from moltcli.utils.codec import CODECS  # noqa: E402
+from moltcli.utils.memory import MemoryStore  # noqa: E402
+
+WORDS = "molt lobster agent karma submolt reef claw shell 🦞 café über think post".split()
+
+
+def make_feed(posts: int, rng: random.Random) -> dict:
+    """A feed page shaped like the API's, with nested authors and unicode text."""
+    return {
+        "success": True,
+        "posts": [
+            {
+                "id": f"{rng.getrandbits(64):016x}",
+                "title": " ".join(rng.choices(WORDS, k=8)),
+                "content": " ".join(rng.choices(WORDS, k=120)),
+                "url": None,
+                "upvotes": rng.randrange(5000),
+                "downvotes": rng.randrange(100),
+                "comment_count": rng.randrange(300),
+                "created_at": "2026-02-03T10:30:00.000Z",
+                "author": {"id": f"a{i}", "name": f"agent_{i}", "karma": rng.randrange(10**5)},
+                "submolt": {"id": f"s{i % 7}", "name": "general", "display_name": "General"},
+            }
+            for i in range(posts)
+        ],
+        "count": posts,
+        "has_more": True,
+    }
+
+
+def bench_feed(codec, payload: bytes, data: dict, iterations: int) -> dict:
+    decode = timeit.timeit(lambda: codec.loads(payload), number=iterations)
+    encode = timeit.timeit(lambda: codec.dumpb(data, indent=True), number=iterations)
+    return {
+        "decode_ms": round(decode / iterations * 1000, 3),
+        "encode_pretty_ms": round(encode / iterations * 1000, 3),
+    }
+
+
+def bench_memory(codec, entries: int, rng: random.Random) -> dict:
+    """Write entries through MemoryStore, then scan them all."""
+    with tempfile.TemporaryDirectory() as tmp, patch.multiple(
+        codec_mod, dumps=codec.dumps, dumpb=codec.dumpb, loads=codec.loads
+    ):
+        store = MemoryStore(tmp, backend="jsonl")
+        start = time.perf_counter()
+        for i in range(entries):
+            store.add(" ".join(rng.choices(WORDS, k=30)), tags=[rng.choice(WORDS), "bench"])
+        write = time.perf_counter() - start
+        size = (Path(tmp) / "learnings.jsonl").stat().st_size
+
+        start = time.perf_counter()
+        scanned = sum(1 for _ in store._iter_category("learnings"))
+        scan = time.perf_counter() - start
+        assert scanned == entries
+    return {
+        "file_mb": round(size / 2**20, 2),
+        "write_ms": round(write * 1000, 1),
+        "scan_ms": round(scan * 1000, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--posts", type=int, default=50, help="Posts per feed page")
+    parser.add_argument("--entries", type=int, default=20000, help="Memory entries")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    data = make_feed(args.posts, random.Random(0))
+    payload = json.dumps(data).encode()
+    results = {
+        "default": codec_mod.BACKEND,
+        "feed_kb": round(len(payload) / 1024, 1),
+        "entries": args.entries,
+        "backends": {},
+    }
+    for name, codec in CODECS.items():
+        results["backends"][name] = {
+            "feed": bench_feed(codec, payload, data, args.iterations),
+            "memory": bench_memory(codec, args.entries, random.Random(1)),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
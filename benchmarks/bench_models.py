@@ -0,0 +1,80 @@
+"""Per-item memory and parse cost: raw response dicts vs slotted models.
+
+Usage:
+    python benchmarks/bench_models.py [--items N]
+"""
+import argparse
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from moltcli.models import Post  # noqa: E402
+
+
+def make_page(items: int) -> bytes:
+    """A feed response body with realistic post shapes."""
+    posts = [
+        {
+            "id": f"{i:032x}",
+            "title": f"Post number {i}",
+            "content": "Lorem ipsum " * 20,
+            "url": None,
+            "upvotes": i % 977,
+            "downvotes": i % 13,
+            "comment_count": i % 101,
+            "created_at": "2026-02-03T10:30:00.000Z",
+            "author": {"id": f"a{i % 500}", "name": f"agent_{i % 500}", "karma": i % 9000},
+            "submolt": {"id": f"s{i % 20}", "name": f"sub{i % 20}", "display_name": "Sub"},
+        }
+        for i in range(items)
+    ]
+    return json.dumps({"posts": posts}).encode()
+
+
+def traced_bytes(build) -> int:
+    """Bytes still allocated by what build() returns."""
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10000)
+    args = parser.parse_args()
+
+    body = make_page(args.items)
+    # Parse the body first so both sides pay only for what they keep
+    dicts_bytes = traced_bytes(lambda: json.loads(body)["posts"])
+
+    def as_models():
+        return [Post.from_dict(p) for p in json.loads(body)["posts"]]
+
+    models_bytes = traced_bytes(as_models)
+    posts = json.loads(body)["posts"]
+    models = as_models()
+    parse = timeit.timeit(lambda: [Post.from_dict(p) for p in posts], number=5) / 5
+    dump = timeit.timeit(lambda: [m.to_dict() for m in models], number=5) / 5
+
+    results = {
+        "items": args.items,
+        "dict_bytes_per_item": round(dicts_bytes / args.items),
+        "model_bytes_per_item": round(models_bytes / args.items),
+        "saved_pct": round(100 * (1 - models_bytes / dicts_bytes), 1),
+        "from_dict_us_per_item": round(parse / args.items * 1e6, 2),
+        "to_dict_us_per_item": round(dump / args.items * 1e6, 2),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
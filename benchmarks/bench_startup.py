@@ -0,0 +1,127 @@
+"""CLI cold-start time: wall clock and import time per command.
+
+Each command runs in a fresh interpreter against a throwaway HOME and a
+local stub API, so nothing touches real credentials or the network.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N] [--check]
+
+With --check, exits non-zero if any command's median wall time exceeds
+its budget (scaled by --budget-scale for slow machines).
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.bench_client_pool import _StubHandler  # noqa: E402
+
+# command -> median wall-clock budget in milliseconds
+BUDGETS_MS = {
+    "--help": 250,
+    "memory add bench": 300,
+    "feed hot": 500,
+}
+
+_IMPORT_RE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _run(args, env):
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-m", "moltcli.cli", *args], capture_output=True, text=True, env=env
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"moltcli {' '.join(args)} failed:\n{result.stderr}")
+    return elapsed
+
+
+def _import_profile(args, env, top=5):
+    """Total moltcli import time and the slowest top-level imports (ms)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "moltcli.cli", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    roots = []
+    for line in result.stderr.splitlines():
+        match = _IMPORT_RE.match(line)
+        # Only top-level entries (no indentation): their cumulative time
+        # already includes their children.
+        if match and len(match.group(2)) == 1:
+            roots.append((int(match.group(1)) / 1000, match.group(3)))
+    roots.sort(reverse=True)
+    return {
+        "total_ms": round(sum(ms for ms, _ in roots), 1),
+        "slowest": {name: round(ms, 1) for ms, name in roots[:top]},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--check", action="store_true", help="Fail if over budget")
+    parser.add_argument("--budget-scale", type=float, default=1.0)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as home:
+        credentials = Path(home) / "credentials.json"
+        credentials.write_text(json.dumps({"api_key": "bench"}))
+        env = {
+            **os.environ,
+            "HOME": home,
+            "PYTHONPATH": str(ROOT),
+            "MOLTCLI_CONFIG_PATH": str(credentials),
+            "MOLTCLI_BASE_URL": f"http://127.0.0.1:{server.server_address[1]}/api/v1",
+        }
+        interpreter = statistics.median(
+            _timed(lambda: subprocess.run([sys.executable, "-c", "pass"], env=env))
+            for _ in range(args.runs)
+        )
+        results = {"runs": args.runs, "interpreter_ms": round(interpreter, 1), "commands": {}}
+        over_budget = []
+        for command, budget in BUDGETS_MS.items():
+            argv = command.split()
+            samples = sorted(_run(argv, env) for _ in range(args.runs))
+            median = statistics.median(samples)
+            limit = budget * args.budget_scale
+            results["commands"][command] = {
+                "median_ms": round(median, 1),
+                "max_ms": round(samples[-1], 1),
+                "budget_ms": limit,
+                "imports": _import_profile(argv, env),
+            }
+            if median > limit:
+                over_budget.append(command)
+
+    server.shutdown()
+    print(json.dumps(results, indent=2))
+    if args.check and over_budget:
+        print(f"Over budget: {', '.join(over_budget)}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    main()
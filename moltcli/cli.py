@@ -1,1098 +1,324 @@
-"""MoltCLI - CLI tool for Moltbook social network."""
+"""MoltCLI - CLI tool for Moltbook social network.
 
+Subcommands live in ``moltcli.commands`` and are imported only when
+invoked, so local commands (memory, daemon) never load the HTTP stack.
+"""
+
+import importlib
+import os
 import sys
-from dataclasses import asdict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 import click
-from .utils import get_config, MoltbookClient, OutputFormatter, handle_error
-from .core import (
-    PostCore,
-    CommentCore,
-    FeedCore,
-    SearchCore,
-    VoteCore,
-    SubmoltsCore,
-    AuthCore,
-    AgentCore,
-)
+
+from .utils.formatter import OutputFormatter
+
+if TYPE_CHECKING:
+    from .utils.api_client import MoltbookClient
+    from .utils.mirror import Mirror
+    from .utils.trace import TraceHook
+
+# name -> ("module:attribute", short help shown in --help without importing)
+COMMANDS: Dict[str, Tuple[str, str]] = {
+    "auth": ("moltcli.commands.auth:auth", "Authentication management."),
+    "register": ("moltcli.commands.auth:register", "Register a new agent."),
+    "status": ("moltcli.commands.auth:claim_status", "Check your claim status (pending or claimed)."),
+    "agent": ("moltcli.commands.agent:agent", "Agent profile and following."),
+    "post": ("moltcli.commands.post:post", "Post operations."),
+    "outbox": (
+        "moltcli.commands.outbox:outbox",
+        "Queue posts locally and publish them as rate limits allow.",
+    ),
+    "comment": ("moltcli.commands.comment:comment", "Comment operations."),
+    "feed": ("moltcli.commands.feed:feed", "Feed operations."),
+    "search": ("moltcli.commands.search:search", "Search operations."),
+    "vote": ("moltcli.commands.vote:vote", "Vote operations."),
+    "submolts": ("moltcli.commands.submolts:submolts", "Submolt operations."),
+    "sync": ("moltcli.commands.sync:sync", "Mirror feeds locally for --offline reads."),
+    "memory": ("moltcli.commands.memory:memory", "Local memory operations for CLI-first agents."),
+    "daemon": ("moltcli.commands.daemon:daemon", "Keep a warm client in a background process."),
+    "bench": (
+        "moltcli.commands.bench:bench",
+        "Benchmark client, formatter, memory and challenge hot paths.",
+    ),
+    "stats": ("moltcli.commands.stats:stats", "Show recorded API latency per endpoint."),
+    "limits": (
+        "moltcli.commands.limits:limits",
+        "Show the rate-limit budget shared by moltcli processes.",
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module on first use."""
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, Tuple[str, str]]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attr = self.lazy_commands[cmd_name][0].split(":")
+            command = getattr(importlib.import_module(module_name), attr)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        """List commands using the stored short help, without importing them."""
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(formatter.width)))
+            else:
+                rows.append((name, self.lazy_commands[name][1]))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
 
 
-def make_formatter(json_mode: bool) -> OutputFormatter:
+def make_formatter(json_mode: bool, ndjson: bool = False) -> OutputFormatter:
     """Create output formatter."""
-    return OutputFormatter(json_mode=json_mode)
+    return OutputFormatter(json_mode=json_mode, ndjson=ndjson)
 
 
 # Global options
-@click.group()
+@click.group(cls=LazyGroup, lazy_commands=COMMANDS)
 @click.option("--json", "json_mode", is_flag=True, help="Output as JSON")
 @click.option(
-    "--need-more-rate", is_flag=True, help="Show verification info when rate limited"
+    "--ndjson", is_flag=True, help="Output compact JSON lines; listings stream one item per line"
 )
-@click.pass_context
-def cli(ctx: click.Context, json_mode: bool, need_more_rate: bool):
-    """MoltCLI - CLI tool for Moltbook social network."""
-    ctx.ensure_object(dict)
-    ctx.obj["json_mode"] = json_mode
-    ctx.obj["need_more_rate"] = need_more_rate
-    ctx.obj["formatter"] = make_formatter(json_mode)
-    # Client is lazily loaded when needed (commands that require auth)
-
-
-def get_client() -> MoltbookClient:
-    """Create API client from config."""
-    config = get_config()
-    return MoltbookClient(config.api_key)
-
-
-def ensure_client(ctx: click.Context) -> MoltbookClient:
-    """Ensure client is available in context."""
-    if "client" not in ctx.obj or ctx.obj["client"] is None:
-        ctx.obj["client"] = get_client()
-    return ctx.obj["client"]
-
-
-# auth command group
-@cli.group()
-def auth():
-    """Authentication management."""
-    pass
-
-
-@auth.command("whoami")
-@click.pass_context
-def auth_whoami(ctx: click.Context):
-    """Show current user info."""
-    client = ensure_client(ctx)
-    formatter = ctx.obj["formatter"]
-    try:
-        result = AuthCore(client).whoami()
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@auth.command("verify")
-@click.pass_context
-def auth_verify(ctx: click.Context):
-    """Verify API key is valid."""
-    client = ensure_client(ctx)
-    formatter = ctx.obj["formatter"]
-    try:
-        result = AuthCore(client).verify()
-        formatter.print({"status": "valid", "message": "API key is valid"})
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@auth.command("login")
-@click.argument("api_key")
-@click.option("--agent-name", help="Agent name (optional)")
-@click.option("--json", "json_mode", is_flag=True, help="Output as JSON")
-@click.pass_context
-def auth_login(ctx: click.Context, api_key: str, agent_name: str, json_mode: bool):
-    """Save API key to credentials file.
-
-    After registering, use this command to save your API key:
-        moltcli auth login moltbook_xxx
-
-    The credentials will be saved to ~/.config/moltbook/credentials.json
-    """
-    from .utils import Config
-
-    formatter = OutputFormatter(json_mode=json_mode)
-
-    try:
-        config = Config()
-        config.save(api_key, agent_name if agent_name else "")
-        formatter.print(
-            {
-                "status": "saved",
-                "config_path": str(config.config_path),
-                "message": "Credentials saved successfully",
-            }
-        )
-        if not json_mode:
-            click.echo(f"\nCredentials saved to: {config.config_path}")
-            click.echo("You can now use other moltcli commands.")
-    except FileExistsError as e:
-        if json_mode:
-            formatter.print({"status": "error", "message": str(e)})
-        else:
-            click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        if json_mode:
-            formatter.print({"status": "error", "message": str(e)})
-        else:
-            click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
-
-
-@auth.command("logout")
-@click.option("--json", "json_mode", is_flag=True, help="Output as JSON")
-@click.pass_context
-def auth_logout(ctx: click.Context, json_mode: bool):
-    """Remove credentials file."""
-    from .utils import Config
-
-    formatter = OutputFormatter(json_mode=json_mode)
-
-    try:
-        config = Config()
-        if config.exists():
-            config.remove()
-            formatter.print(
-                {"status": "removed", "message": "Credentials removed successfully"}
-            )
-            if not json_mode:
-                click.echo("Credentials removed.")
-        else:
-            formatter.print(
-                {"status": "skipped", "message": "No credentials file found"}
-            )
-            if not json_mode:
-                click.echo("No credentials file to remove.")
-    except Exception as e:
-        if json_mode:
-            formatter.print({"status": "error", "message": str(e)})
-        else:
-            click.echo(f"Error: {e}", err=True)
-
-
-# Registration commands (no auth required)
-@cli.command("register")
-@click.argument("name")
-@click.option("--description", default="", help="Agent description")
-@click.option("--json", "json_mode", is_flag=True, help="Output as JSON")
-def register(name: str, description: str, json_mode: bool):
-    """Register a new agent.
-
-    This creates a new agent account. You'll receive an api_key, claim_url, and verification_code.
-
-    IMPORTANT: Save your api_key immediately! You need it for all future requests.
-
-    After registering, send the claim_url to your human to complete verification.
-    """
-    from .utils import MoltbookClient, OutputFormatter, Config
-    from .core import AgentCore
-
-    client = MoltbookClient("")  # No auth needed for register
-    formatter = OutputFormatter(json_mode=json_mode)
-
-    try:
-        result = AgentCore(client).register(name, description)
-        formatter.print(result)
-
-        if "agent" in result:
-            agent = result["agent"]
-            api_key = agent.get("api_key")
-            claim_url = agent.get("claim_url")
-            verification_code = agent.get("verification_code")
-
-            # Auto-save credentials
-            config = Config()
-            config.save(api_key, name)
-
-            if json_mode:
-                formatter.print(
-                    {
-                        "status": "credentials_saved",
-                        "config_path": str(config.config_path),
-                    }
-                )
-            else:
-                click.echo("\n" + "=" * 50)
-                click.echo("Credentials saved to: " + str(config.config_path))
-                click.echo("=" * 50)
-                click.echo("\nNext steps:")
-                click.echo("1. Send this to your human to complete verification:")
-                click.echo(f"   Claim URL: {claim_url}")
-                click.echo(f"   Verification Code: {verification_code}")
-                click.echo("\n2. Your human will post a verification tweet,")
-                click.echo("   then your account will be activated!")
-                click.echo("\n3. Check status with: moltcli status")
-                click.echo("=" * 50)
-    except FileExistsError:
-        if json_mode:
-            formatter.print(
-                {
-                    "status": "error",
-                    "message": "Credentials already exist. Use 'moltcli auth logout' first.",
-                }
-            )
-        else:
-            click.echo(
-                "Error: Credentials already exist. Use 'moltcli auth logout' first.",
-                err=True,
-            )
-    except Exception as e:
-        if json_mode:
-            formatter.print(handle_error(e))
-        else:
-            click.echo(f"Error: {e}", err=True)
-
-
-@cli.command("status")
-@click.option("--json", "json_mode", is_flag=True, help="Output as JSON")
-@click.pass_context
-def claim_status(ctx: click.Context, json_mode: bool):
-    """Check your claim status (pending or claimed).
-
-    After registering, you need to be 'claimed' by your human via Twitter.
-    """
-    from .utils import OutputFormatter
-    from .core import AgentCore
-
-    client = ensure_client(ctx)
-    formatter = OutputFormatter(json_mode=json_mode)
-
-    try:
-        result = AgentCore(client).get_status()
-        formatter.print(result)
-
-        status = result.get("status", "")
-        if not json_mode:
-            if status == "pending_claim":
-                click.echo("\nStatus: PENDING - Awaiting human verification")
-            elif status == "claimed":
-                click.echo("\nStatus: CLAIMED - Your account is active!")
-            else:
-                click.echo(f"\nStatus: {status}")
-    except Exception as e:
-        if json_mode:
-            formatter.print(handle_error(e))
-        else:
-            click.echo(f"Error: {e}", err=True)
-
-
-# agent command group
-@cli.group()
-def agent():
-    """Agent profile and following."""
-    pass
-
-
-@agent.command("me")
-@click.pass_context
-def agent_me(ctx: click.Context):
-    """Get current agent info."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = AgentCore(client).get_me()
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@agent.command("profile")
-@click.argument("name")
-@click.pass_context
-def agent_profile(ctx: click.Context, name: str):
-    """Get another agent's profile."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = AgentCore(client).get_profile(name)
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@agent.command("feed")
-@click.argument("name")
-@click.option("--limit", default=20, help="Number of posts to return")
-@click.pass_context
-def agent_feed(ctx: click.Context, name: str, limit: int):
-    """Get posts from a specific agent."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = AgentCore(client).get_feed(name, limit)
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@agent.command("follow")
-@click.argument("name")
-@click.pass_context
-def agent_follow(ctx: click.Context, name: str):
-    """Follow an agent."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = AgentCore(client).follow(name)
-        formatter.print({"status": "following", "agent": name})
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@agent.command("unfollow")
-@click.argument("name")
-@click.pass_context
-def agent_unfollow(ctx: click.Context, name: str):
-    """Unfollow an agent."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = AgentCore(client).unfollow(name)
-        formatter.print({"status": "unfollowed", "agent": name})
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@agent.command("update")
-@click.option("--description", help="Update your description")
-@click.option("--metadata", help="Update metadata as JSON string")
-@click.pass_context
-def agent_update(ctx: click.Context, description: str, metadata: str):
-    """Update your agent profile.
-
-    Note: You can only update one of description or metadata at a time.
-    """
-    import json
-
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-
-    meta_dict = None
-    if metadata:
-        try:
-            meta_dict = json.loads(metadata)
-        except json.JSONDecodeError:
-            if ctx.obj["json_mode"]:
-                formatter.print({"error": "Invalid JSON for --metadata"})
-            else:
-                click.echo("Error: Invalid JSON for --metadata", err=True)
-            return
-
-    try:
-        result = AgentCore(client).update_profile(
-            description=description if description else None, metadata=meta_dict
-        )
-        formatter.print({"status": "updated"})
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-        else:
-            click.echo(f"Error: {e}", err=True)
-
-
-# post command group
-@cli.group()
-def post():
-    """Post operations."""
-    pass
-
-
-@post.command("create")
-@click.option("--submolt", required=True, help="Submolt name")
-@click.option("--title", required=True, help="Post title")
-@click.option("--content", required=True, help="Post content")
-@click.option("--url", help="Post URL")
-@click.pass_context
-def post_create(ctx: click.Context, submolt: str, title: str, content: str, url: str):
-    """Create a new post."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = PostCore(client).create(
-            submolt=submolt, title=title, content=content, url=url
-        )
-
-        if result.get("verification_required"):
-            # 需要验证时，只有 --need-more-rate 才打印信息
-            if ctx.obj.get("need_more_rate"):
-                formatter.print(
-                    {
-                        "success": True,
-                        "verification_required": True,
-                        "verification": result.get("verification", {}),
-                    }
-                )
-            # 否则不打印任何东西（verification_pending）
-        else:
-            # 不需要验证时，直接发布
-            formatter.print(
-                {
-                    "success": True,
-                    "post_id": result.get("post", {}).get("id"),
-                    "url": result.get("post", {}).get("url"),
-                }
-            )
-
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@post.command("verify")
-@click.argument("verification_code")
-@click.argument("answer")
-@click.pass_context
-def post_verify(ctx: click.Context, verification_code: str, answer: str):
-    """Verify a post with answer to challenge.
-
-    Usage:
-        moltcli post create --submolt X --title Y --content Z
-        moltcli post verify VERIFICATION_CODE ANSWER
-    """
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = PostCore(client).verify(verification_code, answer)
-
-        if result.get("success"):
-            click.echo("✅ Post published successfully!")
-            formatter.print(result)
-        else:
-            click.echo("❌ Verification failed!")
-            formatter.print(result)
-
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@post.command("get")
-@click.argument("post_id")
-@click.pass_context
-def post_get(ctx: click.Context, post_id: str):
-    """Get a post by ID."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = PostCore(client).get(post_id)
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@post.command("delete")
-@click.argument("post_id")
-@click.pass_context
-def post_delete(ctx: click.Context, post_id: str):
-    """Delete a post."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = PostCore(client).delete(post_id)
-        formatter.print({"status": "deleted", "id": post_id})
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-# comment command group
-@cli.group()
-def comment():
-    """Comment operations."""
-    pass
-
-
-@comment.command("create")
-@click.argument("post_id")
-@click.option("--content", required=True, help="Comment content")
-@click.option("--parent", help="Parent comment ID for replies")
-@click.pass_context
-def comment_create(ctx: click.Context, post_id: str, content: str, parent: str):
-    """Create a comment on a post.
-
-    Use --parent to reply to a specific comment.
-    """
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = CommentCore(client).create(
-            post_id=post_id, content=content, parent_id=parent
-        )
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@comment.command("reply")
-@click.argument("post_id")
-@click.argument("parent_id")
-@click.option("--content", required=True, help="Reply content")
-@click.pass_context
-def comment_reply(ctx: click.Context, post_id: str, parent_id: str, content: str):
-    """Reply to a comment."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = CommentCore(client).create(
-            post_id=post_id, content=content, parent_id=parent_id
-        )
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@comment.command("list")
-@click.argument("post_id")
-@click.option("--limit", default=50, help="Max comments to show")
-@click.pass_context
-def comment_list(ctx: click.Context, post_id: str, limit: int):
-    """List comments for a post."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = CommentCore(client).list_by_post(post_id, limit=limit)
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-# feed command group
-@cli.group()
-def feed():
-    """Feed operations."""
-    pass
-
-
-@feed.command("get")
 @click.option(
-    "--sort", type=click.Choice(["hot", "new"]), default="hot", help="Sort order"
+    "--need-more-rate", is_flag=True, help="Show verification info when rate limited"
 )
-@click.option("--limit", default=20, help="Max posts to show")
-@click.option("--submolt", help="Filter by submolt")
-@click.pass_context
-def feed_get(ctx: click.Context, sort: str, limit: int, submolt: str):
-    """Get feed posts."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = FeedCore(client).get(sort=sort, limit=limit, submolt=submolt)
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@feed.command("hot")
-@click.option("--limit", default=20, help="Max posts to show")
-@click.pass_context
-def feed_hot(ctx: click.Context, limit: int):
-    """Get hot posts."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = FeedCore(client).get_hot(limit=limit)
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@feed.command("new")
-@click.option("--limit", default=20, help="Max posts to show")
-@click.pass_context
-def feed_new(ctx: click.Context, limit: int):
-    """Get newest posts."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = FeedCore(client).get_new(limit=limit)
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-# search command group
-@cli.group()
-def search():
-    """Search operations."""
-    pass
-
-
-@search.command("query")
-@click.argument("query")
 @click.option(
-    "--type",
-    "search_type",
-    type=click.Choice(["posts", "users"]),
-    default="posts",
-    help="Search type",
+    "--retries",
+    type=click.IntRange(0),
+    default=None,
+    help="Retries for transient API failures (default: 2)",
 )
-@click.option("--limit", default=20, help="Max results")
-@click.pass_context
-def search_query(ctx: click.Context, query: str, search_type: str, limit: int):
-    """Search posts or users."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = SearchCore(client).search(query=query, type_=search_type, limit=limit)
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-# vote command group
-@cli.group()
-def vote():
-    """Vote operations."""
-    pass
-
-
-@vote.command("up")
-@click.argument("item_id")
+@click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
 @click.option(
-    "--type",
-    "item_type",
-    type=click.Choice(["post", "comment"]),
-    default="post",
-    help="Item type",
+    "--cache-ttl",
+    type=click.FloatRange(0),
+    default=None,
+    help="Cache read responses for this many seconds (enables the cache)",
 )
-@click.pass_context
-def vote_up(ctx: click.Context, item_id: str, item_type: str):
-    """Upvote a post or comment."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = VoteCore(client).upvote(item_id, type_=item_type)
-        formatter.print({"status": "upvoted", "id": item_id, "type": item_type})
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@vote.command("down")
-@click.argument("item_id")
 @click.option(
-    "--type",
-    "item_type",
-    type=click.Choice(["post", "comment"]),
-    default="post",
-    help="Item type",
+    "--trace",
+    is_flag=True,
+    help="Write per-request timing spans (NDJSON) to stderr, with a summary at exit",
 )
-@click.pass_context
-def vote_down(ctx: click.Context, item_id: str, item_type: str):
-    """Downvote a post or comment."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = VoteCore(client).downvote(item_id, type_=item_type)
-        formatter.print({"status": "downvoted", "id": item_id, "type": item_type})
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@vote.command("up-comment")
-@click.argument("comment_id")
-@click.pass_context
-def vote_up_comment(ctx: click.Context, comment_id: str):
-    """Upvote a comment."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = VoteCore(client).upvote_comment(comment_id)
-        formatter.print({"status": "upvoted", "id": comment_id, "type": "comment"})
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@vote.command("down-comment")
-@click.argument("comment_id")
-@click.pass_context
-def vote_down_comment(ctx: click.Context, comment_id: str):
-    """Downvote a comment."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = VoteCore(client).downvote_comment(comment_id)
-        formatter.print({"status": "downvoted", "id": comment_id, "type": "comment"})
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-# submolts command group
-@cli.group()
-def submolts():
-    """Submolt operations."""
-    pass
-
-
-@submolts.command("list")
-@click.option("--limit", default=50, help="Max submolts to show")
-@click.pass_context
-def submolts_list(ctx: click.Context, limit: int):
-    """List all submolts."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = SubmoltsCore(client).list(limit=limit)
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@submolts.command("get")
-@click.argument("name")
-@click.pass_context
-def submolts_get(ctx: click.Context, name: str):
-    """Get submolt info."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = SubmoltsCore(client).get(name)
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@submolts.command("create")
-@click.argument("name")
-@click.argument("display_name")
-@click.option("--description", default="", help="Submolt description")
-@click.pass_context
-def submolts_create(ctx: click.Context, name: str, display_name: str, description: str):
-    """Create a new submolt."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = SubmoltsCore(client).create(name, display_name, description)
-        formatter.print(
-            {"status": "created", "name": name, "display_name": display_name}
-        )
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@submolts.command("feed")
-@click.argument("name")
 @click.option(
-    "--sort",
-    type=click.Choice(["hot", "new", "top", "rising"]),
-    default="hot",
-    help="Sort order",
+    "--trace-file",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Write trace spans to this file instead of stderr (implies --trace)",
 )
-@click.option("--limit", default=20, help="Max posts")
-@click.pass_context
-def submolts_feed(ctx: click.Context, name: str, sort: str, limit: int):
-    """Get posts from a submolt."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = SubmoltsCore(client).feed(name, sort=sort, limit=limit)
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@submolts.command("subscribe")
-@click.argument("name")
-@click.pass_context
-def submolts_subscribe(ctx: click.Context, name: str):
-    """Subscribe to a submolt."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = SubmoltsCore(client).subscribe(name)
-        formatter.print({"status": "subscribed", "name": name})
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@submolts.command("unsubscribe")
-@click.argument("name")
-@click.pass_context
-def submolts_unsubscribe(ctx: click.Context, name: str):
-    """Unsubscribe from a submolt."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = SubmoltsCore(client).unsubscribe(name)
-        formatter.print({"status": "unsubscribed", "name": name})
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-@submolts.command("trending")
-@click.option("--limit", default=10, help="Max submolts to show")
-@click.pass_context
-def submolts_trending(ctx: click.Context, limit: int):
-    """Get trending submolts."""
-    client = ensure_client(ctx)
-    formatter: OutputFormatter = ctx.obj["formatter"]
-    try:
-        result = SubmoltsCore(client).trending(limit=limit)
-        formatter.print(result)
-    except Exception as e:
-        if ctx.obj["json_mode"]:
-            formatter.print(handle_error(e))
-            sys.exit(1)
-        raise
-
-
-# memory command group
-@cli.group()
-def memory():
-    """Local memory operations for CLI-first agents."""
-    pass
-
-
-@memory.command("add")
-@click.argument("content")
 @click.option(
-    "--category",
-    default="learnings",
-    type=click.Choice(
-        ["learnings", "context", "interactions", "platforms", "identity"]
-    ),
-    help="Memory category",
+    "--via-daemon",
+    is_flag=True,
+    help="Run the command in a running 'moltcli daemon' (falls back to in-process)",
 )
-@click.option("--tags", multiple=True, help="Tags for this memory")
-@click.option("--source", default="cli", help="Source of this memory")
 @click.pass_context
-def memory_add(
-    ctx: click.Context, content: str, category: str, tags: tuple, source: str
+def cli(
+    ctx: click.Context,
+    json_mode: bool,
+    ndjson: bool,
+    need_more_rate: bool,
+    retries: int,
+    no_cache: bool,
+    cache_ttl: float,
+    trace: bool,
+    trace_file: Optional[str],
+    via_daemon: bool,
 ):
-    """Add a new memory entry.
-
-    Store learnings, context, or preferences locally.
-
-    Examples:
-        moltcli memory add "Learned about DID identity systems from @Morningstar"
-        moltcli memory add "Following @AiiCLI" --category interactions --tags cli,community
-    """
-    from .utils import get_memory
-
-    memory = get_memory()
-    entry = memory.add(
-        content=content,
-        category=category,
-        tags=list(tags) if tags else [],
-        source=source,
-    )
-    formatter = ctx.obj["formatter"]
-    formatter.print(
-        {
-            "status": "added",
-            "id": entry.id,
-            "category": entry.category,
-            "created_at": entry.created_at,
-        }
-    )
-
-
-@memory.command("view")
-@click.option(
-    "--category",
-    type=click.Choice(
-        ["learnings", "context", "interactions", "platforms", "identity"]
-    ),
-    help="Filter by category",
-)
-@click.pass_context
-def memory_view(ctx: click.Context, category: str):
-    """View local memories as human-readable output.
-
-    Shows all memories or filters by category.
-    """
-    from .utils import get_memory
+    """MoltCLI - CLI tool for Moltbook social network."""
+    ctx.ensure_object(dict)
+    ctx.obj["json_mode"] = json_mode or ndjson
+    ctx.obj["ndjson"] = ndjson
+    ctx.obj["need_more_rate"] = need_more_rate
+    ctx.obj["retries"] = retries
+    ctx.obj["no_cache"] = no_cache
+    ctx.obj["cache_ttl"] = cache_ttl
+    ctx.obj["formatter"] = make_formatter(json_mode, ndjson)
+    if trace or trace_file:
+        from .utils.trace import Tracer
+
+        out = None
+        if trace_file:
+            out = open(trace_file, "w", encoding="utf-8")
+            ctx.call_on_close(out.close)
+        tracer = Tracer(out)
+        ctx.obj["tracer"] = tracer
+        # Runs before out.close, after the client is done
+        ctx.call_on_close(tracer.close)
+    # Client is lazily loaded when needed (commands that require auth)
 
-    memory = get_memory()
-    output = memory.view(category=category)
-    click.echo(output)
 
+def get_client(
+    retries: Optional[int] = None,
+    no_cache: bool = False,
+    cache_ttl: Optional[float] = None,
+    trace: Optional["TraceHook"] = None,
+    warm: Optional["MoltbookClient"] = None,
+) -> "MoltbookClient":
+    """Create API client from config.
 
-@memory.command("search")
-@click.argument("query")
-@click.option(
-    "--category",
-    type=click.Choice(["learnings", "context", "interactions"]),
-    help="Filter by category",
-)
-@click.pass_context
-def memory_search(ctx: click.Context, query: str, category: str):
-    """Search memories by content.
+    The response cache is opt-in: enabled by --cache-ttl or ``"cache": true``
+    in the config file, and always bypassed with --no-cache. Persistent
+    latency stats (``moltcli stats``) are enabled by ``"stats": true``.
+    Rate-limit state is shared with other moltcli processes using the same
+    API key unless ``"shared_limits": false``.
 
-    Find previous learnings, context, or interactions.
+    With ``warm`` (the daemon's long-lived client), the new client reuses its
+    pooled session, governor and stats and only applies the per-call options.
     """
-    from .utils import get_memory
-
-    memory = get_memory()
-    results = memory.search(query=query, category=category)
-    formatter = ctx.obj["formatter"]
-    formatter.print(
-        {"query": query, "count": len(results), "results": [asdict(r) for r in results]}
+    from .utils.api_client import MoltbookClient
+    from .utils.cache import ResponseCache
+    from .utils.config import get_config
+    from .utils.ratelimit import SharedRateLimitGovernor, state_path
+    from .utils.retry import RetryPolicy
+
+    retry = RetryPolicy(max_attempts=retries + 1) if retries is not None else None
+    if warm is not None:
+        cache = None if no_cache else warm.cache
+        if not no_cache and cache_ttl is not None:
+            cache = ResponseCache(ttl_override=cache_ttl)
+        return MoltbookClient(
+            warm.api_key,
+            base_url=warm.base_url,
+            session=warm._session,
+            governor=warm.governor,
+            rate_limit=warm.governor is not None,
+            retry=retry or warm.retry,
+            cache=cache,
+            trace=trace,
+            stats=warm.stats,
+        )
+    config = get_config()
+    cache = None
+    if not no_cache and (cache_ttl is not None or config.get("cache")):
+        cache = ResponseCache(ttl_override=cache_ttl)
+    stats = None
+    if config.get("stats"):
+        from .utils.stats import LatencyStats
+
+        stats = LatencyStats()
+    governor = None
+    if config.get("shared_limits", True):
+        governor = SharedRateLimitGovernor(state_path(config.api_key))
+    return MoltbookClient(
+        config.api_key,
+        base_url=os.environ.get("MOLTCLI_BASE_URL") or config.get("base_url"),
+        governor=governor,
+        retry=retry,
+        cache=cache,
+        trace=trace,
+        stats=stats,
     )
 
 
-@memory.command("export")
-@click.option(
-    "--format",
-    default="markdown",
-    type=click.Choice(["json", "markdown"]),
-    help="Export format",
-)
-@click.pass_context
-def memory_export(ctx: click.Context, format: str):
-    """Export all memories for portability.
-
-    Export to JSON for backup/programmatic use, or markdown for human reading.
+def ensure_client(ctx: click.Context) -> "MoltbookClient":
+    """Ensure client is available in context.
 
-    Use this to migrate memories to a new platform or backup.
+    Under the daemon, ``ctx.obj["warm_client"]`` is used as is unless a
+    per-call option (--retries, --no-cache, --cache-ttl, --trace) needs a
+    client of its own; that one still shares the warm connections.
     """
-    from .utils import get_memory
+    if "client" not in ctx.obj or ctx.obj["client"] is None:
+        warm = ctx.obj.get("warm_client")
+        per_call = (
+            ctx.obj.get("retries") is not None
+            or ctx.obj.get("no_cache", False)
+            or ctx.obj.get("cache_ttl") is not None
+            or ctx.obj.get("tracer") is not None
+        )
+        if warm is not None and not per_call:
+            ctx.obj["client"] = warm
+            return warm
+        client = get_client(
+            ctx.obj.get("retries"),
+            ctx.obj.get("no_cache", False),
+            ctx.obj.get("cache_ttl"),
+            ctx.obj.get("tracer"),
+            warm=warm,
+        )
+        ctx.obj["client"] = client
+        # Release pooled connections when the command finishes
+        ctx.find_root().call_on_close(client.close)
+    return ctx.obj["client"]
 
-    memory = get_memory()
-    output = memory.export(format=format)
-    click.echo(output)
 
+def echo_stream(items) -> int:
+    """Write items as JSON lines as they arrive. Returns the count written."""
+    return OutputFormatter(ndjson=True).stream(items)
 
-@memory.command("record-interaction")
-@click.argument("platform")
-@click.argument("action")
-@click.argument("target")
-@click.option("--result", default="success", help="Interaction result")
-@click.pass_context
-def memory_record_interaction(
-    ctx: click.Context, platform: str, action: str, target: str, result: str
-):
-    """Record a platform interaction.
 
-    Automatically tracks posts, comments, and follows.
+def streaming(ctx: click.Context, fetch_all: bool = False) -> bool:
+    """Whether a listing should stream JSON lines (--all or --ndjson).
 
-    Examples:
-        moltcli memory record-interaction moltbook post "post_id_xxx"
-        moltcli memory record-interaction moltbook follow "AgentRunWeb"
+    With --ndjson alone, stream only the --limit items a plain call returns.
     """
-    from .utils import get_memory
+    return fetch_all or ctx.obj.get("ndjson", False)
 
-    memory = get_memory()
-    memory.record_interaction(
-        platform=platform, action=action, target=target, result=result
-    )
-    formatter = ctx.obj["formatter"]
-    formatter.print(
-        {"status": "recorded", "platform": platform, "action": action, "target": target}
-    )
 
+def all_options(func):
+    """Add --all/--max-items for streaming every page of a listing."""
+    func = click.option(
+        "--max-items", type=click.IntRange(1), help="Stop after this many items (with --all)"
+    )(func)
+    return click.option(
+        "--all", "fetch_all", is_flag=True, help="Stream every page as JSON lines"
+    )(func)
 
-@memory.command("record-learning")
-@click.argument("content")
-@click.argument("topic")
-@click.option("--source", default="cli", help="Source of the learning")
-@click.pass_context
-def memory_record_learning(ctx: click.Context, content: str, topic: str, source: str):
-    """Record something the agent learned.
 
-    Capture insights, discoveries, or key takeaways.
+def offline_option(func):
+    """Add --offline for answering from the local mirror instead of the API."""
+    return click.option(
+        "--offline", is_flag=True, help="Read from the local mirror (see 'moltcli sync')"
+    )(func)
 
-    Examples:
-        moltcli memory record-learning "CLI-first provides better security" "agent-architecture"
-    """
-    from .utils import get_memory
 
-    memory = get_memory()
-    memory.record_learning(content=content, topic=topic, source=source)
-    formatter = ctx.obj["formatter"]
-    formatter.print({"status": "recorded", "topic": topic})
+def ensure_mirror(ctx: click.Context) -> "Mirror":
+    """Ensure the local mirror is open in context."""
+    if ctx.obj.get("mirror") is None:
+        from .utils.mirror import Mirror
 
+        mirror = Mirror()
+        ctx.obj["mirror"] = mirror
+        ctx.find_root().call_on_close(mirror.close)
+    return ctx.obj["mirror"]
 
-@memory.command("update-context")
-@click.argument("topic")
-@click.argument("details")
-@click.pass_context
-def memory_update_context(ctx: click.Context, topic: str, details: str):
-    """Update current context or preferences.
 
-    Set ongoing topics, current interests, or agent state.
+def offline_limit(limit: int, fetch_all: bool = False, max_items: Optional[int] = None) -> int:
+    """Rows to read from the mirror; --all reads every mirrored item (-1)."""
+    return (max_items or -1) if fetch_all else limit
 
-    Examples:
-        moltcli memory update-context "interest" "exploring decentralized identity"
-    """
-    from .utils import get_memory
 
-    memory = get_memory()
-    memory.update_context(topic=topic, details=details)
-    formatter = ctx.obj["formatter"]
-    formatter.print({"status": "updated", "topic": topic})
+def echo_offline(ctx: click.Context, key: str, items: list, fetch_all: bool = False) -> None:
+    """Print mirrored items like the matching API listing, marked offline."""
+    if streaming(ctx, fetch_all):
+        echo_stream(items)
+        return
+    ctx.obj["formatter"].print({"success": True, key: items, "offline": True})
 
 
 def main():
     """Entry point."""
-    cli()
+    argv = sys.argv[1:]
+    if "--via-daemon" in argv or os.environ.get("MOLTCLI_VIA_DAEMON") == "1":
+        from .daemon import run_via_daemon, split_via_daemon
+
+        argv, _ = split_via_daemon(argv)
+        code = run_via_daemon(argv)
+        if code is not None:
+            sys.exit(code)
+    cli(args=argv)
 
 
 if __name__ == "__main__":
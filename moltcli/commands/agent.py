@@ -0,0 +1,137 @@
+"""Agent commands."""
+
+import sys
+import click
+
+from ..cli import ensure_client
+from ..core.agent import AgentCore
+from ..utils.errors import handle_error
+from ..utils.formatter import OutputFormatter
+
+
+@click.group()
+def agent():
+    """Agent profile and following."""
+    pass
+
+
+@agent.command("me")
+@click.pass_context
+def agent_me(ctx: click.Context):
+    """Get current agent info."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = AgentCore(client).get_me()
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@agent.command("profile")
+@click.argument("name")
+@click.pass_context
+def agent_profile(ctx: click.Context, name: str):
+    """Get another agent's profile."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = AgentCore(client).get_profile(name)
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@agent.command("feed")
+@click.argument("name")
+@click.option("--limit", default=20, help="Number of posts to return")
+@click.pass_context
+def agent_feed(ctx: click.Context, name: str, limit: int):
+    """Get posts from a specific agent."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = AgentCore(client).get_feed(name, limit)
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@agent.command("follow")
+@click.argument("name")
+@click.pass_context
+def agent_follow(ctx: click.Context, name: str):
+    """Follow an agent."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = AgentCore(client).follow(name)
+        formatter.print({"status": "following", "agent": name})
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@agent.command("unfollow")
+@click.argument("name")
+@click.pass_context
+def agent_unfollow(ctx: click.Context, name: str):
+    """Unfollow an agent."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = AgentCore(client).unfollow(name)
+        formatter.print({"status": "unfollowed", "agent": name})
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@agent.command("update")
+@click.option("--description", help="Update your description")
+@click.option("--metadata", help="Update metadata as JSON string")
+@click.pass_context
+def agent_update(ctx: click.Context, description: str, metadata: str):
+    """Update your agent profile.
+
+    Note: You can only update one of description or metadata at a time.
+    """
+    import json
+
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+
+    meta_dict = None
+    if metadata:
+        try:
+            meta_dict = json.loads(metadata)
+        except json.JSONDecodeError:
+            if ctx.obj["json_mode"]:
+                formatter.print({"error": "Invalid JSON for --metadata"})
+            else:
+                click.echo("Error: Invalid JSON for --metadata", err=True)
+            return
+
+    try:
+        result = AgentCore(client).update_profile(
+            description=description if description else None, metadata=meta_dict
+        )
+        formatter.print({"status": "updated"})
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+        else:
+            click.echo(f"Error: {e}", err=True)
@@ -0,0 +1,228 @@
+"""Authentication and registration commands."""
+
+import sys
+import click
+
+from ..cli import ensure_client
+from ..core.auth import AuthCore
+from ..utils.errors import handle_error
+from ..utils.formatter import OutputFormatter
+
+
+@click.group()
+def auth():
+    """Authentication management."""
+    pass
+
+
+@auth.command("whoami")
+@click.pass_context
+def auth_whoami(ctx: click.Context):
+    """Show current user info."""
+    client = ensure_client(ctx)
+    formatter = ctx.obj["formatter"]
+    try:
+        result = AuthCore(client).whoami()
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@auth.command("verify")
+@click.pass_context
+def auth_verify(ctx: click.Context):
+    """Verify API key is valid."""
+    client = ensure_client(ctx)
+    formatter = ctx.obj["formatter"]
+    try:
+        result = AuthCore(client).verify()
+        formatter.print({"status": "valid", "message": "API key is valid"})
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@auth.command("login")
+@click.argument("api_key")
+@click.option("--agent-name", help="Agent name (optional)")
+@click.option("--json", "json_mode", is_flag=True, help="Output as JSON")
+@click.pass_context
+def auth_login(ctx: click.Context, api_key: str, agent_name: str, json_mode: bool):
+    """Save API key to credentials file.
+
+    After registering, use this command to save your API key:
+        moltcli auth login moltbook_xxx
+
+    The credentials will be saved to ~/.config/moltbook/credentials.json
+    """
+    from ..utils import Config
+
+    formatter = OutputFormatter(json_mode=json_mode)
+
+    try:
+        config = Config()
+        config.save(api_key, agent_name if agent_name else "")
+        formatter.print(
+            {
+                "status": "saved",
+                "config_path": str(config.config_path),
+                "message": "Credentials saved successfully",
+            }
+        )
+        if not json_mode:
+            click.echo(f"\nCredentials saved to: {config.config_path}")
+            click.echo("You can now use other moltcli commands.")
+    except FileExistsError as e:
+        if json_mode:
+            formatter.print({"status": "error", "message": str(e)})
+        else:
+            click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        if json_mode:
+            formatter.print({"status": "error", "message": str(e)})
+        else:
+            click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@auth.command("logout")
+@click.option("--json", "json_mode", is_flag=True, help="Output as JSON")
+@click.pass_context
+def auth_logout(ctx: click.Context, json_mode: bool):
+    """Remove credentials file."""
+    from ..utils import Config
+
+    formatter = OutputFormatter(json_mode=json_mode)
+
+    try:
+        config = Config()
+        if config.exists():
+            config.remove()
+            formatter.print(
+                {"status": "removed", "message": "Credentials removed successfully"}
+            )
+            if not json_mode:
+                click.echo("Credentials removed.")
+        else:
+            formatter.print(
+                {"status": "skipped", "message": "No credentials file found"}
+            )
+            if not json_mode:
+                click.echo("No credentials file to remove.")
+    except Exception as e:
+        if json_mode:
+            formatter.print({"status": "error", "message": str(e)})
+        else:
+            click.echo(f"Error: {e}", err=True)
+
+
+# Registration commands (no auth required)
+@click.command("register")
+@click.argument("name")
+@click.option("--description", default="", help="Agent description")
+@click.option("--json", "json_mode", is_flag=True, help="Output as JSON")
+def register(name: str, description: str, json_mode: bool):
+    """Register a new agent.
+
+    This creates a new agent account. You'll receive an api_key, claim_url, and verification_code.
+
+    IMPORTANT: Save your api_key immediately! You need it for all future requests.
+
+    After registering, send the claim_url to your human to complete verification.
+    """
+    from ..utils import MoltbookClient, OutputFormatter, Config
+    from ..core import AgentCore
+
+    client = MoltbookClient("")  # No auth needed for register
+    formatter = OutputFormatter(json_mode=json_mode)
+
+    try:
+        result = AgentCore(client).register(name, description)
+        formatter.print(result)
+
+        if "agent" in result:
+            agent = result["agent"]
+            api_key = agent.get("api_key")
+            claim_url = agent.get("claim_url")
+            verification_code = agent.get("verification_code")
+
+            # Auto-save credentials
+            config = Config()
+            config.save(api_key, name)
+
+            if json_mode:
+                formatter.print(
+                    {
+                        "status": "credentials_saved",
+                        "config_path": str(config.config_path),
+                    }
+                )
+            else:
+                click.echo("\n" + "=" * 50)
+                click.echo("Credentials saved to: " + str(config.config_path))
+                click.echo("=" * 50)
+                click.echo("\nNext steps:")
+                click.echo("1. Send this to your human to complete verification:")
+                click.echo(f"   Claim URL: {claim_url}")
+                click.echo(f"   Verification Code: {verification_code}")
+                click.echo("\n2. Your human will post a verification tweet,")
+                click.echo("   then your account will be activated!")
+                click.echo("\n3. Check status with: moltcli status")
+                click.echo("=" * 50)
+    except FileExistsError:
+        if json_mode:
+            formatter.print(
+                {
+                    "status": "error",
+                    "message": "Credentials already exist. Use 'moltcli auth logout' first.",
+                }
+            )
+        else:
+            click.echo(
+                "Error: Credentials already exist. Use 'moltcli auth logout' first.",
+                err=True,
+            )
+    except Exception as e:
+        if json_mode:
+            formatter.print(handle_error(e))
+        else:
+            click.echo(f"Error: {e}", err=True)
+
+
+@click.command("status")
+@click.option("--json", "json_mode", is_flag=True, help="Output as JSON")
+@click.pass_context
+def claim_status(ctx: click.Context, json_mode: bool):
+    """Check your claim status (pending or claimed).
+
+    After registering, you need to be 'claimed' by your human via Twitter.
+    """
+    from ..utils import OutputFormatter
+    from ..core import AgentCore
+
+    client = ensure_client(ctx)
+    formatter = OutputFormatter(json_mode=json_mode)
+
+    try:
+        result = AgentCore(client).get_status()
+        formatter.print(result)
+
+        status = result.get("status", "")
+        if not json_mode:
+            if status == "pending_claim":
+                click.echo("\nStatus: PENDING - Awaiting human verification")
+            elif status == "claimed":
+                click.echo("\nStatus: CLAIMED - Your account is active!")
+            else:
+                click.echo(f"\nStatus: {status}")
+    except Exception as e:
+        if json_mode:
+            formatter.print(handle_error(e))
+        else:
+            click.echo(f"Error: {e}", err=True)
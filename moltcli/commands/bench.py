@@ -0,0 +1,45 @@
+"""Benchmark command."""
+
+from pathlib import Path
+from typing import Optional, Tuple
+import click
+
+from ..testing.bench import PROFILES, SCENARIOS
+from ..utils import codec
+
+
+@click.command()
+@click.option(
+    "--scenario",
+    "-s",
+    "scenarios",
+    multiple=True,
+    type=click.Choice(list(SCENARIOS)),
+    help="Scenario to run (repeatable; default: all)",
+)
+@click.option(
+    "--profile",
+    type=click.Choice(list(PROFILES)),
+    default="default",
+    help="Workload sizes: quick (smoke test), default, or full (1M-entry memory)",
+)
+@click.option(
+    "--output", "-o", type=click.Path(dir_okay=False), help="Also write the report to this file"
+)
+def bench(scenarios: Tuple[str, ...], profile: str, output: Optional[str]):
+    """Benchmark client, formatter, memory and challenge hot paths.
+
+    Prints one JSON report; save reports from two releases and diff them.
+    Runs offline: client requests go to a local stub server.
+    """
+    from ..testing.bench import run
+
+    report = run(
+        scenarios or None,
+        profile=profile,
+        progress=lambda name: click.echo(f"Running {name}...", err=True),
+    )
+    data = codec.dumps(report, indent=True)
+    if output:
+        Path(output).write_text(data + "\n", encoding="utf-8")
+    click.echo(data)
@@ -0,0 +1,152 @@
+"""Comment commands."""
+
+import sys
+from typing import Optional
+import click
+
+from ..cli import (
+    ensure_client,
+    ensure_mirror,
+    echo_offline,
+    echo_stream,
+    all_options,
+    offline_limit,
+    offline_option,
+    streaming,
+)
+from ..core.comment import CommentCore
+from ..utils.errors import handle_error
+from ..utils.formatter import OutputFormatter
+
+
+@click.group()
+def comment():
+    """Comment operations."""
+    pass
+
+
+@comment.command("create")
+@click.argument("post_id")
+@click.option("--content", required=True, help="Comment content")
+@click.option("--parent", help="Parent comment ID for replies")
+@click.pass_context
+def comment_create(ctx: click.Context, post_id: str, content: str, parent: str):
+    """Create a comment on a post.
+
+    Use --parent to reply to a specific comment.
+    """
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = CommentCore(client).create(
+            post_id=post_id, content=content, parent_id=parent
+        )
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@comment.command("reply")
+@click.argument("post_id")
+@click.argument("parent_id")
+@click.option("--content", required=True, help="Reply content")
+@click.pass_context
+def comment_reply(ctx: click.Context, post_id: str, parent_id: str, content: str):
+    """Reply to a comment."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = CommentCore(client).create(
+            post_id=post_id, content=content, parent_id=parent_id
+        )
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@comment.command("list")
+@click.argument("post_id")
+@click.option("--limit", default=50, help="Max comments to show (page size with --all)")
+@all_options
+@offline_option
+@click.pass_context
+def comment_list(
+    ctx: click.Context,
+    post_id: str,
+    limit: int,
+    fetch_all: bool,
+    max_items: Optional[int],
+    offline: bool,
+):
+    """List comments for a post."""
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        if offline:
+            comments = ensure_mirror(ctx).comments(
+                post_id, limit=offline_limit(limit, fetch_all, max_items)
+            )
+            echo_offline(ctx, "comments", comments, fetch_all)
+            return
+        client = ensure_client(ctx)
+        if streaming(ctx, fetch_all):
+            cap = max_items if fetch_all else limit
+            echo_stream(
+                CommentCore(client).iter_by_post(post_id, page_size=limit, max_items=cap)
+            )
+            return
+        result = CommentCore(client).list_by_post(post_id, limit=limit)
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+def _tree_line(depth: int, comment: dict) -> str:
+    """One comment as indented text, continuation lines aligned under it."""
+    author = comment.get("author")
+    if isinstance(author, dict):
+        author = author.get("name")
+    indent = "  " * depth
+    content = str(comment.get("content") or "").replace("\n", "\n" + indent + "  ")
+    return f"{indent}- {author or '?'} ({comment.get('upvotes') or 0}): {content}"
+
+
+@comment.command("tree")
+@click.argument("post_id")
+@click.option("--workers", default=8, type=click.IntRange(1), help="Concurrent page requests")
+@click.option("--page-size", default=50, type=click.IntRange(1), help="Comments per request")
+@offline_option
+@click.pass_context
+def comment_tree(ctx: click.Context, post_id: str, workers: int, page_size: int, offline: bool):
+    """Show a post's full reply tree, depth-first.
+
+    Prints indented text, or with --json/--ndjson one JSON line per comment
+    with its "depth" (0 for top-level comments).
+    """
+    from ..core.comment import walk_tree
+
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        if offline:
+            tree = walk_tree(ensure_mirror(ctx).comments(post_id, limit=-1))
+        else:
+            client = ensure_client(ctx)
+            tree = CommentCore(client).iter_tree(post_id, page_size=page_size, workers=workers)
+        if ctx.obj["json_mode"]:
+            echo_stream({"depth": depth, **c} for depth, c in tree)
+            return
+        for depth, c in tree:
+            click.echo(_tree_line(depth, c))
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
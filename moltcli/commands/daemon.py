@@ -0,0 +1,79 @@
+"""Daemon management commands."""
+
+import sys
+from typing import Optional
+import click
+
+from ..utils.errors import handle_error
+from ..utils.formatter import OutputFormatter
+
+
+@click.group()
+def daemon():
+    """Keep a warm client in a background process.
+
+    Commands sent with 'moltcli --via-daemon ...' (or with
+    MOLTCLI_VIA_DAEMON=1) skip startup, config loading and connection setup.
+    """
+    pass
+
+
+def _socket_option(func):
+    return click.option(
+        "--socket", "socket_file", help="Unix socket path (default: ~/.config/moltcli/daemon.sock)"
+    )(func)
+
+
+@daemon.command("start")
+@_socket_option
+@click.option("--foreground", is_flag=True, help="Run in this process until stopped")
+@click.pass_context
+def daemon_start(ctx: click.Context, socket_file: Optional[str], foreground: bool):
+    """Start the daemon."""
+    from .. import daemon as daemon_mod
+
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        formatter.print(daemon_mod.control("ping", socket_file))
+        return
+    except (OSError, ValueError):
+        pass
+    try:
+        if foreground:
+            daemon_mod.Daemon(socket_file).serve_forever()
+            return
+        formatter.print(daemon_mod.start_background(socket_file))
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@daemon.command("stop")
+@_socket_option
+@click.pass_context
+def daemon_stop(ctx: click.Context, socket_file: Optional[str]):
+    """Stop the daemon."""
+    from .. import daemon as daemon_mod
+
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        formatter.print(daemon_mod.control("shutdown", socket_file))
+    except (OSError, ValueError):
+        formatter.print({"status": "not running"})
+
+
+@daemon.command("status")
+@_socket_option
+@click.pass_context
+def daemon_status(ctx: click.Context, socket_file: Optional[str]):
+    """Show whether the daemon is running."""
+    from .. import daemon as daemon_mod
+
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        formatter.print(daemon_mod.control("ping", socket_file))
+    except (OSError, ValueError):
+        formatter.print({"status": "not running"})
+        sys.exit(1)
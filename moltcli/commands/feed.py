@@ -0,0 +1,144 @@
+"""Feed commands."""
+
+import sys
+from typing import Optional
+import click
+
+from ..cli import (
+    ensure_client,
+    ensure_mirror,
+    echo_offline,
+    echo_stream,
+    all_options,
+    offline_limit,
+    offline_option,
+    streaming,
+)
+from ..core.feed import FeedCore
+from ..utils.errors import handle_error
+from ..utils.formatter import OutputFormatter
+
+
+def _echo_mirrored(
+    ctx: click.Context,
+    sort: str,
+    submolt: Optional[str],
+    limit: int,
+    fetch_all: bool,
+    max_items: Optional[int],
+) -> None:
+    """Print a feed listing from the local mirror."""
+    from ..utils.mirror import listing_key
+
+    posts = ensure_mirror(ctx).listing(
+        listing_key("feed", sort, submolt), limit=offline_limit(limit, fetch_all, max_items)
+    )
+    echo_offline(ctx, "posts", posts, fetch_all)
+
+
+@click.group()
+def feed():
+    """Feed operations."""
+    pass
+
+
+@feed.command("get")
+@click.option(
+    "--sort", type=click.Choice(["hot", "new"]), default="hot", help="Sort order"
+)
+@click.option("--limit", default=20, help="Max posts to show (page size with --all)")
+@click.option("--submolt", help="Filter by submolt")
+@all_options
+@offline_option
+@click.pass_context
+def feed_get(
+    ctx: click.Context,
+    sort: str,
+    limit: int,
+    submolt: str,
+    fetch_all: bool,
+    max_items: Optional[int],
+    offline: bool,
+):
+    """Get feed posts."""
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        if offline:
+            _echo_mirrored(ctx, sort, submolt, limit, fetch_all, max_items)
+            return
+        client = ensure_client(ctx)
+        if streaming(ctx, fetch_all):
+            cap = max_items if fetch_all else limit
+            echo_stream(
+                FeedCore(client).iter_posts(
+                    sort=sort, submolt=submolt, page_size=limit, max_items=cap
+                )
+            )
+            return
+        result = FeedCore(client).get(sort=sort, limit=limit, submolt=submolt)
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@feed.command("hot")
+@click.option("--limit", default=20, help="Max posts to show (page size with --all)")
+@all_options
+@offline_option
+@click.pass_context
+def feed_hot(
+    ctx: click.Context, limit: int, fetch_all: bool, max_items: Optional[int], offline: bool
+):
+    """Get hot posts."""
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        if offline:
+            _echo_mirrored(ctx, "hot", None, limit, fetch_all, max_items)
+            return
+        client = ensure_client(ctx)
+        if streaming(ctx, fetch_all):
+            cap = max_items if fetch_all else limit
+            echo_stream(
+                FeedCore(client).iter_posts(sort="hot", page_size=limit, max_items=cap)
+            )
+            return
+        result = FeedCore(client).get_hot(limit=limit)
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@feed.command("new")
+@click.option("--limit", default=20, help="Max posts to show (page size with --all)")
+@all_options
+@offline_option
+@click.pass_context
+def feed_new(
+    ctx: click.Context, limit: int, fetch_all: bool, max_items: Optional[int], offline: bool
+):
+    """Get newest posts."""
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        if offline:
+            _echo_mirrored(ctx, "new", None, limit, fetch_all, max_items)
+            return
+        client = ensure_client(ctx)
+        if streaming(ctx, fetch_all):
+            cap = max_items if fetch_all else limit
+            echo_stream(
+                FeedCore(client).iter_posts(sort="new", page_size=limit, max_items=cap)
+            )
+            return
+        result = FeedCore(client).get_new(limit=limit)
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
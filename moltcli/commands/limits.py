@@ -0,0 +1,38 @@
+"""Rate-limit state command."""
+
+import sys
+import click
+
+from ..utils.errors import handle_error
+from ..utils.formatter import OutputFormatter
+
+
+@click.command()
+@click.option("--reset", is_flag=True, help="Forget the shared state (e.g. after a key rotation)")
+@click.pass_context
+def limits(ctx: click.Context, reset: bool):
+    """Show the rate-limit budget shared by moltcli processes.
+
+    Every moltcli process using the same API key paces its requests from
+    one state file, so a budget spent or a 429 seen by one process holds
+    back the others too. Per endpoint class this shows the limit, available
+    requests, the wait before the next one, and the last Retry-After.
+    """
+    from ..utils.config import get_config
+    from ..utils.ratelimit import SharedRateLimitGovernor, state_path
+
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        governor = SharedRateLimitGovernor(state_path(get_config().api_key))
+        if reset:
+            governor.reset()
+            formatter.print({"success": True, "reset": str(governor.path)})
+            return
+        formatter.print(
+            {"success": True, "path": str(governor.path), "limits": governor.snapshot()}
+        )
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
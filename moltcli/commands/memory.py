@@ -0,0 +1,247 @@
+"""Local memory commands."""
+
+from dataclasses import asdict
+from typing import Optional
+import click
+
+
+@click.group()
+def memory():
+    """Local memory operations for CLI-first agents."""
+    pass
+
+
+@memory.command("add")
+@click.argument("content")
+@click.option(
+    "--category",
+    default="learnings",
+    type=click.Choice(
+        ["learnings", "context", "interactions", "platforms", "identity"]
+    ),
+    help="Memory category",
+)
+@click.option("--tags", multiple=True, help="Tags for this memory")
+@click.option("--source", default="cli", help="Source of this memory")
+@click.pass_context
+def memory_add(
+    ctx: click.Context, content: str, category: str, tags: tuple, source: str
+):
+    """Add a new memory entry.
+
+    Store learnings, context, or preferences locally.
+
+    Examples:
+        moltcli memory add "Learned about DID identity systems from @Morningstar"
+        moltcli memory add "Following @AiiCLI" --category interactions --tags cli,community
+    """
+    from ..utils import get_memory
+
+    memory = get_memory()
+    entry = memory.add(
+        content=content,
+        category=category,
+        tags=list(tags) if tags else [],
+        source=source,
+    )
+    formatter = ctx.obj["formatter"]
+    formatter.print(
+        {
+            "status": "added",
+            "id": entry.id,
+            "category": entry.category,
+            "created_at": entry.created_at,
+        }
+    )
+
+
+@memory.command("view")
+@click.option(
+    "--category",
+    type=click.Choice(
+        ["learnings", "context", "interactions", "platforms", "identity"]
+    ),
+    help="Filter by category",
+)
+@click.pass_context
+def memory_view(ctx: click.Context, category: str):
+    """View local memories as human-readable output.
+
+    Shows all memories or filters by category.
+    """
+    from ..utils import get_memory
+
+    memory = get_memory()
+    output = memory.view(category=category)
+    click.echo(output)
+
+
+@memory.command("search")
+@click.argument("query")
+@click.option(
+    "--category",
+    type=click.Choice(["learnings", "context", "interactions"]),
+    help="Filter by category",
+)
+@click.option("--tag", "tags", multiple=True, help="Require this tag (repeatable)")
+@click.option(
+    "--any", "match_any", is_flag=True, help="Match entries with any --tag instead of all"
+)
+@click.option("--source", help="Filter by source")
+@click.option("--since", help="Only entries created at or after this ISO date")
+@click.option("--until", help="Only entries created before this ISO date")
+@click.option("--limit", type=click.IntRange(1), help="Max results")
+@click.pass_context
+def memory_search(
+    ctx: click.Context,
+    query: str,
+    category: str,
+    tags: tuple,
+    source: Optional[str],
+    since: Optional[str],
+    until: Optional[str],
+    limit: Optional[int],
+    match_any: bool,
+):
+    """Search memories by content.
+
+    Find previous learnings, context, or interactions.
+
+    Examples:
+        moltcli memory search "identity"
+        moltcli memory search "" --category interactions --tag moltbook --since 2026-01-01
+        moltcli memory search "" --tag post --tag comment --any
+    """
+    from ..utils import get_memory
+
+    memory = get_memory()
+    results = memory.search(
+        query=query,
+        category=category,
+        tags=list(tags),
+        source=source,
+        since=since,
+        until=until,
+        limit=limit,
+        match_any=match_any,
+    )
+    formatter = ctx.obj["formatter"]
+    formatter.print(
+        {"query": query, "count": len(results), "results": [asdict(r) for r in results]}
+    )
+
+
+@memory.command("export")
+@click.option(
+    "--format",
+    default="markdown",
+    type=click.Choice(["json", "markdown"]),
+    help="Export format",
+)
+@click.pass_context
+def memory_export(ctx: click.Context, format: str):
+    """Export all memories for portability.
+
+    Export to JSON for backup/programmatic use, or markdown for human reading.
+
+    Use this to migrate memories to a new platform or backup.
+    """
+    from ..utils import get_memory
+
+    memory = get_memory()
+    output = memory.export(format=format)
+    click.echo(output)
+
+
+@memory.command("migrate")
+@click.pass_context
+def memory_migrate(ctx: click.Context):
+    """Move memories into the indexed SQLite store.
+
+    Ingests every category .jsonl file into memory.db. The JSONL files are
+    kept as a backup; later commands use the SQLite store automatically.
+    Safe to run more than once.
+    """
+    from ..utils import get_memory
+
+    memory = get_memory()
+    counts = memory.migrate()
+    formatter = ctx.obj["formatter"]
+    formatter.print(
+        {
+            "status": "migrated",
+            "database": str(memory.db_path),
+            "imported": counts,
+            "total": sum(counts.values()),
+        }
+    )
+
+
+@memory.command("record-interaction")
+@click.argument("platform")
+@click.argument("action")
+@click.argument("target")
+@click.option("--result", default="success", help="Interaction result")
+@click.pass_context
+def memory_record_interaction(
+    ctx: click.Context, platform: str, action: str, target: str, result: str
+):
+    """Record a platform interaction.
+
+    Automatically tracks posts, comments, and follows.
+
+    Examples:
+        moltcli memory record-interaction moltbook post "post_id_xxx"
+        moltcli memory record-interaction moltbook follow "AgentRunWeb"
+    """
+    from ..utils import get_memory
+
+    memory = get_memory()
+    memory.record_interaction(
+        platform=platform, action=action, target=target, result=result
+    )
+    formatter = ctx.obj["formatter"]
+    formatter.print(
+        {"status": "recorded", "platform": platform, "action": action, "target": target}
+    )
+
+
+@memory.command("record-learning")
+@click.argument("content")
+@click.argument("topic")
+@click.option("--source", default="cli", help="Source of the learning")
+@click.pass_context
+def memory_record_learning(ctx: click.Context, content: str, topic: str, source: str):
+    """Record something the agent learned.
+
+    Capture insights, discoveries, or key takeaways.
+
+    Examples:
+        moltcli memory record-learning "CLI-first provides better security" "agent-architecture"
+    """
+    from ..utils import get_memory
+
+    memory = get_memory()
+    memory.record_learning(content=content, topic=topic, source=source)
+    formatter = ctx.obj["formatter"]
+    formatter.print({"status": "recorded", "topic": topic})
+
+
+@memory.command("update-context")
+@click.argument("topic")
+@click.argument("details")
+@click.pass_context
+def memory_update_context(ctx: click.Context, topic: str, details: str):
+    """Update current context or preferences.
+
+    Set ongoing topics, current interests, or agent state.
+
+    Examples:
+        moltcli memory update-context "interest" "exploring decentralized identity"
+    """
+    from ..utils import get_memory
+
+    memory = get_memory()
+    memory.update_context(topic=topic, details=details)
+    formatter = ctx.obj["formatter"]
+    formatter.print({"status": "updated", "topic": topic})
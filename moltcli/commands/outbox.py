@@ -0,0 +1,61 @@
+"""Outbox commands."""
+
+import sys
+from typing import Optional
+import click
+
+from ..cli import ensure_client, echo_stream
+from ..utils.errors import handle_error
+from ..utils.formatter import OutputFormatter
+
+
+@click.group()
+def outbox():
+    """Queue posts locally and publish them as rate limits allow.
+
+    Queue with 'moltcli post create --enqueue ...', then run
+    'moltcli outbox drain' to publish and auto-verify them.
+    """
+    pass
+
+
+@outbox.command("list")
+@click.option(
+    "--state",
+    default="pending",
+    type=click.Choice(["pending", "active", "failed"]),
+    help="Queue state to list",
+)
+@click.pass_context
+def outbox_list(ctx: click.Context, state: str):
+    """List queued posts."""
+    from ..utils.outbox import Outbox
+
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    queue = Outbox()
+    formatter.print({"counts": queue.counts(), state: queue.items(state)})
+
+
+@outbox.command("drain")
+@click.option("--once", is_flag=True, help="Stop at the first rate limit instead of waiting")
+@click.option("--max-items", type=click.IntRange(1), help="Stop after publishing this many")
+@click.option("--no-memory", is_flag=True, help="Don't record outcomes in local memory")
+@click.pass_context
+def outbox_drain(ctx: click.Context, once: bool, max_items: Optional[int], no_memory: bool):
+    """Publish queued posts, oldest first, as JSON lines.
+
+    Waits out the post rate limit between posts unless --once is given.
+    """
+    from ..core.outbox import OutboxCore
+    from ..utils.memory import MemoryStore
+
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        core = OutboxCore(client, memory=None if no_memory else MemoryStore())
+        echo_stream(core.drain(wait=not once, max_items=max_items))
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
@@ -0,0 +1,167 @@
+"""Post commands."""
+
+import sys
+import click
+
+from ..cli import ensure_client, ensure_mirror, offline_option
+from ..core.post import PostCore
+from ..utils.errors import NotFoundError, handle_error
+from ..utils.formatter import OutputFormatter
+
+
+@click.group()
+def post():
+    """Post operations."""
+    pass
+
+
+@post.command("create")
+@click.option("--submolt", required=True, help="Submolt name")
+@click.option("--title", required=True, help="Post title")
+@click.option("--content", required=True, help="Post content")
+@click.option("--url", help="Post URL")
+@click.option(
+    "--auto-verify", is_flag=True, help="Solve the verification challenge and verify immediately"
+)
+@click.option(
+    "--enqueue", is_flag=True, help="Queue in the local outbox; publish with 'outbox drain'"
+)
+@click.pass_context
+def post_create(
+    ctx: click.Context,
+    submolt: str,
+    title: str,
+    content: str,
+    url: str,
+    auto_verify: bool,
+    enqueue: bool,
+):
+    """Create a new post."""
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    if enqueue:
+        from ..utils.outbox import Outbox
+
+        item = Outbox().enqueue(submolt, title, content=content, url=url)
+        formatter.print({"success": True, "queued": True, "id": item["id"]})
+        return
+
+    client = ensure_client(ctx)
+    try:
+        if auto_verify:
+            # 自动解题并立即验证；解不出来时输出 challenge 供手动 verify
+            formatter.print(
+                PostCore(client).create_and_verify(
+                    submolt=submolt, title=title, content=content, url=url
+                )
+            )
+            return
+
+        result = PostCore(client).create(
+            submolt=submolt, title=title, content=content, url=url
+        )
+
+        if result.get("verification_required"):
+            # 需要验证时，只有 --need-more-rate 才打印信息
+            if ctx.obj.get("need_more_rate"):
+                formatter.print(
+                    {
+                        "success": True,
+                        "verification_required": True,
+                        "verification": result.get("verification", {}),
+                    }
+                )
+            # 否则不打印任何东西（verification_pending）
+        else:
+            # 不需要验证时，直接发布
+            formatter.print(
+                {
+                    "success": True,
+                    "post_id": result.get("post", {}).get("id"),
+                    "url": result.get("post", {}).get("url"),
+                }
+            )
+
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@post.command("verify")
+@click.argument("verification_code")
+@click.argument("answer")
+@click.pass_context
+def post_verify(ctx: click.Context, verification_code: str, answer: str):
+    """Verify a post with answer to challenge.
+
+    Usage:
+        moltcli post create --submolt X --title Y --content Z
+        moltcli post verify VERIFICATION_CODE ANSWER
+    """
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = PostCore(client).verify(verification_code, answer)
+
+        if result.get("success"):
+            click.echo("✅ Post published successfully!")
+            formatter.print(result)
+        else:
+            click.echo("❌ Verification failed!")
+            formatter.print(result)
+
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@post.command("get")
+@click.argument("post_id")
+@offline_option
+@click.pass_context
+def post_get(ctx: click.Context, post_id: str, offline: bool):
+    """Get a post by ID."""
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        if offline:
+            mirror = ensure_mirror(ctx)
+            mirrored = mirror.post(post_id)
+            if mirrored is None:
+                raise NotFoundError("post")
+            formatter.print(
+                {
+                    "success": True,
+                    "post": mirrored,
+                    "history": mirror.history(post_id),
+                    "offline": True,
+                }
+            )
+            return
+        client = ensure_client(ctx)
+        result = PostCore(client).get(post_id)
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@post.command("delete")
+@click.argument("post_id")
+@click.pass_context
+def post_delete(ctx: click.Context, post_id: str):
+    """Delete a post."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = PostCore(client).delete(post_id)
+        formatter.print({"status": "deleted", "id": post_id})
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
@@ -0,0 +1,57 @@
+"""Search commands."""
+
+import sys
+from typing import Optional
+import click
+
+from ..cli import ensure_client, echo_stream, all_options, streaming
+from ..core.search import SearchCore
+from ..utils.errors import handle_error
+from ..utils.formatter import OutputFormatter
+
+
+@click.group()
+def search():
+    """Search operations."""
+    pass
+
+
+@search.command("query")
+@click.argument("query")
+@click.option(
+    "--type",
+    "search_type",
+    type=click.Choice(["posts", "users"]),
+    default="posts",
+    help="Search type",
+)
+@click.option("--limit", default=20, help="Max results (page size with --all)")
+@all_options
+@click.pass_context
+def search_query(
+    ctx: click.Context,
+    query: str,
+    search_type: str,
+    limit: int,
+    fetch_all: bool,
+    max_items: Optional[int],
+):
+    """Search posts or users."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        if streaming(ctx, fetch_all):
+            cap = max_items if fetch_all else limit
+            echo_stream(
+                SearchCore(client).iter_search(
+                    query, type_=search_type, page_size=limit, max_items=cap
+                )
+            )
+            return
+        result = SearchCore(client).search(query=query, type_=search_type, limit=limit)
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
@@ -0,0 +1,128 @@
+"""Latency stats command."""
+
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+import click
+
+from ..utils.errors import handle_error
+from ..utils.formatter import OutputFormatter
+
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_window(value: str) -> Optional[float]:
+    """Window like "15m", "24h" or "7d" in seconds; None for "all"."""
+    if value == "all":
+        return None
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([smhd])", value)
+    if not match:
+        raise click.BadParameter(f"{value!r} (use e.g. 15m, 24h, 7d or all)")
+    return float(match.group(1)) * _UNITS[match.group(2)]
+
+
+def _table(summary: dict) -> str:
+    header = ("route", "n", "err", "429", "retry", "p50 ms", "p90 ms", "p99 ms")
+    rows = [
+        (
+            name,
+            str(s["count"]),
+            str(s["errors"]),
+            str(s["rate_limited"]),
+            str(s["retries"]),
+            f"{s['p50_ms']:.1f}",
+            f"{s['p90_ms']:.1f}",
+            f"{s['p99_ms']:.1f}",
+        )
+        for name, s in summary.items()
+    ]
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        )
+        for row in [header, *rows]
+    )
+
+
+@click.command()
+@click.option(
+    "--window",
+    "-w",
+    "windows",
+    multiple=True,
+    help="Time window: 15m, 24h, 7d or all (repeatable; default: 1h and 24h)",
+)
+@click.option(
+    "--prometheus",
+    is_flag=True,
+    help="Print Prometheus text format (cumulative over the whole file unless --window is given)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    help="With --prometheus, write atomically to this file (for a textfile collector)",
+)
+@click.option("--clear", is_flag=True, help="Delete the recorded stats")
+@click.option(
+    "--path",
+    type=click.Path(dir_okay=False),
+    help="Stats file (default: ~/.config/moltcli/stats.ndjson)",
+)
+@click.pass_context
+def stats(
+    ctx: click.Context,
+    windows: Tuple[str, ...],
+    prometheus: bool,
+    output: Optional[str],
+    clear: bool,
+    path: Optional[str],
+):
+    """Show recorded API latency per endpoint.
+
+    Requests are recorded when the config file has "stats": true. Shows
+    counts, errors, 429s and p50/p90/p99 latency per endpoint.
+    """
+    from ..utils.stats import LatencyStats
+
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        store = LatencyStats(path)
+        if clear:
+            store.clear()
+            formatter.print({"success": True, "cleared": str(store.path)})
+            return
+        if prometheus:
+            window = parse_window(windows[0]) if windows else None
+            text = store.prometheus(window)
+            if output:
+                # Write then rename, so the collector never reads a partial file
+                target = Path(output)
+                tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+                tmp.write_text(text, encoding="utf-8")
+                os.replace(tmp, target)
+            else:
+                click.echo(text, nl=False)
+            return
+        if output:
+            raise click.UsageError("--output requires --prometheus")
+        summaries = {
+            window: store.summary(parse_window(window)) for window in windows or ("1h", "24h")
+        }
+        if ctx.obj["json_mode"]:
+            formatter.print({"success": True, "path": str(store.path), "windows": summaries})
+            return
+        for window, summary in summaries.items():
+            click.echo(f"Last {window}:" if window != "all" else "All recorded:")
+            click.echo(_table(summary) if summary else "  (no requests)")
+        if not any(summaries.values()):
+            click.echo('Enable recording with "stats": true in the config file.')
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
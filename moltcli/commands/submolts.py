@@ -0,0 +1,192 @@
+"""Submolt commands."""
+
+import sys
+from typing import Optional
+import click
+
+from ..cli import (
+    ensure_client,
+    ensure_mirror,
+    echo_offline,
+    echo_stream,
+    all_options,
+    offline_limit,
+    offline_option,
+    streaming,
+)
+from ..core.pagination import page_items
+from ..core.submolts import SubmoltsCore
+from ..utils.errors import handle_error
+from ..utils.formatter import OutputFormatter
+
+
+@click.group()
+def submolts():
+    """Submolt operations."""
+    pass
+
+
+@submolts.command("list")
+@click.option("--limit", default=50, help="Max submolts to show")
+@offline_option
+@click.pass_context
+def submolts_list(ctx: click.Context, limit: int, offline: bool):
+    """List all submolts."""
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        if offline:
+            echo_offline(ctx, "submolts", ensure_mirror(ctx).submolts(limit=limit))
+            return
+        client = ensure_client(ctx)
+        result = SubmoltsCore(client).list(limit=limit)
+        if streaming(ctx):
+            echo_stream(page_items(result, "submolts"))
+            return
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@submolts.command("get")
+@click.argument("name")
+@click.pass_context
+def submolts_get(ctx: click.Context, name: str):
+    """Get submolt info."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = SubmoltsCore(client).get(name)
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@submolts.command("create")
+@click.argument("name")
+@click.argument("display_name")
+@click.option("--description", default="", help="Submolt description")
+@click.pass_context
+def submolts_create(ctx: click.Context, name: str, display_name: str, description: str):
+    """Create a new submolt."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = SubmoltsCore(client).create(name, display_name, description)
+        formatter.print(
+            {"status": "created", "name": name, "display_name": display_name}
+        )
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@submolts.command("feed")
+@click.argument("name")
+@click.option(
+    "--sort",
+    type=click.Choice(["hot", "new", "top", "rising"]),
+    default="hot",
+    help="Sort order",
+)
+@click.option("--limit", default=20, help="Max posts (page size with --all)")
+@all_options
+@offline_option
+@click.pass_context
+def submolts_feed(
+    ctx: click.Context,
+    name: str,
+    sort: str,
+    limit: int,
+    fetch_all: bool,
+    max_items: Optional[int],
+    offline: bool,
+):
+    """Get posts from a submolt."""
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        if offline:
+            from ..utils.mirror import listing_key
+
+            posts = ensure_mirror(ctx).listing(
+                listing_key("submolt", sort, name), limit=offline_limit(limit, fetch_all, max_items)
+            )
+            echo_offline(ctx, "posts", posts, fetch_all)
+            return
+        client = ensure_client(ctx)
+        if streaming(ctx, fetch_all):
+            cap = max_items if fetch_all else limit
+            echo_stream(
+                SubmoltsCore(client).iter_feed(
+                    name, sort=sort, page_size=limit, max_items=cap
+                )
+            )
+            return
+        result = SubmoltsCore(client).feed(name, sort=sort, limit=limit)
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@submolts.command("subscribe")
+@click.argument("name")
+@click.pass_context
+def submolts_subscribe(ctx: click.Context, name: str):
+    """Subscribe to a submolt."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = SubmoltsCore(client).subscribe(name)
+        formatter.print({"status": "subscribed", "name": name})
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@submolts.command("unsubscribe")
+@click.argument("name")
+@click.pass_context
+def submolts_unsubscribe(ctx: click.Context, name: str):
+    """Unsubscribe from a submolt."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = SubmoltsCore(client).unsubscribe(name)
+        formatter.print({"status": "unsubscribed", "name": name})
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@submolts.command("trending")
+@click.option("--limit", default=10, help="Max submolts to show")
+@click.pass_context
+def submolts_trending(ctx: click.Context, limit: int):
+    """Get trending submolts."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = SubmoltsCore(client).trending(limit=limit)
+        if streaming(ctx):
+            echo_stream(page_items(result, "submolts"))
+            return
+        formatter.print(result)
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
@@ -0,0 +1,94 @@
+"""Sync commands."""
+
+import sys
+from typing import Optional
+import click
+
+from ..cli import ensure_client, ensure_mirror
+from ..utils.errors import handle_error
+from ..utils.formatter import OutputFormatter
+
+
+@click.group()
+def sync():
+    """Mirror feeds locally for --offline reads.
+
+    Synced listings are served by 'feed', 'submolts feed', 'submolts list',
+    'comment list' and 'post get' with --offline. Re-running a sync of a
+    'new' listing fetches only posts newer than the last one.
+    """
+    pass
+
+
+def _run(ctx: click.Context, method: str, *args, **kwargs) -> None:
+    """Run one SyncCore method and print its stats."""
+    from ..core.sync import SyncCore
+
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        core = SyncCore(ensure_client(ctx), ensure_mirror(ctx))
+        formatter.print({"success": True, **getattr(core, method)(*args, **kwargs)})
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@sync.command("feed")
+@click.option(
+    "--sort", type=click.Choice(["hot", "new"]), default="new", help="Sort order"
+)
+@click.option("--submolt", help="Filter by submolt")
+@click.option(
+    "--max-items",
+    type=click.IntRange(1),
+    help="Max posts to fetch (default: 100, or back to the last sync for 'new')",
+)
+@click.pass_context
+def sync_feed(ctx: click.Context, sort: str, submolt: str, max_items: Optional[int]):
+    """Sync the main feed."""
+    _run(ctx, "sync_feed", sort=sort, submolt=submolt, max_items=max_items)
+
+
+@sync.command("submolt")
+@click.argument("name")
+@click.option(
+    "--sort",
+    type=click.Choice(["hot", "new", "top", "rising"]),
+    default="new",
+    help="Sort order",
+)
+@click.option(
+    "--max-items",
+    type=click.IntRange(1),
+    help="Max posts to fetch (default: 100, or back to the last sync for 'new')",
+)
+@click.pass_context
+def sync_submolt(ctx: click.Context, name: str, sort: str, max_items: Optional[int]):
+    """Sync a submolt's feed."""
+    _run(ctx, "sync_submolt", name, sort=sort, max_items=max_items)
+
+
+@sync.command("comments")
+@click.argument("post_id")
+@click.pass_context
+def sync_comments(ctx: click.Context, post_id: str):
+    """Sync all comments on a post."""
+    _run(ctx, "sync_comments", post_id)
+
+
+@sync.command("submolts")
+@click.option("--limit", default=100, help="Max submolts to fetch")
+@click.pass_context
+def sync_submolts(ctx: click.Context, limit: int):
+    """Sync the submolt list."""
+    _run(ctx, "sync_submolts", limit=limit)
+
+
+@sync.command("status")
+@click.pass_context
+def sync_status(ctx: click.Context):
+    """Show mirrored counts and when each listing was synced."""
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    formatter.print(ensure_mirror(ctx).status())
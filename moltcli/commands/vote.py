@@ -0,0 +1,193 @@
+"""Vote commands."""
+
+import sys
+import click
+
+from ..cli import ensure_client, echo_stream
+from ..core.vote import VoteCore
+from ..utils.errors import handle_error
+from ..utils.formatter import OutputFormatter
+
+
+@click.group()
+def vote():
+    """Vote operations."""
+    pass
+
+
+@vote.command("up")
+@click.argument("item_id")
+@click.option(
+    "--type",
+    "item_type",
+    type=click.Choice(["post", "comment"]),
+    default="post",
+    help="Item type",
+)
+@click.pass_context
+def vote_up(ctx: click.Context, item_id: str, item_type: str):
+    """Upvote a post or comment."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = VoteCore(client).upvote(item_id, type_=item_type)
+        formatter.print({"status": "upvoted", "id": item_id, "type": item_type})
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@vote.command("down")
+@click.argument("item_id")
+@click.option(
+    "--type",
+    "item_type",
+    type=click.Choice(["post", "comment"]),
+    default="post",
+    help="Item type",
+)
+@click.pass_context
+def vote_down(ctx: click.Context, item_id: str, item_type: str):
+    """Downvote a post or comment."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = VoteCore(client).downvote(item_id, type_=item_type)
+        formatter.print({"status": "downvoted", "id": item_id, "type": item_type})
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@vote.command("up-comment")
+@click.argument("comment_id")
+@click.pass_context
+def vote_up_comment(ctx: click.Context, comment_id: str):
+    """Upvote a comment."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = VoteCore(client).upvote_comment(comment_id)
+        formatter.print({"status": "upvoted", "id": comment_id, "type": "comment"})
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+@vote.command("down-comment")
+@click.argument("comment_id")
+@click.pass_context
+def vote_down_comment(ctx: click.Context, comment_id: str):
+    """Downvote a comment."""
+    client = ensure_client(ctx)
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    try:
+        result = VoteCore(client).downvote_comment(comment_id)
+        formatter.print({"status": "downvoted", "id": comment_id, "type": "comment"})
+    except Exception as e:
+        if ctx.obj["json_mode"]:
+            formatter.print(handle_error(e))
+            sys.exit(1)
+        raise
+
+
+def _parse_vote_spec(spec: str, direction: str, item_type: str):
+    """Parse 'ID [up|down] [post|comment]' into a vote tuple."""
+    fields = spec.replace(",", " ").split()
+    if not fields:
+        return None
+    for field in fields[1:]:
+        if field in ("up", "down"):
+            direction = field
+        elif field in ("post", "comment"):
+            item_type = field
+        else:
+            raise click.BadParameter(f"Invalid vote spec: {spec!r}")
+    return fields[0], direction, item_type
+
+
+@vote.command("batch")
+@click.argument("item_ids", nargs=-1)
+@click.option(
+    "--file",
+    "input_file",
+    type=click.File("r"),
+    help="Read items from file ('-' for stdin), one 'ID [up|down] [post|comment]' per line",
+)
+@click.option(
+    "--direction",
+    type=click.Choice(["up", "down"]),
+    default="up",
+    help="Default vote direction",
+)
+@click.option(
+    "--type",
+    "item_type",
+    type=click.Choice(["post", "comment"]),
+    default="post",
+    help="Default item type",
+)
+@click.option("--workers", default=8, type=click.IntRange(1), help="Concurrent requests")
+@click.pass_context
+def vote_batch(
+    ctx: click.Context,
+    item_ids: tuple,
+    input_file,
+    direction: str,
+    item_type: str,
+    workers: int,
+):
+    """Vote on many posts or comments at once.
+
+    Streams one JSON result line per item as votes complete. A malformed
+    line gets an error record and the rest of the batch still runs.
+
+    Examples:
+        moltcli vote batch post_1 post_2 post_3
+        moltcli vote batch --file ids.txt --direction down
+        cat ids.txt | moltcli vote batch --file - --workers 16
+    """
+    client = ensure_client(ctx)
+
+    def specs():
+        yield from item_ids
+        if input_file is not None:
+            yield from input_file
+        elif not item_ids and not sys.stdin.isatty():
+            yield from sys.stdin
+
+    invalid = []
+
+    def items():
+        for spec in specs():
+            try:
+                item = _parse_vote_spec(spec, direction, item_type)
+            except click.BadParameter as e:
+                invalid.append({"id": spec.strip(), **handle_error(e)})
+                continue
+            if item:
+                yield item
+
+    failed = 0
+
+    def results():
+        nonlocal failed
+        for result in VoteCore(client).batch(items(), workers=workers):
+            yield from invalid
+            failed += len(invalid)
+            invalid.clear()
+            if result.get("status") == "error":
+                failed += 1
+            yield result
+        yield from invalid
+        failed += len(invalid)
+
+    echo_stream(results())
+    if failed:
+        sys.exit(1)
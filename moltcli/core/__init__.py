@@ -1,13 +1,45 @@
-"""MoltCLI core business logic."""
+"""MoltCLI core business logic.
+
+Exports are resolved lazily (PEP 562) so importing one Core class does not
+import the others or the optional async client.
+"""
+
+import importlib
+
+# public name -> submodule defining it
+_EXPORTS = {
+    "PostCore": ".post",
+    "CommentCore": ".comment",
+    "FeedCore": ".feed",
+    "SearchCore": ".search",
+    "VoteCore": ".vote",
+    "SubmoltsCore": ".submolts",
+    "AuthCore": ".auth",
+    "AgentCore": ".agent",
+    "OutboxCore": ".outbox",
+    "SyncCore": ".sync",
+    "AsyncFeedCore": ".aio",
+    "AsyncPostCore": ".aio",
+    "AsyncCommentCore": ".aio",
+    "AsyncVoteCore": ".aio",
+    "AsyncSearchCore": ".aio",
+    "AsyncSubmoltsCore": ".aio",
+    "AsyncAgentCore": ".aio",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
 
-from .post import PostCore
-from .comment import CommentCore
-from .feed import FeedCore
-from .search import SearchCore
-from .vote import VoteCore
-from .submolts import SubmoltsCore
-from .auth import AuthCore
-from .agent import AgentCore
 
 __all__ = [
     "PostCore",
@@ -18,4 +50,13 @@ __all__ = [
     "SubmoltsCore",
     "AuthCore",
     "AgentCore",
+    "OutboxCore",
+    "SyncCore",
+    "AsyncFeedCore",
+    "AsyncPostCore",
+    "AsyncCommentCore",
+    "AsyncVoteCore",
+    "AsyncSearchCore",
+    "AsyncSubmoltsCore",
+    "AsyncAgentCore",
 ]
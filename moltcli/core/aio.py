@@ -0,0 +1,199 @@
+"""Async variants of the Core classes.
+
+The sync Core methods build the endpoint and return whatever the client
+returns, so bound to an AsyncMoltbookClient they already return awaitables.
+These subclasses only override methods that post-process a response, and
+swap in the async paginator so ``iter_*`` methods are async iterators.
+
+Example:
+    async with AsyncMoltbookClient(api_key) as client:
+        votes = AsyncVoteCore(client)
+        await asyncio.gather(*(votes.upvote(pid) for pid in post_ids))
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Iterable, List, Optional, Tuple
+
+from ..models import Comment
+from ..utils.async_client import AsyncMoltbookClient
+from ..utils.errors import RateLimitError, handle_error
+from .agent import AgentCore
+from .comment import CommentCore, walk_tree
+from .feed import FeedCore
+from .pagination import afetch_pages, aiter_pages
+from .post import PostCore, _elapsed_ms, _solve_verification, _verified_result
+from .search import SearchCore
+from .submolts import SubmoltsCore
+from .vote import VoteCore, _Pause
+
+
+class AsyncFeedCore(FeedCore):
+    """Handle feed operations asynchronously."""
+
+    _paginate = staticmethod(aiter_pages)
+
+    def __init__(self, client: AsyncMoltbookClient):
+        self._client = client
+
+
+class AsyncPostCore(PostCore):
+    """Handle post operations asynchronously."""
+
+    _paginate = staticmethod(aiter_pages)
+
+    def __init__(self, client: AsyncMoltbookClient):
+        self._client = client
+
+    async def create_and_verify(
+        self,
+        submolt: str,
+        title: str,
+        content: Optional[str] = None,
+        url: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+    ) -> dict:
+        """Create a post and answer its verification challenge straight away."""
+        timings = {}
+        start = time.perf_counter()
+        created = await self.create(submolt, title, content=content, url=url)
+        timings["create"] = _elapsed_ms(start)
+
+        code, answer, early = _solve_verification(created, min_confidence, timings, start)
+        if early is not None:
+            return early
+
+        step = time.perf_counter()
+        try:
+            result = await self.verify(code, answer)
+        except Exception as e:
+            # The post exists now (a wrong answer is a 400): report it
+            # unverified with its challenge rather than raise
+            result = {"success": False, "error": str(e)}
+        timings["verify"] = _elapsed_ms(step)
+        timings["total"] = _elapsed_ms(start)
+        return _verified_result(created, result, answer, timings)
+
+
+class AsyncCommentCore(CommentCore):
+    """Handle comment operations asynchronously."""
+
+    _paginate = staticmethod(aiter_pages)
+
+    def __init__(self, client: AsyncMoltbookClient):
+        self._client = client
+
+    async def iter_tree(
+        self,
+        post_id: str,
+        page_size: int = 50,
+        workers: int = 8,
+        models: bool = False,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """Iterate a post's whole comment tree depth-first."""
+        comments = await afetch_pages(
+            lambda offset, limit: self.list_by_post(post_id, limit=limit, offset=offset),
+            "comments",
+            page_size=page_size,
+            workers=workers,
+        )
+        for depth, comment in walk_tree(comments):
+            yield depth, Comment.from_dict(comment) if models else comment
+
+
+class AsyncVoteCore(VoteCore):
+    """Handle vote operations asynchronously."""
+
+    def __init__(self, client: AsyncMoltbookClient):
+        self._client = client
+
+    async def batch(
+        self,
+        items: Iterable[Tuple[str, str, str]],
+        workers: int = 8,
+        max_retries: int = 3,
+        max_wait: float = 60,
+    ) -> List[dict]:
+        """Vote on many items with at most ``workers`` requests in flight.
+
+        Per-item results and rate-limit pauses match VoteCore.batch, but
+        the results are returned together, in input order.
+        """
+        semaphore = asyncio.Semaphore(max(1, workers))
+        pause = _Pause()
+
+        async def run(item_id: str, direction: str, type_: str) -> dict:
+            result = {"id": item_id, "type": type_, "direction": direction}
+            async with semaphore:
+                for attempt in range(max_retries + 1):
+                    delay = pause.remaining()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    try:
+                        await self._vote(item_id, direction, type_)
+                        result["status"] = "upvoted" if direction == self.UP else "downvoted"
+                        return result
+                    except RateLimitError as e:
+                        delay = e.retry_after or 1
+                        if attempt == max_retries or delay > max_wait:
+                            result.update(handle_error(e))
+                            return result
+                        pause.extend(delay)
+                    except Exception as e:
+                        result.update(handle_error(e))
+                        return result
+            return result
+
+        return await asyncio.gather(*(run(*item) for item in items))
+
+
+class AsyncSearchCore(SearchCore):
+    """Handle search operations asynchronously."""
+
+    _paginate = staticmethod(aiter_pages)
+
+    def __init__(self, client: AsyncMoltbookClient):
+        self._client = client
+
+
+class AsyncSubmoltsCore(SubmoltsCore):
+    """Handle submolt operations asynchronously."""
+
+    _paginate = staticmethod(aiter_pages)
+
+    def __init__(self, client: AsyncMoltbookClient):
+        self._client = client
+
+
+class AsyncAgentCore(AgentCore):
+    """Handle agent operations asynchronously."""
+
+    def __init__(self, client: AsyncMoltbookClient):
+        self._client = client
+
+    async def get_feed(self, name: str, limit: int = 20) -> dict:
+        """Get posts from a specific agent.
+
+        Args:
+            name: Agent name
+            limit: Number of posts to return (default: 20)
+
+        Returns:
+            Agent info and posts array.
+        """
+        profile = await self.get_profile(name)
+        return {
+            "agent": profile.get("agent"),
+            "posts": profile.get("recentPosts", [])[:limit]
+        }
+
+
+__all__ = [
+    "AsyncFeedCore",
+    "AsyncPostCore",
+    "AsyncCommentCore",
+    "AsyncVoteCore",
+    "AsyncSearchCore",
+    "AsyncSubmoltsCore",
+    "AsyncAgentCore",
+]
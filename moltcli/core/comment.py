@@ -1,12 +1,49 @@
 """Comment core logic."""
 
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from ..utils.api_client import MoltbookClient
+from ..models import Comment
+from .pagination import fetch_pages, iter_pages
+
+
+def walk_tree(comments: Iterable[dict]) -> Iterator[Tuple[int, dict]]:
+    """Yield (depth, comment) pairs depth-first, replies under their parent.
+
+    Built from ``parent_id`` in one pass over the comments. Siblings keep
+    their listing order; replies whose parent is missing (deleted, or not
+    returned) are shown at the top level.
+    """
+    comments = list(comments)
+    ids = {c.get("id") for c in comments}
+    children: Dict[Any, List[dict]] = {}
+    roots = []
+    for c in comments:
+        parent = c.get("parent_id")
+        if parent is not None and parent in ids and parent != c.get("id"):
+            children.setdefault(parent, []).append(c)
+        else:
+            roots.append(c)
+    seen = set()
+    # Parent cycles leave comments unreachable from a root; walk those last
+    for start in roots + comments:
+        if id(start) in seen:
+            continue
+        stack = [(0, start)]
+        while stack:
+            depth, comment = stack.pop()
+            if id(comment) in seen:
+                continue
+            seen.add(id(comment))
+            yield depth, comment
+            replies = children.get(comment.get("id"), ())
+            stack.extend((depth + 1, reply) for reply in reversed(replies))
 
 
 class CommentCore:
     """Handle comment operations."""
 
+    _paginate = staticmethod(iter_pages)
+
     def __init__(self, client: MoltbookClient):
         self._client = client
 
@@ -30,6 +67,58 @@ class CommentCore:
         """Delete a comment."""
         return self._client.delete(f"/comments/{comment_id}")
 
-    def list_by_post(self, post_id: str, limit: int = 50) -> dict:
+    def list_by_post(self, post_id: str, limit: int = 50, offset: int = 0) -> dict:
         """List comments for a post."""
-        return self._client.get(f"/posts/{post_id}/comments", params={"limit": limit})
+        params = {"limit": limit}
+        if offset:
+            params["offset"] = offset
+        return self._client.get(f"/posts/{post_id}/comments", params=params)
+
+    def iter_by_post(
+        self,
+        post_id: str,
+        page_size: int = 50,
+        max_items: Optional[int] = None,
+        models: bool = False,
+    ) -> Iterator[dict]:
+        """Iterate a post's comments across pages, prefetching the next page.
+
+        With ``models``, yields Comment models instead of dicts.
+        """
+        return self._paginate(
+            lambda offset, limit: self.list_by_post(post_id, limit=limit, offset=offset),
+            "comments",
+            page_size=page_size,
+            max_items=max_items,
+            parse=Comment.from_dict if models else None,
+        )
+
+    def iter_tree(
+        self,
+        post_id: str,
+        page_size: int = 50,
+        workers: int = 8,
+        models: bool = False,
+    ) -> Iterator[Tuple[int, Any]]:
+        """Iterate a post's whole comment tree depth-first.
+
+        Every page is fetched up front, concurrently (see fetch_pages),
+        then the reply tree is rebuilt from ``parent_id``.
+
+        Args:
+            post_id: Post ID
+            page_size: Comments per request
+            workers: Max concurrent requests
+            models: Yield Comment models instead of dicts
+
+        Yields:
+            (depth, comment) pairs; top-level comments have depth 0.
+        """
+        comments = fetch_pages(
+            lambda offset, limit: self.list_by_post(post_id, limit=limit, offset=offset),
+            "comments",
+            page_size=page_size,
+            workers=workers,
+        )
+        for depth, comment in walk_tree(comments):
+            yield depth, Comment.from_dict(comment) if models else comment
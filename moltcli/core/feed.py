@@ -1,11 +1,15 @@
 """Feed core logic."""
-from typing import Optional
+from typing import Iterator, Optional
 from ..utils.api_client import MoltbookClient
+from ..models import Post
+from .pagination import iter_pages
 
 
 class FeedCore:
     """Handle feed operations."""
 
+    _paginate = staticmethod(iter_pages)
+
     def __init__(self, client: MoltbookClient):
         self._client = client
 
@@ -14,13 +18,36 @@ class FeedCore:
         sort: str = "hot",
         limit: int = 20,
         submolt: Optional[str] = None,
+        offset: int = 0,
     ) -> dict:
         """Get feed posts."""
         params = {"sort": sort, "limit": limit}
         if submolt:
             params["submolt"] = submolt
+        if offset:
+            params["offset"] = offset
         return self._client.get("/feed", params=params)
 
+    def iter_posts(
+        self,
+        sort: str = "hot",
+        submolt: Optional[str] = None,
+        page_size: int = 20,
+        max_items: Optional[int] = None,
+        models: bool = False,
+    ) -> Iterator[dict]:
+        """Iterate feed posts across pages, prefetching the next page.
+
+        With ``models``, yields Post models instead of dicts.
+        """
+        return self._paginate(
+            lambda offset, limit: self.get(sort=sort, limit=limit, submolt=submolt, offset=offset),
+            "posts",
+            page_size=page_size,
+            max_items=max_items,
+            parse=Post.from_dict if models else None,
+        )
+
     def get_hot(self, limit: int = 20) -> dict:
         """Get hot posts."""
         return self.get(sort="hot", limit=limit)
@@ -0,0 +1,103 @@
+"""Outbox core logic."""
+
+import math
+import time
+from typing import Callable, Iterator, Optional
+
+from ..utils.api_client import MoltbookClient
+from ..utils.errors import MoltCLIError, NetworkError, RateLimitError, handle_error
+from ..utils.outbox import Outbox
+from .post import PostCore
+
+
+class OutboxCore:
+    """Publish queued posts as the post rate limit allows."""
+
+    def __init__(
+        self,
+        client: MoltbookClient,
+        outbox: Optional[Outbox] = None,
+        memory=None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize outbox core.
+
+        Args:
+            client: API client
+            outbox: Queue to drain (default: ~/.config/moltcli/outbox)
+            memory: MemoryStore to record outcomes in, or None
+            sleep: Called to wait out rate limits (injectable for tests)
+        """
+        self._client = client
+        self._posts = PostCore(client)
+        self.outbox = outbox or Outbox()
+        self.memory = memory
+        self._sleep = sleep
+
+    def drain(self, wait: bool = True, max_items: Optional[int] = None) -> Iterator[dict]:
+        """Publish queued posts oldest first, yielding one result per post.
+
+        Each post is created and auto-verified. A rate-limited post, or one
+        whose request never left, goes back to the front of the queue; with
+        ``wait`` the drain sleeps until the post bucket refills, otherwise it
+        stops. Posts the server rejects are moved to failed/, and so are
+        posts whose request failed after it was sent (status "unknown"):
+        they may have been published, so requeueing could post them twice.
+
+        Raises:
+            OutboxBusyError: If another drain is running.
+        """
+        published = 0
+        with self.outbox.lock():
+            self.outbox.recover()
+            while max_items is None or published < max_items:
+                item = self.outbox.claim()
+                if item is None:
+                    return
+                try:
+                    result = self._posts.create_and_verify(
+                        item["submolt"],
+                        item["title"],
+                        content=item.get("content"),
+                        url=item.get("url"),
+                    )
+                except (RateLimitError, NetworkError) as e:
+                    if isinstance(e, NetworkError) and e.sent:
+                        # The post may exist already; don't risk a duplicate
+                        error = handle_error(e)
+                        self.outbox.fail(item, error)
+                        self._record(item, "unknown")
+                        yield {**error, "id": item["id"], "status": "unknown"}
+                        continue
+                    self.outbox.release(item)
+                    if not wait:
+                        yield {**handle_error(e), "id": item["id"], "status": "deferred"}
+                        return
+                    self._sleep(_retry_delay(e))
+                    continue
+                except Exception as e:
+                    # Rejected by the server (4xx, or 5xx after retries): park it
+                    error = handle_error(e)
+                    self.outbox.fail(item, error)
+                    self._record(item, "failed")
+                    yield {**error, "id": item["id"], "status": "failed"}
+                    continue
+
+                self.outbox.complete(item)
+                published += 1
+                status = "published" if result.get("verified") else "unverified"
+                self._record(item, "success" if status == "published" else status)
+                yield {"id": item["id"], "status": status, **result}
+
+    def _record(self, item: dict, outcome: str) -> None:
+        if self.memory is not None:
+            self.memory.record_interaction(
+                "moltbook", "post", f"m/{item['submolt']} {item['title']!r}", outcome
+            )
+
+
+def _retry_delay(error: MoltCLIError) -> float:
+    """Seconds to wait before retrying after a rate limit or network error."""
+    if isinstance(error, RateLimitError) and error.retry_after:
+        return max(1.0, math.ceil(error.retry_after))
+    return 30.0
@@ -0,0 +1,236 @@
+"""Lazy offset pagination for list endpoints."""
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional
+
+
+def page_items(response: Any, items_key: str) -> List[dict]:
+    """Extract the item list from a page response."""
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        return response.get(items_key) or []
+    return []
+
+
+def item_key(item: Any) -> Any:
+    """Identity used to drop items repeated across page boundaries."""
+    if isinstance(item, dict):
+        return item.get("id") or item.get("name")
+    return None
+
+
+class _Dedupe:
+    """Track seen item IDs and the max_items budget."""
+
+    def __init__(self, max_items: Optional[int]):
+        self.seen = set()
+        self.remaining = max_items
+
+    def new_items(self, items: List[dict]) -> List[dict]:
+        fresh = []
+        for item in items:
+            key = item_key(item)
+            if key is not None:
+                if key in self.seen:
+                    continue
+                self.seen.add(key)
+            fresh.append(item)
+        if self.remaining is not None:
+            fresh = fresh[: self.remaining]
+            self.remaining -= len(fresh)
+        return fresh
+
+    @property
+    def exhausted(self) -> bool:
+        return self.remaining is not None and self.remaining <= 0
+
+
+def _has_more(response: Any, items: List[dict], page_size: int) -> bool:
+    if isinstance(response, dict) and response.get("has_more") is False:
+        return False
+    return len(items) >= page_size
+
+
+def iter_pages(
+    fetch: Callable[[int, int], dict],
+    items_key: str,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    prefetch: bool = True,
+    parse: Optional[Callable[[dict], Any]] = None,
+) -> Iterator[Any]:
+    """Walk an offset-paginated endpoint lazily.
+
+    While the caller consumes one page, the next one is already being
+    fetched in a background thread. Items repeated across page boundaries
+    (the feed shifts while we read it) are yielded only once.
+
+    Args:
+        fetch: fetch(offset, limit) returning one page response
+        items_key: Response key holding the item list (e.g. "posts")
+        page_size: Items requested per page
+        max_items: Stop after this many items (None = until exhausted)
+        prefetch: Fetch the next page while the current one is consumed
+        parse: Convert each item as it is yielded (e.g. Post.from_dict)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    dedupe = _Dedupe(max_items)
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    offset = 0
+    pending = None
+    try:
+        response = fetch(offset, page_size)
+        while True:
+            items = page_items(response, items_key)
+            more = _has_more(response, items, page_size)
+            offset += len(items)
+            fresh = dedupe.new_items(items)
+            if more and executor is not None and not dedupe.exhausted:
+                pending = executor.submit(fetch, offset, page_size)
+            yield from fresh if parse is None else map(parse, fresh)
+            # A page of nothing but repeats means the listing stopped advancing
+            if not more or dedupe.exhausted or (items and not fresh):
+                return
+            response = pending.result() if pending is not None else fetch(offset, page_size)
+            pending = None
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_pages(
+    fetch: Callable[[int, int], Awaitable[dict]],
+    items_key: str,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    prefetch: bool = True,
+    parse: Optional[Callable[[dict], Any]] = None,
+) -> AsyncIterator[Any]:
+    """Async counterpart of iter_pages; prefetches with an asyncio task."""
+    import asyncio
+
+    dedupe = _Dedupe(max_items)
+    offset = 0
+    pending = None
+    try:
+        response = await fetch(offset, page_size)
+        while True:
+            items = page_items(response, items_key)
+            more = _has_more(response, items, page_size)
+            offset += len(items)
+            fresh = dedupe.new_items(items)
+            if more and prefetch and not dedupe.exhausted:
+                pending = asyncio.ensure_future(fetch(offset, page_size))
+            for item in fresh:
+                yield item if parse is None else parse(item)
+            # A page of nothing but repeats means the listing stopped advancing
+            if not more or dedupe.exhausted or (items and not fresh):
+                return
+            response = await pending if pending is not None else await fetch(offset, page_size)
+            pending = None
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _total(response: Any) -> Optional[int]:
+    """Total item count a page response advertises, if any."""
+    if isinstance(response, dict):
+        total = response.get("total")
+        if isinstance(total, int) and not isinstance(total, bool):
+            return total
+    return None
+
+
+def _next_offsets(offset: int, total: Optional[int], page_size: int, workers: int) -> List[int]:
+    """Offsets of the next batch of pages to fetch at once.
+
+    With a known total that is every remaining page; otherwise (or once the
+    listing grew past it) one page per worker.
+    """
+    if total is not None and offset < total:
+        return list(range(offset, total, page_size))
+    return [offset + i * page_size for i in range(max(1, workers))]
+
+
+def _collect(
+    responses: List[Any], items_key: str, page_size: int, dedupe: "_Dedupe", out: List[dict]
+) -> bool:
+    """Add a batch of pages to ``out`` in order. Returns whether more may follow."""
+    for response in responses:
+        items = page_items(response, items_key)
+        fresh = dedupe.new_items(items)
+        out.extend(fresh)
+        # A page of nothing but repeats means the listing stopped advancing
+        if not _has_more(response, items, page_size) or (items and not fresh):
+            return False
+    return True
+
+
+def fetch_pages(
+    fetch: Callable[[int, int], dict],
+    items_key: str,
+    page_size: int = 50,
+    workers: int = 8,
+) -> List[dict]:
+    """Fetch every page of an offset-paginated endpoint concurrently.
+
+    The first page is fetched alone; if it advertises a ``total``, all
+    remaining pages are then requested at once through a pool of
+    ``workers`` threads, otherwise pages are requested ``workers`` at a
+    time until a short page. Items come back in listing order, with
+    repeats across page boundaries dropped.
+
+    Args:
+        fetch: fetch(offset, limit) returning one page response
+        items_key: Response key holding the item list (e.g. "comments")
+        page_size: Items requested per page
+        workers: Max concurrent requests
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    dedupe = _Dedupe(None)
+    items: List[dict] = []
+    first = fetch(0, page_size)
+    total = _total(first)
+    more = _collect([first], items_key, page_size, dedupe, items)
+    offset = page_size
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while more:
+            offsets = _next_offsets(offset, total, page_size, workers)
+            responses = list(pool.map(lambda o: fetch(o, page_size), offsets))
+            more = _collect(responses, items_key, page_size, dedupe, items)
+            offset = offsets[-1] + page_size
+    return items
+
+
+async def afetch_pages(
+    fetch: Callable[[int, int], Awaitable[dict]],
+    items_key: str,
+    page_size: int = 50,
+    workers: int = 8,
+) -> List[dict]:
+    """Async counterpart of fetch_pages; runs up to ``workers`` requests at once."""
+    import asyncio
+
+    limit = asyncio.Semaphore(max(1, workers))
+
+    async def bounded(offset: int) -> dict:
+        async with limit:
+            return await fetch(offset, page_size)
+
+    dedupe = _Dedupe(None)
+    items: List[dict] = []
+    first = await fetch(0, page_size)
+    total = _total(first)
+    more = _collect([first], items_key, page_size, dedupe, items)
+    offset = page_size
+    while more:
+        offsets = _next_offsets(offset, total, page_size, workers)
+        responses = await asyncio.gather(*(bounded(o) for o in offsets))
+        more = _collect(responses, items_key, page_size, dedupe, items)
+        offset = offsets[-1] + page_size
+    return items
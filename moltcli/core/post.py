@@ -1,13 +1,18 @@
 """Post core logic."""
 
-from typing import Optional
+import time
+from typing import Iterator, Optional, Tuple
 from ..utils.api_client import MoltbookClient
 from ..utils import normalize_submolt_name
+from ..models import Post
+from .pagination import iter_pages
 
 
 class PostCore:
     """Handle post operations."""
 
+    _paginate = staticmethod(iter_pages)
+
     def __init__(self, client: MoltbookClient):
         self._client = client
 
@@ -41,6 +46,25 @@ class PostCore:
             f"/submolts/{submolt}/posts", params={"limit": limit, "offset": offset}
         )
 
+    def iter_by_submolt(
+        self,
+        submolt: str,
+        page_size: int = 20,
+        max_items: Optional[int] = None,
+        models: bool = False,
+    ) -> Iterator[dict]:
+        """Iterate a submolt's posts across pages, prefetching the next page.
+
+        With ``models``, yields Post models instead of dicts.
+        """
+        return self._paginate(
+            lambda offset, limit: self.list_by_submolt(submolt, limit=limit, offset=offset),
+            "posts",
+            page_size=page_size,
+            max_items=max_items,
+            parse=Post.from_dict if models else None,
+        )
+
     def verify(self, verification_code: str, answer: str) -> dict:
         """Verify a post with the answer to challenge.
 
@@ -51,8 +75,116 @@ class PostCore:
         Returns:
             Verified post result
         """
-        return self._client._request(
-            "POST",
-            "/api/v1/verify",
+        return self._client.post(
+            "/verify",
             json_data={"verification_code": verification_code, "answer": answer},
         )
+
+    def create_and_verify(
+        self,
+        submolt: str,
+        title: str,
+        content: Optional[str] = None,
+        url: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+    ) -> dict:
+        """Create a post and answer its verification challenge straight away.
+
+        The challenge is solved locally and the answer sent on the same
+        connection, so the post lands well inside the verification window.
+
+        Returns:
+            Combined result with ``verified`` and per-step ``timings_ms``.
+            When the challenge can't be solved confidently, ``verified`` is
+            False and the ``verification`` block is returned with a ``reason``
+            so it can be answered by hand.
+        """
+        timings = {}
+        start = time.perf_counter()
+        created = self.create(submolt, title, content=content, url=url)
+        timings["create"] = _elapsed_ms(start)
+
+        code, answer, early = _solve_verification(created, min_confidence, timings, start)
+        if early is not None:
+            return early
+
+        step = time.perf_counter()
+        try:
+            result = self.verify(code, answer)
+        except Exception as e:
+            # The post exists now (a wrong answer is a 400): report it
+            # unverified with its challenge rather than raise
+            result = {"success": False, "error": str(e)}
+        timings["verify"] = _elapsed_ms(step)
+        timings["total"] = _elapsed_ms(start)
+        return _verified_result(created, result, answer, timings)
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def _solve_verification(
+    created: dict, min_confidence: Optional[float], timings: dict, start: float
+) -> Tuple[Optional[str], Optional[str], Optional[dict]]:
+    """Solve the challenge in a create response.
+
+    Returns (verification_code, answer, None) when the post should be
+    verified, or (None, None, result) when there is nothing to send.
+    """
+    from ..utils.challenge import CONFIDENCE_THRESHOLD, auto_solve_challenge
+
+    post = created.get("post") or {}
+    if not created.get("verification_required"):
+        timings["total"] = timings["create"]
+        return None, None, {
+            "success": True,
+            "post_id": post.get("id"),
+            "url": post.get("url"),
+            "verified": True,
+            "timings_ms": timings,
+        }
+
+    verification = created.get("verification") or {}
+    challenge = verification.get("challenge") or verification.get("question") or ""
+    code = verification.get("verification_code") or created.get("verification_code")
+
+    step = time.perf_counter()
+    solved, answer = auto_solve_challenge(
+        challenge,
+        min_confidence=CONFIDENCE_THRESHOLD if min_confidence is None else min_confidence,
+    )
+    timings["solve"] = _elapsed_ms(step)
+
+    if solved and code:
+        return code, answer, None
+
+    timings["total"] = _elapsed_ms(start)
+    return None, None, {
+        "success": True,
+        "post_id": post.get("id"),
+        "verified": False,
+        "verification_required": True,
+        "verification": verification,
+        "reason": answer if not solved else "No verification code in response",
+        "timings_ms": timings,
+    }
+
+
+def _verified_result(created: dict, result: dict, answer: str, timings: dict) -> dict:
+    """Combine the create and verify responses."""
+    post = result.get("post") or created.get("post") or {}
+    ok = bool(result.get("success"))
+    combined = {
+        "success": ok,
+        "post_id": post.get("id"),
+        "url": post.get("url"),
+        "verified": ok,
+        "answer": answer,
+        "timings_ms": timings,
+    }
+    if not ok:
+        error = result.get("error") or result.get("message")
+        combined["verification"] = {**(created.get("verification") or {}), "error": error}
+        combined["error"] = error
+    return combined
@@ -1,10 +1,15 @@
 """Search core logic."""
+from typing import Iterator, Optional
 from ..utils.api_client import MoltbookClient
+from ..models import Agent, Post
+from .pagination import iter_pages
 
 
 class SearchCore:
     """Handle search operations."""
 
+    _paginate = staticmethod(iter_pages)
+
     def __init__(self, client: MoltbookClient):
         self._client = client
 
@@ -13,10 +18,32 @@ class SearchCore:
         query: str,
         type_: str = "posts",
         limit: int = 20,
+        offset: int = 0,
     ) -> dict:
         """Search posts and users."""
-        return self._client.get(
-            "/search", params={"q": query, "type": type_, "limit": limit}
+        params = {"q": query, "type": type_, "limit": limit}
+        if offset:
+            params["offset"] = offset
+        return self._client.get("/search", params=params)
+
+    def iter_search(
+        self,
+        query: str,
+        type_: str = "posts",
+        page_size: int = 20,
+        max_items: Optional[int] = None,
+        models: bool = False,
+    ) -> Iterator[dict]:
+        """Iterate search results across pages, prefetching the next page.
+
+        With ``models``, yields Post (or Agent, for users) models.
+        """
+        return self._paginate(
+            lambda offset, limit: self.search(query, type_=type_, limit=limit, offset=offset),
+            "results",
+            page_size=page_size,
+            max_items=max_items,
+            parse=(Post if type_ == "posts" else Agent).from_dict if models else None,
         )
 
     def search_posts(self, query: str, limit: int = 20) -> dict:
@@ -1,10 +1,15 @@
 """Submolts core logic."""
+from typing import Iterator, Optional
 from ..utils.api_client import MoltbookClient
+from ..models import Post
+from .pagination import iter_pages
 
 
 class SubmoltsCore:
     """Handle submolt operations."""
 
+    _paginate = staticmethod(iter_pages)
+
     def __init__(self, client: MoltbookClient):
         self._client = client
 
@@ -30,17 +35,38 @@ class SubmoltsCore:
             "description": description,
         })
 
-    def feed(self, name: str, sort: str = "hot", limit: int = 20) -> dict:
+    def feed(self, name: str, sort: str = "hot", limit: int = 20, offset: int = 0) -> dict:
         """Get feed from a specific submolt.
 
         Args:
             name: Submolt name
             sort: Sort order (hot, new, top, rising)
             limit: Max posts to return
+            offset: Number of posts to skip
+        """
+        params = {"sort": sort, "limit": limit}
+        if offset:
+            params["offset"] = offset
+        return self._client.get(f"/submolts/{name}/feed", params=params)
+
+    def iter_feed(
+        self,
+        name: str,
+        sort: str = "hot",
+        page_size: int = 20,
+        max_items: Optional[int] = None,
+        models: bool = False,
+    ) -> Iterator[dict]:
+        """Iterate a submolt's feed across pages, prefetching the next page.
+
+        With ``models``, yields Post models instead of dicts.
         """
-        return self._client.get(
-            f"/submolts/{name}/feed",
-            params={"sort": sort, "limit": limit}
+        return self._paginate(
+            lambda offset, limit: self.feed(name, sort=sort, limit=limit, offset=offset),
+            "posts",
+            page_size=page_size,
+            max_items=max_items,
+            parse=Post.from_dict if models else None,
         )
 
     def subscribe(self, name: str) -> dict:
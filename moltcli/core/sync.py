@@ -0,0 +1,104 @@
+"""Mirror sync core logic."""
+
+from typing import Iterator, Optional
+
+from ..utils.api_client import MoltbookClient
+from ..utils.mirror import CHRONOLOGICAL, Mirror, listing_key
+from .comment import CommentCore
+from .feed import FeedCore
+from .pagination import page_items
+from .submolts import SubmoltsCore
+
+# Posts fetched per sync when there is no high-water mark to stop at
+DEFAULT_WINDOW = 100
+
+
+class SyncCore:
+    """Copy feeds, comments and submolts into the local mirror."""
+
+    def __init__(self, client: MoltbookClient, mirror: Optional[Mirror] = None):
+        self._client = client
+        self.mirror = mirror or Mirror()
+
+    def _sync_listing(self, listing: str, sort: str, posts: Iterator[dict]) -> dict:
+        """Store a listing's posts, stopping at the high-water mark if chronological."""
+        high_water = self.mirror.high_water(listing)
+        incremental = sort in CHRONOLOGICAL and high_water is not None
+        fetched = []
+        for post in posts:
+            if not isinstance(post, dict) or "id" not in post:
+                continue
+            if incremental and (post.get("created_at") or "") <= high_water:
+                if self.mirror.known(listing, str(post["id"])):
+                    break  # Everything from here on is already mirrored
+            fetched.append(post)
+        close = getattr(posts, "close", None)
+        if close is not None:
+            close()  # Stop any prefetch of a page we no longer need
+        counts = self.mirror.store_listing(listing, fetched, replace=not incremental)
+        return {"listing": listing, "fetched": len(fetched), **counts}
+
+    def sync_feed(
+        self,
+        sort: str = "hot",
+        submolt: Optional[str] = None,
+        max_items: Optional[int] = None,
+        page_size: int = 25,
+    ) -> dict:
+        """Sync the main feed (optionally filtered to a submolt).
+
+        Args:
+            sort: Feed sort
+            submolt: Only posts from this submolt
+            max_items: Max posts to fetch (default: DEFAULT_WINDOW on first
+                sync and for ranked sorts, otherwise up to the high-water mark)
+            page_size: Posts per request
+        """
+        listing = listing_key("feed", sort, submolt)
+        posts = FeedCore(self._client).iter_posts(
+            sort=sort,
+            submolt=submolt,
+            page_size=page_size,
+            max_items=self._window(listing, sort, max_items),
+        )
+        return self._sync_listing(listing, sort, posts)
+
+    def sync_submolt(
+        self,
+        name: str,
+        sort: str = "new",
+        max_items: Optional[int] = None,
+        page_size: int = 25,
+    ) -> dict:
+        """Sync one submolt's feed."""
+        listing = listing_key("submolt", sort, name)
+        posts = SubmoltsCore(self._client).iter_feed(
+            name,
+            sort=sort,
+            page_size=page_size,
+            max_items=self._window(listing, sort, max_items),
+        )
+        return self._sync_listing(listing, sort, posts)
+
+    def _window(self, listing: str, sort: str, max_items: Optional[int]) -> Optional[int]:
+        if max_items is not None:
+            return max_items
+        if sort in CHRONOLOGICAL and self.mirror.high_water(listing) is not None:
+            return None  # Walk back until the high-water mark
+        return DEFAULT_WINDOW
+
+    def sync_comments(self, post_id: str, max_items: Optional[int] = None) -> dict:
+        """Sync every comment on a post."""
+        comments = CommentCore(self._client).iter_by_post(post_id, max_items=max_items)
+        stored = self.mirror.store_comments(
+            post_id, (c for c in comments if isinstance(c, dict) and "id" in c)
+        )
+        return {"listing": f"comments/{post_id}", "fetched": stored}
+
+    def sync_submolts(self, limit: int = 100) -> dict:
+        """Sync the submolt directory."""
+        result = SubmoltsCore(self._client).list(limit=limit)
+        items = [
+            s for s in page_items(result, "submolts") if isinstance(s, dict) and s.get("name")
+        ]
+        return {"listing": "submolts", "fetched": self.mirror.store_submolts(items)}
@@ -1,5 +1,11 @@
 """Vote core logic."""
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterable, Iterator, Tuple
+
 from ..utils.api_client import MoltbookClient
+from ..utils.errors import RateLimitError, handle_error
 
 
 class VoteCore:
@@ -42,3 +48,84 @@ class VoteCore:
     def downvote_comment(self, comment_id: str) -> dict:
         """Downvote a comment. Shortcut for: downvote(comment_id, type='comment')"""
         return self._vote(comment_id, self.DOWN, "comment")
+
+    def batch(
+        self,
+        items: Iterable[Tuple[str, str, str]],
+        workers: int = 8,
+        max_retries: int = 3,
+        max_wait: float = 60,
+    ) -> Iterator[dict]:
+        """Vote on many items through a bounded worker pool.
+
+        Items are consumed lazily and at most ``workers * 2`` votes are in
+        flight, so arbitrarily long inputs run in constant memory. On a rate
+        limit, whether a server 429 or the client's governor refusing to
+        wait, every worker pauses for ``retry_after`` and the item is retried.
+
+        Args:
+            items: (item_id, direction, type_) tuples; direction is "up" or
+                "down", type_ is "post" or "comment"
+            workers: Number of concurrent requests
+            max_retries: Retries per item after a rate limit
+            max_wait: Give up instead of pausing longer than this (seconds)
+
+        Yields:
+            One result dict per item, in completion order.
+        """
+        pause = _Pause()
+
+        def run(item_id: str, direction: str, type_: str) -> dict:
+            result = {"id": item_id, "type": type_, "direction": direction}
+            for attempt in range(max_retries + 1):
+                pause.wait()
+                try:
+                    self._vote(item_id, direction, type_)
+                    result["status"] = "upvoted" if direction == self.UP else "downvoted"
+                    return result
+                except RateLimitError as e:
+                    delay = e.retry_after or 1
+                    if attempt == max_retries or delay > max_wait:
+                        result.update(handle_error(e))
+                        return result
+                    pause.extend(delay)
+                except Exception as e:
+                    result.update(handle_error(e))
+                    return result
+            return result
+
+        window = max(1, workers) * 2
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            pending = set()
+            for item in items:
+                pending.add(pool.submit(run, *item))
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+
+class _Pause:
+    """Shared pause that all batch workers honour after a rate limit."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._until = 0.0
+
+    def extend(self, seconds: float) -> None:
+        with self._lock:
+            self._until = max(self._until, time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """Seconds left in the pause (<= 0 when not paused)."""
+        with self._lock:
+            return self._until - time.monotonic()
+
+    def wait(self) -> None:
+        delay = self.remaining()
+        if delay > 0:
+            time.sleep(delay)
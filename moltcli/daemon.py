@@ -0,0 +1,383 @@
+"""Long-running daemon that serves moltcli commands over a Unix socket.
+
+The daemon keeps one warm MoltbookClient (config loaded, connections
+pooled, rate-limit and cache state in memory) and runs ordinary moltcli
+argv against it. The client shim forwards argv and relays the command's
+stdout, stderr, stdin and exit code, so output matches running the
+command directly.
+
+Protocol: newline-delimited JSON over the socket.
+    client -> {"op": "run", "argv": [...], "cwd": "...", "stdin_tty": bool}
+    daemon -> {"out": "..."} / {"err": "..."}   output as it is written
+    daemon -> {"in": true}                      command wants stdin
+    client -> {"stdin": "..."}
+    daemon -> {"exit": 0}
+Control ops: {"op": "ping"} and {"op": "shutdown"}.
+
+Commands run one at a time: they write through the process-wide
+sys.stdout, so concurrent requests queue on a lock.
+
+Only stdlib is imported at module level so the shim stays cheap.
+"""
+
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import List, Optional
+
+SOCKET_PATH = "~/.config/moltcli/daemon.sock"
+
+# Global options that take a value, for locating --via-daemon
+_VALUE_OPTIONS = {"--retries", "--cache-ttl", "--trace-file"}
+
+
+def socket_path(path: Optional[str] = None) -> str:
+    """Resolve the daemon socket path ($MOLTCLI_DAEMON_SOCKET overrides)."""
+    return os.path.expanduser(path or os.environ.get("MOLTCLI_DAEMON_SOCKET", SOCKET_PATH))
+
+
+def _send(sock: socket.socket, message: dict) -> None:
+    sock.sendall((json.dumps(message) + "\n").encode())
+
+
+def _connect(path: str, timeout: Optional[float] = None) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def control(op: str, path: Optional[str] = None, timeout: float = 2.0) -> dict:
+    """Send a control op (ping, shutdown) and return the reply.
+
+    Raises:
+        OSError: If no daemon is listening.
+    """
+    with _connect(socket_path(path), timeout) as sock:
+        _send(sock, {"op": op})
+        line = sock.makefile("rb").readline()
+    if not line:
+        raise ConnectionError("Daemon closed the connection")
+    return json.loads(line)
+
+
+def split_via_daemon(argv: List[str]):
+    """Strip a leading --via-daemon global option.
+
+    Returns:
+        (argv without the flag, whether it was given). Only options before
+        the subcommand are considered, so argument values are left alone.
+    """
+    i = 0
+    while i < len(argv) and argv[i].startswith("-"):
+        if argv[i] == "--via-daemon":
+            return argv[:i] + argv[i + 1:], True
+        i += 2 if argv[i] in _VALUE_OPTIONS else 1
+    return argv, False
+
+
+def run_via_daemon(
+    argv: List[str], path: Optional[str] = None, stdout=None, stderr=None, stdin=None
+) -> Optional[int]:
+    """Run argv in the daemon, relaying its I/O.
+
+    Args:
+        argv: moltcli arguments, without the program name
+        path: Socket path
+        stdout, stderr, stdin: Local streams (default: the sys streams)
+
+    Returns:
+        The command's exit code, or None if no daemon is reachable.
+    """
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    stdin = stdin if stdin is not None else sys.stdin
+    try:
+        sock = _connect(socket_path(path))
+    except OSError:
+        return None
+    with sock:
+        _send(sock, {
+            "op": "run",
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "stdin_tty": stdin is not None and stdin.isatty(),
+        })
+        for line in sock.makefile("rb"):
+            message = json.loads(line)
+            if "out" in message:
+                stdout.write(message["out"])
+                stdout.flush()
+            elif "err" in message:
+                stderr.write(message["err"])
+                stderr.flush()
+            elif "in" in message:
+                _send(sock, {"stdin": stdin.read() if stdin else ""})
+            elif "exit" in message:
+                return message["exit"]
+    raise ConnectionError("Daemon closed the connection before the command finished")
+
+
+class _SocketWriter(io.TextIOBase):
+    """Text stream that forwards writes to the client as messages."""
+
+    def __init__(self, sock: socket.socket, kind: str):
+        self._sock = sock
+        self._kind = kind
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if not isinstance(text, str):
+            # Click probes streams with write(b"") to detect binary ones
+            raise TypeError("write() argument must be str")
+        if text:
+            _send(self._sock, {self._kind: text})
+        return len(text)
+
+
+class _SocketStdin(io.TextIOBase):
+    """Stdin that asks the client for its input on first read."""
+
+    def __init__(self, sock: socket.socket, reader, tty: bool):
+        self._sock = sock
+        self._reader = reader
+        self._tty = tty
+        self._buffer: Optional[io.StringIO] = None
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def readable(self) -> bool:
+        return True
+
+    def _fill(self) -> io.StringIO:
+        if self._buffer is None:
+            _send(self._sock, {"in": True})
+            reply = json.loads(self._reader.readline() or "{}")
+            self._buffer = io.StringIO(reply.get("stdin", ""))
+        return self._buffer
+
+    def read(self, size: int = -1) -> str:
+        return self._fill().read(size)
+
+    def readline(self, size: int = -1) -> str:
+        return self._fill().readline(size)
+
+    def __iter__(self):
+        return iter(self._fill())
+
+
+class Daemon:
+    """Serve moltcli commands on a Unix socket with a shared warm client."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = socket_path(path)
+        self.started = time.time()
+        self.served = 0
+        self._client = None
+        self._credentials = None
+        self._run_lock = threading.Lock()
+        self._server = None
+
+    def _get_client(self):
+        """Build the shared client once; None if credentials are missing.
+
+        The client is rebuilt when the credentials file changes (auth login
+        or logout, in the daemon or in another process).
+        """
+        from .utils.config import get_config
+
+        config = get_config()
+        try:
+            stat = config.config_path.stat()
+            credentials = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            credentials = None
+        if credentials != self._credentials:
+            self._credentials = credentials
+            config.reload()
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+        if self._client is None:
+            from .cli import get_client
+
+            try:
+                self._client = get_client()
+            except Exception:
+                return None
+        return self._client
+
+    def run_command(self, argv: List[str], sock: socket.socket, reader, request: dict) -> int:
+        """Run one moltcli invocation with I/O bound to the connection."""
+        import click
+        from .cli import cli
+
+        stdout = _SocketWriter(sock, "out")
+        stderr = _SocketWriter(sock, "err")
+        stdin = _SocketStdin(sock, reader, request.get("stdin_tty", False))
+        with self._run_lock:
+            obj = {}
+            client = self._get_client()
+            if client is not None:
+                obj["warm_client"] = client
+            old_cwd, old_stdin = os.getcwd(), sys.stdin
+            try:
+                os.chdir(request.get("cwd") or old_cwd)
+                sys.stdin = stdin
+                with redirect_stdout(stdout), redirect_stderr(stderr):
+                    try:
+                        rv = cli.main(
+                            args=argv, prog_name="moltcli", standalone_mode=False, obj=obj
+                        )
+                        return rv if isinstance(rv, int) else 0
+                    except click.exceptions.Exit as e:
+                        return e.exit_code
+                    except click.ClickException as e:
+                        e.show()
+                        return e.exit_code
+                    except click.Abort:
+                        click.echo("Aborted!", err=True)
+                        return 1
+                    except SystemExit as e:
+                        code = e.code
+                        if code is None or isinstance(code, int):
+                            return code or 0
+                        click.echo(code, err=True)
+                        return 1
+                    except Exception:
+                        traceback.print_exc()
+                        return 1
+            finally:
+                sys.stdin = old_stdin
+                os.chdir(old_cwd)
+                self.served += 1
+
+    def handle(self, sock: socket.socket) -> None:
+        reader = sock.makefile("r")
+        line = reader.readline()
+        if not line:
+            return
+        request = json.loads(line)
+        op = request.get("op")
+        if op == "ping":
+            _send(sock, self.status())
+        elif op == "shutdown":
+            _send(sock, {"status": "stopping", "pid": os.getpid()})
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+        elif op == "run":
+            code = self.run_command(list(request.get("argv") or []), sock, reader, request)
+            _send(sock, {"exit": code})
+        else:
+            _send(sock, {"err": f"Unknown daemon op: {op!r}\n"})
+            _send(sock, {"exit": 2})
+
+    def status(self) -> dict:
+        return {
+            "status": "running",
+            "pid": os.getpid(),
+            "socket": self.path,
+            "uptime": round(time.time() - self.started, 1),
+            "served": self.served,
+        }
+
+    def serve_forever(self) -> None:
+        """Bind the socket and serve until a shutdown op arrives."""
+        import socketserver
+
+        daemon = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                try:
+                    daemon.handle(self.request)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        if os.path.exists(self.path):
+            try:
+                control("ping", self.path, timeout=0.5)
+            except OSError:
+                os.unlink(self.path)  # stale socket from a dead daemon
+            else:
+                raise RuntimeError(f"Daemon already running on {self.path}")
+        class Server(socketserver.ThreadingUnixStreamServer):
+            daemon_threads = True
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._server = Server(self.path, Handler)
+        # The socket hands out an authenticated client: owner only
+        os.chmod(self.path, 0o600)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if self._client is not None:
+                self._client.close()
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+
+def start_background(path: Optional[str] = None, wait: float = 5.0) -> dict:
+    """Spawn a detached daemon process and wait until it answers.
+
+    Raises:
+        TimeoutError: If the daemon does not come up within wait seconds.
+    """
+    import subprocess
+
+    path = socket_path(path)
+    subprocess.Popen(
+        [sys.executable, "-m", "moltcli.daemon", "--socket", path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        try:
+            return control("ping", path)
+        except (OSError, ValueError):
+            time.sleep(0.05)
+    raise TimeoutError(f"Daemon did not start on {path}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a daemon in the foreground: python -m moltcli.daemon [--socket PATH]."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="moltcli-daemon")
+    parser.add_argument("--socket", help="Unix socket path")
+    args = parser.parse_args(argv)
+    Daemon(args.socket).serve_forever()
+
+
+__all__ = [
+    "Daemon",
+    "SOCKET_PATH",
+    "socket_path",
+    "control",
+    "split_via_daemon",
+    "run_via_daemon",
+    "start_background",
+]
+
+
+if __name__ == "__main__":
+    main()
+
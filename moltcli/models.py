@@ -0,0 +1,202 @@
+"""Compact typed models for API items.
+
+Core methods return the raw response dicts; these models are opt-in (e.g.
+``FeedCore.iter_posts(models=True)``) for code that keeps many items alive,
+such as long crawls. Known fields live in ``__slots__`` instead of a
+per-item dict, nested authors and submolts become models too, and
+``to_dict()`` rebuilds the original dict, key order included, so JSON
+output is byte-for-byte unchanged.
+
+Fields missing from a response read as None. Keys a model doesn't know are
+kept aside and round-trip untouched.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Type, TypeVar
+
+M = TypeVar("M", bound="Model")
+
+# Key-order tuples shared by every item with the same shape
+_SHAPES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _shape(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    return _SHAPES.setdefault(keys, keys)
+
+
+class Model:
+    """Base for slotted API models."""
+
+    __slots__ = ("_keys", "_extra")
+
+    # field name -> model for nested dicts
+    NESTED: Dict[str, Type["Model"]] = {}
+    _fields: frozenset = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = frozenset(cls.__slots__)
+
+    def __init__(self, **fields: Any):
+        self._load(fields)
+
+    @classmethod
+    def from_dict(cls: Type[M], data: Dict[str, Any]) -> M:
+        """Build a model from one response item."""
+        obj = cls.__new__(cls)
+        obj._load(data)
+        return obj
+
+    def _load(self, data: Dict[str, Any]) -> None:
+        for name in self.__slots__:
+            setattr(self, name, None)
+        extra = None
+        for key, value in data.items():
+            if key in self._fields:
+                nested = self.NESTED.get(key)
+                if nested is not None and isinstance(value, dict):
+                    value = nested.from_dict(value)
+                setattr(self, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        self._keys = _shape(tuple(data))
+        self._extra = extra
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The original response item."""
+        out = {}
+        for key in self._keys:
+            if key in self._fields:
+                value = getattr(self, key)
+                out[key] = value.to_dict() if isinstance(value, Model) else value
+            else:
+                out[key] = self._extra[key]
+        return out
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        shown = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self.__slots__
+            if getattr(self, name) is not None
+        )
+        return f"{type(self).__name__}({shown})"
+
+
+class Agent(Model):
+    """An agent (user) profile."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "karma",
+        "follower_count",
+        "following_count",
+        "is_claimed",
+        "created_at",
+    )
+    id: Optional[str]
+    name: Optional[str]
+    description: Optional[str]
+    karma: Optional[int]
+    follower_count: Optional[int]
+    following_count: Optional[int]
+    is_claimed: Optional[bool]
+    created_at: Optional[str]
+
+
+class Submolt(Model):
+    """A submolt (community)."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "display_name",
+        "description",
+        "subscriber_count",
+        "created_at",
+    )
+    id: Optional[str]
+    name: Optional[str]
+    display_name: Optional[str]
+    description: Optional[str]
+    subscriber_count: Optional[int]
+    created_at: Optional[str]
+
+
+class Post(Model):
+    """A post."""
+
+    __slots__ = (
+        "id",
+        "title",
+        "content",
+        "url",
+        "upvotes",
+        "downvotes",
+        "comment_count",
+        "created_at",
+        "author",
+        "submolt",
+    )
+    NESTED = {"author": Agent, "submolt": Submolt}
+    id: Optional[str]
+    title: Optional[str]
+    content: Optional[str]
+    url: Optional[str]
+    upvotes: Optional[int]
+    downvotes: Optional[int]
+    comment_count: Optional[int]
+    created_at: Optional[str]
+    author: Optional[Agent]
+    submolt: Any  # Submolt, or a bare name in some responses
+
+
+class Comment(Model):
+    """A comment on a post."""
+
+    __slots__ = (
+        "id",
+        "post_id",
+        "parent_id",
+        "content",
+        "upvotes",
+        "downvotes",
+        "created_at",
+        "author",
+    )
+    NESTED = {"author": Agent}
+    id: Optional[str]
+    post_id: Optional[str]
+    parent_id: Optional[str]
+    content: Optional[str]
+    upvotes: Optional[int]
+    downvotes: Optional[int]
+    created_at: Optional[str]
+    author: Optional[Agent]
+
+
+class VoteResult(Model):
+    """Response to an upvote or downvote."""
+
+    __slots__ = ("success", "message", "action", "author")
+    NESTED = {"author": Agent}
+    success: Optional[bool]
+    message: Optional[str]
+    action: Optional[str]
+    author: Optional[Agent]
+
+
+def parse_items(items: Iterable[Dict[str, Any]], model: Type[M]) -> Iterator[M]:
+    """Lazily convert response items to models (non-dicts pass through)."""
+    for item in items:
+        yield model.from_dict(item) if isinstance(item, dict) else item
+
+
+__all__ = ["Model", "Agent", "Submolt", "Post", "Comment", "VoteResult", "parse_items"]
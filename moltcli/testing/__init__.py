@@ -0,0 +1,9 @@
+"""Test and benchmark helpers.
+
+``StubServer`` serves the Moltbook API from memory on a loopback port, so
+client throughput, retries and rate limiting can be measured offline.
+"""
+
+from .server import API_PREFIX, CHALLENGE, StubServer, StubState
+
+__all__ = ["StubServer", "StubState", "API_PREFIX", "CHALLENGE"]
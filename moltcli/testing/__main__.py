@@ -0,0 +1,53 @@
+"""Run the stub server in the foreground.
+
+Usage:
+    python -m moltcli.testing [--port 8080] [--latency 0.05] [--error-rate 0.01] ...
+
+Then point the CLI at it with ``MOLTCLI_BASE_URL=http://127.0.0.1:8080/api/v1``.
+"""
+
+import argparse
+import time
+
+from .server import StubServer, StubState
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local Moltbook API stub.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Max extra random seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 500s")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of 429s")
+    parser.add_argument("--rate-limit", type=int, help="Requests per --rate-window")
+    parser.add_argument("--rate-window", type=float, default=60.0)
+    parser.add_argument("--posts", type=int, default=200)
+    parser.add_argument("--comments-per-post", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = StubServer(
+        StubState(posts=args.posts, comments_per_post=args.comments_per_post, seed=args.seed),
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        seed=args.seed,
+    ).start()
+    print(f"Serving Moltbook stub at {server.base_url} (Ctrl+C to stop)", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""Benchmark suite for the client, formatter, memory and challenge hot paths.
+
+Run with ``moltcli bench`` (or ``run()`` from code). Every scenario returns
+plain numbers, and the whole run is one JSON document with the version,
+Python and JSON backend alongside, so runs from two releases can be diffed
+directly.
+
+Sizes come from a profile: ``quick`` (smoke test, a few seconds),
+``default``, and ``full`` (adds 1M-entry memory stores and takes
+minutes).
+"""
+
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .. import __version__
+from ..utils import codec
+
+PROFILES: Dict[str, Dict[str, object]] = {
+    "quick": {
+        "requests": 50,
+        "workers": 4,
+        "feed_sizes": (100, 1_000),
+        "memory_sizes": (1_000,),
+        "memory_ops": 100,
+        "challenge_rounds": 200,
+    },
+    "default": {
+        "requests": 500,
+        "workers": 8,
+        "feed_sizes": (1_000, 10_000),
+        "memory_sizes": (10_000, 100_000),
+        "memory_ops": 1_000,
+        "challenge_rounds": 5_000,
+    },
+    "full": {
+        "requests": 2_000,
+        "workers": 16,
+        "feed_sizes": (1_000, 10_000),
+        "memory_sizes": (10_000, 100_000, 1_000_000),
+        "memory_ops": 1_000,
+        "challenge_rounds": 20_000,
+    },
+}
+
+WORDS = "molt lobster agent karma submolt reef claw shell café über think post".split()
+
+CHALLENGES = [
+    "A lObStEr SwImS aT ThIrTy-TwO mEtErS pEr SeCoNd AnD aCcElErAtEs By FoUr, wHaT iS tHe ToTaL?",
+    "wHaT iS fIfTy MiNuS tWeLvE?",
+    "A cRaB hAs SeVeN lEgS tImEs ThReE cLaWs",
+    "the molt reached 12 plus TwEnTy-OnE points today",
+]
+
+# name -> scenario(sizes) -> results
+SCENARIOS: Dict[str, Callable[[Dict[str, object]], dict]] = {}
+
+
+def scenario(name: str):
+    """Register a benchmark scenario."""
+
+    def register(func):
+        SCENARIOS[name] = func
+        return func
+
+    return register
+
+
+def _latency_ms(samples: List[float]) -> dict:
+    """Summary of per-call latencies given in seconds."""
+    samples = sorted(samples)
+    return {
+        "mean_ms": round(statistics.mean(samples) * 1000, 3),
+        "p50_ms": round(samples[len(samples) // 2] * 1000, 3),
+        "p99_ms": round(samples[max(0, int(len(samples) * 0.99) - 1)] * 1000, 3),
+    }
+
+
+def _timed(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def make_posts(count: int, seed: int = 0) -> List[dict]:
+    """Feed items shaped like the API's, with nested authors and unicode text."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"{rng.getrandbits(64):016x}",
+            "title": " ".join(rng.choices(WORDS, k=8)),
+            "content": " ".join(rng.choices(WORDS, k=60)),
+            "url": None,
+            "upvotes": rng.randrange(5000),
+            "downvotes": rng.randrange(100),
+            "comment_count": rng.randrange(300),
+            "created_at": "2026-02-03T10:30:00.000Z",
+            "author": {"id": f"a{i}", "name": f"agent_{i}", "karma": rng.randrange(10**5)},
+            "submolt": {"id": f"s{i % 7}", "name": "general", "display_name": "General"},
+        }
+        for i in range(count)
+    ]
+
+
+@scenario("client")
+def bench_client(sizes: Dict[str, object]) -> dict:
+    """Requests through a StubServer: new connection per call, pooled, concurrent."""
+    import requests
+
+    from ..utils.api_client import MoltbookClient
+    from .server import StubServer
+
+    n = sizes["requests"]
+    workers = sizes["workers"]
+    params = {"sort": "hot", "limit": 20}
+    results = {"requests": n, "workers": workers}
+    with StubServer() as server:
+        url = f"{server.base_url}/feed"
+
+        def unpooled():
+            # Baseline: no session, so a new TCP connection every call
+            requests.get(url, params=params, timeout=30).json()
+
+        samples = [_timed(unpooled) for _ in range(n)]
+        results["sequential_unpooled"] = {
+            **_latency_ms(samples),
+            "req_per_s": round(n / sum(samples), 1),
+        }
+
+        with MoltbookClient(
+            "bench", base_url=server.base_url, rate_limit=False, pool_maxsize=workers
+        ) as client:
+            samples = [_timed(lambda: client.get("/feed", params=params)) for _ in range(n)]
+            results["sequential_pooled"] = {
+                **_latency_ms(samples),
+                "req_per_s": round(n / sum(samples), 1),
+            }
+
+            def fetch(_):
+                return _timed(lambda: client.get("/feed", params=params))
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                start = time.perf_counter()
+                samples = list(pool.map(fetch, range(n)))
+                elapsed = time.perf_counter() - start
+            results["concurrent_pooled"] = {
+                **_latency_ms(samples),
+                "req_per_s": round(n / elapsed, 1),
+            }
+    return results
+
+
+@scenario("formatter")
+def bench_formatter(sizes: Dict[str, object]) -> dict:
+    """OutputFormatter.format on whole feeds, in JSON, NDJSON and human mode."""
+    from ..utils.formatter import OutputFormatter
+
+    modes = {
+        "json": OutputFormatter(json_mode=True),
+        "ndjson": OutputFormatter(ndjson=True),
+        "human": OutputFormatter(),
+    }
+    results = {}
+    for count in sizes["feed_sizes"]:
+        feed = {"success": True, "posts": make_posts(count), "has_more": True}
+        results[str(count)] = {
+            f"{mode}_ms": round(_timed(lambda: formatter.format(feed)) * 1000, 2)
+            for mode, formatter in modes.items()
+        }
+    return results
+
+
+def _fill(store, count: int, rng: random.Random, chunk: int = 20_000) -> None:
+    """Bulk-load entries through import_from, in chunks to bound memory."""
+    for start in range(0, count, chunk):
+        entries = [
+            {
+                "id": f"{start + i:016x}",
+                "category": "learnings",
+                "content": " ".join(rng.choices(WORDS, k=20)) + f" note{start + i}",
+                "tags": [rng.choice(WORDS)],
+                "source": "bench",
+                "created_at": "2026-02-03T10:30:00",
+                "metadata": {},
+            }
+            for i in range(min(chunk, count - start))
+        ]
+        store.import_from(codec.dumps({"learnings": entries}))
+
+
+@scenario("memory")
+def bench_memory(sizes: Dict[str, object]) -> dict:
+    """MemoryStore add/search/view/export on pre-filled stores, per backend."""
+    from ..utils.memory import MemoryStore
+
+    ops = sizes["memory_ops"]
+    results = {}
+    for backend in ("jsonl", "sqlite"):
+        for count in sizes["memory_sizes"]:
+            rng = random.Random(count)
+            with tempfile.TemporaryDirectory() as tmp:
+                store = MemoryStore(tmp, backend=backend)
+                fill_s = _timed(lambda: _fill(store, count, rng))
+
+                def add():
+                    for i in range(ops):
+                        store.add(f"bench entry {i} lobster", tags=["bench"])
+
+                add_s = _timed(add)
+                # First search builds the JSONL index; later ones use it
+                first_s = _timed(lambda: store.search("lobster", limit=20))
+                searches = [
+                    _timed(lambda: store.search(rng.choice(WORDS), limit=20)) for _ in range(20)
+                ]
+                needle_s = _timed(lambda: store.search(f"note{count // 2}"))
+                results[f"{backend}/{count}"] = {
+                    "fill_s": round(fill_s, 2),
+                    "add_us": round(add_s / ops * 1e6, 1),
+                    "search_first_ms": round(first_s * 1000, 2),
+                    "search_ms": round(statistics.mean(searches) * 1000, 3),
+                    "search_rare_ms": round(needle_s * 1000, 2),
+                    "view_ms": round(_timed(lambda: store.view("learnings")) * 1000, 1),
+                    "export_ms": round(_timed(store.export) * 1000, 1),
+                }
+                if store._db is not None:
+                    store._db.close()  # Release the file before the directory goes
+    return results
+
+
+@scenario("challenge")
+def bench_challenge(sizes: Dict[str, object]) -> dict:
+    """extract_numbers and parse_challenge throughput over obfuscated challenges."""
+    from ..utils.challenge import extract_numbers, parse_challenge
+
+    rounds = sizes["challenge_rounds"]
+    results = {"challenges": len(CHALLENGES), "rounds": rounds}
+    for name, func in (("extract_numbers", extract_numbers), ("parse_challenge", parse_challenge)):
+        elapsed = _timed(lambda: [func(text) for _ in range(rounds) for text in CHALLENGES])
+        calls = rounds * len(CHALLENGES)
+        results[name] = {
+            "calls_per_s": round(calls / elapsed),
+            "us_per_call": round(elapsed / calls * 1e6, 2),
+        }
+    return results
+
+
+def run(
+    names: Optional[Iterable[str]] = None,
+    profile: str = "default",
+    progress: Optional[Callable[[str], None]] = None,
+) -> dict:
+    """Run scenarios and return one JSON-serializable report.
+
+    Args:
+        names: Scenarios to run (default: all, in registration order)
+        profile: Key of PROFILES
+        progress: Called with each scenario name before it starts
+
+    Raises:
+        ValueError: For an unknown scenario or profile.
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile: {profile!r}")
+    names = list(names or SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenario(s): {', '.join(unknown)}")
+    report = {
+        "moltcli": __version__,
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "cpus": os.cpu_count(),
+        "json_backend": codec.BACKEND,
+        "profile": profile,
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "results": {},
+    }
+    for name in names:
+        if progress is not None:
+            progress(name)
+        start = time.perf_counter()
+        result = SCENARIOS[name](PROFILES[profile])
+        result["elapsed_s"] = round(time.perf_counter() - start, 2)
+        report["results"][name] = result
+    return report
+
+
+__all__ = ["PROFILES", "SCENARIOS", "make_posts", "run", "scenario"]
@@ -0,0 +1,691 @@
+"""In-process Moltbook API stub for benchmarks and load tests.
+
+Example:
+    with StubServer(latency=0.02, jitter=0.01, error_rate=0.05) as server:
+        client = MoltbookClient("test", base_url=server.base_url)
+        FeedCore(client).get_hot()
+        print(server.stats())
+
+The server speaks HTTP/1.1 keep-alive on a loopback port in a background
+thread, so the real client stack (pooling, retries, governor, cache) is
+exercised end to end. Every endpoint the Core classes call is served from
+a seeded in-memory dataset; writes (posts, comments, votes, follows)
+mutate it.
+"""
+
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from ..utils import codec
+
+API_PREFIX = "/api/v1"
+
+# Challenge sent for every created post and the answer /verify accepts
+CHALLENGE = "ThIrTy-TwO pLuS fOuR"
+CHALLENGE_ANSWER = 36.0
+
+
+class StubState:
+    """Seeded in-memory agents, submolts, posts and comments."""
+
+    def __init__(
+        self,
+        posts: int = 200,
+        comments_per_post: int = 10,
+        submolts: int = 8,
+        agents: int = 20,
+        seed: int = 0,
+    ):
+        rng = random.Random(seed)
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.lock = threading.Lock()
+        self.agents: Dict[str, dict] = {}
+        for i in range(agents):
+            name = f"agent_{i}"
+            self.agents[name] = {
+                "id": f"agent-{i}",
+                "name": name,
+                "description": f"Stub agent {i}",
+                "karma": rng.randint(0, 5000),
+                "follower_count": rng.randint(0, 500),
+                "following_count": rng.randint(0, 100),
+                "is_claimed": True,
+                "created_at": start.isoformat(),
+            }
+        self.me = self.agents["agent_0"]
+        self.submolts: Dict[str, dict] = {}
+        for i in range(submolts):
+            name = "general" if i == 0 else f"submolt_{i}"
+            self.submolts[name] = {
+                "id": f"submolt-{i}",
+                "name": name,
+                "display_name": name.replace("_", " ").title(),
+                "description": f"Stub submolt {i}",
+                "subscriber_count": rng.randint(0, 10000),
+                "created_at": start.isoformat(),
+            }
+        # Newest first, like the "new" feed
+        self.posts: List[dict] = []
+        self.comments: Dict[str, List[dict]] = {}
+        names = list(self.agents)
+        submolt_names = list(self.submolts)
+        for i in reversed(range(posts)):
+            post_id = f"post-{i}"
+            self.posts.append(
+                {
+                    "id": post_id,
+                    "title": f"Stub post {i}",
+                    "content": f"Body of stub post {i}. " * rng.randint(1, 8),
+                    "url": None,
+                    "upvotes": rng.randint(0, 1000),
+                    "downvotes": rng.randint(0, 50),
+                    "comment_count": comments_per_post,
+                    "created_at": (start + timedelta(minutes=i)).isoformat(),
+                    "author": {"name": rng.choice(names)},
+                    "submolt": {"name": rng.choice(submolt_names)},
+                }
+            )
+            thread: List[dict] = []
+            for j in range(comments_per_post):
+                # Roughly half the comments reply to an earlier one
+                parent = thread[rng.randrange(j)]["id"] if j and rng.random() < 0.5 else None
+                thread.append(
+                    {
+                        "id": f"comment-{i}-{j}",
+                        "post_id": post_id,
+                        "parent_id": parent,
+                        "content": f"Stub comment {j}",
+                        "upvotes": rng.randint(0, 100),
+                        "downvotes": 0,
+                        "created_at": (start + timedelta(minutes=i, seconds=j)).isoformat(),
+                        "author": {"name": rng.choice(names)},
+                    }
+                )
+            self.comments[post_id] = thread
+        self.by_id = {post["id"]: post for post in self.posts}
+        self.subscriptions: List[str] = []
+        self.pending: Dict[str, dict] = {}
+
+    def find_comment(self, comment_id: str) -> Optional[dict]:
+        for thread in self.comments.values():
+            for comment in thread:
+                if comment["id"] == comment_id:
+                    return comment
+        return None
+
+
+class _Reply(Exception):
+    """Short-circuit a handler with a status and JSON body."""
+
+    def __init__(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None):
+        super().__init__(status)
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+
+def _not_found(what: str) -> _Reply:
+    return _Reply(404, {"success": False, "error": f"{what} not found"})
+
+
+def _int(query: Dict[str, str], name: str, default: int) -> int:
+    try:
+        return max(0, int(query.get(name, default)))
+    except ValueError:
+        raise _Reply(400, {"success": False, "error": f"Invalid {name}"}) from None
+
+
+def _page(items: List[dict], query: Dict[str, str], key: str, default: int = 20) -> dict:
+    limit = _int(query, "limit", default)
+    offset = _int(query, "offset", 0)
+    page = items[offset : offset + limit]
+    return {
+        "success": True,
+        key: page,
+        "total": len(items),
+        "has_more": offset + len(page) < len(items),
+    }
+
+
+def _sorted_posts(posts: List[dict], sort: str) -> List[dict]:
+    if sort == "new":
+        return posts
+    if sort == "top":
+        return sorted(posts, key=lambda p: p["upvotes"] - p["downvotes"], reverse=True)
+    # hot / rising: score decayed by age (position in the newest-first list)
+    ranked = sorted(
+        enumerate(posts),
+        key=lambda item: (item[1]["upvotes"] - item[1]["downvotes"]) / (item[0] + 2),
+        reverse=True,
+    )
+    return [post for _, post in ranked]
+
+
+Route = Tuple[str, "re.Pattern", Callable[..., Any]]
+
+
+class _Api:
+    """Endpoint handlers over a StubState."""
+
+    def __init__(self, state: StubState):
+        self.state = state
+        self.routes: List[Route] = [
+            ("GET", r"/feed", self.feed),
+            ("POST", r"/posts", self.create_post),
+            ("GET", r"/posts/([^/]+)", self.get_post),
+            ("DELETE", r"/posts/([^/]+)", self.delete_post),
+            ("GET", r"/posts/([^/]+)/comments", self.list_comments),
+            ("POST", r"/posts/([^/]+)/comments", self.create_comment),
+            ("POST", r"/posts/([^/]+)/(upvote|downvote)", self.vote_post),
+            ("POST", r"/verify", self.verify),
+            ("GET", r"/comments/([^/]+)", self.get_comment),
+            ("DELETE", r"/comments/([^/]+)", self.delete_comment),
+            ("POST", r"/comments/([^/]+)/(upvote|downvote)", self.vote_comment),
+            ("GET", r"/submolts", self.list_submolts),
+            ("POST", r"/submolts", self.create_submolt),
+            ("GET", r"/submolts/trending", self.trending),
+            ("GET", r"/submolts/([^/]+)", self.get_submolt),
+            ("GET", r"/submolts/([^/]+)/(?:feed|posts)", self.submolt_feed),
+            ("POST", r"/submolts/([^/]+)/subscribe", self.subscribe),
+            ("DELETE", r"/submolts/([^/]+)/subscribe", self.unsubscribe),
+            ("GET", r"/user/subscriptions", self.subscriptions),
+            ("GET", r"/search", self.search),
+            ("POST", r"/agents/register", self.register),
+            ("GET", r"/agents/status", self.status),
+            ("GET", r"/agents/me", self.me),
+            ("PATCH", r"/agents/me", self.update_me),
+            ("GET", r"/agents/profile", self.profile),
+            ("POST", r"/agents/([^/]+)/follow", self.follow),
+            ("DELETE", r"/agents/([^/]+)/follow", self.unfollow),
+            ("POST", r"/auth/refresh", self.refresh),
+        ]
+        self.routes = [(m, re.compile(p + "$"), h) for m, p, h in self.routes]
+
+    def dispatch(self, method: str, path: str, query: Dict[str, str], body: Any) -> Any:
+        allowed = False
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            if route_method == method:
+                with self.state.lock:
+                    return handler(*match.groups(), query=query, body=body)
+            allowed = True
+        if allowed:
+            raise _Reply(405, {"success": False, "error": "Method not allowed"})
+        raise _not_found("Endpoint")
+
+    # -- posts and feeds -------------------------------------------------
+
+    def _post(self, post_id: str) -> dict:
+        post = self.state.by_id.get(post_id)
+        if post is None:
+            raise _not_found("Post")
+        return post
+
+    def feed(self, query, body):
+        posts = self.state.posts
+        if query.get("submolt"):
+            posts = [p for p in posts if p["submolt"]["name"] == query["submolt"]]
+        return _page(_sorted_posts(posts, query.get("sort", "hot")), query, "posts")
+
+    def create_post(self, query, body):
+        body = body or {}
+        if not body.get("title"):
+            raise _Reply(400, {"success": False, "error": "Title is required"})
+        if body.get("submolt") not in self.state.submolts:
+            raise _not_found("Submolt")
+        post = {
+            "id": f"post-{uuid.uuid4().hex[:12]}",
+            "title": body["title"],
+            "content": body.get("content"),
+            "url": body.get("url"),
+            "upvotes": 0,
+            "downvotes": 0,
+            "comment_count": 0,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "author": {"name": self.state.me["name"]},
+            "submolt": {"name": body["submolt"]},
+        }
+        code = f"verify-{uuid.uuid4().hex[:12]}"
+        self.state.pending[code] = post
+        return {
+            "success": True,
+            "verification_required": True,
+            "post": post,
+            "verification": {"verification_code": code, "challenge": CHALLENGE},
+        }
+
+    def verify(self, query, body):
+        body = body or {}
+        post = self.state.pending.get(body.get("verification_code"))
+        if post is None:
+            raise _not_found("Verification code")
+        try:
+            correct = abs(float(body.get("answer")) - CHALLENGE_ANSWER) < 0.01
+        except (TypeError, ValueError):
+            correct = False
+        if not correct:
+            return {"success": False, "error": "Incorrect answer"}
+        del self.state.pending[body["verification_code"]]
+        self.state.posts.insert(0, post)
+        self.state.by_id[post["id"]] = post
+        self.state.comments[post["id"]] = []
+        return {"success": True, "post": post}
+
+    def get_post(self, post_id, query, body):
+        return {"success": True, "post": self._post(post_id)}
+
+    def delete_post(self, post_id, query, body):
+        post = self._post(post_id)
+        self.state.posts.remove(post)
+        del self.state.by_id[post_id]
+        self.state.comments.pop(post_id, None)
+        return {"success": True}
+
+    def _vote(self, item: dict, direction: str) -> dict:
+        item["upvotes" if direction == "upvote" else "downvotes"] += 1
+        return {
+            "success": True,
+            "message": "Upvoted!" if direction == "upvote" else "Downvoted!",
+            "action": direction,
+            "author": item.get("author"),
+        }
+
+    def vote_post(self, post_id, direction, query, body):
+        return self._vote(self._post(post_id), direction)
+
+    # -- comments --------------------------------------------------------
+
+    def list_comments(self, post_id, query, body):
+        self._post(post_id)
+        return _page(self.state.comments.get(post_id, []), query, "comments", default=50)
+
+    def create_comment(self, post_id, query, body):
+        post = self._post(post_id)
+        body = body or {}
+        if not body.get("content"):
+            raise _Reply(400, {"success": False, "error": "Content is required"})
+        comment = {
+            "id": f"comment-{uuid.uuid4().hex[:12]}",
+            "post_id": post_id,
+            "parent_id": body.get("parent_id"),
+            "content": body["content"],
+            "upvotes": 0,
+            "downvotes": 0,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "author": {"name": self.state.me["name"]},
+        }
+        self.state.comments.setdefault(post_id, []).append(comment)
+        post["comment_count"] += 1
+        return {"success": True, "comment": comment}
+
+    def _comment(self, comment_id: str) -> dict:
+        comment = self.state.find_comment(comment_id)
+        if comment is None:
+            raise _not_found("Comment")
+        return comment
+
+    def get_comment(self, comment_id, query, body):
+        return {"success": True, "comment": self._comment(comment_id)}
+
+    def delete_comment(self, comment_id, query, body):
+        comment = self._comment(comment_id)
+        self.state.comments[comment["post_id"]].remove(comment)
+        self.state.by_id[comment["post_id"]]["comment_count"] -= 1
+        return {"success": True}
+
+    def vote_comment(self, comment_id, direction, query, body):
+        return self._vote(self._comment(comment_id), direction)
+
+    # -- submolts --------------------------------------------------------
+
+    def _submolt(self, name: str) -> dict:
+        submolt = self.state.submolts.get(name)
+        if submolt is None:
+            raise _not_found("Submolt")
+        return submolt
+
+    def list_submolts(self, query, body):
+        return _page(list(self.state.submolts.values()), query, "submolts", default=50)
+
+    def create_submolt(self, query, body):
+        body = body or {}
+        name = body.get("name")
+        if not name or name in self.state.submolts:
+            raise _Reply(400, {"success": False, "error": "Invalid or taken submolt name"})
+        submolt = {
+            "id": f"submolt-{uuid.uuid4().hex[:12]}",
+            "name": name,
+            "display_name": body.get("display_name") or name,
+            "description": body.get("description", ""),
+            "subscriber_count": 1,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self.state.submolts[name] = submolt
+        return {"success": True, "submolt": submolt}
+
+    def trending(self, query, body):
+        ranked = sorted(
+            self.state.submolts.values(), key=lambda s: s["subscriber_count"], reverse=True
+        )
+        return _page(ranked, query, "submolts", default=10)
+
+    def get_submolt(self, name, query, body):
+        return {"success": True, "submolt": self._submolt(name)}
+
+    def submolt_feed(self, name, query, body):
+        self._submolt(name)
+        posts = [p for p in self.state.posts if p["submolt"]["name"] == name]
+        return _page(_sorted_posts(posts, query.get("sort", "hot")), query, "posts")
+
+    def subscribe(self, name, query, body):
+        self._submolt(name)
+        if name not in self.state.subscriptions:
+            self.state.subscriptions.append(name)
+        return {"success": True, "action": "subscribed"}
+
+    def unsubscribe(self, name, query, body):
+        self._submolt(name)
+        if name in self.state.subscriptions:
+            self.state.subscriptions.remove(name)
+        return {"success": True, "action": "unsubscribed"}
+
+    def subscriptions(self, query, body):
+        return {
+            "success": True,
+            "submolts": [self.state.submolts[n] for n in self.state.subscriptions],
+        }
+
+    # -- search ----------------------------------------------------------
+
+    def search(self, query, body):
+        q = query.get("q", "").lower()
+        if query.get("type") in ("users", "agents"):
+            items = [a for a in self.state.agents.values() if q in a["name"].lower()]
+        else:
+            items = [
+                p
+                for p in self.state.posts
+                if q in p["title"].lower() or q in (p["content"] or "").lower()
+            ]
+        return _page(items, query, "results")
+
+    # -- agents and auth -------------------------------------------------
+
+    def _agent(self, name: str) -> dict:
+        agent = self.state.agents.get(name)
+        if agent is None:
+            raise _not_found("Agent")
+        return agent
+
+    def register(self, query, body):
+        name = (body or {}).get("name")
+        if not name or name in self.state.agents:
+            raise _Reply(400, {"success": False, "error": "Invalid or taken agent name"})
+        self.state.agents[name] = {
+            "id": f"agent-{uuid.uuid4().hex[:12]}",
+            "name": name,
+            "description": (body or {}).get("description", ""),
+            "karma": 0,
+            "follower_count": 0,
+            "following_count": 0,
+            "is_claimed": False,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        return {
+            "success": True,
+            "agent": {
+                "name": name,
+                "api_key": f"moltbook_sk_stub_{uuid.uuid4().hex}",
+                "claim_url": f"https://stub.invalid/claim/{name}",
+                "verification_code": "stub-claim",
+            },
+        }
+
+    def status(self, query, body):
+        return {"success": True, "status": "claimed"}
+
+    def me(self, query, body):
+        return {"success": True, "agent": self.state.me}
+
+    def update_me(self, query, body):
+        body = body or {}
+        for key in ("description", "metadata"):
+            if key in body:
+                self.state.me[key] = body[key]
+        return {"success": True, "agent": self.state.me}
+
+    def profile(self, query, body):
+        agent = self._agent(query.get("name", ""))
+        posts = [p for p in self.state.posts if p["author"]["name"] == agent["name"]]
+        return {"success": True, "agent": agent, "recentPosts": posts[:10]}
+
+    def follow(self, name, query, body):
+        self._agent(name)["follower_count"] += 1
+        return {"success": True, "action": "followed"}
+
+    def unfollow(self, name, query, body):
+        agent = self._agent(name)
+        agent["follower_count"] = max(0, agent["follower_count"] - 1)
+        return {"success": True, "action": "unfollowed"}
+
+    def refresh(self, query, body):
+        return {"success": True, "api_key": f"moltbook_sk_stub_{uuid.uuid4().hex}"}
+
+
+class _FixedWindow:
+    """Server-side request quota advertised through X-RateLimit-* headers."""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self._lock = threading.Lock()
+        self._start = time.time()
+        self._used = 0
+
+    def take(self) -> Tuple[bool, Dict[str, str]]:
+        with self._lock:
+            now = time.time()
+            if now - self._start >= self.window:
+                self._start, self._used = now, 0
+            allowed = self._used < self.limit
+            if allowed:
+                self._used += 1
+            reset = self._start + self.window
+            headers = {
+                "X-RateLimit-Limit": str(self.limit),
+                "X-RateLimit-Remaining": str(self.limit - self._used),
+                "X-RateLimit-Reset": str(int(reset) + 1),
+            }
+            if not allowed:
+                headers["Retry-After"] = str(max(1, int(reset - now + 0.999)))
+            return allowed, headers
+
+
+class StubServer:
+    """Moltbook API stub on a loopback port, served from a background thread."""
+
+    def __init__(
+        self,
+        state: Optional[StubState] = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        rate_limit: Optional[int] = None,
+        rate_window: float = 60.0,
+        api_key: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        """Initialize server (call start(), or use it as a context manager).
+
+        Args:
+            state: Dataset to serve (default: a seeded StubState)
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+            latency: Seconds added to every response
+            jitter: Up to this many extra seconds, uniformly random
+            error_rate: Fraction of requests answered with a 500
+            rate_limit_rate: Fraction of requests answered with a 429
+            retry_after: Retry-After seconds sent with injected 429s
+            rate_limit: Requests allowed per rate_window before real 429s
+                (None = unlimited, no X-RateLimit-* headers)
+            rate_window: Quota window in seconds
+            api_key: Reject requests without this bearer token (None = any)
+            seed: Seed for latency jitter and fault injection
+        """
+        self.state = state or StubState()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.api_key = api_key
+        self._quota = _FixedWindow(rate_limit, rate_window) if rate_limit else None
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self._api = _Api(self.state)
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Server root, e.g. http://127.0.0.1:54321."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self) -> str:
+        """API base URL to pass to MoltbookClient(base_url=...)."""
+        return self.url + API_PREFIX
+
+    def start(self) -> "StubServer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                kwargs={"poll_interval": 0.05},  # Keeps stop() fast
+                name="moltcli-stub",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """Requests served so far, in total and per status code."""
+        with self._stats_lock:
+            return dict(self._counts)
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._counts.clear()
+
+    def _count(self, status: int) -> None:
+        with self._stats_lock:
+            self._counts["requests"] = self._counts.get("requests", 0) + 1
+            self._counts[str(status)] = self._counts.get(str(status), 0) + 1
+
+    def _draw(self) -> Tuple[float, float]:
+        """Delay for this response and a uniform draw for fault injection."""
+        with self._rng_lock:
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0)
+            return delay, self._rng.random()
+
+    def respond(
+        self, method: str, target: str, headers: Dict[str, str], raw: bytes
+    ) -> Tuple[int, Dict[str, str], Any]:
+        """Answer one request: (status, extra headers, JSON body)."""
+        delay, roll = self._draw()
+        if delay:
+            time.sleep(delay)
+        extra: Dict[str, str] = {}
+        try:
+            if self.api_key is not None and headers.get("Authorization") != (
+                f"Bearer {self.api_key}"
+            ):
+                raise _Reply(401, {"success": False, "error": "Invalid API key"})
+            if self._quota is not None:
+                allowed, extra = self._quota.take()
+                if not allowed:
+                    raise _Reply(429, {"success": False, "error": "Rate limit exceeded"})
+            if roll < self.rate_limit_rate:
+                raise _Reply(
+                    429,
+                    {"success": False, "error": "Rate limit exceeded"},
+                    {"Retry-After": str(self.retry_after)},
+                )
+            if roll < self.rate_limit_rate + self.error_rate:
+                raise _Reply(500, {"success": False, "error": "Injected server error"})
+            parts = urlsplit(target)
+            if not parts.path.startswith(API_PREFIX):
+                raise _not_found("Endpoint")
+            query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+            try:
+                body = codec.loads(raw) if raw else None
+            except ValueError:
+                raise _Reply(400, {"success": False, "error": "Invalid JSON"}) from None
+            path = parts.path[len(API_PREFIX) :].rstrip("/") or "/"
+            return 200, extra, self._api.dispatch(method, path, query, body)
+        except _Reply as reply:
+            return reply.status, {**extra, **reply.headers}, reply.body
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; avoid Nagle/delayed-ACK stalls
+            disable_nagle_algorithm = True
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                status, headers, body = server.respond(
+                    self.command, self.path, dict(self.headers), raw
+                )
+                payload = codec.dumpb(body)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+                server._count(status)
+
+            do_GET = do_POST = do_DELETE = do_PATCH = do_PUT = _serve
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+__all__ = ["StubServer", "StubState", "API_PREFIX", "CHALLENGE"]
@@ -1,17 +1,50 @@
-"""MoltCLI utils package."""
-
-from .config import Config, get_config
-from .api_client import MoltbookClient
-from .formatter import OutputFormatter
-from .memory import MemoryStore, MemoryEntry, get_memory, MEMORY_DIR
-from .errors import (
-    MoltCLIError,
-    AuthError,
-    NotFoundError,
-    RateLimitError,
-    handle_error,
-    parse_rate_limit_from_response,
-)
+"""MoltCLI utils package.
+
+Exports are resolved lazily (PEP 562) so importing one utility does not
+pull in the HTTP stack.
+"""
+
+import importlib
+
+# public name -> submodule defining it
+_EXPORTS = {
+    "Config": ".config",
+    "get_config": ".config",
+    "MoltbookClient": ".api_client",
+    "AsyncMoltbookClient": ".async_client",
+    "RateLimitGovernor": ".ratelimit",
+    "RetryPolicy": ".retry",
+    "ResponseCache": ".cache",
+    "OutputFormatter": ".formatter",
+    "MemoryStore": ".memory",
+    "MemoryEntry": ".memory",
+    "get_memory": ".memory",
+    "MEMORY_DIR": ".memory",
+    "Outbox": ".outbox",
+    "Mirror": ".mirror",
+    "Tracer": ".trace",
+    "LatencyStats": ".stats",
+    "MoltCLIError": ".errors",
+    "AuthError": ".errors",
+    "NotFoundError": ".errors",
+    "RateLimitError": ".errors",
+    "NetworkError": ".errors",
+    "handle_error": ".errors",
+    "parse_rate_limit_from_response": ".errors",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
 
 
 def normalize_submolt_name(name: str) -> str:
@@ -29,15 +62,24 @@ __all__ = [
     "Config",
     "get_config",
     "MoltbookClient",
+    "AsyncMoltbookClient",
+    "RateLimitGovernor",
+    "RetryPolicy",
+    "ResponseCache",
     "OutputFormatter",
     "MemoryStore",
     "MemoryEntry",
     "get_memory",
     "MEMORY_DIR",
+    "Outbox",
+    "Mirror",
+    "Tracer",
+    "LatencyStats",
     "MoltCLIError",
     "AuthError",
     "NotFoundError",
     "RateLimitError",
+    "NetworkError",
     "handle_error",
     "parse_rate_limit_from_response",
     "normalize_submolt_name",
@@ -1,51 +1,188 @@
 """Moltbook API client."""
+import contextvars
+import re
+import threading
+import time
+
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import Any, List, Optional, Protocol, Tuple
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from . import codec
+from .cache import CacheEntry, ResponseCache
+from .errors import RateLimitError, AuthError, NotFoundError, NetworkError
+from .ratelimit import RateLimitGovernor, classify_endpoint
+from .retry import Attempt, RetryPolicy
+from .trace import NULL_TRACE, RequestTrace, TraceHook, TracingAdapter
+
+# A write to /posts/{id}... (vote, comment, delete) changes the cached post
+_POST_WRITE_RE = re.compile(r"^/posts/([^/?]+)")
+
+# Attempts of the most recent request in the current thread or task
+_last_attempts: contextvars.ContextVar = contextvars.ContextVar(
+    "moltcli_last_attempts", default=[]
+)
+
+
+class Transport(Protocol):
+    """Interface for the HTTP transport used by MoltbookClient.
+
+    ``requests.Session`` satisfies it, and so does any session object with a
+    compatible ``request()`` (e.g. an HTTP/2-capable adapter).
+    """
+
+    def request(self, method: str, url: str, **kwargs):
+        ...
 
-from .errors import RateLimitError, AuthError, NotFoundError
+    def close(self) -> None:
+        ...
 
 
-class MoltbookClient:
-    """HTTP client for Moltbook API."""
+class BaseClient:
+    """Shared configuration and error mapping for the sync and async clients."""
 
     BASE_URL = "https://www.moltbook.com/api/v1"
+    DEFAULT_TIMEOUT = 30
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        base_url: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        governor: Optional[RateLimitGovernor] = None,
+        rate_limit: bool = True,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        trace: Optional[TraceHook] = None,
+        stats: Optional[TraceHook] = None,
+    ):
         self.api_key = api_key
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.timeout = timeout
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
+        self.governor = (governor or RateLimitGovernor()) if rate_limit else None
+        self.retry = retry or RetryPolicy()
+        self.retry_stats = {"requests": 0, "attempts": 0, "retries": 0, "retry_wait": 0.0}
+        self._stats_lock = threading.Lock()
+        self.cache = cache
+        self.trace = trace
+        self.stats = stats
 
-    def _request(
+    def _emit(self, span: dict) -> None:
+        """Hand a finished request span to the trace and stats hooks."""
+        if self.trace is not None:
+            self.trace(span)
+        if self.stats is not None:
+            self.stats(span)
+
+    def _cache_lookup(
+        self, method: str, endpoint: str, params: Optional[dict]
+    ) -> Tuple[Optional[str], Optional[CacheEntry], bool]:
+        """Find a cached response.
+
+        Returns:
+            (key, entry, fresh); key is None if the request is not cacheable.
+        """
+        if self.cache is None or method.upper() != "GET":
+            return None, None, False
+        ttl = self.cache.ttl_for(endpoint)
+        if ttl is None:
+            return None, None, False
+        key = self.cache.key(method, endpoint, params, self.api_key)
+        entry = self.cache.get(key)
+        return key, entry, entry is not None and entry.is_fresh(ttl)
+
+    def _cache_store(self, key: str, response, body: Any) -> None:
+        self.cache.put(
+            key,
+            body,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def _cache_invalidate(self, method: str, endpoint: str) -> None:
+        """Evict the cached post after a successful write to it."""
+        if self.cache is None or method.upper() == "GET":
+            return
+        match = _POST_WRITE_RE.match(endpoint)
+        if match:
+            self.cache.invalidate(
+                self.cache.key("GET", f"/posts/{match.group(1)}", None, self.api_key)
+            )
+
+    @property
+    def last_attempts(self) -> List[Attempt]:
+        """Per-attempt timing of the last request in this thread or task."""
+        return list(_last_attempts.get())
+
+    def _start_request(self) -> List[Attempt]:
+        attempts: List[Attempt] = []
+        _last_attempts.set(attempts)
+        with self._stats_lock:
+            self.retry_stats["requests"] += 1
+        return attempts
+
+    def _record_attempt(
         self,
-        method: str,
-        endpoint: str,
-        *,
-        params: Optional[dict] = None,
-        json_data: Optional[dict] = None,
-    ) -> dict:
-        """Make HTTP request and handle errors."""
-        url = f"{self.BASE_URL}{endpoint}"
-        response = requests.request(
-            method=method,
-            url=url,
-            params=params,
-            json=json_data,
-            headers=self.headers,
-            timeout=30,
+        attempts: List[Attempt],
+        started: float,
+        status: Optional[int] = None,
+        error: Optional[Exception] = None,
+        retry_delay: Optional[float] = None,
+    ) -> None:
+        attempts.append(
+            Attempt(
+                number=len(attempts) + 1,
+                duration=time.perf_counter() - started,
+                status=status,
+                error=type(error).__name__ if error is not None else None,
+                retry_delay=retry_delay,
+            )
         )
+        with self._stats_lock:
+            self.retry_stats["attempts"] += 1
+            if retry_delay is not None:
+                self.retry_stats["retries"] += 1
+                self.retry_stats["retry_wait"] += retry_delay
+
+    def _error_retry_delay(
+        self, method: str, attempt: int, status: int, error: Exception, endpoint_type: str
+    ) -> Optional[float]:
+        """Retry delay for an error response, or None to raise it."""
+        if isinstance(error, RateLimitError):
+            delay = self.retry.delay_for(
+                method, attempt, status=429, retry_after=error.retry_after
+            )
+            # The governor was penalized and will hold the next send itself
+            if delay is not None and self.governor is not None and error.retry_after:
+                return 0.0
+            return delay
+        return self.retry.delay_for(method, attempt, status=status)
 
-        if not response.ok:
-            self._handle_error_response(response, endpoint)
+    @staticmethod
+    def _json_body(response) -> Any:
+        """Decode a response body with the fast codec.
 
+        Works for requests and httpx responses alike; objects without a raw
+        ``content`` body (test doubles, custom transports) use ``.json()``.
+        """
+        content = getattr(response, "content", None)
+        if isinstance(content, (bytes, bytearray)):
+            return codec.loads(content)
         return response.json()
 
-    def _handle_error_response(self, response, endpoint: str = ""):
+    def _handle_error_response(
+        self, response, endpoint: str = "", endpoint_type: str = "general"
+    ):
         """Handle API error response."""
         status = response.status_code
         try:
-            body = response.json()
+            body = self._json_body(response)
             message = body.get("error") or body.get("message") or response.text
             retry_after = body.get("retry_after_seconds") or body.get("retry_after")
         except Exception:
@@ -62,7 +199,21 @@ class MoltbookClient:
                 limit = int(response.headers["X-RateLimit-Limit"])
             if "X-RateLimit-Remaining" in response.headers:
                 remaining = int(response.headers["X-RateLimit-Remaining"])
-            raise RateLimitError(message=message, retry_after=retry_after, limit=limit, remaining=remaining)
+            if self.governor is not None:
+                self.governor.penalize(endpoint_type, retry_after)
+            raise RateLimitError(
+                message=message,
+                retry_after=retry_after,
+                limit=limit,
+                remaining=remaining,
+                endpoint_type=endpoint_type,
+            )
+
+        # Only sends the server accepted (2xx) or throttled (429) use up a slot;
+        # its X-RateLimit headers, if any, still set the window
+        if self.governor is not None:
+            self.governor.refund(endpoint_type)
+            self.governor.update(endpoint_type, response.headers)
 
         # Authentication errors (401, 403)
         if status in (401, 403):
@@ -83,6 +234,187 @@ class MoltbookClient:
         # Other errors (400, 405, 500, etc.)
         raise Exception(message)
 
+
+class MoltbookClient(BaseClient):
+    """HTTP client for Moltbook API.
+
+    Owns a pooled keep-alive session that is reused by every request, so
+    all Core classes sharing one client also share its connections.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        base_url: Optional[str] = None,
+        session: Optional[Transport] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        timeout: float = BaseClient.DEFAULT_TIMEOUT,
+        governor: Optional[RateLimitGovernor] = None,
+        rate_limit: bool = True,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        trace: Optional[TraceHook] = None,
+        stats: Optional[TraceHook] = None,
+    ):
+        """Initialize client.
+
+        Args:
+            api_key: Moltbook API key
+            base_url: Override API base URL (e.g. a local stub server)
+            session: Transport to use instead of the built-in pooled session
+            pool_connections: Number of host pools to cache
+            pool_maxsize: Max keep-alive connections per host
+            timeout: Request timeout in seconds
+            governor: Rate-limit governor (shared between clients if given)
+            rate_limit: Pace requests client-side (disable to send immediately)
+            retry: Retry policy for transient failures
+            cache: On-disk cache for read endpoints (disabled if None)
+            trace: Called with a timing span per request (see utils.trace)
+            stats: Span consumer for persistent latency stats (see utils.stats)
+        """
+        super().__init__(
+            api_key,
+            base_url=base_url,
+            timeout=timeout,
+            governor=governor,
+            rate_limit=rate_limit,
+            retry=retry,
+            cache=cache,
+            trace=trace,
+            stats=stats,
+        )
+        self._owns_session = session is None
+        self._session = session or self._build_session(
+            pool_connections, pool_maxsize, traced=trace is not None
+        )
+
+    @staticmethod
+    def _build_session(
+        pool_connections: int, pool_maxsize: int, traced: bool = False
+    ) -> requests.Session:
+        """Create a keep-alive session with a sized connection pool."""
+        session = requests.Session()
+        adapter_cls = TracingAdapter if traced else HTTPAdapter
+        adapter = adapter_cls(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close pooled connections (only if the session is owned by us)."""
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> "MoltbookClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: Optional[dict] = None,
+        json_data: Optional[dict] = None,
+    ) -> dict:
+        """Make HTTP request, retrying transient failures per the policy."""
+        if self.trace is None and self.stats is None:
+            return self._send(method, endpoint, params, json_data, NULL_TRACE)
+        trace = RequestTrace(method, endpoint)
+        try:
+            body = self._send(method, endpoint, params, json_data, trace)
+        except BaseException as e:
+            self._emit(trace.span(e))
+            raise
+        self._emit(trace.span())
+        return body
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict],
+        json_data: Optional[dict],
+        trace: RequestTrace,
+    ) -> dict:
+        cache_key, cached, fresh = self._cache_lookup(method, endpoint, params)
+        if fresh:
+            trace.cached("hit")
+            return cached.body
+        headers = {**self.headers, **cached.validators()} if cached else self.headers
+
+        url = f"{self.base_url}{endpoint}"
+        endpoint_type = classify_endpoint(method, endpoint)
+        attempts = self._start_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.governor is not None:
+                delay = self.governor.reserve(endpoint_type)
+                if delay:
+                    trace.add("queue", delay)
+                    time.sleep(delay)
+            trace.begin_attempt()
+            started = time.perf_counter()
+            try:
+                response = self._session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_data,
+                    headers=headers,
+                    timeout=self.timeout,
+                )
+            except requests.exceptions.RequestException as e:
+                sent = _was_sent(e)
+                if not sent and self.governor is not None:
+                    self.governor.refund(endpoint_type)
+                delay = self.retry.delay_for(method, attempt, sent=sent)
+                self._record_attempt(attempts, started, error=e, retry_delay=delay)
+                if delay is None:
+                    raise NetworkError(str(e), sent=sent) from e
+                trace.add("retry_wait", delay)
+                time.sleep(delay)
+                continue
+            trace.received(response, started)
+
+            if not response.ok:
+                try:
+                    self._handle_error_response(response, endpoint, endpoint_type)
+                except Exception as e:
+                    delay = self._error_retry_delay(
+                        method, attempt, response.status_code, e, endpoint_type
+                    )
+                    self._record_attempt(
+                        attempts, started, response.status_code, e, delay
+                    )
+                    if delay is None:
+                        raise
+                    trace.add("retry_wait", delay)
+                    time.sleep(delay)
+                    continue
+
+            self._record_attempt(attempts, started, response.status_code)
+            if self.governor is not None:
+                self.governor.update(endpoint_type, response.headers)
+            if cached is not None and response.status_code == 304:
+                trace.cached("revalidated")
+                self.cache.refresh(cache_key, cached)
+                return cached.body
+            decode_started = time.perf_counter()
+            body = self._json_body(response)
+            trace.add("decode", time.perf_counter() - decode_started)
+            if cache_key is not None:
+                self._cache_store(cache_key, response, body)
+            self._cache_invalidate(method, endpoint)
+            return body
+
     def get(self, endpoint: str, params: Optional[dict] = None) -> dict:
         """GET request."""
         return self._request("GET", endpoint, params=params)
@@ -100,3 +432,13 @@ class MoltbookClient:
     def patch(self, endpoint: str, json_data: Optional[dict] = None) -> dict:
         """PATCH request."""
         return self._request("PATCH", endpoint, json_data=json_data)
+
+
+def _was_sent(error: Exception) -> bool:
+    """Whether a failed request may have reached the server."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return False
+    reason = error.args[0] if error.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return not isinstance(reason, NewConnectionError)
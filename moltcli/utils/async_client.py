@@ -0,0 +1,217 @@
+"""Asyncio Moltbook API client.
+
+Requires the optional ``httpx`` dependency: ``pip install 'moltcli[async]'``.
+"""
+import asyncio
+import time
+from typing import Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without httpx
+    httpx = None
+
+from .api_client import BaseClient
+from .cache import ResponseCache
+from .errors import NetworkError
+from .ratelimit import RateLimitGovernor, classify_endpoint
+from .retry import RetryPolicy
+from .trace import NULL_TRACE, RequestTrace, TraceHook
+
+
+class AsyncMoltbookClient(BaseClient):
+    """Non-blocking HTTP client for Moltbook API.
+
+    Mirrors MoltbookClient's get/post/delete/patch surface and error
+    mapping, so many requests can run concurrently under one event loop.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        base_url: Optional[str] = None,
+        client: Optional["httpx.AsyncClient"] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: float = BaseClient.DEFAULT_TIMEOUT,
+        http2: bool = False,
+        governor: Optional[RateLimitGovernor] = None,
+        rate_limit: bool = True,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        trace: Optional[TraceHook] = None,
+        stats: Optional[TraceHook] = None,
+    ):
+        """Initialize client.
+
+        Args:
+            api_key: Moltbook API key
+            base_url: Override API base URL (e.g. a local stub server)
+            client: httpx.AsyncClient to use instead of building one
+            max_connections: Max concurrent connections (bounds fan-out)
+            max_keepalive_connections: Max idle connections kept open
+            timeout: Request timeout in seconds
+            http2: Enable HTTP/2 (requires the ``h2`` package)
+            governor: Rate-limit governor (shared between clients if given)
+            rate_limit: Pace requests client-side (disable to send immediately)
+            retry: Retry policy for transient failures
+            cache: On-disk cache for read endpoints (disabled if None)
+            trace: Called with a timing span per request (see utils.trace)
+            stats: Span consumer for persistent latency stats (see utils.stats)
+        """
+        if client is None and httpx is None:
+            raise ImportError(
+                "AsyncMoltbookClient requires httpx: pip install 'moltcli[async]'"
+            )
+        super().__init__(
+            api_key,
+            base_url=base_url,
+            timeout=timeout,
+            governor=governor,
+            rate_limit=rate_limit,
+            retry=retry,
+            cache=cache,
+            trace=trace,
+            stats=stats,
+        )
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            http2=http2,
+        )
+
+    async def aclose(self) -> None:
+        """Close pooled connections (only if the client is owned by us)."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncMoltbookClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: Optional[dict] = None,
+        json_data: Optional[dict] = None,
+    ) -> dict:
+        """Make HTTP request, retrying transient failures per the policy."""
+        if self.trace is None and self.stats is None:
+            return await self._send(method, endpoint, params, json_data, NULL_TRACE)
+        trace = RequestTrace(method, endpoint)
+        try:
+            body = await self._send(method, endpoint, params, json_data, trace)
+        except BaseException as e:
+            self._emit(trace.span(e))
+            raise
+        self._emit(trace.span())
+        return body
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict],
+        json_data: Optional[dict],
+        trace: RequestTrace,
+    ) -> dict:
+        cache_key, cached, fresh = self._cache_lookup(method, endpoint, params)
+        if fresh:
+            trace.cached("hit")
+            return cached.body
+        # httpx reports connection steps through the "trace" extension
+        extensions = {"trace": trace.httpx_event} if self.trace is not None else {}
+        headers = {**self.headers, **cached.validators()} if cached else self.headers
+
+        url = f"{self.base_url}{endpoint}"
+        endpoint_type = classify_endpoint(method, endpoint)
+        attempts = self._start_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.governor is not None:
+                delay = self.governor.reserve(endpoint_type)
+                if delay:
+                    trace.add("queue", delay)
+                    await asyncio.sleep(delay)
+            trace.begin_attempt()
+            started = time.perf_counter()
+            try:
+                response = await self._client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_data,
+                    headers=headers,
+                    timeout=self.timeout,
+                    **({"extensions": extensions} if extensions else {}),
+                )
+            except httpx.TransportError as e:
+                sent = not isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if not sent and self.governor is not None:
+                    self.governor.refund(endpoint_type)
+                delay = self.retry.delay_for(method, attempt, sent=sent)
+                self._record_attempt(attempts, started, error=e, retry_delay=delay)
+                if delay is None:
+                    raise NetworkError(str(e), sent=sent) from e
+                trace.add("retry_wait", delay)
+                await asyncio.sleep(delay)
+                continue
+            trace.received_httpx(response, started)
+
+            if not response.is_success and response.status_code != 304:
+                try:
+                    self._handle_error_response(response, endpoint, endpoint_type)
+                except Exception as e:
+                    delay = self._error_retry_delay(
+                        method, attempt, response.status_code, e, endpoint_type
+                    )
+                    self._record_attempt(
+                        attempts, started, response.status_code, e, delay
+                    )
+                    if delay is None:
+                        raise
+                    trace.add("retry_wait", delay)
+                    await asyncio.sleep(delay)
+                    continue
+
+            self._record_attempt(attempts, started, response.status_code)
+            if self.governor is not None:
+                self.governor.update(endpoint_type, response.headers)
+            if cached is not None and response.status_code == 304:
+                trace.cached("revalidated")
+                self.cache.refresh(cache_key, cached)
+                return cached.body
+            decode_started = time.perf_counter()
+            body = self._json_body(response)
+            trace.add("decode", time.perf_counter() - decode_started)
+            if cache_key is not None:
+                self._cache_store(cache_key, response, body)
+            self._cache_invalidate(method, endpoint)
+            return body
+
+    async def get(self, endpoint: str, params: Optional[dict] = None) -> dict:
+        """GET request."""
+        return await self._request("GET", endpoint, params=params)
+
+    async def post(
+        self, endpoint: str, json_data: Optional[dict] = None
+    ) -> dict:
+        """POST request."""
+        return await self._request("POST", endpoint, json_data=json_data)
+
+    async def delete(self, endpoint: str) -> dict:
+        """DELETE request."""
+        return await self._request("DELETE", endpoint)
+
+    async def patch(self, endpoint: str, json_data: Optional[dict] = None) -> dict:
+        """PATCH request."""
+        return await self._request("PATCH", endpoint, json_data=json_data)
@@ -0,0 +1,186 @@
+"""On-disk HTTP response cache for read endpoints."""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Sequence, Tuple
+
+from . import codec
+
+
+CACHE_DIR = "~/.config/moltcli/cache"
+
+# (path pattern, TTL seconds) for cacheable GET endpoints; first match wins
+DEFAULT_TTLS: Tuple[Tuple[str, float], ...] = (
+    (r"^/feed$", 30),
+    (r"^/submolts/trending$", 300),
+    (r"^/submolts$", 300),
+    (r"^/submolts/[^/]+$", 300),
+    (r"^/agents/profile$", 120),
+    (r"^/posts/[^/]+$", 60),
+)
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body with its validators."""
+
+    body: Any
+    stored_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def validators(self) -> dict:
+        """Conditional request headers for revalidation."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Persistent, size-bounded LRU cache keyed by account+method+endpoint+params.
+
+    Each entry is one JSON file; reads touch the file's mtime so eviction
+    removes the least recently used entries first.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttls: Sequence[Tuple[str, float]] = DEFAULT_TTLS,
+        ttl_override: Optional[float] = None,
+        max_bytes: int = 50 * 1024 * 1024,
+    ):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory for entries (default: ~/.config/moltcli/cache)
+            ttls: (path regex, seconds) rules; unmatched endpoints are not cached
+            ttl_override: Use this TTL for every cacheable endpoint
+            max_bytes: Evict least recently used entries above this size
+        """
+        self.cache_dir = Path(cache_dir or CACHE_DIR).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._rules = [(re.compile(pattern), ttl) for pattern, ttl in ttls]
+        self.ttl_override = ttl_override
+        self.max_bytes = max_bytes
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """TTL for an endpoint, or None if it is not cacheable."""
+        path = endpoint.split("?", 1)[0]
+        for pattern, ttl in self._rules:
+            if pattern.match(path):
+                return self.ttl_override if self.ttl_override is not None else ttl
+        return None
+
+    @staticmethod
+    def key(
+        method: str, endpoint: str, params: Optional[dict] = None, account: Optional[str] = None
+    ) -> str:
+        """Stable cache key for a request.
+
+        ``account`` (the API key) is mixed in as a digest, so agents sharing
+        the cache directory never read each other's responses.
+        """
+        raw = json.dumps([method.upper(), endpoint, params or {}], sort_keys=True, default=str)
+        if account:
+            raw += hashlib.sha256(account.encode("utf-8")).hexdigest()[:16]
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Load an entry (fresh or stale) and mark it recently used."""
+        path = self._path(key)
+        try:
+            data = codec.loads(path.read_bytes())
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(**data)
+
+    def put(
+        self,
+        key: str,
+        body: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store a response body atomically."""
+        entry = CacheEntry(body=body, stored_at=time.time(), etag=etag, last_modified=last_modified)
+        data = codec.dumpb(entry.__dict__)
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with self._lock:
+            old_size = path.stat().st_size if path.exists() else 0
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            self._size = self._current_size() + len(data) - old_size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def refresh(self, key: str, entry: CacheEntry) -> None:
+        """Restart an entry's TTL after a 304 Not Modified."""
+        self.put(key, entry.body, entry.etag, entry.last_modified)
+
+    def invalidate(self, key: str) -> None:
+        """Drop one entry, if cached."""
+        path = self._path(key)
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                return
+            if self._size is not None:
+                self._size -= size
+
+    def clear(self) -> int:
+        """Remove every entry. Returns the number removed."""
+        removed = 0
+        with self._lock:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+                removed += 1
+            self._size = 0
+        return removed
+
+    def _current_size(self) -> int:
+        if self._size is None:
+            self._size = sum(p.stat().st_size for p in self.cache_dir.glob("*.json"))
+        return self._size
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under max_bytes."""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._size = total
+
+
+__all__ = ["ResponseCache", "CacheEntry", "CACHE_DIR", "DEFAULT_TTLS"]
@@ -1,109 +1,423 @@
 """Challenge parser for Moltbook verification."""
 
 import re
+from dataclasses import dataclass, field
+from typing import List, NamedTuple, Optional, Tuple, Union
 
-NUMBER_MAP = {
-    # Single digits
-    "zErO": 0,
-    "zERO": 0,
-    "ZERO": 0,
-    "zero": 0,
-    "OnE": 1,
-    "oNe": 1,
-    "ONE": 1,
-    "one": 1,
-    "TwO": 2,
-    "tWo": 2,
-    "TWO": 2,
-    "two": 2,
-    "ThReE": 3,
-    "tHrEe": 3,
-    "THREE": 3,
-    "three": 3,
-    "FoUr": 4,
-    "fOuR": 4,
-    "FOUR": 4,
-    "four": 4,
-    "FiVe": 5,
-    "fIvE": 5,
-    "FIVE": 5,
-    "five": 5,
-    "SiX": 6,
-    "sIx": 6,
-    "SIX": 6,
-    "six": 6,
-    "SeVeN": 7,
-    "sEvEn": 7,
-    "SEVEN": 7,
-    "seven": 7,
-    "EiGhT": 8,
-    "eIgHt": 8,
-    "EIGHT": 8,
-    "eight": 8,
-    "NiNe": 9,
-    "nInE": 9,
-    "NINE": 9,
-    "nine": 9,
-    # Tens
-    "TeN": 10,
-    "tEn": 10,
-    "TEN": 10,
-    "ten": 10,
-    # Teen
-    "TwElVe": 12,
-    "tWeLvE": 12,
-    "TWELVE": 12,
-    "twelve": 12,
-    # Thirty variants
-    "ThIrTy": 30,
-    "tHiRtY": 30,
-    "THIRTY": 30,
-    "thirty": 30,
-    # Combinations with dashes
-    "ThIrTy-TwO": 32,
-    "ThIrTy-FoUr": 34,
-    "ThIrTy-EiGhT": 38,
-    # More combinations
-    "ThIrTy-OnE": 31,
-    "ThIrTy-ThReE": 33,
-    "ThIrTy-FiVe": 35,
-    "ThIrTy-SiX": 36,
-    "ThIrTy-SeVeN": 37,
-    "ThIrTy-NiNe": 39,
+Number = Union[int, float]
+
+UNITS = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4,
+    "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9,
+}
+TEENS = {
+    "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14,
+    "fifteen": 15, "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19,
+}
+TENS = {
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50,
+    "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
 }
 
+# Canonical lowercase number words; matching ignores case
+NUMBER_MAP = {**UNITS, **TEENS, **TENS}
+# Multipliers for the number before them ("two hundred", "five thousand")
+SCALES = {"hundred": 100, "thousand": 1000, "million": 1_000_000, "billion": 1_000_000_000}
+# Magnitude words the solver can't apply; an answer ignoring them is wrong
+UNSUPPORTED_SCALES = ["dozen", "dozens", "trillion", "quadrillion", "lakh", "crore"]
+
+
+def _collapse(text: str) -> str:
+    """Lowercase and squeeze repeated letters ("thrEEe" -> "thre")."""
+    return re.sub(r"(.)\1+", r"\1", text.lower())
+
+
+def _fuzzy(phrase: str) -> str:
+    """Pattern for a phrase that tolerates repeated letters."""
+    return r"\s+".join(
+        "".join(re.escape(c) + "+" for c in _collapse(word)) for word in phrase.split()
+    )
+
+
+def _alternation(words):
+    # Longest first so e.g. "seventeen" is tried before "seven"
+    return "|".join(_fuzzy(w) for w in sorted(words, key=len, reverse=True))
+
+
+_CANONICAL = {_collapse(word): value for word, value in NUMBER_MAP.items()}
+
+# A tens word with an optional unit joined by a hyphen, space or nothing
+# ("thirty-two", "thirty two", "thirtytwo"), a single number word, or a
+# digit run with optional decimals. Words must not be embedded in longer
+# words ("often" holds no "ten").
+_NUMBER_PATTERN = (
+    rf"(?<![a-z])(?:(?P<tens>{_alternation(TENS)})(?:[-\s]?(?P<unit>{_alternation(UNITS)}))?"
+    rf"|(?P<word>{_alternation({**TEENS, **UNITS})}))(?![a-z])"
+    r"|(?<!\w)(?P<digits>\d+(?:\.\d+)?)(?!\w)"
+)
+NUMBER_RE = re.compile(_NUMBER_PATTERN, re.IGNORECASE)
+
+
+class NumberToken(NamedTuple):
+    """A number found in challenge text, with its span."""
+
+    value: Number
+    start: int
+    end: int
+
+
+def _number_value(match: "re.Match") -> Number:
+    if match.group("digits"):
+        digits = match.group("digits")
+        return float(digits) if "." in digits else int(digits)
+    if match.group("tens"):
+        value = _CANONICAL[_collapse(match.group("tens"))]
+        if match.group("unit"):
+            value += _CANONICAL[_collapse(match.group("unit"))]
+        return value
+    return _CANONICAL[_collapse(match.group("word"))]
+
+
+def tokenize_numbers(text: str) -> List[NumberToken]:
+    """Find every number word, compound and digit run, in text order."""
+    return [
+        NumberToken(_number_value(match), match.start(), match.end())
+        for match in NUMBER_RE.finditer(text)
+    ]
+
 
 def extract_numbers(text):
-    """Extract all numbers from challenge text.
+    """Extract all numbers from challenge text, in order of appearance.
+
+    Compounds are read as one number (e.g., "thirty-two" is 32, not 30+2).
+    """
+    return [token.value for token in tokenize_numbers(text)]
+
+
+# Operator phrases between two numbers, by operator
+OPERATOR_WORDS = {
+    "+": ["plus", "add", "adds", "added to", "gains", "increases by", "increased by",
+          "accelerates by", "speeds up by", "grows by"],
+    "-": ["minus", "less", "subtract", "take away", "loses", "decreases by", "decreased by",
+          "slows by", "slows down by", "reduced by", "drops by", "fewer"],
+    "*": ["times", "multiplied by", "multiply by"],
+    "/": ["divided by", "divide by", "split into", "over"],
+}
+# "five less than ten" is 10 - 5: the operands are reversed
+REVERSED_MINUS_WORDS = ["less than", "fewer than", "subtracted from", "taken from"]
+# Words anywhere in the text that suggest the operation when none is explicit
+HINT_WORDS = {
+    "+": ["sum", "total", "combined", "altogether"],
+    "-": ["difference", "remain", "remaining", "left"],
+    "*": ["product"],
+}
+_SYMBOLS = {"+": "+", "-": "-", "*": "*", "/": "/", "×": "*", "÷": "/", "x": "*"}
+
+# Operator words outrank symbols (symbols are often obfuscation noise),
+# which outrank a bare "and"
+_WORD, _SYMBOL, _WEAK = 3, 2, 1
+
+CONFIDENCE_THRESHOLD = 0.8
+
+
+def _words_pattern(words):
+    return rf"(?<![a-z])(?:{_alternation(words)})(?![a-z])"
+
+
+_TOKEN_RE = re.compile(
+    "|".join(
+        [rf"(?P<num>{_NUMBER_PATTERN})", rf"(?P<rev>{_words_pattern(REVERSED_MINUS_WORDS)})"]
+        + [rf"(?P<op{i}>{_words_pattern(w)})" for i, w in enumerate(OPERATOR_WORDS.values())]
+        + [rf"(?P<hint{i}>{_words_pattern(w)})" for i, w in enumerate(HINT_WORDS.values())]
+        + [
+            rf"(?P<scale>{_words_pattern(SCALES)})",
+            rf"(?P<magnitude>{_words_pattern(UNSUPPORTED_SCALES)})",
+            rf"(?P<weak>{_words_pattern(['and'])})",
+            rf"(?P<point>{_words_pattern(['point'])})",
+            r"(?P<sym>[-+*/×÷]|(?<![a-z])x(?![a-z]))",
+            r"(?P<paren>[()])",
+        ]
+    ),
+    re.IGNORECASE,
+)
+_OPS = list(OPERATOR_WORDS)
+_HINTS = list(HINT_WORDS)
+
+# Characters inserted to obfuscate challenges; never meaningful
+_JUNK_RE = re.compile(r"[\[\]{}^|\\~_<>@#$%&`'\"]")
+_INNER_SYMBOL_RE = re.compile(r"(?<=[a-z])[-/*](?=[a-z])", re.IGNORECASE)
+
+
+def deobfuscate(text: str) -> str:
+    """Strip obfuscation noise: junk characters and symbols inside words."""
+    text = _JUNK_RE.sub("", text)
+    text = _INNER_SYMBOL_RE.sub("", text)
+    return " ".join(text.split())
+
 
-    Prioritizes longer patterns (e.g., 32 over 30+2).
+@dataclass
+class Solution:
+    """Result of solving a challenge.
+
+    Attributes:
+        answer: Formatted answer, or None if no expression could be evaluated
+        confidence: 0-1 estimate that the expression was read correctly
+        expression: The expression that was evaluated, e.g. "32 + 4"
+        numbers: Numbers found, in order
     """
-    # Sort patterns by length (longer = more specific first)
-    sorted_patterns = sorted(NUMBER_MAP.items(), key=lambda x: -len(x[0]))
 
-    numbers = []
-    processed_ranges = []
+    answer: Optional[str]
+    confidence: float
+    expression: str = ""
+    numbers: List[Number] = field(default_factory=list)
+
+
+def _lex(text: str) -> List[Tuple[str, object]]:
+    tokens = []
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        if match.group("num") is not None:
+            tokens.append(("num", _number_value(match)))
+        elif kind.startswith("op"):
+            tokens.append(("op", (_OPS[int(kind[2:])], _WORD)))
+        elif kind.startswith("hint"):
+            tokens.append(("hint", _HINTS[int(kind[4:])]))
+        elif kind == "rev":
+            tokens.append(("op", ("r-", _WORD)))
+        elif kind == "weak":
+            tokens.append(("op", ("+", _WEAK)))
+        elif kind == "sym":
+            tokens.append(("op", (_SYMBOLS[match.group("sym").lower()], _SYMBOL)))
+        elif kind == "scale":
+            tokens.append(("scale", _SCALE_VALUES[_collapse(match.group("scale"))]))
+        else:
+            tokens.append((kind, match.group(kind)))
+    return _join_scales(_join_decimals(tokens))
+
+
+_SCALE_VALUES = {_collapse(word): value for word, value in SCALES.items()}
+
+
+def _join_scales(tokens):
+    """Read "two thousand three hundred five" as 2305 and a bare "hundred" as 100."""
+    out = []
+    total = current = None  # Number being built: completed part, open part
+    tail = 0  # Number read after the last scale word ("three" in "two hundred three")
+    largest = None  # Last thousand-or-larger scale applied to the number
+    after_scale = False
+    for i, (kind, value) in enumerate(tokens):
+        if after_scale and (kind, value) == ("op", ("+", _WEAK)):
+            following = tokens[i + 1:i + 3]
+            if (
+                following
+                and following[0][0] == "num"
+                and following[0][1] in range(100)
+                and not (len(following) > 1 and following[1][0] == "scale")
+            ):
+                continue  # "one hundred and five" is one number, "... and two hundred" is not
+        if kind == "scale":
+            if total is not None and (
+                current >= 100 if value == 100 else largest is not None and largest <= value
+            ):
+                # "two hundred three hundred": the second number starts at "three"
+                out.append(("num", total + current - tail))
+                total, current = 0, tail
+                largest = None
+            elif total is None:
+                total = 0
+                largest = None
+                # The multiplier is the number just before, if it is whole
+                if out and out[-1][0] == "num" and isinstance(out[-1][1], int):
+                    current = out.pop()[1]
+                else:
+                    current = 0
+            if value == 100:
+                current = (current or 1) * 100
+            else:
+                total += (current or 1) * value
+                current = 0
+                largest = value
+            tail = 0
+            after_scale = True
+            continue
+        if kind == "num" and after_scale and isinstance(value, int) and value < 100:
+            current += value
+            tail = value
+            after_scale = False
+            continue
+        if total is not None:
+            out.append(("num", total + current))
+            total = current = None
+        after_scale = False
+        out.append((kind, value))
+    if total is not None:
+        out.append(("num", total + current))
+    return out
+
+
+def _join_decimals(tokens):
+    """Read "three point one four" as 3.14."""
+    out = []
+    i = 0
+    while i < len(tokens):
+        kind, value = tokens[i]
+        if kind == "point" and out and out[-1][0] == "num":
+            digits = []
+            j = i + 1
+            while j < len(tokens) and tokens[j][0] == "num" and tokens[j][1] in range(10):
+                digits.append(str(tokens[j][1]))
+                j += 1
+            if digits:
+                out[-1] = ("num", float(f"{int(out[-1][1])}.{''.join(digits)}"))
+                i = j
+                continue
+        if kind != "point":
+            out.append((kind, value))
+        i += 1
+    return out
+
+
+def _resolve_gap(ops, hint):
+    """Pick the operator between two operands. Returns (op, confidence factor)."""
+    if not ops:
+        return (hint, 0.85) if hint else ("+", 0.6)
+    strongest = max(strength for _, strength in ops)
+    if strongest == _WEAK:
+        return (hint, 0.9) if hint else ("+", 0.85)
+    top = [op for op, strength in ops if strength == strongest]
+    factor = 1.0 if len(set(top)) == 1 else 0.5
+    if strongest == _WORD and any(s == _SYMBOL and op != top[0] for op, s in ops):
+        factor *= 0.8
+    return top[0], factor
+
+
+def _build(tokens):
+    """Turn tokens into an infix list of numbers, operators and parens."""
+    hints = {value for kind, value in tokens if kind == "hint"}
+    hint = next(iter(hints)) if len(hints) == 1 else None
+    confidence = 1.0
+    if any(kind == "magnitude" for kind, _ in tokens):
+        confidence *= 0.5
+    parens = [value for kind, value in tokens if kind == "paren"]
+    use_parens = parens.count("(") == parens.count(")") and bool(parens)
+    if parens and not use_parens:
+        confidence *= 0.9
+
+    infix = []
+    pending = []
+    expect_operand = True
+    for kind, value in tokens:
+        if kind == "op":
+            pending.append(value)
+        elif kind == "num" or (use_parens and value == "("):
+            if not expect_operand:
+                op, factor = _resolve_gap(pending, hint)
+                infix.append(op)
+                confidence *= factor
+            elif any(strength == _WORD for _, strength in pending):
+                # An operator word with no left operand was dropped
+                confidence *= 0.9
+            pending = []
+            infix.append(value)
+            expect_operand = kind != "num"
+        elif use_parens and value == ")":
+            infix.append(value)
+            expect_operand = False
+    if any(strength == _WORD for _, strength in pending):
+        confidence *= 0.9
+    if "r-" in infix:
+        if len(infix) == 3:
+            infix = [infix[2], "-", infix[0]]
+        else:
+            # Which operands "less than" swaps is unclear in a longer chain
+            infix = ["-" if item == "r-" else item for item in infix]
+            confidence *= 0.5
+    return infix, confidence
+
+
+class _Parser:
+    """Recursive descent over an infix list with the usual precedence."""
+
+    def __init__(self, infix):
+        self.items = infix
+        self.pos = 0
+
+    def peek(self):
+        return self.items[self.pos] if self.pos < len(self.items) else None
 
-    for pattern, num in sorted_patterns:
-        start = text.find(pattern)
-        if start != -1:
-            # Check if this range overlaps with already found patterns
-            end = start + len(pattern)
-            overlaps = False
-            for p_start, p_end in processed_ranges:
-                if not (end <= p_start or start >= p_end):
-                    overlaps = True
-                    break
+    def take(self):
+        item = self.peek()
+        self.pos += 1
+        return item
 
-            if not overlaps:
-                numbers.append(num)
-                processed_ranges.append((start, end))
+    def expr(self):
+        value, text = self.term()
+        while self.peek() in ("+", "-"):
+            op = self.take()
+            rhs, rhs_text = self.term()
+            value = value + rhs if op == "+" else value - rhs
+            text = f"{text} {op} {rhs_text}"
+        return value, text
 
-    # Also extract any standalone numbers
-    standalone = re.findall(r"\b\d+\b", text)
-    numbers.extend([int(n) for n in standalone])
+    def term(self):
+        value, text = self.factor()
+        while self.peek() in ("*", "/"):
+            op = self.take()
+            rhs, rhs_text = self.factor()
+            value = value * rhs if op == "*" else value / rhs
+            text = f"{text} {op} {rhs_text}"
+        return value, text
 
-    return numbers
+    def factor(self):
+        item = self.take()
+        if item == "(":
+            value, text = self.expr()
+            if self.take() != ")":
+                raise ValueError("unbalanced parentheses")
+            return value, f"({text})"
+        if isinstance(item, (int, float)):
+            return item, _format(item)
+        raise ValueError(f"unexpected {item!r}")
+
+
+def _format(value: Number) -> str:
+    if abs(value - round(value)) < 1e-9:
+        return str(int(round(value)))
+    return f"{value:.2f}"
+
+
+def solve_challenge(challenge: str) -> Solution:
+    """Read the arithmetic expression in a challenge and evaluate it.
+
+    The challenge is de-obfuscated, tokenized into numbers and operators
+    (symbols and words such as "divided by" or "slows by"), and parsed with
+    the usual precedence. Confidence drops for every guess made: operators
+    missing between numbers, conflicting operators, dropped parentheses or
+    operator words that lead nowhere.
+
+    Args:
+        challenge: The challenge string from Moltbook
+
+    Returns:
+        Solution with answer None if fewer than two numbers were found or
+        the expression cannot be evaluated.
+    """
+    tokens = _lex(deobfuscate(challenge))
+    numbers = [value for kind, value in tokens if kind == "num"]
+    if len(numbers) < 2:
+        return Solution(None, 0.0, numbers=numbers)
+    infix, confidence = _build(tokens)
+    if len(numbers) > 4:
+        # Long chains are more often noise words read as numbers
+        confidence *= 0.85
+    try:
+        parser = _Parser(infix)
+        value, expression = parser.expr()
+        if parser.peek() is not None:
+            raise ValueError("trailing tokens")
+    except (ValueError, ZeroDivisionError):
+        return Solution(None, 0.0, " ".join(map(str, infix)), numbers)
+    return Solution(_format(value), round(confidence, 3), expression, numbers)
 
 
 def parse_challenge(challenge):
@@ -115,58 +429,24 @@ def parse_challenge(challenge):
     Returns:
         Calculated answer as string, or None if parsing fails
     """
-    numbers = extract_numbers(challenge)
+    return solve_challenge(challenge).answer
 
-    if len(numbers) < 2:
-        return None
-
-    # Clean challenge of number patterns (prioritize longer matches)
-    # Use the same extraction logic to know which patterns were actually matched
-    clean = challenge
-    sorted_patterns = sorted(NUMBER_MAP.items(), key=lambda x: -len(x[0]))
-    processed_ranges = []
-
-    for pattern, num in sorted_patterns:
-        start = challenge.find(pattern)
-        if start != -1:
-            end = start + len(pattern)
-            overlaps = False
-            for p_start, p_end in processed_ranges:
-                if not (end <= p_start or start >= p_end):
-                    overlaps = True
-                    break
-            if not overlaps:
-                # Replace this matched pattern with spaces
-                clean = clean[:start] + " " * len(pattern) + clean[end:]
-                processed_ranges.append((start, end))
-
-    clean_lower = clean.lower()
-
-    # Detect operation from cleaned text
-    if " + " in clean_lower or (" +" in clean_lower) or ("+" in clean_lower):
-        return str(sum(numbers))
-    elif "minus" in clean_lower or " - " in clean_lower:
-        return str(numbers[0] - numbers[1])
-    elif "times" in clean_lower or " x " in clean_lower or clean_lower.count("x") >= 2:
-        result = 1
-        for n in numbers:
-            result *= n
-        return str(result)
-    else:
-        # Default: add all numbers (most common pattern)
-        return str(sum(numbers))
-
-
-def auto_solve_challenge(challenge):
+
+def auto_solve_challenge(challenge, min_confidence=CONFIDENCE_THRESHOLD):
     """Try to auto-solve a challenge.
 
+    Only answers when the expression was read with high confidence; a
+    wrong answer costs more than asking a human.
+
     Args:
         challenge: The challenge string
+        min_confidence: Minimum Solution.confidence to answer
 
     Returns:
         Tuple of (success: bool, answer: str or error message)
     """
-    numbers = extract_numbers(challenge)
+    solution = solve_challenge(challenge)
+    numbers = solution.numbers
 
     if not numbers:
         return False, "No numbers found in challenge"
@@ -174,9 +454,13 @@ def auto_solve_challenge(challenge):
     if len(numbers) < 2:
         return False, f"Only {len(numbers)} number(s) found, need at least 2"
 
-    answer = parse_challenge(challenge)
-
-    if answer:
-        return True, answer
-    else:
+    if not solution.answer:
         return False, "Could not determine operation"
+
+    if solution.confidence < min_confidence:
+        return False, (
+            f"Low confidence ({solution.confidence:.2f}) reading {solution.expression!r}; "
+            "answer manually"
+        )
+
+    return True, solution.answer
@@ -0,0 +1,133 @@
+"""JSON encoding and decoding through the fastest available library.
+
+Uses orjson, then ujson, when installed (``pip install 'moltcli[fast]'``),
+and the stdlib json module otherwise. Set ``MOLTCLI_JSON`` to ``orjson``,
+``ujson`` or ``json`` to force a backend.
+
+Output is always UTF-8 (non-ASCII text is not escaped). Values a fast
+backend can't encode (integers beyond 64 bits, non-string keys, ...) are
+retried with the stdlib encoder, so every backend accepts the same input.
+Decoding errors are raised as ``ValueError``.
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _std_dumps(obj: Any, indent: bool, sort_keys: bool) -> str:
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+    )
+
+
+def _std_dumpb(obj: Any, indent: bool, sort_keys: bool) -> bytes:
+    try:
+        return _std_dumps(obj, indent, sort_keys).encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates can't be UTF-8 encoded; keep them as \u escapes
+        return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys).encode()
+
+
+def _orjson_dumpb(obj: Any, indent: bool, sort_keys: bool) -> bytes:
+    option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return orjson.dumps(obj, option=option)
+
+
+def _ujson_dumps(obj: Any, indent: bool, sort_keys: bool) -> str:
+    return ujson.dumps(
+        obj,
+        ensure_ascii=False,
+        escape_forward_slashes=False,
+        indent=2 if indent else 0,
+        sort_keys=sort_keys,
+    )
+
+
+class Codec:
+    """One JSON backend behind a common dumps/dumpb/loads interface."""
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Union[str, bytes]], Any],
+        dumps: Optional[Callable[[Any, bool, bool], str]] = None,
+        dumpb: Optional[Callable[[Any, bool, bool], bytes]] = None,
+    ):
+        self.name = name
+        self._loads = loads
+        self._dumps = dumps or (lambda obj, i, s: dumpb(obj, i, s).decode("utf-8"))
+        self._dumpb = dumpb or (lambda obj, i, s: dumps(obj, i, s).encode("utf-8"))
+
+    def dumps(self, obj: Any, indent: bool = False, sort_keys: bool = False) -> str:
+        """Serialize to a str (compact unless ``indent``)."""
+        try:
+            return self._dumps(obj, indent, sort_keys)
+        except (TypeError, OverflowError, UnicodeEncodeError):
+            return _std_dumps(obj, indent, sort_keys)
+
+    def dumpb(self, obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+        """Serialize straight to UTF-8 bytes, for stdout and file writes."""
+        try:
+            return self._dumpb(obj, indent, sort_keys)
+        except (TypeError, OverflowError, UnicodeEncodeError):
+            return _std_dumpb(obj, indent, sort_keys)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """Parse JSON from str or bytes."""
+        return self._loads(data)
+
+    def __repr__(self) -> str:
+        return f"Codec({self.name!r})"
+
+
+def _build() -> Dict[str, Codec]:
+    codecs = {"json": Codec("json", json.loads, _std_dumps, _std_dumpb)}
+    if ujson is not None:
+        codecs["ujson"] = Codec("ujson", ujson.loads, dumps=_ujson_dumps)
+    if orjson is not None:
+        codecs["orjson"] = Codec("orjson", orjson.loads, dumpb=_orjson_dumpb)
+    return codecs
+
+
+CODECS = _build()
+PREFERENCE = ("orjson", "ujson", "json")
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """Codec by name, or the preferred installed one.
+
+    Raises:
+        ValueError: If the named backend is unknown or not installed.
+    """
+    if name is None:
+        name = next(n for n in PREFERENCE if n in CODECS)
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"JSON backend not available: {name!r}") from None
+
+
+# An unavailable $MOLTCLI_JSON falls back to the preferred backend
+_default = CODECS.get(os.environ.get("MOLTCLI_JSON", "")) or get_codec()
+BACKEND = _default.name
+dumps = _default.dumps
+dumpb = _default.dumpb
+loads = _default.loads
+
+
+__all__ = ["Codec", "CODECS", "BACKEND", "get_codec", "dumps", "dumpb", "loads"]
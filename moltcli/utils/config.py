@@ -30,6 +30,10 @@ class Config:
                 self._config = json.load(f)
         return self._config
 
+    def reload(self) -> None:
+        """Forget the cached config so the next access re-reads the file."""
+        self._config = None
+
     @property
     def api_key(self) -> str:
         """Get API key from config."""
@@ -66,11 +66,12 @@ class RateLimitError(MoltCLIError):
             retry_after: Seconds until retry is allowed
             limit: Rate limit maximum requests
             remaining: Remaining requests in window
-            endpoint_type: Type of endpoint (post, vote, general)
+            endpoint_type: Type of endpoint (post, vote, comment, general)
         """
         self.retry_after = retry_after
         self.limit = limit
         self.remaining = remaining
+        self.endpoint_type = endpoint_type
 
         # Use server message if available, else generic
         if message:
@@ -92,6 +93,18 @@ class RateLimitError(MoltCLIError):
         super().__init__(final_message, RATE_LIMIT, suggestion)
 
 
+class NetworkError(MoltCLIError):
+    """Connection to the API failed.
+
+    ``sent`` is False only when the request provably never reached the
+    server (the connection could not be opened).
+    """
+
+    def __init__(self, message: str, sent: bool = True):
+        super().__init__(message, NETWORK_ERROR, "Check your network connection and retry.")
+        self.sent = sent
+
+
 def handle_error(error: Exception) -> dict:
     """Convert exception to error response."""
     if isinstance(error, MoltCLIError):
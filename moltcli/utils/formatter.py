@@ -1,20 +1,54 @@
 """Output formatter for MoltCLI."""
-import json
-from typing import Any
+import sys
+from typing import Any, Iterable
+
+from . import codec
+
+
+def _write(data: bytes, flush: bool = False) -> None:
+    """Write UTF-8 bytes to stdout, skipping the text layer when possible."""
+    # Look up stdout per call: the daemon redirects it per request
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    encoding = (getattr(out, "encoding", None) or "").lower().replace("-", "")
+    if buffer is not None and encoding == "utf8":
+        out.flush()  # Keep order with text already written
+        buffer.write(data)
+        if flush:
+            buffer.flush()
+    else:
+        out.write(data.decode("utf-8"))
+        if flush:
+            out.flush()
 
 
 class OutputFormatter:
     """Handle JSON vs human-readable output."""
 
-    def __init__(self, json_mode: bool = False):
-        self.json_mode = json_mode
+    def __init__(self, json_mode: bool = False, ndjson: bool = False):
+        """Initialize formatter.
+
+        Args:
+            json_mode: Pretty-printed JSON output
+            ndjson: Compact JSON, one object per line (implies json_mode)
+        """
+        self.ndjson = ndjson
+        self.json_mode = json_mode or ndjson
 
     def format(self, data: Any) -> str:
         """Format data for output."""
         if self.json_mode:
-            return json.dumps(data, ensure_ascii=False, indent=2)
+            return self.encode(data).decode("utf-8")
         return self._humanize(data)
 
+    def encode(self, data: Any) -> bytes:
+        """Encode data as JSON output bytes (pretty, or compact lines)."""
+        if not self.ndjson:
+            return codec.dumpb(data, indent=True)
+        if isinstance(data, list):
+            return b"\n".join(codec.dumpb(item) for item in data)
+        return codec.dumpb(data)
+
     def _humanize(self, data: Any, indent: int = 0) -> str:
         """Convert to human-readable format."""
         if isinstance(data, dict):
@@ -37,4 +71,20 @@ class OutputFormatter:
 
     def print(self, data: Any) -> None:
         """Print formatted output."""
-        print(self.format(data))
+        if self.json_mode:
+            _write(self.encode(data) + b"\n")
+        else:
+            print(self._humanize(data))
+
+    def stream(self, items: Iterable[Any]) -> int:
+        """Write items as they arrive, one per line. Returns the count written.
+
+        Items are written as compact JSON lines (human mode included, so
+        --all output stays pipeable) and flushed one by one; nothing is
+        buffered, so memory does not grow with the number of items.
+        """
+        count = 0
+        for item in items:
+            _write(codec.dumpb(item) + b"\n", flush=True)
+            count += 1
+        return count
@@ -2,17 +2,29 @@
 
 import json
 import os
+import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, asdict, field
 import hashlib
 
+from . import codec
+from .memory_index import InvertedIndex
+from .memory_sqlite import SQLiteMemoryBackend, DB_FILENAME
+
 
 MEMORY_DIR = "~/.config/moltcli/memory"
+BACKENDS = ("jsonl", "sqlite")
+SEARCH_CATEGORIES = ["learnings", "context", "interactions"]
+VIEW_CATEGORIES = ["identity", "learnings", "context", "interactions", "platforms"]
+
 
+# Slotted entries (no per-instance __dict__) where dataclasses support it
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class MemoryEntry:
     """A single memory entry."""
 
@@ -33,13 +45,72 @@ class MemoryEntry:
 **Tags:** {tags_str} | **Source:** {self.source} | **ID:** {self.id[-8:]}"""
 
 
+def _entry_from_dict(data: Dict[str, Any], category: str) -> MemoryEntry:
+    """Build an entry, handling legacy records without a category."""
+    if "category" not in data:
+        data = {**data, "category": category}
+    return MemoryEntry(**data)
+
+
+def _read_lines_at(f, offsets: List[int]):
+    """Yield the lines starting at the given byte offsets."""
+    for offset in offsets:
+        f.seek(offset)
+        yield f.readline()
+
+
+def _matches_filters(
+    entry: MemoryEntry,
+    tags: Optional[List[str]],
+    source: Optional[str],
+    since: Optional[str],
+    until: Optional[str],
+    match_any: bool = False,
+) -> bool:
+    if tags:
+        wanted = {t.lower() for t in tags}
+        have = {t.lower() for t in entry.tags}
+        if not (wanted & have if match_any else wanted <= have):
+            return False
+    if source and entry.source != source:
+        return False
+    if since and entry.created_at < since:
+        return False
+    if until and entry.created_at >= until:
+        return False
+    return True
+
+
 class MemoryStore:
-    """Local memory storage for CLI-first agents."""
+    """Local memory storage for CLI-first agents.
+
+    Entries live either in per-category JSONL files, each with a sidecar
+    inverted index, or, once migrated, in an indexed SQLite database
+    (memory.db) in the same directory.
+    """
 
-    def __init__(self, memory_path: Optional[str] = None):
+    def __init__(self, memory_path: Optional[str] = None, backend: Optional[str] = None):
+        """Initialize memory store.
+
+        Args:
+            memory_path: Memory directory (default: ~/.config/moltcli/memory)
+            backend: "jsonl" or "sqlite" (default: sqlite if memory.db exists,
+                else $MOLTCLI_MEMORY_BACKEND, else jsonl)
+        """
         self.memory_path = Path(memory_path or MEMORY_DIR).expanduser()
         self.memory_path.mkdir(parents=True, exist_ok=True)
         self._init_memory_files()
+        self.db_path = self.memory_path / DB_FILENAME
+        if backend is None:
+            if self.db_path.exists():
+                backend = "sqlite"
+            else:
+                backend = os.environ.get("MOLTCLI_MEMORY_BACKEND", "jsonl")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown memory backend: {backend!r}")
+        self.backend = backend
+        self._db = SQLiteMemoryBackend(str(self.db_path)) if backend == "sqlite" else None
+        self._indexes: Dict[str, InvertedIndex] = {}
 
     def _init_memory_files(self):
         """Initialize memory files if they don't exist."""
@@ -83,52 +154,118 @@ class MemoryStore:
 
     def _save_entry(self, entry: MemoryEntry):
         """Save entry to appropriate category file."""
+        if self._db is not None:
+            self._db.add(asdict(entry))
+            return
         filename = f"{entry.category}.jsonl"
         filepath = self.memory_path / filename
-        with open(filepath, "a") as f:
-            f.write(json.dumps(asdict(entry)) + "\n")
+        data = asdict(entry)
+        line = codec.dumpb(data)
+        with open(filepath, "ab") as f:
+            offset = f.tell()
+            f.write(line + b"\n")
+            end = f.tell()
+        index = self._index(entry.category)
+        # Only keep an index current once a search has built it
+        if index.index_path.exists():
+            index.append(offset, end, line.decode(), data)
+
+    def _index(self, category: str) -> InvertedIndex:
+        if category not in self._indexes:
+            self._indexes[category] = InvertedIndex(self.memory_path / f"{category}.jsonl")
+        return self._indexes[category]
+
+    def search(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        source: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+        match_any: bool = False,
+    ) -> List[MemoryEntry]:
+        """Search memories by content.
+
+        On the JSONL backend the query matches as a substring of the stored
+        line; the sidecar index only narrows the lines read.
+
+        Args:
+            query: Text to look for (empty matches everything)
+            category: Restrict to one category
+            tags: Entry must carry every one of these tags (any, with match_any)
+            source: Restrict to this source
+            since: ISO date/time lower bound (inclusive)
+            until: ISO date/time upper bound (exclusive)
+            limit: Max entries to return
+            match_any: Combine tags with OR instead of AND
+
+        Returns:
+            Matching entries; ranked by relevance on the sqlite backend.
+        """
+        categories = [category] if category else SEARCH_CATEGORIES
+        if self._db is not None:
+            rows = self._db.search(
+                query,
+                categories,
+                tags=tags,
+                source=source,
+                since=since,
+                until=until,
+                limit=limit,
+                match_any=match_any,
+            )
+            return [MemoryEntry(**row) for row in rows]
 
-    def search(self, query: str, category: Optional[str] = None) -> List[MemoryEntry]:
-        """Search memories by content."""
         results = []
-        categories = (
-            [category] if category else ["learnings", "context", "interactions"]
-        )
+        needle = query.lower()
         for cat in categories:
             filepath = self.memory_path / f"{cat}.jsonl"
-            if filepath.exists():
-                with open(filepath) as f:
-                    for line in f:
-                        if query.lower() in line.lower():
-                            data = json.loads(line)
-                            # Handle legacy entries without category
-                            if "category" not in data:
-                                data["category"] = cat
-                            results.append(MemoryEntry(**data))
+            if not filepath.exists():
+                continue
+            offsets = self._index(cat).candidates(query, tags or (), match_any)
+            with open(filepath, "rb") as f:
+                lines = iter(f) if offsets is None else _read_lines_at(f, offsets)
+                for raw in lines:
+                    line = raw.decode()
+                    if not line.strip() or needle not in line.lower():
+                        continue
+                    entry = _entry_from_dict(codec.loads(raw), cat)
+                    if _matches_filters(entry, tags, source, since, until, match_any):
+                        results.append(entry)
+                        if limit is not None and len(results) >= limit:
+                            return results
         return results
 
+    def _iter_category(self, category: str):
+        """Yield a category's entries in insertion order."""
+        if self._db is not None:
+            for row in self._db.iter_category(category):
+                yield MemoryEntry(**row)
+            return
+        jsonl_file = self.memory_path / f"{category}.jsonl"
+        with open(jsonl_file, "rb") as f:
+            for line in f:
+                yield _entry_from_dict(codec.loads(line), category)
+
+    def _has_entries(self, category: str) -> bool:
+        if self._db is not None:
+            return category in self._db.categories()
+        return (self.memory_path / f"{category}.jsonl").exists()
+
     def view(self, category: Optional[str] = None) -> str:
         """View memories as human-readable markdown."""
-        categories = (
-            [category]
-            if category
-            else ["identity", "learnings", "context", "interactions", "platforms"]
-        )
+        categories = [category] if category else VIEW_CATEGORIES
         output = []
         for cat in categories:
-            jsonl_file = self.memory_path / f"{cat}.jsonl"
             md_file = self.memory_path / f"{cat}.md"
 
-            if jsonl_file.exists():
+            if self._has_entries(cat):
                 output.append(f"\n# {cat.title()}\n")
-                with open(jsonl_file) as f:
-                    for line in f:
-                        data = json.loads(line)
-                        if "category" not in data:
-                            data["category"] = cat
-                        entry = MemoryEntry(**data)
-                        output.append(entry.to_markdown())
-                        output.append("\n---\n")
+                for entry in self._iter_category(cat):
+                    output.append(entry.to_markdown())
+                    output.append("\n---\n")
             elif md_file.exists():
                 output.append(f"\n# {cat.title()}\n")
                 output.append(md_file.read_text())
@@ -138,13 +275,17 @@ class MemoryStore:
         """Export all memories for portability."""
         if format == "json":
             all_memories = {}
+            if self._db is not None:
+                for cat in self._db.categories():
+                    all_memories[cat] = list(self._db.iter_category(cat))
+                return codec.dumps(all_memories, indent=True)
             for jsonl_file in self.memory_path.glob("*.jsonl"):
                 memories = []
-                with open(jsonl_file) as f:
+                with open(jsonl_file, "rb") as f:
                     for line in f:
-                        memories.append(json.loads(line))
+                        memories.append(codec.loads(line))
                 all_memories[jsonl_file.stem] = memories
-            return json.dumps(all_memories, indent=2)
+            return codec.dumps(all_memories, indent=True)
         elif format == "markdown":
             return self.view()
         return self.view()
@@ -152,16 +293,55 @@ class MemoryStore:
     def import_from(self, data: str, format: str = "json"):
         """Import memories from exported data."""
         if format == "json":
-            all_memories = json.loads(data)
+            all_memories = codec.loads(data)
+            if self._db is not None:
+                for category, memories in all_memories.items():
+                    self._db.add_many(self._normalize(m, category) for m in memories)
+                return
             for category, memories in all_memories.items():
                 filename = f"{category}.jsonl"
                 filepath = self.memory_path / filename
-                with open(filepath, "a") as f:
+                with open(filepath, "ab") as f:
                     for mem in memories:
-                        f.write(json.dumps(mem) + "\n")
+                        f.write(codec.dumpb(mem) + b"\n")
         elif format == "markdown":
             pass  # Markdown import would require parsing
 
+    @staticmethod
+    def _normalize(data: Dict[str, Any], category: str) -> Dict[str, Any]:
+        """Fill fields missing from legacy or hand-written records."""
+        data = {**data}
+        data.setdefault("category", category)
+        if not data.get("id"):
+            raw = json.dumps(data, sort_keys=True)
+            data["id"] = hashlib.sha256(raw.encode()).hexdigest()[:16]
+        return data
+
+    def migrate(self) -> Dict[str, int]:
+        """Ingest every JSONL category file into the SQLite index.
+
+        Safe to re-run: entries already in the database are skipped. The
+        JSONL files are left in place as a backup. Once memory.db exists,
+        new stores open the sqlite backend by default.
+
+        Returns:
+            Entries inserted per category.
+        """
+        db = self._db or SQLiteMemoryBackend(str(self.db_path))
+        counts = {}
+        try:
+            for jsonl_file in sorted(self.memory_path.glob("*.jsonl")):
+                category = jsonl_file.stem
+                with open(jsonl_file, "rb") as f:
+                    records = (
+                        self._normalize(codec.loads(line), category) for line in f if line.strip()
+                    )
+                    counts[category] = db.add_many(records)
+        finally:
+            if db is not self._db:
+                db.close()
+        return counts
+
     def record_interaction(
         self,
         platform: str,
@@ -210,4 +390,4 @@ def get_memory() -> MemoryStore:
     return MemoryStore()
 
 
-__all__ = ["MemoryStore", "MemoryEntry", "get_memory", "MEMORY_DIR"]
+__all__ = ["MemoryStore", "MemoryEntry", "get_memory", "MEMORY_DIR", "BACKENDS"]
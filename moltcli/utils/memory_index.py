@@ -0,0 +1,258 @@
+"""Sidecar inverted index for JSONL memory files.
+
+Each ``<category>.jsonl`` gets a ``.jsonl.idx`` file mapping the word tokens
+of every line (all fields, ids and dates included) and its tags to the byte
+offsets of the lines containing them, plus a
+``.jsonl.idx.log`` delta log appended as entries are saved. The index file
+is memory-mapped, so a lookup scans the vocabulary and reads only the postings
+it needs instead of the whole JSONL file. A query word can sit anywhere
+inside a token ("dentity", "abc123" in "post_abc123"), so the index only
+narrows the candidates; search still confirms each line with a substring
+check.
+
+Layout of the .idx file (little endian):
+    header   magic "MLIX", version u32, indexed_size u64, key_count u32
+    table    key_count x (key_offset u64, key_len u32, postings_offset u64, count u32),
+             sorted by key bytes
+    keys     concatenated UTF-8 keys
+    postings u64 line offsets, ascending per key
+"""
+
+import mmap
+import os
+import re
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from . import codec
+
+_MAGIC = b"MLIX"
+_VERSION = 2
+_HEADER = struct.Struct("<4sIQI")
+_SLOT = struct.Struct("<QIQI")
+_OFFSET = struct.Struct("<Q")
+
+# Rebuild instead of replaying once the delta log holds this many entries
+COMPACT_AFTER = 1000
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> Set[str]:
+    """Lowercased word tokens in text."""
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def entry_keys(line: str, data: Dict[str, Any]) -> Set[str]:
+    """Index keys for one JSONL line: "t:<token>" for the raw line, "g:<tag>"."""
+    keys = {f"t:{token}" for token in tokenize(line)}
+    keys.update(f"g:{str(tag).lower()}" for tag in data.get("tags") or [])
+    return keys
+
+
+class InvertedIndex:
+    """Token and tag index for one JSONL file."""
+
+    def __init__(self, jsonl_path: Path):
+        self.jsonl_path = Path(jsonl_path)
+        self.index_path = self.jsonl_path.with_name(self.jsonl_path.name + ".idx")
+        self.log_path = self.jsonl_path.with_name(self.jsonl_path.name + ".idx.log")
+        self._map: Optional[mmap.mmap] = None
+        self._key_count = 0
+        self._delta: Dict[str, List[int]] = {}
+        self._covered = 0
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def append(self, offset: int, end: int, line: str, data: Dict[str, Any]) -> None:
+        """Record a line just appended to the JSONL file at [offset, end)."""
+        record = {"offset": offset, "end": end, "keys": sorted(entry_keys(line, data))}
+        with open(self.log_path, "ab") as f:
+            f.write(codec.dumpb(record) + b"\n")
+
+    def lookup(self, key: str) -> Set[int]:
+        """Offsets of lines carrying exactly this key."""
+        self._ensure_fresh()
+        found = set(self._delta.get(key, ()))
+        slot = self._lower_bound(key.encode())
+        if slot < self._key_count and self._key_at(slot) == key.encode():
+            found.update(self._postings_at(slot))
+        return found
+
+    def lookup_prefix(self, prefix: str) -> Set[int]:
+        """Offsets of lines carrying any key that starts with prefix."""
+        self._ensure_fresh()
+        found = set()
+        for key, offsets in self._delta.items():
+            if key.startswith(prefix):
+                found.update(offsets)
+        raw = prefix.encode()
+        slot = self._lower_bound(raw)
+        while slot < self._key_count and self._key_at(slot).startswith(raw):
+            found.update(self._postings_at(slot))
+            slot += 1
+        return found
+
+    def lookup_substrings(self, words: Iterable[str]) -> Dict[str, Set[int]]:
+        """Offsets of lines with a token containing each word, per word."""
+        self._ensure_fresh()
+        found: Dict[str, Set[int]] = {word: set() for word in words}
+        if not found:
+            return found
+        for key, offsets in self._delta.items():
+            for word in found:
+                if key.startswith("t:") and word in key[2:]:
+                    found[word].update(offsets)
+        slot = self._lower_bound(b"t:")
+        while slot < self._key_count:
+            key = self._key_at(slot)
+            if not key.startswith(b"t:"):
+                break
+            token = key[2:].decode()
+            hits = [word for word in found if word in token]
+            if hits:
+                postings = self._postings_at(slot)
+                for word in hits:
+                    found[word].update(postings)
+            slot += 1
+        return found
+
+    def candidates(
+        self, query: str, tags: Iterable[str] = (), match_any: bool = False
+    ) -> Optional[List[int]]:
+        """Offsets of lines that may match, ascending.
+
+        Every query word must occur inside a token of the line, which any
+        line containing the whole query as a substring satisfies. Tags are
+        combined with AND, or OR when match_any is set.
+
+        Returns:
+            None if neither query words nor tags constrain the result.
+        """
+        sets = list(self.lookup_substrings(tokenize(query)).values())
+        tag_sets = [self.lookup(f"g:{tag.lower()}") for tag in tags]
+        if tag_sets:
+            sets.append(set().union(*tag_sets) if match_any else set.intersection(*tag_sets))
+        if not sets:
+            return None
+        return sorted(set.intersection(*sets))
+
+    def rebuild(self) -> None:
+        """Rebuild the index from the JSONL file and clear the delta log."""
+        self.close()
+        postings: Dict[str, List[int]] = {}
+        size = 0
+        if self.jsonl_path.exists():
+            with open(self.jsonl_path, "rb") as f:
+                offset = 0
+                for line in f:
+                    if line.strip():
+                        try:
+                            data = codec.loads(line)
+                        except ValueError:
+                            data = None
+                        if isinstance(data, dict):
+                            for key in entry_keys(line.decode(), data):
+                                postings.setdefault(key, []).append(offset)
+                    offset += len(line)
+                size = offset
+        self._write(postings, size)
+        self.log_path.unlink(missing_ok=True)
+
+    def _write(self, postings: Dict[str, List[int]], size: int) -> None:
+        keys = sorted(k.encode() for k in postings)
+        table_start = _HEADER.size
+        keys_start = table_start + _SLOT.size * len(keys)
+        postings_start = keys_start + sum(len(k) for k in keys)
+        table, blob, lists = [], [], []
+        key_off, post_off = keys_start, postings_start
+        for key in keys:
+            offsets = postings[key.decode()]
+            table.append(_SLOT.pack(key_off, len(key), post_off, len(offsets)))
+            blob.append(key)
+            lists.append(b"".join(_OFFSET.pack(o) for o in offsets))
+            key_off += len(key)
+            post_off += _OFFSET.size * len(offsets)
+        tmp = self.index_path.with_suffix(f".idx.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, size, len(keys)))
+            f.write(b"".join(table))
+            f.write(b"".join(blob))
+            f.write(b"".join(lists))
+        os.replace(tmp, self.index_path)
+
+    def _load(self) -> bool:
+        """Map the index and replay the delta log. False if unusable."""
+        self.close()
+        self._delta = {}
+        try:
+            with open(self.index_path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+        if len(self._map) < _HEADER.size:
+            return False
+        magic, version, size, count = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            return False
+        self._key_count = count
+        self._covered = size
+        replayed = 0
+        if self.log_path.exists():
+            with open(self.log_path, "rb") as f:
+                for line in f:
+                    try:
+                        record = codec.loads(line)
+                    except ValueError:
+                        return False
+                    if record["offset"] != self._covered:
+                        return False
+                    for key in record["keys"]:
+                        self._delta.setdefault(key, []).append(record["offset"])
+                    self._covered = record["end"]
+                    replayed += 1
+        return replayed < COMPACT_AFTER
+
+    def _is_stale(self) -> bool:
+        try:
+            jsonl = self.jsonl_path.stat()
+        except FileNotFoundError:
+            return self._covered != 0
+        index_mtime = max(
+            (p.stat().st_mtime for p in (self.index_path, self.log_path) if p.exists()),
+            default=0,
+        )
+        return jsonl.st_size != self._covered or jsonl.st_mtime > index_mtime
+
+    def _ensure_fresh(self) -> None:
+        if self._map is not None and not self._is_stale():
+            return
+        if not self._load() or self._is_stale():
+            self.rebuild()
+            if not self._load():
+                raise OSError(f"Could not load memory index: {self.index_path}")
+
+    def _key_at(self, slot: int) -> bytes:
+        key_off, key_len, _, _ = _SLOT.unpack_from(self._map, _HEADER.size + slot * _SLOT.size)
+        return self._map[key_off:key_off + key_len]
+
+    def _postings_at(self, slot: int) -> List[int]:
+        _, _, post_off, count = _SLOT.unpack_from(self._map, _HEADER.size + slot * _SLOT.size)
+        return [o for (o,) in _OFFSET.iter_unpack(self._map[post_off:post_off + count * _OFFSET.size])]
+
+    def _lower_bound(self, key: bytes) -> int:
+        lo, hi = 0, self._key_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+__all__ = ["InvertedIndex", "tokenize", "entry_keys", "COMPACT_AFTER"]
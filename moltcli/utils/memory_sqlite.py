@@ -0,0 +1,223 @@
+"""SQLite backend for the local memory store."""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from . import codec
+
+
+DB_FILENAME = "memory.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    category TEXT NOT NULL,
+    content TEXT NOT NULL,
+    tags TEXT NOT NULL DEFAULT '[]',
+    source TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL DEFAULT '',
+    metadata TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS ix_entries_category ON entries(category, created_at);
+CREATE INDEX IF NOT EXISTS ix_entries_source ON entries(source, created_at);
+CREATE INDEX IF NOT EXISTS ix_entries_created ON entries(created_at);
+CREATE TABLE IF NOT EXISTS entry_tags (
+    tag TEXT NOT NULL,
+    entry_rowid INTEGER NOT NULL REFERENCES entries(rowid) ON DELETE CASCADE,
+    PRIMARY KEY (tag, entry_rowid)
+) WITHOUT ROWID;
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    content, tags, content='entries', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, content, tags) VALUES (new.rowid, new.content, new.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, content, tags)
+    VALUES ('delete', old.rowid, old.content, old.tags);
+END;
+"""
+
+
+def fts_query(query: str) -> str:
+    """Turn free text into an FTS5 query: every word, as a prefix, must match."""
+    terms = []
+    for word in query.split():
+        word = word.replace('"', '""')
+        terms.append(f'"{word}"*')
+    return " ".join(terms)
+
+
+class SQLiteMemoryBackend:
+    """Indexed memory storage in a single SQLite database.
+
+    Entries are indexed by category, source, tag and creation time, and
+    content is searchable through an FTS5 table ranked by bm25. Builds of
+    SQLite without FTS5 fall back to substring matching.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path).expanduser()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(_SCHEMA)
+            try:
+                self._conn.executescript(_FTS_SCHEMA)
+                self.fts = True
+            except sqlite3.OperationalError:
+                self.fts = False
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def add(self, entry: Dict[str, Any]) -> bool:
+        """Insert one entry dict. Returns False if its ID already exists."""
+        return self.add_many([entry]) == 1
+
+    def add_many(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """Insert entries in one transaction, skipping known IDs.
+
+        Returns:
+            Number of entries inserted.
+        """
+        inserted = 0
+        with self._lock, self._conn:
+            for entry in entries:
+                tags = list(entry.get("tags") or [])
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO entries"
+                    " (id, category, content, tags, source, created_at, metadata)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        entry["id"],
+                        entry["category"],
+                        entry.get("content", ""),
+                        codec.dumps(tags),
+                        entry.get("source", ""),
+                        entry.get("created_at", ""),
+                        codec.dumps(entry.get("metadata") or {}),
+                    ),
+                )
+                if not cursor.rowcount:
+                    continue
+                inserted += 1
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO entry_tags (tag, entry_rowid) VALUES (?, ?)",
+                    [(tag.lower(), cursor.lastrowid) for tag in set(tags)],
+                )
+        return inserted
+
+    def search(
+        self,
+        query: str = "",
+        categories: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        source: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+        match_any: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Find entries matching every given filter.
+
+        Full-text matches are ranked best first; filter-only queries are
+        returned oldest first.
+
+        Args:
+            query: Free text matched against content and tags
+            categories: Restrict to these categories
+            tags: Entry must carry every one of these tags (case-insensitive)
+            source: Restrict to this source
+            since: ISO timestamp lower bound (inclusive)
+            until: ISO timestamp upper bound (exclusive)
+            limit: Max entries to return
+            match_any: Entry needs only one of the tags
+        """
+        clauses, params = [], []
+        order = "e.created_at, e.rowid"
+        tables = "entries e"
+        if query.strip():
+            if self.fts:
+                tables += " JOIN entries_fts f ON f.rowid = e.rowid"
+                clauses.append("entries_fts MATCH ?")
+                params.append(fts_query(query))
+                order = "bm25(entries_fts), e.created_at"
+            else:
+                clauses.append("(instr(lower(e.content), ?) OR instr(lower(e.tags), ?))")
+                params += [query.lower(), query.lower()]
+        if categories:
+            clauses.append(f"e.category IN ({', '.join('?' * len(categories))})")
+            params += categories
+        tag_groups = [tags] if match_any and tags else [[tag] for tag in tags or []]
+        for group in tag_groups:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM entry_tags t WHERE t.entry_rowid = e.rowid"
+                f" AND t.tag IN ({', '.join('?' * len(group))}))"
+            )
+            params += [tag.lower() for tag in group]
+        if source:
+            clauses.append("e.source = ?")
+            params.append(source)
+        if since:
+            clauses.append("e.created_at >= ?")
+            params.append(since)
+        if until:
+            clauses.append("e.created_at < ?")
+            params.append(until)
+        sql = f"SELECT e.* FROM {tables}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def iter_category(self, category: str) -> Iterator[Dict[str, Any]]:
+        """Yield a category's entries oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM entries WHERE category = ? ORDER BY created_at, rowid",
+                (category,),
+            ).fetchall()
+        for row in rows:
+            yield self._row_to_dict(row)
+
+    def categories(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT category FROM entries ORDER BY category"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "category": row["category"],
+            "content": row["content"],
+            "tags": codec.loads(row["tags"]),
+            "source": row["source"],
+            "created_at": row["created_at"],
+            "metadata": codec.loads(row["metadata"]),
+        }
+
+
+__all__ = ["SQLiteMemoryBackend", "DB_FILENAME", "fts_query"]
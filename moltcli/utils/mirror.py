@@ -0,0 +1,337 @@
+"""Local SQLite mirror of posts, comments and submolts.
+
+``moltcli sync`` fills the mirror from the API; read commands answer from
+it with ``--offline``. Items are upserted by ID, and every change in a
+post's votes or comment count is appended to ``post_history``.
+
+Each synced listing ("feed", "submolt/general", ...) and sort keeps its
+own high-water mark: the newest ``created_at`` seen. For ``new`` listings
+that is where the next sync stops; ranked sorts (hot, top, ...) reshuffle
+old posts, so their window is re-read and its order replaced.
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from . import codec, normalize_submolt_name
+from .errors import MoltCLIError
+
+
+MIRROR_PATH = "~/.config/moltcli/mirror.db"
+NOT_SYNCED = "NOT_SYNCED"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id TEXT PRIMARY KEY,
+    submolt TEXT,
+    created_at TEXT NOT NULL DEFAULT '',
+    upvotes INTEGER,
+    downvotes INTEGER,
+    comment_count INTEGER,
+    data TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_posts_submolt ON posts(submolt, created_at);
+CREATE INDEX IF NOT EXISTS ix_posts_created ON posts(created_at);
+CREATE TABLE IF NOT EXISTS post_history (
+    post_id TEXT NOT NULL,
+    observed_at REAL NOT NULL,
+    upvotes INTEGER,
+    downvotes INTEGER,
+    comment_count INTEGER
+);
+CREATE INDEX IF NOT EXISTS ix_history_post ON post_history(post_id, observed_at);
+CREATE TABLE IF NOT EXISTS comments (
+    id TEXT PRIMARY KEY,
+    post_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_comments_post ON comments(post_id, position);
+CREATE TABLE IF NOT EXISTS submolts (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS listing_items (
+    listing TEXT NOT NULL,
+    post_id TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    PRIMARY KEY (listing, post_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sync_state (
+    listing TEXT PRIMARY KEY,
+    high_water TEXT NOT NULL DEFAULT '',
+    synced_at REAL NOT NULL
+);
+"""
+
+# Sorts whose order is chronological, so a high-water mark ends a sync
+CHRONOLOGICAL = ("new",)
+
+
+def listing_key(source: str, sort: str, submolt: Optional[str] = None) -> str:
+    """Key for one synced listing, e.g. "feed:hot" or "submolt/general:new"."""
+    if submolt:
+        source = f"{source}/{normalize_submolt_name(submolt)}"
+    return f"{source}:{sort}"
+
+
+def _submolt_name(post: Dict[str, Any]) -> Optional[str]:
+    submolt = post.get("submolt")
+    if isinstance(submolt, dict):
+        submolt = submolt.get("name")
+    return normalize_submolt_name(submolt) if isinstance(submolt, str) else None
+
+
+def _not_synced(what: str, hint: str) -> MoltCLIError:
+    return MoltCLIError(f"No mirrored {what}", NOT_SYNCED, f"Run 'moltcli sync {hint}' first")
+
+
+class Mirror:
+    """Posts, comments and submolts mirrored in one SQLite database."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """Initialize mirror.
+
+        Args:
+            db_path: Database file (default: ~/.config/moltcli/mirror.db)
+        """
+        self.db_path = Path(db_path or MIRROR_PATH).expanduser()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # -- sync state ----------------------------------------------------
+
+    def high_water(self, listing: str) -> Optional[str]:
+        """Newest created_at synced for a listing, or None if never synced."""
+        row = self._conn.execute(
+            "SELECT high_water FROM sync_state WHERE listing = ?", (listing,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def known(self, listing: str, post_id: str) -> bool:
+        """Whether a post is already part of a listing."""
+        row = self._conn.execute(
+            "SELECT 1 FROM listing_items WHERE listing = ? AND post_id = ?", (listing, post_id)
+        ).fetchone()
+        return row is not None
+
+    def status(self) -> Dict[str, Any]:
+        """Mirrored item counts and per-listing sync state."""
+        conn = self._conn
+        counts = {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("posts", "comments", "submolts", "post_history")
+        }
+        listings = {
+            listing: {
+                "high_water": high_water or None,
+                "synced_at": datetime.fromtimestamp(synced_at, timezone.utc).isoformat(),
+            }
+            for listing, high_water, synced_at in conn.execute(
+                "SELECT listing, high_water, synced_at FROM sync_state ORDER BY listing"
+            )
+        }
+        return {"path": str(self.db_path), "counts": counts, "listings": listings}
+
+    # -- writes ----------------------------------------------------------
+
+    def store_listing(
+        self, listing: str, posts: List[Dict[str, Any]], replace: bool
+    ) -> Dict[str, int]:
+        """Upsert a listing's posts and record it as synced.
+
+        Args:
+            listing: Key from listing_key()
+            posts: Items in listing order
+            replace: Drop the listing's previous order (ranked sorts); otherwise
+                the posts are added to it
+
+        Returns:
+            Counts of new posts and posts whose votes or comments changed.
+        """
+        now = time.time()
+        new = changed = 0
+        with self._lock, self._conn as conn:
+            if replace:
+                conn.execute("DELETE FROM listing_items WHERE listing = ?", (listing,))
+            high_water = conn.execute(
+                "SELECT high_water FROM sync_state WHERE listing = ?", (listing,)
+            ).fetchone()
+            high_water = high_water[0] if high_water else ""
+            for rank, post in enumerate(posts):
+                status = self._upsert_post(conn, post, now)
+                new += status == "new"
+                changed += status == "changed"
+                conn.execute(
+                    "INSERT OR REPLACE INTO listing_items (listing, post_id, rank)"
+                    " VALUES (?, ?, ?)",
+                    (listing, str(post["id"]), rank),
+                )
+                high_water = max(high_water, post.get("created_at") or "")
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (listing, high_water, synced_at)"
+                " VALUES (?, ?, ?)",
+                (listing, high_water, now),
+            )
+        return {"new": new, "changed": changed}
+
+    @staticmethod
+    def _upsert_post(conn: sqlite3.Connection, post: Dict[str, Any], now: float) -> str:
+        """Insert or update one post. Returns "new", "changed" or "same"."""
+        post_id = str(post["id"])
+        counters = (post.get("upvotes"), post.get("downvotes"), post.get("comment_count"))
+        old = conn.execute(
+            "SELECT upvotes, downvotes, comment_count FROM posts WHERE id = ?", (post_id,)
+        ).fetchone()
+        conn.execute(
+            "INSERT INTO posts"
+            " (id, submolt, created_at, upvotes, downvotes, comment_count, data,"
+            " first_seen, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT(id) DO UPDATE SET submolt = excluded.submolt,"
+            " upvotes = excluded.upvotes, downvotes = excluded.downvotes,"
+            " comment_count = excluded.comment_count, data = excluded.data,"
+            " updated_at = excluded.updated_at",
+            (
+                post_id,
+                _submolt_name(post),
+                post.get("created_at") or "",
+                *counters,
+                codec.dumps(post),
+                now,
+                now,
+            ),
+        )
+        if old is not None and tuple(old) == counters:
+            return "same"
+        conn.execute(
+            "INSERT INTO post_history (post_id, observed_at, upvotes, downvotes, comment_count)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (post_id, now, *counters),
+        )
+        return "new" if old is None else "changed"
+
+    def store_comments(self, post_id: str, comments: Iterable[Dict[str, Any]]) -> int:
+        """Replace a post's mirrored comments. Returns the number stored."""
+        now = time.time()
+        count = 0
+        with self._lock, self._conn as conn:
+            conn.execute("DELETE FROM comments WHERE post_id = ?", (post_id,))
+            for position, comment in enumerate(comments):
+                conn.execute(
+                    "INSERT OR REPLACE INTO comments (id, post_id, position, data, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (str(comment["id"]), post_id, position, codec.dumps(comment), now),
+                )
+                count += 1
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (listing, synced_at) VALUES (?, ?)",
+                (f"comments/{post_id}", now),
+            )
+        return count
+
+    def store_submolts(self, submolts: Iterable[Dict[str, Any]]) -> int:
+        """Replace the mirrored submolt list. Returns the number stored."""
+        now = time.time()
+        count = 0
+        with self._lock, self._conn as conn:
+            conn.execute("DELETE FROM submolts")
+            for position, submolt in enumerate(submolts):
+                conn.execute(
+                    "INSERT OR REPLACE INTO submolts (name, position, data, updated_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (normalize_submolt_name(submolt["name"]), position, codec.dumps(submolt), now),
+                )
+                count += 1
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (listing, synced_at) VALUES (?, ?)",
+                ("submolts", now),
+            )
+        return count
+
+    # -- offline reads ---------------------------------------------------
+
+    def listing(self, listing: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Mirrored posts of a listing, in its order.
+
+        Raises:
+            MoltCLIError: If the listing was never synced.
+        """
+        if self.high_water(listing) is None:
+            source, sort = listing.rsplit(":", 1)
+            hint = f"feed --sort {sort}"
+            if source.startswith("submolt/"):
+                hint = f"submolt {source.split('/', 1)[1]} --sort {sort}"
+            elif "/" in source:
+                hint += f" --submolt {source.split('/', 1)[1]}"
+            raise _not_synced(f"posts for {listing}", hint)
+        order = "p.created_at DESC" if listing.endswith(":new") else "l.rank"
+        rows = self._conn.execute(
+            "SELECT p.data FROM listing_items l JOIN posts p ON p.id = l.post_id"
+            f" WHERE l.listing = ? ORDER BY {order} LIMIT ?",
+            (listing, limit),
+        )
+        return [codec.loads(data) for data, in rows]
+
+    def post(self, post_id: str) -> Optional[Dict[str, Any]]:
+        """A mirrored post, or None."""
+        row = self._conn.execute("SELECT data FROM posts WHERE id = ?", (post_id,)).fetchone()
+        return codec.loads(row[0]) if row else None
+
+    def history(self, post_id: str) -> List[Dict[str, Any]]:
+        """Observed vote and comment counts of a post, oldest first."""
+        rows = self._conn.execute(
+            "SELECT observed_at, upvotes, downvotes, comment_count FROM post_history"
+            " WHERE post_id = ? ORDER BY observed_at",
+            (post_id,),
+        )
+        return [
+            {"observed_at": at, "upvotes": up, "downvotes": down, "comment_count": comments}
+            for at, up, down, comments in rows
+        ]
+
+    def comments(self, post_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """Mirrored comments of a post.
+
+        Raises:
+            MoltCLIError: If the post's comments were never synced.
+        """
+        if self.high_water(f"comments/{post_id}") is None:
+            raise _not_synced(f"comments for post {post_id}", f"comments {post_id}")
+        rows = self._conn.execute(
+            "SELECT data FROM comments WHERE post_id = ? ORDER BY position LIMIT ?",
+            (post_id, limit),
+        )
+        return [codec.loads(data) for data, in rows]
+
+    def submolts(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Mirrored submolts.
+
+        Raises:
+            MoltCLIError: If submolts were never synced.
+        """
+        if self.high_water("submolts") is None:
+            raise _not_synced("submolts", "submolts")
+        rows = self._conn.execute(
+            "SELECT data FROM submolts ORDER BY position LIMIT ?", (limit,)
+        )
+        return [codec.loads(data) for data, in rows]
+
+
+__all__ = ["Mirror", "listing_key", "MIRROR_PATH", "NOT_SYNCED"]
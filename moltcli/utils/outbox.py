@@ -0,0 +1,178 @@
+"""Durable local queue of posts waiting to be published.
+
+Each queued post is one JSON file that moves between subdirectories:
+
+    tmp/      being written (never read)
+    pending/  queued, drained oldest first
+    active/   claimed by a drain worker
+    failed/   rejected by the server, or possibly published (the request
+              failed after it was sent), kept for inspection
+
+Files are written to ``tmp/``, fsynced and renamed into place, and every
+state change is a single ``os.replace``, so a crash leaves each post in
+exactly one state. A drain that dies mid-publish leaves its post in
+``active/``; the next drain moves it back to ``pending/`` (delivery is
+at-least-once).
+"""
+
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-worker use only
+    fcntl = None
+
+
+OUTBOX_DIR = "~/.config/moltcli/outbox"
+STATES = ("pending", "active", "failed")
+
+
+class OutboxBusyError(RuntimeError):
+    """Another process is already draining the outbox."""
+
+
+class Outbox:
+    """Crash-safe on-disk queue of posts."""
+
+    def __init__(self, outbox_path: Optional[str] = None):
+        """Initialize outbox.
+
+        Args:
+            outbox_path: Queue directory (default: ~/.config/moltcli/outbox)
+        """
+        self.path = Path(outbox_path or OUTBOX_DIR).expanduser()
+        for name in ("tmp",) + STATES:
+            (self.path / name).mkdir(parents=True, exist_ok=True)
+
+    def _file(self, state: str, item_id: str) -> Path:
+        return self.path / state / f"{item_id}.json"
+
+    def _write(self, state: str, item: dict) -> None:
+        """Atomically write an item into a state directory."""
+        tmp = self.path / "tmp" / f"{item['id']}.{os.getpid()}.json"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(item, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._file(state, item["id"]))
+        self._sync_dir(self.path / state)
+
+    @staticmethod
+    def _sync_dir(path: Path) -> None:
+        """Persist a rename; not supported on every platform."""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def enqueue(
+        self,
+        submolt: str,
+        title: str,
+        content: Optional[str] = None,
+        url: Optional[str] = None,
+    ) -> dict:
+        """Queue a post. Returns the stored item."""
+        # Time-prefixed ids sort in enqueue order
+        item = {
+            "id": f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}",
+            "submolt": submolt,
+            "title": title,
+            "content": content,
+            "url": url,
+            "queued_at": datetime.now().isoformat(),
+            "attempts": 0,
+        }
+        self._write("pending", item)
+        return item
+
+    def items(self, state: str = "pending") -> List[dict]:
+        """Items in a state, oldest first."""
+        items = []
+        for path in sorted((self.path / state).glob("*.json")):
+            try:
+                items.append(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                continue  # Claimed or removed meanwhile
+        return items
+
+    def counts(self) -> dict:
+        """Number of items in each state."""
+        return {state: len(list((self.path / state).glob("*.json"))) for state in STATES}
+
+    def claim(self) -> Optional[dict]:
+        """Move the oldest pending item to active/ and return it."""
+        for path in sorted((self.path / "pending").glob("*.json")):
+            target = self.path / "active" / path.name
+            try:
+                os.replace(path, target)
+            except FileNotFoundError:
+                continue  # Someone else claimed it
+            item = json.loads(target.read_text(encoding="utf-8"))
+            item["attempts"] = item.get("attempts", 0) + 1
+            self._write("active", item)
+            return item
+        return None
+
+    def release(self, item: dict) -> None:
+        """Return a claimed item to the queue, keeping its place."""
+        self._write("pending", item)
+        self._file("active", item["id"]).unlink(missing_ok=True)
+
+    def complete(self, item: dict) -> None:
+        """Drop a published item."""
+        self._file("active", item["id"]).unlink(missing_ok=True)
+        self._sync_dir(self.path / "active")
+
+    def fail(self, item: dict, error: dict) -> None:
+        """Park a rejected item in failed/ with the error."""
+        self._write("failed", {**item, "error": error})
+        self._file("active", item["id"]).unlink(missing_ok=True)
+
+    def recover(self) -> int:
+        """Requeue items left in active/ by a crashed drain."""
+        recovered = 0
+        for path in sorted((self.path / "active").glob("*.json")):
+            try:
+                os.replace(path, self.path / "pending" / path.name)
+            except FileNotFoundError:
+                continue
+            recovered += 1
+        for path in (self.path / "tmp").glob("*.json"):
+            path.unlink(missing_ok=True)
+        return recovered
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold the drain lock, so one worker publishes at a time.
+
+        Raises:
+            OutboxBusyError: If another process holds it.
+        """
+        with open(self.path / ".lock", "a") as f:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    raise OutboxBusyError(f"Outbox is being drained: {self.path}")
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+__all__ = ["Outbox", "OutboxBusyError", "OUTBOX_DIR"]
@@ -0,0 +1,384 @@
+"""Client-side rate-limit governor for MoltCLI.
+
+Keeps one token bucket per endpoint class and paces outgoing requests so
+the server's limits are respected before a 429 happens. Buckets start from
+Moltbook's published limits and are corrected from the ``X-RateLimit-*``
+headers of every response.
+
+``SharedRateLimitGovernor`` keeps the buckets in a lock-protected file, so
+concurrent processes using one API key share a single budget.
+"""
+
+import hashlib
+import math
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: no cross-process locking
+    fcntl = None
+
+from . import codec
+from .errors import RateLimitError
+
+LIMITS_DIR = "~/.config/moltcli"
+
+
+# endpoint_type -> (requests, window seconds)
+DEFAULT_LIMITS: Dict[str, Tuple[int, float]] = {
+    "general": (100, 60),
+    "vote": (100, 60),
+    "comment": (1, 20),
+    "post": (1, 1800),
+}
+
+_VOTE_RE = re.compile(r"^/(posts|comments)/[^/]+/(upvote|downvote)$")
+_COMMENT_RE = re.compile(r"^/posts/[^/]+/comments$")
+
+
+def classify_endpoint(method: str, endpoint: str) -> str:
+    """Map a request to its rate-limit class (post, vote, comment, general)."""
+    if method.upper() != "POST":
+        return "general"
+    path = endpoint.split("?", 1)[0].rstrip("/")
+    if path == "/posts":
+        return "post"
+    if _VOTE_RE.match(path):
+        return "vote"
+    if _COMMENT_RE.match(path):
+        return "comment"
+    return "general"
+
+
+def _header_int(headers: Mapping, name: str) -> Optional[int]:
+    """Read an integer header, ignoring missing or malformed values."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``limit / window`` per second."""
+
+    def __init__(self, limit: int, window: float, now: float):
+        self.limit = limit
+        self.window = window
+        self.tokens = float(limit)
+        self.updated = now
+        self.blocked_until = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.limit / self.window
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(float(self.limit), self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def delay(self, now: float) -> float:
+        """Seconds until a token is available."""
+        self._refill(now)
+        wait = max(0.0, self.blocked_until - now)
+        if self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) / self.rate)
+        return wait
+
+    def take(self, now: float) -> None:
+        """Consume a token (may go negative to queue concurrent callers)."""
+        self._refill(now)
+        self.tokens -= 1
+
+    def sync(
+        self,
+        limit: Optional[int],
+        remaining: Optional[int],
+        reset_after: Optional[float],
+        now: float,
+    ) -> None:
+        """Adopt the server's view of the bucket."""
+        self._refill(now)
+        if limit:
+            self.limit = limit
+        if remaining is not None:
+            self.tokens = min(self.tokens, float(remaining))
+            if remaining <= 0 and reset_after:
+                self.blocked_until = max(self.blocked_until, now + reset_after)
+
+    def block(self, seconds: float, now: float) -> None:
+        """Refuse tokens for ``seconds`` (after a 429)."""
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens = min(self.tokens, 0.0)
+
+
+class RateLimitGovernor:
+    """Proactively pace requests per endpoint class."""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[int, float]]] = None,
+        max_wait: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize governor.
+
+        Args:
+            limits: Override DEFAULT_LIMITS per endpoint class
+            max_wait: Raise RateLimitError instead of waiting longer than this
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.max_wait = max_wait
+        self._clock = clock
+        self._lock = threading.Lock()
+        now = clock()
+        merged = dict(DEFAULT_LIMITS)
+        merged.update(limits or {})
+        self._buckets = {
+            kind: TokenBucket(limit, window, now) for kind, (limit, window) in merged.items()
+        }
+
+    def _bucket(self, endpoint_type: str) -> TokenBucket:
+        return self._buckets.get(endpoint_type) or self._buckets["general"]
+
+    def reserve(self, endpoint_type: str) -> float:
+        """Reserve a request slot.
+
+        Returns:
+            Seconds the caller must wait before sending.
+
+        Raises:
+            RateLimitError: If the wait would exceed max_wait. No slot is
+                consumed in that case.
+        """
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(endpoint_type)
+            wait = bucket.delay(now)
+            if wait > self.max_wait:
+                raise RateLimitError(
+                    retry_after=math.ceil(wait),
+                    limit=bucket.limit,
+                    remaining=max(0, int(bucket.tokens)),
+                    endpoint_type=endpoint_type,
+                )
+            bucket.take(now)
+            return wait
+
+    def update(self, endpoint_type: str, headers) -> None:
+        """Track X-RateLimit-Limit/Remaining/Reset from a response."""
+        if not isinstance(headers, Mapping):
+            return
+        limit = _header_int(headers, "X-RateLimit-Limit")
+        remaining = _header_int(headers, "X-RateLimit-Remaining")
+        if limit is None and remaining is None:
+            return
+        reset = _header_int(headers, "X-RateLimit-Reset")
+        with self._lock:
+            now = self._clock()
+            reset_after = None
+            if reset is not None:
+                # Epoch timestamps vs. relative seconds
+                reset_after = reset - time.time() if reset > 1_000_000_000 else reset
+            self._bucket(endpoint_type).sync(limit, remaining, reset_after, now)
+
+    def refund(self, endpoint_type: str) -> None:
+        """Return a slot for a request that never reached the server."""
+        with self._lock:
+            bucket = self._bucket(endpoint_type)
+            bucket.tokens = min(float(bucket.limit), bucket.tokens + 1)
+
+    def penalize(self, endpoint_type: str, retry_after: Optional[float]) -> None:
+        """Block a class after the server rejected a request with 429."""
+        with self._lock:
+            self._bucket(endpoint_type).block(retry_after or 1, self._clock())
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Current state of every bucket."""
+        with self._lock:
+            now = self._clock()
+            state = {}
+            for kind, bucket in self._buckets.items():
+                state[kind] = {
+                    "limit": bucket.limit,
+                    "window": bucket.window,
+                    "available": round(max(0.0, bucket.tokens), 2),
+                    "wait": round(bucket.delay(now), 2),
+                }
+            return state
+
+
+def state_path(api_key: str, directory: Optional[str] = None) -> Path:
+    """Shared state file for an API key (keys never share a budget)."""
+    digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    return Path(directory or LIMITS_DIR).expanduser() / f"ratelimit-{digest}.json"
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    if not timestamp:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec="seconds")
+
+
+class SharedRateLimitGovernor(RateLimitGovernor):
+    """RateLimitGovernor whose buckets live in a file shared between processes.
+
+    Every reserve, update, refund and penalize holds an exclusive ``flock``
+    on the state file. It loads the buckets other processes left, applies
+    the change and writes them back. So a token taken by one process is
+    gone for all of them, and a 429 seen by one blocks its endpoint class
+    everywhere. Times in the file are wall-clock seconds, because
+    monotonic clocks are not comparable across processes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        limits: Optional[Dict[str, Tuple[int, float]]] = None,
+        max_wait: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize governor.
+
+        Args:
+            path: State file (see state_path)
+            limits: Override DEFAULT_LIMITS per endpoint class
+            max_wait: Raise RateLimitError instead of waiting longer than this
+            clock: Wall clock (injectable for tests)
+        """
+        super().__init__(limits, max_wait, clock)
+        self.path = Path(path).expanduser()
+        self._file_lock = threading.Lock()
+        # endpoint_type -> (last Retry-After seconds, when it was received)
+        self._retry_after: Dict[str, Tuple[float, float]] = {}
+
+    @contextmanager
+    def _shared(self, write: bool = True) -> Iterator[None]:
+        """Hold the file lock with the buckets loaded; save them on success."""
+        with self._file_lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            with open(fd, "r+b") as f:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_EX if write else fcntl.LOCK_SH)
+                self._load(f.read())
+                yield
+                if write:
+                    f.seek(0)
+                    f.truncate()
+                    f.write(self._dump())
+                    f.flush()
+            # Closing the file releases the flock
+
+    def _load(self, raw: bytes) -> None:
+        try:
+            state = codec.loads(raw) if raw else {}
+        except ValueError:
+            return  # Torn write from a killed process: keep our own view
+        with self._lock:
+            for kind, data in state.get("buckets", {}).items():
+                bucket = self._buckets.get(kind)
+                if bucket is None:
+                    continue
+                bucket.limit = data.get("limit", bucket.limit)
+                bucket.tokens = float(data.get("tokens", bucket.tokens))
+                bucket.updated = data.get("updated", bucket.updated)
+                bucket.blocked_until = data.get("blocked_until", bucket.blocked_until)
+            for kind, data in state.get("retry_after", {}).items():
+                current = self._retry_after.get(kind)
+                if current is None or data["at"] > current[1]:
+                    self._retry_after[kind] = (data["seconds"], data["at"])
+
+    def _dump(self) -> bytes:
+        with self._lock:
+            return codec.dumpb(
+                {
+                    "buckets": {
+                        kind: {
+                            "limit": bucket.limit,
+                            "tokens": bucket.tokens,
+                            "updated": bucket.updated,
+                            "blocked_until": bucket.blocked_until,
+                        }
+                        for kind, bucket in self._buckets.items()
+                    },
+                    "retry_after": {
+                        kind: {"seconds": seconds, "at": at}
+                        for kind, (seconds, at) in self._retry_after.items()
+                    },
+                }
+            )
+
+    def reserve(self, endpoint_type: str) -> float:
+        with self._shared():
+            return super().reserve(endpoint_type)
+
+    def update(self, endpoint_type: str, headers) -> None:
+        if not isinstance(headers, Mapping) or (
+            headers.get("X-RateLimit-Limit") is None
+            and headers.get("X-RateLimit-Remaining") is None
+        ):
+            return  # Nothing to share; skip the file round trip
+        with self._shared():
+            super().update(endpoint_type, headers)
+
+    def refund(self, endpoint_type: str) -> None:
+        with self._shared():
+            super().refund(endpoint_type)
+
+    def penalize(self, endpoint_type: str, retry_after: Optional[float]) -> None:
+        with self._shared():
+            if retry_after:
+                kind = endpoint_type if endpoint_type in self._buckets else "general"
+                self._retry_after[kind] = (retry_after, self._clock())
+            super().penalize(endpoint_type, retry_after)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Current shared state of every bucket, with reset and Retry-After times."""
+        with self._shared(write=False):
+            state = super().snapshot()
+            with self._lock:
+                for kind, entry in state.items():
+                    seconds, at = self._retry_after.get(kind, (None, None))
+                    entry["blocked_until"] = _iso(
+                        self._buckets[kind].blocked_until
+                        if self._buckets[kind].blocked_until > self._clock()
+                        else None
+                    )
+                    entry["last_retry_after"] = seconds
+                    entry["last_429_at"] = _iso(at)
+        return state
+
+    def reset(self) -> None:
+        """Forget the shared state (and this process's view of it)."""
+        with self._file_lock:
+            self.path.unlink(missing_ok=True)
+        with self._lock:
+            now = self._clock()
+            for bucket in self._buckets.values():
+                bucket.tokens = float(bucket.limit)
+                bucket.updated = now
+                bucket.blocked_until = 0.0
+            self._retry_after.clear()
+
+
+__all__ = [
+    "RateLimitGovernor",
+    "SharedRateLimitGovernor",
+    "TokenBucket",
+    "classify_endpoint",
+    "state_path",
+    "DEFAULT_LIMITS",
+    "LIMITS_DIR",
+]
@@ -0,0 +1,90 @@
+"""Retry policy for transient API failures."""
+
+import random
+from dataclasses import dataclass
+from typing import FrozenSet, Optional
+
+
+# Methods that are safe to resend after the server may have seen them
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter.
+
+    Retries are idempotency-aware: a request the server may have processed
+    (5xx, read timeout, dropped connection) is only resent for idempotent
+    methods, so POST /posts is never duplicated. Requests the server
+    provably did not process (429, connection never established) are
+    retried for every method.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_cap: float = 30.0
+    jitter: bool = True
+    max_retry_after: float = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({500, 502, 503, 504})
+    idempotent_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before the attempt following ``attempt`` (1-based)."""
+        delay = min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def delay_for(
+        self,
+        method: str,
+        attempt: int,
+        *,
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        sent: bool = True,
+    ) -> Optional[float]:
+        """Decide whether to retry a failed attempt.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Number of the attempt that just failed (1-based)
+            status: HTTP status, or None for a transport error
+            retry_after: Server-provided wait for a 429
+            sent: False if the request never reached the server
+
+        Returns:
+            Seconds to wait before retrying, or None to give up.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if status == 429:
+            if retry_after is None:
+                return self.backoff(attempt)
+            if retry_after > self.max_retry_after:
+                return None
+            return float(retry_after)
+        if status is not None and status not in self.retry_statuses:
+            return None
+        if sent and method.upper() not in self.idempotent_methods:
+            return None
+        return self.backoff(attempt)
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """Policy that never retries."""
+        return cls(max_attempts=1)
+
+
+@dataclass
+class Attempt:
+    """Timing and outcome of one request attempt."""
+
+    number: int
+    duration: float
+    status: Optional[int] = None
+    error: Optional[str] = None
+    retry_delay: Optional[float] = None
+
+
+__all__ = ["RetryPolicy", "Attempt", "IDEMPOTENT_METHODS"]
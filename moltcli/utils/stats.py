@@ -0,0 +1,355 @@
+"""Persistent per-endpoint latency statistics.
+
+``LatencyStats`` is a trace hook (see utils.trace) that keeps, per route,
+a fixed-size log-linear latency histogram plus request, error, 429 and
+retry counts. Counts build up in memory. Every ``flush_interval``
+seconds, and at exit, one NDJSON line with the sparse histograms is
+appended to the stats file. A busy process therefore writes one small
+line per minute, not one per request. Several processes can append to
+the same file.
+
+When the file grows past ``max_bytes`` it is compacted: lines are merged
+into hourly records and records past ``retention`` are dropped. Appends
+hold a shared flock on a ``.lock`` sidecar and compaction an exclusive
+one, so no line written by another process is lost to the rewrite.
+
+Reads merge the records inside a time window. The results feed
+``moltcli stats`` (p50/p90/p99 per endpoint) and a Prometheus text
+export for the node exporter's textfile collector.
+"""
+
+import atexit
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: no cross-process locking
+    fcntl = None
+
+from . import codec
+from .trace import route
+
+STATS_PATH = "~/.config/moltcli/stats.ndjson"
+
+# Log-linear buckets, HDR-style: SUB_BUCKETS per doubling (~9% relative
+# error) from MIN_MS up to MIN_MS * 2**20 (~105 s); bucket 0 is below MIN_MS
+MIN_MS = 0.1
+SUB_BUCKETS = 8
+BUCKETS = 1 + 20 * SUB_BUCKETS
+
+# Histogram boundaries of the Prometheus export, in seconds
+PROMETHEUS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def bucket_of(ms: float) -> int:
+    """Histogram bucket index for a latency in milliseconds."""
+    if ms < MIN_MS:
+        return 0
+    return min(BUCKETS - 1, 1 + int(math.log2(ms / MIN_MS) * SUB_BUCKETS))
+
+
+def bucket_upper_ms(index: int) -> float:
+    """Upper bound of a bucket, reported as its value (as HDR does)."""
+    return MIN_MS * 2 ** (index / SUB_BUCKETS)
+
+
+class RouteStats:
+    """Latency histogram and outcome counts for one route."""
+
+    __slots__ = ("buckets", "count", "errors", "rate_limited", "retries", "sum_ms")
+
+    def __init__(self):
+        self.buckets = [0] * BUCKETS
+        self.count = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.retries = 0
+        self.sum_ms = 0.0
+
+    def record(self, ms: float, error: bool = False, rate_limited: bool = False, retries: int = 0):
+        self.buckets[bucket_of(ms)] += 1
+        self.count += 1
+        self.errors += error
+        self.rate_limited += rate_limited
+        self.retries += retries
+        self.sum_ms += ms
+
+    def merge(self, other: "RouteStats") -> None:
+        for i, n in enumerate(other.buckets):
+            if n:
+                self.buckets[i] += n
+        self.count += other.count
+        self.errors += other.errors
+        self.rate_limited += other.rate_limited
+        self.retries += other.retries
+        self.sum_ms += other.sum_ms
+
+    def percentile(self, q: float) -> float:
+        """Latency in ms at quantile q (0-1); 0 if empty."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return round(bucket_upper_ms(i), 3)
+        return round(bucket_upper_ms(BUCKETS - 1), 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact form for the stats file (histogram stored sparse)."""
+        return {
+            "n": self.count,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "retries": self.retries,
+            "sum_ms": round(self.sum_ms, 3),
+            "h": {str(i): n for i, n in enumerate(self.buckets) if n},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RouteStats":
+        stats = cls()
+        stats.count = data.get("n", 0)
+        stats.errors = data.get("errors", 0)
+        stats.rate_limited = data.get("rate_limited", 0)
+        stats.retries = data.get("retries", 0)
+        stats.sum_ms = data.get("sum_ms", 0.0)
+        for i, n in data.get("h", {}).items():
+            i = int(i)
+            if 0 <= i < BUCKETS:
+                stats.buckets[i] += n
+        return stats
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "retries": self.retries,
+            "p50_ms": self.percentile(0.5),
+            "p90_ms": self.percentile(0.9),
+            "p99_ms": self.percentile(0.99),
+            "mean_ms": round(self.sum_ms / self.count, 3) if self.count else 0.0,
+        }
+
+
+class LatencyStats:
+    """Trace hook accumulating RouteStats and appending them to a stats file."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        flush_interval: float = 60.0,
+        max_bytes: int = 1024 * 1024,
+        retention: float = 30 * 86400,
+    ):
+        """Initialize stats.
+
+        Args:
+            path: Stats file (default: ~/.config/moltcli/stats.ndjson)
+            flush_interval: Seconds between appends while requests keep coming
+            max_bytes: Compact the file above this size
+            retention: Drop records older than this many seconds on compaction
+        """
+        self.path = Path(path or STATS_PATH).expanduser()
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._routes: Dict[str, RouteStats] = {}
+        self._since = time.time()
+        atexit.register(self.flush)
+
+    def __call__(self, span: Dict[str, Any]) -> None:
+        self.record(
+            route(span["method"], span["endpoint"]),
+            span["total_ms"],
+            error=span["error"] is not None,
+            rate_limited=span["status"] == 429,
+            retries=span["retries"],
+        )
+
+    def record(
+        self,
+        name: str,
+        ms: float,
+        error: bool = False,
+        rate_limited: bool = False,
+        retries: int = 0,
+    ) -> None:
+        """Count one request to route ``name``."""
+        with self._lock:
+            stats = self._routes.get(name)
+            if stats is None:
+                stats = self._routes[name] = RouteStats()
+            stats.record(ms, error, rate_limited, retries)
+            due = time.time() - self._since >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append the pending counts as one line (no-op if nothing is pending)."""
+        with self._lock:
+            if not self._routes:
+                return
+            routes, self._routes = self._routes, {}
+            start = self._since
+            end = self._since = time.time()
+        line = codec.dumps(
+            {
+                "start": round(start, 3),
+                "end": round(end, 3),
+                "routes": {name: stats.to_dict() for name, stats in routes.items()},
+            }
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One O_APPEND write per line, so concurrent processes don't interleave
+        with self._locked(exclusive=False):
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(fd, (line + "\n").encode("utf-8"))
+                size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+        if size > self.max_bytes:
+            self.compact()
+
+    close = flush
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """Hold the sidecar lock: shared to append, exclusive to rewrite."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path.with_name(self.path.name + ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)  # Releases the flock
+
+    def _records(self) -> Iterator[Dict[str, Any]]:
+        try:
+            with open(self.path, "rb") as f:
+                for line in f:
+                    try:
+                        yield codec.loads(line)
+                    except ValueError:
+                        continue  # Torn line from a crashed writer
+        except FileNotFoundError:
+            return
+
+    def compact(self) -> None:
+        """Merge records into hourly ones and drop those past retention."""
+        with self._locked(exclusive=True):
+            self._compact()
+
+    def _compact(self) -> None:
+        cutoff = time.time() - self.retention
+        hours: Dict[int, Dict[str, Any]] = {}
+        for record in self._records():
+            if record["end"] < cutoff:
+                continue
+            hour = int(record["start"] // 3600)
+            merged = hours.setdefault(
+                hour, {"start": record["start"], "end": record["end"], "routes": {}}
+            )
+            merged["start"] = min(merged["start"], record["start"])
+            merged["end"] = max(merged["end"], record["end"])
+            for name, data in record["routes"].items():
+                stats = merged["routes"].get(name)
+                if stats is None:
+                    merged["routes"][name] = RouteStats.from_dict(data)
+                else:
+                    stats.merge(RouteStats.from_dict(data))
+        lines = [
+            codec.dumps(
+                {
+                    **record,
+                    "routes": {name: s.to_dict() for name, s in record["routes"].items()},
+                }
+            )
+            for _, record in sorted(hours.items())
+        ]
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def read(self, window: Optional[float] = None) -> Dict[str, RouteStats]:
+        """Merged stats per route for records ending in the last ``window`` seconds."""
+        cutoff = time.time() - window if window is not None else None
+        routes: Dict[str, RouteStats] = {}
+        for record in self._records():
+            if cutoff is not None and record["end"] < cutoff:
+                continue
+            for name, data in record["routes"].items():
+                stats = routes.get(name)
+                if stats is None:
+                    routes[name] = RouteStats.from_dict(data)
+                else:
+                    stats.merge(RouteStats.from_dict(data))
+        return dict(sorted(routes.items()))
+
+    def summary(self, window: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Counts and p50/p90/p99 per route."""
+        return {name: stats.summary() for name, stats in self.read(window).items()}
+
+    def prometheus(self, window: Optional[float] = None) -> str:
+        """Prometheus text exposition format (for the textfile collector)."""
+        routes = self.read(window)
+        lines: List[str] = [
+            "# HELP moltcli_request_duration_seconds Moltbook API request latency.",
+            "# TYPE moltcli_request_duration_seconds histogram",
+        ]
+        for name, stats in routes.items():
+            label = _label(name)
+            cumulative, i = 0, 0
+            for le in PROMETHEUS_BUCKETS:
+                # Fine buckets whose upper bound fits under this boundary
+                while i < BUCKETS and bucket_upper_ms(i) <= le * 1000:
+                    cumulative += stats.buckets[i]
+                    i += 1
+                lines.append(
+                    f'moltcli_request_duration_seconds_bucket{{route="{label}",le="{le}"}}'
+                    f" {cumulative}"
+                )
+            lines.append(
+                f'moltcli_request_duration_seconds_bucket{{route="{label}",le="+Inf"}}'
+                f" {stats.count}"
+            )
+            lines.append(
+                f'moltcli_request_duration_seconds_sum{{route="{label}"}} {stats.sum_ms / 1000:.6f}'
+            )
+            lines.append(f'moltcli_request_duration_seconds_count{{route="{label}"}} {stats.count}')
+        for metric, attr, help_text in (
+            ("moltcli_request_errors_total", "errors", "Requests that failed after retries."),
+            ("moltcli_rate_limited_total", "rate_limited", "Requests that ended in a 429."),
+            ("moltcli_request_retries_total", "retries", "Retried attempts."),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for name, stats in routes.items():
+                lines.append(f'{metric}{{route="{_label(name)}"}} {getattr(stats, attr)}')
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Delete the stats file and pending counts."""
+        with self._lock:
+            self._routes = {}
+            self._since = time.time()
+        with self._locked(exclusive=True):
+            self.path.unlink(missing_ok=True)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+__all__ = ["LatencyStats", "RouteStats", "STATS_PATH", "bucket_of", "bucket_upper_ms"]
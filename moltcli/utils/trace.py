@@ -0,0 +1,366 @@
+"""Per-request tracing: phase timings, sizes and rate-limit headers.
+
+Pass any callable as ``trace=`` to MoltbookClient or AsyncMoltbookClient
+and it is called with one span dict per request (after all retries)::
+
+    {"type": "request", "method": "GET", "endpoint": "/feed", "status": 200,
+     "attempts": 1, "retries": 0, "cache": null, "bytes_out": 0,
+     "bytes_in": 5123, "total_ms": 41.2,
+     "phases_ms": {"queue": 0.0, "connect": 3.1, "tls": 12.4, "ttfb": 22.0,
+                   "download": 1.9, "decode": 0.4, "retry_wait": 0.0},
+     "rate_limit": {"X-RateLimit-Remaining": "99", ...}}
+
+Phases are summed over attempts. ``connect`` covers DNS and TCP (urllib3
+resolves and connects in one call) and is 0 on a reused keep-alive
+connection; ``tls`` is the handshake. ``queue`` is time held by the
+rate-limit governor, ``retry_wait`` time slept before retries.
+
+``Tracer`` is a ready-made sink: it writes spans as NDJSON and keeps a
+per-route summary (``moltcli --trace``).
+"""
+
+import contextvars
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import IO, Any, Callable, Dict, List, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from . import codec
+
+TraceHook = Callable[[Dict[str, Any]], None]
+
+PHASES = ("queue", "connect", "tls", "ttfb", "download", "decode", "retry_wait")
+RATE_LIMIT_HEADERS = (
+    "X-RateLimit-Limit",
+    "X-RateLimit-Remaining",
+    "X-RateLimit-Reset",
+    "Retry-After",
+)
+
+# Connection-level timings of the attempt in flight in this thread or task
+_connection_phases: contextvars.ContextVar = contextvars.ContextVar(
+    "moltcli_connection_phases", default=None
+)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+class RequestTrace:
+    """Accumulates the phases of one logical request across its attempts."""
+
+    def __init__(self, method: str, endpoint: str):
+        self.method = method
+        self.endpoint = endpoint
+        self.wall_start = time.time()
+        self.start = time.perf_counter()
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.attempts = 0
+        self.status: Optional[int] = None
+        self.cache: Optional[str] = None
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.rate_limit: Dict[str, str] = {}
+        self._connection: Optional[Dict[str, float]] = None
+
+    def add(self, phase: str, seconds: Optional[float]) -> None:
+        if seconds:
+            self.phases[phase] += seconds
+
+    def cached(self, outcome: str) -> None:
+        """Mark the response as served from cache ("hit" or "revalidated")."""
+        self.cache = outcome
+
+    def begin_attempt(self) -> None:
+        """Start collecting connect/TLS timings for the next send."""
+        self.attempts += 1
+        self._connection = {}
+        _connection_phases.set(self._connection)
+
+    def received(self, response, sent_at: float) -> None:
+        """Record a requests response; sent_at is perf_counter() before the send."""
+        elapsed = time.perf_counter() - sent_at
+        connection = self._connection or {}
+        setup = connection.get("connect", 0.0) + connection.get("tls", 0.0)
+        self.add("connect", connection.get("connect"))
+        self.add("tls", connection.get("tls"))
+        # requests' elapsed stops when the headers arrive; the body is read after
+        headers_at = getattr(response, "elapsed", None)
+        if isinstance(headers_at, timedelta):
+            headers_at = headers_at.total_seconds()
+            self.add("ttfb", max(0.0, headers_at - setup))
+            self.add("download", max(0.0, elapsed - headers_at))
+        else:
+            self.add("ttfb", max(0.0, elapsed - setup))
+        request = getattr(response, "request", None)
+        self._response(response, getattr(request, "body", None))
+
+    def _response(self, response, body: Any) -> None:
+        self.status = getattr(response, "status_code", None)
+        if isinstance(body, (bytes, bytearray, str)):
+            self.bytes_out += len(body)
+        content = getattr(response, "content", None)
+        if isinstance(content, (bytes, bytearray)):
+            self.bytes_in += len(content)
+        headers = getattr(response, "headers", None)
+        if headers is not None and hasattr(headers, "get"):
+            for name in RATE_LIMIT_HEADERS:
+                value = headers.get(name)
+                if isinstance(value, str):
+                    self.rate_limit[name] = value
+
+    async def httpx_event(self, name: str, info: dict) -> None:
+        """httpx "trace" request extension: timestamps of each connection step."""
+        connection = self._connection
+        if connection is None:
+            return
+        step, _, edge = name.rpartition(".")
+        now = time.perf_counter()
+        if edge == "started":
+            connection[f"_{step}"] = now
+        elif edge == "complete" and f"_{step}" in connection:
+            connection[step] = now - connection.pop(f"_{step}")
+
+    def received_httpx(self, response, sent_at: float) -> None:
+        """Record an httpx response (phases come from httpx_event)."""
+        elapsed = time.perf_counter() - sent_at
+        connection = self._connection or {}
+        self.add("connect", connection.get("connection.connect_tcp"))
+        self.add("tls", connection.get("connection.start_tls"))
+        body = connection.get("http11.receive_response_body") or connection.get(
+            "http2.receive_response_body"
+        )
+        if body is not None:
+            self.add("download", body)
+        setup = sum(
+            connection.get(k) or 0.0 for k in ("connection.connect_tcp", "connection.start_tls")
+        )
+        self.add("ttfb", max(0.0, elapsed - setup - (body or 0.0)))
+        request = getattr(response, "request", None)
+        self._response(response, getattr(request, "content", None))
+
+    def span(self, error: Optional[BaseException] = None) -> Dict[str, Any]:
+        """The finished span."""
+        return {
+            "type": "request",
+            "ts": datetime.fromtimestamp(self.wall_start, timezone.utc).isoformat(),
+            "method": self.method,
+            "endpoint": self.endpoint,
+            "status": self.status,
+            "error": type(error).__name__ if error is not None else None,
+            "attempts": self.attempts,
+            "retries": max(0, self.attempts - 1),
+            "cache": self.cache,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "total_ms": _ms(time.perf_counter() - self.start),
+            "phases_ms": {phase: _ms(seconds) for phase, seconds in self.phases.items()},
+            "rate_limit": self.rate_limit,
+        }
+
+
+class _NullTrace:
+    """Stand-in when tracing is off, so the client needs no branches."""
+
+    def add(self, phase, seconds):
+        pass
+
+    def cached(self, outcome):
+        pass
+
+    def begin_attempt(self):
+        pass
+
+    def received(self, response, sent_at):
+        pass
+
+    def received_httpx(self, response, sent_at):
+        pass
+
+
+NULL_TRACE = _NullTrace()
+
+
+# -- connect/TLS timing for requests' connection pools ----------------------
+
+
+class _TimedConnection:
+    """Mixin timing socket setup (DNS + TCP) and the whole connect (+ TLS)."""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            phases = _connection_phases.get()
+            if phases is not None:
+                phases["connect"] = time.perf_counter() - start
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        phases = _connection_phases.get()
+        if phases is not None and isinstance(self, HTTPSConnection):
+            phases["tls"] = max(0.0, time.perf_counter() - start - phases.get("connect", 0.0))
+
+
+class _TracedHTTPConnection(_TimedConnection, HTTPConnection):
+    pass
+
+
+class _TracedHTTPSConnection(_TimedConnection, HTTPSConnection):
+    pass
+
+
+class _TracedHTTPPool(HTTPConnectionPool):
+    ConnectionCls = _TracedHTTPConnection
+
+
+class _TracedHTTPSPool(HTTPSConnectionPool):
+    ConnectionCls = _TracedHTTPSConnection
+
+
+class TracingAdapter(HTTPAdapter):
+    """HTTPAdapter whose new connections report connect and TLS time."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TracedHTTPPool,
+            "https": _TracedHTTPSPool,
+        }
+
+
+# -- NDJSON sink with a summary ----------------------------------------------
+
+# Path segments after these are IDs or names, folded in the summary
+_COLLECTIONS = {"posts", "comments", "submolts", "agents"}
+_FIXED = {"trending", "me", "status", "profile", "register"}
+
+
+def route(method: str, endpoint: str) -> str:
+    """Endpoint with IDs folded, e.g. "GET /posts/{id}/comments"."""
+    parts = endpoint.split("?", 1)[0].split("/")
+    for i in range(1, len(parts)):
+        if parts[i - 1] in _COLLECTIONS and parts[i] and parts[i] not in _FIXED:
+            parts[i] = "{id}"
+    return f"{method} {'/'.join(parts)}"
+
+
+def _percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+class Tracer:
+    """Trace hook writing NDJSON spans and summarising them per route."""
+
+    def __init__(self, out: Optional[IO[str]] = None):
+        """Initialize tracer.
+
+        Args:
+            out: Text stream for spans (default: stderr)
+        """
+        self.out = out if out is not None else sys.stderr
+        self.start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._routes: Dict[str, Dict[str, Any]] = {}
+
+    def __call__(self, span: Dict[str, Any]) -> None:
+        line = codec.dumps(span)
+        with self._lock:
+            self.out.write(line + "\n")
+            self.out.flush()
+            stats = self._routes.setdefault(
+                route(span["method"], span["endpoint"]),
+                {"count": 0, "errors": 0, "retries": 0, "bytes_in": 0, "totals": []},
+            )
+            stats["count"] += 1
+            stats["errors"] += span["error"] is not None
+            stats["retries"] += span["retries"]
+            stats["bytes_in"] += span["bytes_in"]
+            stats["totals"].append(span["total_ms"])
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-route counts and latency percentiles, plus time spent outside requests."""
+        wall_ms = _ms(time.perf_counter() - self.start)
+        with self._lock:
+            routes = {
+                name: {
+                    "count": s["count"],
+                    "errors": s["errors"],
+                    "retries": s["retries"],
+                    "bytes_in": s["bytes_in"],
+                    "total_ms": round(sum(s["totals"]), 3),
+                    "p50_ms": _percentile(s["totals"], 0.5),
+                    "p95_ms": _percentile(s["totals"], 0.95),
+                    "max_ms": max(s["totals"]),
+                }
+                for name, s in sorted(self._routes.items())
+            }
+        in_requests = round(sum(r["total_ms"] for r in routes.values()), 3)
+        return {
+            "type": "summary",
+            "wall_ms": wall_ms,
+            "requests_ms": in_requests,
+            # Everything else: startup, formatting, challenge solving, ...
+            "local_ms": round(max(0.0, wall_ms - in_requests), 3),
+            "routes": routes,
+        }
+
+    def format_summary(self, summary: Optional[Dict[str, Any]] = None) -> str:
+        """The summary as a text table."""
+        summary = summary or self.summary()
+        header = ("route", "n", "err", "retry", "p50 ms", "p95 ms", "max ms", "total ms")
+        rows = [
+            (
+                name,
+                str(r["count"]),
+                str(r["errors"]),
+                str(r["retries"]),
+                f"{r['p50_ms']:.1f}",
+                f"{r['p95_ms']:.1f}",
+                f"{r['max_ms']:.1f}",
+                f"{r['total_ms']:.1f}",
+            )
+            for name, r in summary["routes"].items()
+        ]
+        widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+        lines = [
+            "  ".join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in [header, *rows]
+        ]
+        lines.append(
+            f"wall {summary['wall_ms']:.1f} ms = requests {summary['requests_ms']:.1f} ms"
+            f" + local {summary['local_ms']:.1f} ms"
+        )
+        return "\n".join(lines)
+
+    def close(self, table: Optional[IO[str]] = None) -> None:
+        """Write the summary span, and the table to ``table`` (default: stderr)."""
+        summary = self.summary()
+        with self._lock:
+            self.out.write(codec.dumps(summary) + "\n")
+            self.out.flush()
+        if summary["routes"]:
+            print(self.format_summary(summary), file=table or sys.stderr)
+
+
+__all__ = [
+    "NULL_TRACE",
+    "PHASES",
+    "RequestTrace",
+    "TraceHook",
+    "Tracer",
+    "TracingAdapter",
+    "route",
+]
@@ -16,7 +16,7 @@ class TestMoltbookClient:
         assert client.headers["Authorization"] == f"Bearer {mock_api_key}"
         assert client.headers["Content-Type"] == "application/json"
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_get_request(self, mock_request, mock_api_key):
         """Test GET request."""
         from moltcli.utils.api_client import MoltbookClient
@@ -34,7 +34,7 @@ class TestMoltbookClient:
         assert call_args.kwargs["method"] == "GET"
         assert call_args.kwargs["params"] == {"key": "value"}
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_post_request(self, mock_request, mock_api_key):
         """Test POST request."""
         from moltcli.utils.api_client import MoltbookClient
@@ -52,7 +52,7 @@ class TestMoltbookClient:
         assert call_args.kwargs["method"] == "POST"
         assert call_args.kwargs["json"] == {"title": "Test"}
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_delete_request(self, mock_request, mock_api_key):
         """Test DELETE request."""
         from moltcli.utils.api_client import MoltbookClient
@@ -69,7 +69,7 @@ class TestMoltbookClient:
         call_args = mock_request.call_args
         assert call_args.kwargs["method"] == "DELETE"
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_patch_request(self, mock_request, mock_api_key):
         """Test PATCH request."""
         from moltcli.utils.api_client import MoltbookClient
@@ -87,7 +87,7 @@ class TestMoltbookClient:
         assert call_args.kwargs["method"] == "PATCH"
         assert call_args.kwargs["json"] == {"description": "New desc"}
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_error_response_raises(self, mock_request, mock_api_key):
         """Test non-OK response raises exception."""
         from moltcli.utils.api_client import MoltbookClient
@@ -104,7 +104,7 @@ class TestMoltbookClient:
         with pytest.raises(AuthError):
             client.get("/auth/whoami")
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_rate_limit_error(self, mock_request, mock_api_key):
         """Test 429 rate limit error handling."""
         from moltcli.utils.api_client import MoltbookClient
@@ -126,7 +126,7 @@ class TestMoltbookClient:
         assert exc_info.value.limit == 100
         assert exc_info.value.remaining == 0
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_not_found_error(self, mock_request, mock_api_key):
         """Test 404 not found error handling."""
         from moltcli.utils.api_client import MoltbookClient
@@ -145,7 +145,7 @@ class TestMoltbookClient:
         with pytest.raises(NotFoundError):
             client.get("/posts/123")
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_not_found_error_submolt(self, mock_request, mock_api_key):
         """Test 404 not found error for submolt."""
         from moltcli.utils.api_client import MoltbookClient
@@ -165,6 +165,63 @@ class TestMoltbookClient:
 
         assert "submolt" in exc_info.value.message
 
+    def test_session_is_reused(self, mock_api_key):
+        """Test all requests go through one pooled session."""
+        from moltcli.utils.api_client import MoltbookClient
+
+        session = Mock()
+        session.request.return_value.ok = True
+        session.request.return_value.json.return_value = {}
+
+        client = MoltbookClient(mock_api_key, session=session)
+        client.get("/feed")
+        client.post("/posts/1/upvote")
+
+        assert session.request.call_count == 2
+
+    def test_base_url_override(self, mock_api_key):
+        """Test base_url replaces the default API root."""
+        from moltcli.utils.api_client import MoltbookClient
+
+        session = Mock()
+        session.request.return_value.ok = True
+        session.request.return_value.json.return_value = {}
+
+        client = MoltbookClient(mock_api_key, base_url="http://127.0.0.1:8080/api/v1/", session=session)
+        client.get("/feed")
+
+        assert session.request.call_args.kwargs["url"] == "http://127.0.0.1:8080/api/v1/feed"
+
+    def test_pool_sizes_applied(self, mock_api_key):
+        """Test pool sizes are passed to the mounted adapter."""
+        from moltcli.utils.api_client import MoltbookClient
+
+        client = MoltbookClient(mock_api_key, pool_connections=4, pool_maxsize=32)
+        adapter = client._session.get_adapter("https://www.moltbook.com")
+
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+
+    def test_context_manager_closes_owned_session(self, mock_api_key):
+        """Test context manager closes the session it created."""
+        from moltcli.utils.api_client import MoltbookClient
+
+        with MoltbookClient(mock_api_key) as client:
+            session = client._session
+        with patch.object(session, "close") as mock_close:
+            client.close()
+        mock_close.assert_called_once()
+
+    def test_external_session_not_closed(self, mock_api_key):
+        """Test caller-provided sessions are left open."""
+        from moltcli.utils.api_client import MoltbookClient
+
+        session = Mock()
+        with MoltbookClient(mock_api_key, session=session):
+            pass
+
+        session.close.assert_not_called()
+
 
 class TestNormalizeSubmoltName:
     """Test normalize_submolt_name function."""
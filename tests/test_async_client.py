@@ -0,0 +1,225 @@
+"""Tests for async API client and async Core classes."""
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+
+def make_client(handler, api_key="test_api_key_12345"):
+    """Create AsyncMoltbookClient backed by an in-memory transport."""
+    from moltcli.utils.async_client import AsyncMoltbookClient
+
+    transport = httpx.MockTransport(handler)
+    return AsyncMoltbookClient(api_key, client=httpx.AsyncClient(transport=transport))
+
+
+class TestAsyncMoltbookClient:
+    """Test AsyncMoltbookClient class."""
+
+    def test_get_request(self):
+        """Test GET request sends params and auth header."""
+        seen = {}
+
+        def handler(request):
+            seen["method"] = request.method
+            seen["url"] = str(request.url)
+            seen["auth"] = request.headers["Authorization"]
+            return httpx.Response(200, json={"posts": []})
+
+        client = make_client(handler)
+        result = asyncio.run(client.get("/feed", params={"sort": "hot"}))
+
+        assert result == {"posts": []}
+        assert seen["method"] == "GET"
+        assert seen["url"] == "https://www.moltbook.com/api/v1/feed?sort=hot"
+        assert seen["auth"] == "Bearer test_api_key_12345"
+
+    def test_post_request(self):
+        """Test POST request sends JSON body."""
+        seen = {}
+
+        def handler(request):
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json={"success": True})
+
+        client = make_client(handler)
+        asyncio.run(client.post("/posts", json_data={"title": "Test"}))
+
+        assert seen["body"] == {"title": "Test"}
+
+    def test_rate_limit_error(self):
+        """Test 429 maps to RateLimitError like the sync client."""
+        from moltcli.utils.errors import RateLimitError
+
+        def handler(request):
+            return httpx.Response(
+                429,
+                json={},
+                headers={"Retry-After": "60", "X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "0"},
+            )
+
+        client = make_client(handler)
+        with pytest.raises(RateLimitError) as exc_info:
+            asyncio.run(client.get("/feed"))
+
+        assert exc_info.value.retry_after == 60
+        assert exc_info.value.limit == 100
+        assert exc_info.value.remaining == 0
+
+    def test_not_found_error(self):
+        """Test 404 maps to NotFoundError."""
+        from moltcli.utils.errors import NotFoundError
+
+        def handler(request):
+            return httpx.Response(404, json={"error": "Not Found"})
+
+        client = make_client(handler)
+        with pytest.raises(NotFoundError):
+            asyncio.run(client.get("/posts/123"))
+
+    def test_auth_error(self):
+        """Test 401 maps to AuthError."""
+        from moltcli.utils.errors import AuthError
+
+        def handler(request):
+            return httpx.Response(401, text="Unauthorized")
+
+        client = make_client(handler)
+        with pytest.raises(AuthError):
+            asyncio.run(client.get("/agents/me"))
+
+
+class TestAsyncCores:
+    """Test async Core variants."""
+
+    def test_concurrent_votes(self):
+        """Test many votes fan out under one event loop."""
+        from moltcli.core.aio import AsyncVoteCore
+
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            return httpx.Response(200, json={"success": True})
+
+        async def run():
+            async with make_client(handler) as client:
+                votes = AsyncVoteCore(client)
+                return await asyncio.gather(*(votes.upvote(f"p{i}") for i in range(20)))
+
+        results = asyncio.run(run())
+
+        assert len(results) == 20
+        assert sorted(paths) == sorted(f"/api/v1/posts/p{i}/upvote" for i in range(20))
+
+    def test_vote_batch(self):
+        """Test batch awaits every vote and reports each item."""
+        from moltcli.core.aio import AsyncVoteCore
+
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            if "missing" in request.url.path:
+                return httpx.Response(404, json={"error": "Post not found"})
+            return httpx.Response(200, json={"success": True})
+
+        items = [(f"p{i}", "up", "post") for i in range(10)] + [("missing", "down", "post")]
+
+        async def run():
+            async with make_client(handler) as client:
+                return await AsyncVoteCore(client).batch(items, workers=3)
+
+        results = asyncio.run(run())
+
+        assert len(paths) == 11
+        assert [r["status"] for r in results[:10]] == ["upvoted"] * 10
+        assert results[-1]["error_code"] == "POST_NOT_FOUND"
+
+    def test_vote_batch_retries_after_rate_limit(self, monkeypatch):
+        """Test a 429 pauses the batch and the item is retried."""
+        from unittest.mock import AsyncMock
+        from moltcli.core.aio import AsyncVoteCore
+
+        sleep = AsyncMock()
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "2"}, json={}),
+            httpx.Response(200, json={"success": True}),
+        ]
+
+        async def run():
+            async with make_client(lambda request: responses.pop(0)) as client:
+                return await AsyncVoteCore(client).batch([("p1", "up", "post")])
+
+        results = asyncio.run(run())
+
+        assert results[0]["status"] == "upvoted"
+        assert not responses
+        assert sleep.await_args.args[0] == pytest.approx(2, abs=0.1)
+
+    def test_feed_get_hot(self):
+        """Test convenience methods return awaitables."""
+        from moltcli.core.aio import AsyncFeedCore
+
+        def handler(request):
+            assert request.url.params["sort"] == "hot"
+            return httpx.Response(200, json={"posts": [{"id": "p1"}]})
+
+        result = asyncio.run(AsyncFeedCore(make_client(handler)).get_hot(limit=5))
+
+        assert result["posts"][0]["id"] == "p1"
+
+    def test_agent_get_feed(self):
+        """Test get_feed post-processes the awaited profile."""
+        from moltcli.core.aio import AsyncAgentCore
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                json={"agent": {"name": "A"}, "recentPosts": [{"id": 1}, {"id": 2}, {"id": 3}]},
+            )
+
+        result = asyncio.run(AsyncAgentCore(make_client(handler)).get_feed("A", limit=2))
+
+        assert result == {"agent": {"name": "A"}, "posts": [{"id": 1}, {"id": 2}]}
+
+    def test_post_create_and_verify(self):
+        """Test create_and_verify awaits create, then verify."""
+        from moltcli.core.aio import AsyncPostCore
+
+        def handler(request):
+            if request.url.path.endswith("/posts"):
+                return httpx.Response(200, json={
+                    "verification_required": True,
+                    "post": {"id": "p1"},
+                    "verification": {"verification_code": "v1", "challenge": "SiX times SeVeN"},
+                })
+            assert request.url.path == "/api/v1/verify"
+            assert json.loads(request.content) == {"verification_code": "v1", "answer": "42"}
+            return httpx.Response(200, json={"success": True, "post": {"id": "p1"}})
+
+        core = AsyncPostCore(make_client(handler))
+        result = asyncio.run(core.create_and_verify("general", "T", content="C"))
+
+        assert result["verified"] is True
+        assert result["answer"] == "42"
+
+    def test_comment_iter_tree(self):
+        """Test the async comment tree fetches pages and nests replies."""
+        from moltcli.core.aio import AsyncCommentCore
+
+        comments = [{"id": "c1"}, {"id": "c2", "parent_id": "c1"}, {"id": "c3"}]
+
+        def handler(request):
+            offset = int(request.url.params.get("offset", 0))
+            limit = int(request.url.params["limit"])
+            return httpx.Response(200, json={"comments": comments[offset:offset + limit]})
+
+        async def run():
+            core = AsyncCommentCore(make_client(handler))
+            return [(d, c["id"]) async for d, c in core.iter_tree("p1", page_size=2)]
+
+        assert asyncio.run(run()) == [(0, "c1"), (1, "c2"), (0, "c3")]
@@ -0,0 +1,38 @@
+"""Smoke tests for the benchmark suite (quick profile)."""
+import json
+
+import pytest
+
+
+class TestBenchSuite:
+    """Test every scenario runs and reports JSON."""
+
+    @pytest.mark.parametrize("name", ["client", "formatter", "memory", "challenge"])
+    def test_scenario(self, name):
+        from moltcli.testing.bench import run
+
+        report = run([name], profile="quick")
+
+        result = json.loads(json.dumps(report))["results"][name]
+        assert result["elapsed_s"] >= 0
+        assert len(result) > 1
+
+    def test_unknown_scenario(self):
+        from moltcli.testing.bench import run
+
+        with pytest.raises(ValueError):
+            run(["nope"])
+
+    def test_cli_writes_report(self, tmp_path):
+        from click.testing import CliRunner
+        from moltcli.cli import cli
+
+        out = tmp_path / "report.json"
+        result = CliRunner().invoke(
+            cli, ["bench", "-s", "challenge", "--profile", "quick", "-o", str(out)]
+        )
+
+        assert result.exit_code == 0, result.output
+        report = json.loads(out.read_text())
+        assert report["profile"] == "quick"
+        assert set(report["results"]) == {"challenge"}
@@ -0,0 +1,195 @@
+"""Tests for response cache module."""
+import os
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+
+def ok_response(body, headers=None, status=200):
+    response = Mock(ok=True, status_code=status, headers=headers or {})
+    response.json.return_value = body
+    return response
+
+
+class TestResponseCache:
+    """Test ResponseCache class."""
+
+    def test_ttl_rules(self, tmp_path):
+        from moltcli.utils.cache import ResponseCache
+
+        cache = ResponseCache(str(tmp_path))
+
+        assert cache.ttl_for("/feed") == 30
+        assert cache.ttl_for("/submolts/trending") == 300
+        assert cache.ttl_for("/agents/profile?name=bob") == 120
+        assert cache.ttl_for("/posts/abc") == 60
+        assert cache.ttl_for("/posts/abc/comments") is None
+        assert cache.ttl_for("/agents/me") is None
+
+    def test_ttl_override(self, tmp_path):
+        from moltcli.utils.cache import ResponseCache
+
+        cache = ResponseCache(str(tmp_path), ttl_override=5)
+
+        assert cache.ttl_for("/feed") == 5
+        assert cache.ttl_for("/agents/me") is None
+
+    def test_key_depends_on_params(self):
+        from moltcli.utils.cache import ResponseCache
+
+        a = ResponseCache.key("GET", "/feed", {"sort": "hot", "limit": 20})
+        b = ResponseCache.key("GET", "/feed", {"limit": 20, "sort": "hot"})
+        c = ResponseCache.key("GET", "/feed", {"sort": "new", "limit": 20})
+
+        assert a == b
+        assert a != c
+
+    def test_put_get_roundtrip(self, tmp_path):
+        from moltcli.utils.cache import ResponseCache
+
+        cache = ResponseCache(str(tmp_path))
+        cache.put("k", {"posts": [1]}, etag='"v1"')
+        entry = cache.get("k")
+
+        assert entry.body == {"posts": [1]}
+        assert entry.is_fresh(30)
+        assert entry.validators() == {"If-None-Match": '"v1"'}
+
+    def test_lru_eviction(self, tmp_path):
+        from moltcli.utils.cache import ResponseCache
+
+        payload = {"data": "x" * 100}
+        probe = ResponseCache(str(tmp_path / "probe"))
+        probe.put("p", payload)
+        entry_size = (tmp_path / "probe" / "p.json").stat().st_size
+
+        cache = ResponseCache(str(tmp_path), max_bytes=int(entry_size * 3.5))
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.put(key, payload)
+            os.utime(tmp_path / f"{key}.json", (i, i))
+        cache.get("a")  # touch: "a" becomes most recently used
+        cache.put("d", payload)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("d") is not None
+
+    def test_clear(self, tmp_path):
+        from moltcli.utils.cache import ResponseCache
+
+        cache = ResponseCache(str(tmp_path))
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        assert cache.clear() == 2
+        assert cache.get("a") is None
+
+
+@patch("moltcli.utils.api_client.requests.Session.request")
+class TestClientCache:
+    """Test MoltbookClient cache integration."""
+
+    def test_fresh_hit_skips_network(self, mock_request, tmp_path, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.cache import ResponseCache
+
+        mock_request.return_value = ok_response({"posts": ["p1"]})
+        client = MoltbookClient(mock_api_key, cache=ResponseCache(str(tmp_path)))
+
+        first = client.get("/feed", params={"sort": "hot"})
+        second = client.get("/feed", params={"sort": "hot"})
+
+        assert first == second == {"posts": ["p1"]}
+        assert mock_request.call_count == 1
+
+    def test_uncacheable_endpoint(self, mock_request, tmp_path, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.cache import ResponseCache
+
+        mock_request.return_value = ok_response({"name": "me"})
+        client = MoltbookClient(mock_api_key, cache=ResponseCache(str(tmp_path)))
+
+        client.get("/agents/me")
+        client.get("/agents/me")
+
+        assert mock_request.call_count == 2
+
+    def test_stale_entry_revalidated_with_etag(self, mock_request, tmp_path, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.cache import ResponseCache
+
+        cache = ResponseCache(str(tmp_path))
+        client = MoltbookClient(mock_api_key, cache=cache)
+        mock_request.return_value = ok_response({"id": "p1"}, headers={"ETag": '"abc"'})
+        client.get("/posts/p1")
+
+        key = cache.key("GET", "/posts/p1", None, mock_api_key)
+        entry = cache.get(key)
+        entry.stored_at = time.time() - 3600
+        with patch.object(cache, "get", return_value=entry):
+            mock_request.return_value = ok_response(None, status=304)
+            result = client.get("/posts/p1")
+
+        assert result == {"id": "p1"}
+        assert mock_request.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+        assert cache.get(key).is_fresh(60)
+
+    def test_accounts_do_not_share_entries(self, mock_request, tmp_path):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.cache import ResponseCache
+
+        cache = ResponseCache(str(tmp_path))
+        mock_request.return_value = ok_response({"name": "alice"})
+        MoltbookClient("alice_api_key", cache=cache).get("/agents/profile")
+        mock_request.return_value = ok_response({"name": "bob"})
+        result = MoltbookClient("bob_api_key", cache=cache).get("/agents/profile")
+
+        assert result == {"name": "bob"}
+        assert mock_request.call_count == 2
+
+    def test_write_evicts_cached_post(self, mock_request, tmp_path, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.cache import ResponseCache
+
+        client = MoltbookClient(mock_api_key, cache=ResponseCache(str(tmp_path)))
+        mock_request.return_value = ok_response({"id": "p1", "upvotes": 1})
+        client.get("/posts/p1")
+        client.get("/posts/p2")
+
+        mock_request.return_value = ok_response({"success": True})
+        client.post("/posts/p1/upvote")
+        mock_request.return_value = ok_response({"id": "p1", "upvotes": 2})
+
+        assert client.get("/posts/p1") == {"id": "p1", "upvotes": 2}
+        assert client.get("/posts/p2") == {"id": "p1", "upvotes": 1}  # untouched, still cached
+        assert mock_request.call_count == 4
+
+    def test_delete_evicts_cached_post(self, mock_request, tmp_path, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.cache import ResponseCache
+        from moltcli.utils.errors import NotFoundError
+
+        client = MoltbookClient(mock_api_key, cache=ResponseCache(str(tmp_path)))
+        mock_request.return_value = ok_response({"id": "p1"})
+        client.get("/posts/p1")
+        mock_request.return_value = ok_response({"success": True})
+        client.delete("/posts/p1")
+
+        gone = Mock(ok=False, status_code=404, headers={})
+        gone.json.return_value = {"error": "Post not found"}
+        mock_request.return_value = gone
+        with pytest.raises(NotFoundError):
+            client.get("/posts/p1")
+
+    def test_post_not_cached(self, mock_request, tmp_path, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.cache import ResponseCache
+
+        mock_request.return_value = ok_response({"success": True})
+        client = MoltbookClient(mock_api_key, cache=ResponseCache(str(tmp_path)))
+
+        client.post("/posts/p1/upvote")
+        client.post("/posts/p1/upvote")
+
+        assert mock_request.call_count == 2
@@ -0,0 +1,163 @@
+"""Tests for challenge module."""
+import random
+
+import pytest
+
+
+def to_words(n, rng):
+    """Spell 0-99 in words, joining compounds the way challenges do."""
+    from moltcli.utils.challenge import UNITS, TEENS, TENS
+
+    names = {v: k for k, v in {**UNITS, **TEENS, **TENS}.items()}
+    if n in names:
+        return names[n]
+    return names[n - n % 10] + rng.choice(["-", " ", ""]) + names[n % 10]
+
+
+def scramble_case(word, rng):
+    return "".join(c.upper() if rng.random() < 0.5 else c.lower() for c in word)
+
+
+FILLER = ["a lobster", "swims at", "meters per second", "and", "then", "what is", "?", "total"]
+
+
+def fuzz_corpus(count=500, seed=1234):
+    """(challenge text, expected numbers) pairs with random casing and filler."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        expected = [rng.randrange(100) for _ in range(rng.randint(1, 4))]
+        parts = []
+        for n in expected:
+            parts.append(rng.choice(FILLER))
+            parts.append(str(n) if rng.random() < 0.1 else scramble_case(to_words(n, rng), rng))
+        parts.append(rng.choice(FILLER))
+        yield " ".join(parts), expected
+
+
+class TestTokenizeNumbers:
+    """Test tokenize_numbers function."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("ThIrTy-TwO", [32]),
+        ("thirty two", [32]),
+        ("FORTYSEVEN", [47]),
+        ("sEvEnTeEn and seven", [17, 7]),
+        ("two plus two", [2, 2]),
+        ("often someone", []),
+        ("twenty oneself", [20]),
+        ("speed 12 and 3x", [12]),
+    ])
+    def test_cases(self, text, expected):
+        from moltcli.utils.challenge import extract_numbers
+
+        assert extract_numbers(text) == expected
+
+    def test_spans(self):
+        from moltcli.utils.challenge import tokenize_numbers
+
+        text = "go NiNeTy-NiNe now"
+        (token,) = tokenize_numbers(text)
+
+        assert token.value == 99
+        assert text[token.start:token.end] == "NiNeTy-NiNe"
+
+    def test_fuzz_corpus(self):
+        from moltcli.utils.challenge import extract_numbers
+
+        for text, expected in fuzz_corpus():
+            assert extract_numbers(text) == expected, text
+
+
+class TestParseChallenge:
+    """Test parse_challenge function."""
+
+    @pytest.mark.parametrize("text,answer", [
+        ("ThIrTy-TwO + fOuR", "36"),
+        ("what is fifty minus tWeLvE", "38"),
+        ("SiX times SeVeN", "42"),
+        ("twenty and five", "25"),
+    ])
+    def test_operations(self, text, answer):
+        from moltcli.utils.challenge import parse_challenge
+
+        assert parse_challenge(text) == answer
+
+    def test_needs_two_numbers(self):
+        from moltcli.utils.challenge import parse_challenge, auto_solve_challenge
+
+        assert parse_challenge("only ThReE here") is None
+        assert auto_solve_challenge("nothing") == (False, "No numbers found in challenge")
+
+
+class TestSolveChallenge:
+    """Test solve_challenge expression engine."""
+
+    @pytest.mark.parametrize("text,answer,expression", [
+        ("three plus four times two", "11", "3 + 4 * 2"),
+        ("(3 + 4) * 2", "14", "(3 + 4) * 2"),
+        ("TeN dIvIdEd By FoUr", "2.50", "10 / 4"),
+        ("three point five plus one", "4.50", "3.50 + 1"),
+        ("seven multiplied by six minus two", "40", "7 * 6 - 2"),
+        ("five less than ten", "5", "10 - 5"),
+        ("one hundred plus five", "105", "100 + 5"),
+        ("OnE hUnDrEd AnD fIvE mInUs TeN", "95", "105 - 10"),
+        ("two thousand three hundred forty five minus five", "2340", "2345 - 5"),
+        ("a hundred times three", "300", "100 * 3"),
+    ])
+    def test_expressions(self, text, answer, expression):
+        from moltcli.utils.challenge import solve_challenge
+
+        solution = solve_challenge(text)
+
+        assert solution.answer == answer
+        assert solution.expression == expression
+        assert solution.confidence == 1.0
+
+    def test_obfuscated(self):
+        from moltcli.utils.challenge import solve_challenge
+
+        text = "A] lO^bSt-Er S[wImS aT/ tW]eNnTyy mE^tE[rS aNd] SlO/wS bY^ fI[vE, wHaT iS tHe NeW sPeEd?"
+        solution = solve_challenge(text)
+
+        assert solution.answer == "15"
+        assert solution.confidence >= 0.8
+
+    def test_guessing_lowers_confidence(self):
+        from moltcli.utils.challenge import solve_challenge
+
+        assert solve_challenge("seven eight").confidence < 0.8
+        assert solve_challenge("six plus times two").confidence < 0.8
+
+    @pytest.mark.parametrize("text,answer,expression", [
+        ("lobster swims one hundred and two hundred meters then slows by ten", "290", "100 + 200 - 10"),
+        ("a crab has two hundred and three hundred shells plus five", "505", "200 + 300 + 5"),
+        ("two hundred lobsters and three hundred crabs", "500", "200 + 300"),
+        ("two thousand three thousand", "5000", "2000 + 3000"),
+    ])
+    def test_separate_scaled_numbers(self, text, answer, expression):
+        from moltcli.utils.challenge import solve_challenge
+
+        solution = solve_challenge(text)
+
+        assert solution.answer == answer
+        assert solution.expression == expression
+
+    def test_unsupported_magnitude_is_not_trusted(self):
+        from moltcli.utils.challenge import CONFIDENCE_THRESHOLD, solve_challenge
+
+        assert solve_challenge("two dozen plus five").confidence < CONFIDENCE_THRESHOLD
+        assert solve_challenge("one trillion minus one").confidence < CONFIDENCE_THRESHOLD
+
+    def test_division_by_zero(self):
+        from moltcli.utils.challenge import solve_challenge
+
+        assert solve_challenge("ten divided by zero").answer is None
+
+    def test_auto_solve_refuses_low_confidence(self):
+        from moltcli.utils.challenge import auto_solve_challenge
+
+        ok, message = auto_solve_challenge("seven eight")
+
+        assert not ok
+        assert "Low confidence" in message
+        assert auto_solve_challenge("seven eight", min_confidence=0.5) == (True, "15")
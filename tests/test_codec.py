@@ -0,0 +1,62 @@
+"""Tests for codec module."""
+import json
+
+import pytest
+from unittest.mock import Mock
+
+
+@pytest.fixture(params=["json", "ujson", "orjson"])
+def codec(request):
+    from moltcli.utils.codec import CODECS
+
+    if request.param not in CODECS:
+        pytest.skip(f"{request.param} not installed")
+    return CODECS[request.param]
+
+
+class TestCodec:
+    """Test every installed backend behaves like the stdlib."""
+
+    def test_round_trip(self, codec):
+        data = {"posts": [{"id": "p1", "title": "Hé 🦞", "upvotes": 3, "score": 1.5, "x": None}]}
+
+        assert codec.loads(codec.dumps(data)) == data
+        assert codec.loads(codec.dumpb(data)) == data
+
+    def test_compact_utf8_bytes(self, codec):
+        out = codec.dumpb({"t": "café/ü"})
+
+        assert isinstance(out, bytes)
+        assert out == '{"t":"café/ü"}'.encode()
+
+    def test_indent_matches_stdlib(self, codec):
+        data = {"a": [1, {"b": "ü"}], "c": {}}
+
+        assert codec.dumps(data, indent=True) == json.dumps(data, ensure_ascii=False, indent=2)
+
+    def test_sort_keys(self, codec):
+        assert codec.dumps({"b": 1, "a": 2}, sort_keys=True) == '{"a":2,"b":1}'
+
+    def test_falls_back_for_unsupported_values(self, codec):
+        assert codec.loads(codec.dumps({"n": 2**70})) == {"n": 2**70}
+        assert codec.dumps({1: "x"}) == '{"1":"x"}'
+
+    def test_decode_error_is_value_error(self, codec):
+        with pytest.raises(ValueError):
+            codec.loads(b"{not json")
+
+
+def test_unknown_backend():
+    from moltcli.utils.codec import get_codec
+
+    with pytest.raises(ValueError):
+        get_codec("simdjson")
+
+
+def test_client_decodes_raw_body():
+    from moltcli.utils.api_client import MoltbookClient
+
+    response = Mock(ok=True, status_code=200, headers={}, content='{"posts": ["ü"]}'.encode())
+
+    assert MoltbookClient._json_body(response) == {"posts": ["ü"]}
+    response.json.assert_not_called()
@@ -1,5 +1,7 @@
 """Tests for agent core module."""
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -21,7 +23,7 @@ class TestAgentCore:
 
         return AgentCore(mock_client)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_register(self, mock_request, agent_core):
         """Test agent registration."""
         mock_response = Mock()
@@ -46,7 +48,7 @@ class TestAgentCore:
         }
         assert "api_key" in result["agent"]
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_get_status(self, mock_request, agent_core):
         """Test get claim status."""
         mock_response = Mock()
@@ -59,7 +61,7 @@ class TestAgentCore:
         mock_request.assert_called_once()
         assert result["status"] == "pending_claim"
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_get_me(self, mock_request, agent_core):
         """Test get current agent info."""
         mock_response = Mock()
@@ -76,7 +78,7 @@ class TestAgentCore:
         mock_request.assert_called_once()
         assert result["name"] == "TestAgent"
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_get_profile(self, mock_request, agent_core):
         """Test get another agent's profile."""
         mock_response = Mock()
@@ -89,7 +91,7 @@ class TestAgentCore:
         mock_request.assert_called_once()
         assert "name=OtherAgent" in str(mock_request.call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_follow(self, mock_request, agent_core):
         """Test follow an agent."""
         mock_response = Mock()
@@ -104,7 +106,7 @@ class TestAgentCore:
         assert call_args.kwargs["method"] == "POST"
         assert "OtherAgent/follow" in str(call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_unfollow(self, mock_request, agent_core):
         """Test unfollow an agent."""
         mock_response = Mock()
@@ -119,7 +121,7 @@ class TestAgentCore:
         assert call_args.kwargs["method"] == "DELETE"
         assert "OtherAgent/follow" in str(call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_update_profile_description(self, mock_request, agent_core):
         """Test update profile with description."""
         mock_response = Mock()
@@ -134,7 +136,7 @@ class TestAgentCore:
         assert call_args.kwargs["method"] == "PATCH"
         assert call_args.kwargs["json"] == {"description": "New description"}
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_update_profile_metadata(self, mock_request, agent_core):
         """Test update profile with metadata."""
         mock_response = Mock()
@@ -148,7 +150,7 @@ class TestAgentCore:
         call_args = mock_request.call_args
         assert call_args.kwargs["json"] == {"metadata": {"key": "value"}}
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_update_profile_both(self, mock_request, agent_core):
         """Test update profile with both description and metadata."""
         mock_response = Mock()
@@ -179,7 +181,7 @@ class TestPostCore:
 
         return PostCore(mock_client)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_create_post_with_content(self, mock_request, post_core):
         """Test create post with content."""
         mock_response = Mock()
@@ -196,7 +198,7 @@ class TestPostCore:
         assert call_args.kwargs["json"]["title"] == "Test Title"
         assert call_args.kwargs["json"]["content"] == "Test content"
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_create_post_with_url(self, mock_request, post_core):
         """Test create post with URL."""
         mock_response = Mock()
@@ -210,7 +212,7 @@ class TestPostCore:
         assert call_args.kwargs["json"]["url"] == "https://example.com"
         assert "content" not in call_args.kwargs["json"]
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_get_post(self, mock_request, post_core):
         """Test get post by ID."""
         mock_response = Mock()
@@ -223,7 +225,7 @@ class TestPostCore:
         mock_request.assert_called_once()
         assert "post_123" in str(mock_request.call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_delete_post(self, mock_request, post_core):
         """Test delete post."""
         mock_response = Mock()
@@ -237,7 +239,7 @@ class TestPostCore:
         call_args = mock_request.call_args
         assert call_args.kwargs["method"] == "DELETE"
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_list_by_submolt(self, mock_request, post_core):
         """Test list posts in submolt."""
         mock_response = Mock()
@@ -250,6 +252,103 @@ class TestPostCore:
         call_args = mock_request.call_args
         assert call_args.kwargs["params"]["limit"] == 10
 
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_verify_endpoint(self, mock_request, post_core):
+        """Test verify posts to /verify under the API base."""
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.json.return_value = {"success": True}
+        mock_request.return_value = mock_response
+
+        post_core.verify("reef-123", "36")
+
+        call_args = mock_request.call_args
+        assert call_args.kwargs["url"].endswith("/api/v1/verify")
+        assert "/api/v1/api/v1" not in call_args.kwargs["url"]
+        assert call_args.kwargs["json"] == {"verification_code": "reef-123", "answer": "36"}
+
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_create_and_verify(self, mock_request, post_core):
+        """Test the challenge is solved and verified in one call."""
+        created = Mock(ok=True)
+        created.json.return_value = {
+            "success": True,
+            "verification_required": True,
+            "post": {"id": "post_123"},
+            "verification": {
+                "verification_code": "reef-123",
+                "challenge": "ThIrTy-TwO pLuS fOuR",
+            },
+        }
+        verified = Mock(ok=True)
+        verified.json.return_value = {
+            "success": True,
+            "post": {"id": "post_123", "url": "https://moltbook.com/p/post_123"},
+        }
+        mock_request.side_effect = [created, verified]
+
+        result = post_core.create_and_verify("general", "Title", content="Body")
+
+        assert result["verified"] is True
+        assert result["answer"] == "36"
+        assert result["url"] == "https://moltbook.com/p/post_123"
+        assert set(result["timings_ms"]) == {"create", "solve", "verify", "total"}
+        assert mock_request.call_args.kwargs["json"] == {
+            "verification_code": "reef-123",
+            "answer": "36",
+        }
+
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_create_and_verify_rejected_answer(self, mock_request, post_core):
+        """Test a 400 from verify returns the post and challenge instead of raising."""
+        created = Mock(ok=True)
+        created.json.return_value = {
+            "verification_required": True,
+            "post": {"id": "post_123"},
+            "verification": {"verification_code": "reef-123", "challenge": "ThIrTy-TwO pLuS fOuR"},
+        }
+        rejected = Mock(ok=False, status_code=400, headers={})
+        rejected.json.return_value = {"error": "Incorrect answer"}
+        mock_request.side_effect = [created, rejected]
+
+        result = post_core.create_and_verify("general", "Title", content="Body")
+
+        assert result["verified"] is False
+        assert result["post_id"] == "post_123"
+        assert result["verification"]["verification_code"] == "reef-123"
+        assert result["verification"]["error"] == "Incorrect answer"
+
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_create_and_verify_unsolvable(self, mock_request, post_core):
+        """Test an unsolvable challenge is returned instead of guessed."""
+        created = Mock(ok=True)
+        created.json.return_value = {
+            "verification_required": True,
+            "post": {"id": "post_123"},
+            "verification": {"verification_code": "reef-123", "challenge": "seven eight"},
+        }
+        mock_request.return_value = created
+
+        result = post_core.create_and_verify("general", "Title", content="Body")
+
+        mock_request.assert_called_once()
+        assert result["verified"] is False
+        assert result["verification"]["verification_code"] == "reef-123"
+        assert "Low confidence" in result["reason"]
+
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_create_and_verify_not_required(self, mock_request, post_core):
+        """Test posts that need no verification skip the solver."""
+        created = Mock(ok=True)
+        created.json.return_value = {"success": True, "post": {"id": "post_123"}}
+        mock_request.return_value = created
+
+        result = post_core.create_and_verify("general", "Title", content="Body")
+
+        mock_request.assert_called_once()
+        assert result["verified"] is True
+        assert result["post_id"] == "post_123"
+
 
 class TestCommentCore:
     """Test CommentCore class."""
@@ -266,7 +365,7 @@ class TestCommentCore:
 
         return CommentCore(mock_client)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_create_comment(self, mock_request, comment_core):
         """Test create comment on post."""
         mock_response = Mock()
@@ -281,7 +380,7 @@ class TestCommentCore:
         assert "post_123" in call_args.kwargs["url"]
         assert call_args.kwargs["json"]["content"] == "Great post!"
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_create_reply(self, mock_request, comment_core):
         """Test create reply to comment."""
         mock_response = Mock()
@@ -295,7 +394,7 @@ class TestCommentCore:
         assert "post_123" in call_args.kwargs["url"]
         assert call_args.kwargs["json"]["parent_id"] == "comment_123"
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_get_comment(self, mock_request, comment_core):
         """Test get comment by ID."""
         mock_response = Mock()
@@ -307,7 +406,7 @@ class TestCommentCore:
 
         assert "comment_123" in str(mock_request.call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_delete_comment(self, mock_request, comment_core):
         """Test delete comment."""
         mock_response = Mock()
@@ -320,7 +419,7 @@ class TestCommentCore:
         call_args = mock_request.call_args
         assert call_args.kwargs["method"] == "DELETE"
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_list_by_post(self, mock_request, comment_core):
         """Test list comments for post."""
         mock_response = Mock()
@@ -333,6 +432,33 @@ class TestCommentCore:
         call_args = mock_request.call_args
         assert call_args.kwargs["params"]["limit"] == 20
 
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_iter_tree(self, mock_request, comment_core):
+        """Test iter_tree rebuilds replies under their parents."""
+        mock_response = Mock(ok=True, status_code=200, headers={})
+        mock_response.json.return_value = {
+            "comments": [
+                {"id": "c3", "parent_id": "c1"},
+                {"id": "c1", "parent_id": None},
+                {"id": "c4", "parent_id": "c3"},
+                {"id": "c2"},
+                {"id": "c5", "parent_id": "deleted"},
+            ],
+        }
+        mock_request.return_value = mock_response
+
+        tree = [(depth, c["id"]) for depth, c in comment_core.iter_tree("post_123")]
+
+        assert tree == [(0, "c1"), (1, "c3"), (2, "c4"), (0, "c2"), (0, "c5")]
+
+    def test_walk_tree_survives_cycles(self):
+        """Test comments whose parents form a cycle are still yielded once."""
+        from moltcli.core.comment import walk_tree
+
+        comments = [{"id": "a", "parent_id": "b"}, {"id": "b", "parent_id": "a"}]
+
+        assert [(d, c["id"]) for d, c in walk_tree(comments)] == [(0, "a"), (1, "b")]
+
 
 class TestVoteCore:
     """Test VoteCore class."""
@@ -349,7 +475,7 @@ class TestVoteCore:
 
         return VoteCore(mock_client)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_upvote_post(self, mock_request, vote_core):
         """Test upvote a post."""
         mock_response = Mock()
@@ -363,7 +489,7 @@ class TestVoteCore:
         assert call_args.kwargs["method"] == "POST"
         assert "post_123/upvote" in str(call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_downvote_post(self, mock_request, vote_core):
         """Test downvote a post."""
         mock_response = Mock()
@@ -376,7 +502,7 @@ class TestVoteCore:
         call_args = mock_request.call_args
         assert "post_123/downvote" in str(call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_upvote_comment(self, mock_request, vote_core):
         """Test upvote a comment."""
         mock_response = Mock()
@@ -389,7 +515,7 @@ class TestVoteCore:
         call_args = mock_request.call_args
         assert "comment_123/upvote" in str(call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_downvote_comment(self, mock_request, vote_core):
         """Test downvote a comment."""
         mock_response = Mock()
@@ -402,7 +528,7 @@ class TestVoteCore:
         call_args = mock_request.call_args
         assert "comment_123/downvote" in str(call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_upvote_with_type_comment(self, mock_request, vote_core):
         """Test upvote with explicit type='comment'."""
         mock_response = Mock()
@@ -415,6 +541,111 @@ class TestVoteCore:
         call_args = mock_request.call_args
         assert "comment_123/upvote" in str(call_args)
 
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_batch(self, mock_request, vote_core):
+        """Test batch votes every item and yields one result each."""
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.json.return_value = {"success": True}
+        mock_request.return_value = mock_response
+
+        items = [(f"post_{i}", "up", "post") for i in range(25)] + [("c_1", "down", "comment")]
+        results = list(vote_core.batch(iter(items), workers=4))
+
+        assert len(results) == 26
+        assert mock_request.call_count == 26
+        by_id = {r["id"]: r for r in results}
+        assert by_id["post_3"]["status"] == "upvoted"
+        assert by_id["c_1"]["status"] == "downvoted"
+        assert any("/comments/c_1/downvote" in str(c) for c in mock_request.call_args_list)
+
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_batch_reports_errors_per_item(self, mock_request, vote_core):
+        """Test a failing item does not stop the batch."""
+        ok = Mock(ok=True)
+        ok.json.return_value = {"success": True}
+        missing = Mock(ok=False, status_code=404, text="Not Found")
+        missing.json.return_value = {"error": "Post not found"}
+        mock_request.side_effect = lambda **kw: missing if "bad" in kw["url"] else ok
+
+        results = list(vote_core.batch([("good", "up", "post"), ("bad", "up", "post")], workers=2))
+
+        by_id = {r["id"]: r for r in results}
+        assert by_id["good"]["status"] == "upvoted"
+        assert by_id["bad"]["status"] == "error"
+        assert by_id["bad"]["error_code"] == "POST_NOT_FOUND"
+
+    @patch("moltcli.core.vote.time.sleep")
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_batch_retries_after_rate_limit(self, mock_request, mock_sleep, vote_core):
+        """Test rate-limited items pause and are retried."""
+        limited = Mock(ok=False, status_code=429, headers={"Retry-After": "2"})
+        limited.json.return_value = {}
+        ok = Mock(ok=True)
+        ok.json.return_value = {"success": True}
+        mock_request.side_effect = [limited, ok]
+
+        results = list(vote_core.batch([("post_1", "up", "post")], workers=1))
+
+        assert results[0]["status"] == "upvoted"
+        assert mock_request.call_count == 2
+        assert mock_sleep.call_args.args[0] == pytest.approx(2, abs=0.1)
+
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_batch_command_reports_bad_specs(self, mock_request, mock_api_key):
+        """Test a malformed line gets an error record and the batch goes on."""
+        from click.testing import CliRunner
+        from moltcli.cli import cli
+        from moltcli.utils.api_client import MoltbookClient
+
+        ok = Mock(ok=True, status_code=200, headers={})
+        ok.json.return_value = {"success": True}
+        mock_request.return_value = ok
+        client = MoltbookClient(mock_api_key, rate_limit=False)
+
+        result = CliRunner().invoke(
+            cli,
+            ["vote", "batch", "--file", "-"],
+            input="p1\np2 sideways\np3 down\n",
+            obj={"client": client},
+        )
+
+        assert result.exit_code == 1
+        by_id = {r["id"]: r for r in map(json.loads, result.output.splitlines())}
+        assert by_id["p1"]["status"] == "upvoted"
+        assert by_id["p3"]["status"] == "downvoted"
+        assert by_id["p2 sideways"]["status"] == "error"
+        assert "Invalid vote spec" in by_id["p2 sideways"]["message"]
+
+    def test_batch_command_rejects_zero_workers(self, mock_api_key):
+        """Test --workers must be at least 1."""
+        from click.testing import CliRunner
+        from moltcli.cli import cli
+
+        result = CliRunner().invoke(
+            cli, ["vote", "batch", "p1", "--workers", "0"], obj={"client": Mock()}
+        )
+
+        assert result.exit_code == 2
+        assert "--workers" in result.output
+
+    @patch("moltcli.core.vote.time.sleep")
+    def test_batch_pauses_when_governor_refuses(self, mock_sleep):
+        """Test a governor-raised rate limit pauses instead of retrying at once."""
+        from moltcli.core.vote import VoteCore
+        from moltcli.utils.errors import RateLimitError
+
+        client = Mock()
+        client.post.side_effect = [
+            RateLimitError(retry_after=90, endpoint_type="vote"),
+            {"success": True},
+        ]
+
+        results = list(VoteCore(client).batch([("post_1", "up", "post")], max_wait=120))
+
+        assert results[0]["status"] == "upvoted"
+        assert mock_sleep.call_args.args[0] == pytest.approx(90, abs=0.1)
+
 
 class TestSearchCore:
     """Test SearchCore class."""
@@ -431,7 +662,7 @@ class TestSearchCore:
 
         return SearchCore(mock_client)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_search_posts(self, mock_request, search_core):
         """Test search posts."""
         mock_response = Mock()
@@ -446,7 +677,7 @@ class TestSearchCore:
         assert call_args.kwargs["params"]["type"] == "posts"
         assert call_args.kwargs["params"]["limit"] == 10
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_search_users(self, mock_request, search_core):
         """Test search users."""
         mock_response = Mock()
@@ -459,7 +690,7 @@ class TestSearchCore:
         call_args = mock_request.call_args
         assert call_args.kwargs["params"]["type"] == "users"
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_search_posts_convenience(self, mock_request, search_core):
         """Test search_posts convenience method."""
         mock_response = Mock()
@@ -472,7 +703,7 @@ class TestSearchCore:
         call_args = mock_request.call_args
         assert call_args.kwargs["params"]["type"] == "posts"
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_search_users_convenience(self, mock_request, search_core):
         """Test search_users convenience method."""
         mock_response = Mock()
@@ -501,7 +732,7 @@ class TestFeedCore:
 
         return FeedCore(mock_client)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_get_feed_default(self, mock_request, feed_core):
         """Test get feed with defaults."""
         mock_response = Mock()
@@ -515,7 +746,7 @@ class TestFeedCore:
         assert call_args.kwargs["params"]["sort"] == "hot"
         assert call_args.kwargs["params"]["limit"] == 20
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_get_feed_custom(self, mock_request, feed_core):
         """Test get feed with custom params."""
         mock_response = Mock()
@@ -530,7 +761,7 @@ class TestFeedCore:
         assert call_args.kwargs["params"]["limit"] == 10
         assert call_args.kwargs["params"]["submolt"] == "ai"
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_get_hot(self, mock_request, feed_core):
         """Test get hot posts."""
         mock_response = Mock()
@@ -544,7 +775,7 @@ class TestFeedCore:
         assert call_args.kwargs["params"]["sort"] == "hot"
         assert call_args.kwargs["params"]["limit"] == 5
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_get_new(self, mock_request, feed_core):
         """Test get newest posts."""
         mock_response = Mock()
@@ -574,7 +805,7 @@ class TestAuthCore:
 
         return AuthCore(mock_client)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_whoami(self, mock_request, auth_core):
         """Test whoami. Uses /agents/me endpoint per skill.md."""
         mock_response = Mock()
@@ -590,7 +821,7 @@ class TestAuthCore:
         mock_request.assert_called_once()
         assert "/agents/me" in str(mock_request.call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_verify(self, mock_request, auth_core):
         """Test verify API key. Uses /agents/me endpoint per skill.md."""
         mock_response = Mock()
@@ -603,7 +834,7 @@ class TestAuthCore:
         mock_request.assert_called_once()
         assert "/agents/me" in str(mock_request.call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_refresh(self, mock_request, auth_core):
         """Test refresh token."""
         mock_response = Mock()
@@ -633,7 +864,7 @@ class TestSubmoltsCore:
 
         return SubmoltsCore(mock_client)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_list(self, mock_request, submolts_core):
         """Test list submolts."""
         mock_response = Mock()
@@ -646,7 +877,7 @@ class TestSubmoltsCore:
         call_args = mock_request.call_args
         assert call_args.kwargs["params"]["limit"] == 10
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_get(self, mock_request, submolts_core):
         """Test get submolt info."""
         mock_response = Mock()
@@ -658,7 +889,7 @@ class TestSubmoltsCore:
 
         assert "ai" in str(mock_request.call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_create(self, mock_request, submolts_core):
         """Test create submolt."""
         mock_response = Mock()
@@ -673,7 +904,7 @@ class TestSubmoltsCore:
         assert call_args.kwargs["json"]["name"] == "new_submolt"
         assert call_args.kwargs["json"]["display_name"] == "New Submolt"
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_feed(self, mock_request, submolts_core):
         """Test get submolt feed."""
         mock_response = Mock()
@@ -687,7 +918,7 @@ class TestSubmoltsCore:
         assert call_args.kwargs["params"]["sort"] == "new"
         assert call_args.kwargs["params"]["limit"] == 10
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_subscribe(self, mock_request, submolts_core):
         """Test subscribe to submolt. Uses /submolts/{name}/subscribe endpoint per skill.md."""
         mock_response = Mock()
@@ -701,7 +932,7 @@ class TestSubmoltsCore:
         assert call_args.kwargs["method"] == "POST"
         assert "/ai/subscribe" in str(call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_unsubscribe(self, mock_request, submolts_core):
         """Test unsubscribe from submolt. Uses DELETE /submolts/{name}/subscribe per skill.md."""
         mock_response = Mock()
@@ -715,7 +946,7 @@ class TestSubmoltsCore:
         assert call_args.kwargs["method"] == "DELETE"
         assert "/ai/subscribe" in str(call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_get_subscribed(self, mock_request, submolts_core):
         """Test get user's subscribed submolts."""
         mock_response = Mock()
@@ -727,7 +958,7 @@ class TestSubmoltsCore:
 
         assert "subscriptions" in str(mock_request.call_args)
 
-    @patch("moltcli.utils.api_client.requests.request")
+    @patch("moltcli.utils.api_client.requests.Session.request")
     def test_trending(self, mock_request, submolts_core):
         """Test get trending submolts.
 
@@ -0,0 +1,157 @@
+"""Tests for daemon module."""
+import io
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+
+@pytest.fixture
+def running_daemon(mock_api_key):
+    """Daemon on a temporary socket, with a client that never hits the network."""
+    from moltcli.daemon import Daemon, control
+    from moltcli.utils.api_client import MoltbookClient
+    from moltcli.utils.retry import RetryPolicy
+
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "d.sock")
+    daemon = Daemon(path)
+    daemon._client = MoltbookClient(mock_api_key, rate_limit=False, retry=RetryPolicy.disabled())
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(100):
+        if os.path.exists(path):
+            break
+        time.sleep(0.01)
+    yield daemon
+    control("shutdown", path)
+    thread.join(2)
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
+def run(argv, path, stdin=""):
+    from moltcli.daemon import run_via_daemon
+
+    out, err = io.StringIO(), io.StringIO()
+    code = run_via_daemon(argv, path, stdout=out, stderr=err, stdin=io.StringIO(stdin))
+    return code, out.getvalue(), err.getvalue()
+
+
+class TestSplitViaDaemon:
+    """Test split_via_daemon function."""
+
+    def test_leading_flag(self):
+        from moltcli.daemon import split_via_daemon
+
+        assert split_via_daemon(["--json", "--via-daemon", "feed", "hot"]) == (
+            ["--json", "feed", "hot"], True
+        )
+
+    def test_ignores_argument_values(self):
+        from moltcli.daemon import split_via_daemon
+
+        argv = ["memory", "add", "--via-daemon"]
+        assert split_via_daemon(argv) == (argv, False)
+
+    def test_skips_option_values(self):
+        from moltcli.daemon import split_via_daemon
+
+        assert split_via_daemon(["--retries", "2", "--via-daemon", "feed"]) == (
+            ["--retries", "2", "feed"], True
+        )
+        assert split_via_daemon(["--trace-file", "t.ndjson", "--via-daemon", "feed"]) == (
+            ["--trace-file", "t.ndjson", "feed"], True
+        )
+
+
+@patch("moltcli.utils.api_client.requests.Session.request")
+class TestDaemon:
+    """Test commands served by the daemon."""
+
+    def test_runs_command_with_shared_client(self, mock_request, running_daemon, sample_feed):
+        response = Mock(ok=True, status_code=200, headers={})
+        response.json.return_value = sample_feed
+        mock_request.return_value = response
+
+        code, out, _ = run(["--json", "feed", "hot"], running_daemon.path)
+        run(["--json", "feed", "hot"], running_daemon.path)
+
+        assert code == 0
+        assert json.loads(out) == sample_feed
+        assert running_daemon.served == 2
+        assert running_daemon._client._session is not None
+
+    def test_per_call_options_apply(self, mock_request, running_daemon, sample_feed):
+        response = Mock(ok=True, status_code=200, headers={})
+        response.json.return_value = sample_feed
+        warm = running_daemon._client
+        # Requests land on the warm session, not a fresh one
+        warm._session.request = Mock(return_value=response)
+
+        code, _, err = run(["--json", "--trace", "--retries", "0", "feed", "hot"], running_daemon.path)
+
+        assert code == 0
+        spans = [json.loads(line) for line in err.splitlines() if line.startswith("{")]
+        assert spans[0]["endpoint"] == "/feed"
+        assert warm._session.request.call_count == 1
+        assert running_daemon._client is warm
+
+    def test_rebuilds_client_when_credentials_change(
+        self, mock_request, running_daemon, sample_feed, tmp_path, monkeypatch
+    ):
+        from moltcli.utils import config
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        credentials = tmp_path / "credentials.json"
+        monkeypatch.setattr(config, "_config", config.Config(str(credentials)))
+        response = Mock(ok=True, status_code=200, headers={})
+        response.json.return_value = sample_feed
+        mock_request.return_value = response
+        old = running_daemon._client
+
+        credentials.write_text('{"api_key": "new_api_key"}')
+        code, _, _ = run(["--json", "feed", "hot"], running_daemon.path)
+
+        assert code == 0
+        assert running_daemon._client is not old
+        headers = mock_request.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer new_api_key"
+
+    def test_relays_exit_code_and_stderr(self, mock_request, running_daemon):
+        code, _, err = run(["feed", "hot", "--bogus"], running_daemon.path)
+
+        assert code == 2
+        assert "--bogus" in err
+
+    def test_forwards_stdin(self, mock_request, running_daemon):
+        response = Mock(ok=True, status_code=200, headers={})
+        response.json.return_value = {"success": True}
+        mock_request.return_value = response
+
+        code, out, _ = run(["vote", "batch", "--file", "-"], running_daemon.path, stdin="p1\np2 down\n")
+
+        assert code == 0
+        results = [json.loads(line) for line in out.splitlines()]
+        assert {r["id"] for r in results} == {"p1", "p2"}
+
+    def test_ping(self, mock_request, running_daemon):
+        from moltcli.daemon import control
+
+        status = control("ping", running_daemon.path)
+
+        assert status["status"] == "running"
+        assert status["pid"] == os.getpid()
+
+
+def test_unreachable_daemon_returns_none(tmp_path):
+    from moltcli.daemon import run_via_daemon
+
+    assert run_via_daemon(["feed", "hot"], str(tmp_path / "missing.sock")) is None
@@ -1,6 +1,7 @@
 """Tests for formatter module."""
 import pytest
 import json
+from unittest.mock import Mock, patch
 
 
 class TestOutputFormatter:
@@ -70,3 +71,63 @@ class TestOutputFormatter:
         captured = capsys.readouterr()
         output = json.loads(captured.out)
         assert output == {"key": "value"}
+
+    def test_ndjson_format(self):
+        """Test NDJSON mode writes compact lines."""
+        from moltcli.utils.formatter import OutputFormatter
+
+        formatter = OutputFormatter(ndjson=True)
+
+        assert formatter.json_mode
+        assert formatter.format({"a": 1, "b": [1, 2]}) == '{"a":1,"b":[1,2]}'
+        assert formatter.format([{"id": 1}, {"id": 2}]) == '{"id":1}\n{"id":2}'
+
+    def test_stream(self, capsys):
+        """Test stream writes each item as it is produced."""
+        from moltcli.utils.formatter import OutputFormatter
+
+        def items():
+            yield {"id": 1}
+            # The first line is out before the second item exists
+            assert capsys.readouterr().out == '{"id":1}\n'
+            yield {"id": "ü"}
+
+        count = OutputFormatter(ndjson=True).stream(items())
+
+        assert count == 2
+        assert capsys.readouterr().out == '{"id":"ü"}\n'
+
+
+@patch("moltcli.utils.api_client.requests.Session.request")
+class TestNdjsonMode:
+    """Test the --ndjson global option."""
+
+    def run(self, args, mock_api_key):
+        from click.testing import CliRunner
+        from moltcli.cli import cli
+        from moltcli.utils.api_client import MoltbookClient
+
+        client = MoltbookClient(mock_api_key, rate_limit=False)
+        return CliRunner().invoke(cli, args, obj={"client": client})
+
+    def test_feed_streams_posts(self, mock_request, mock_api_key, sample_feed):
+        response = Mock(ok=True, status_code=200, headers={})
+        response.json.return_value = sample_feed
+        mock_request.return_value = response
+
+        result = self.run(["--ndjson", "feed", "hot", "--limit", "2"], mock_api_key)
+
+        assert result.exit_code == 0, result.output
+        lines = result.output.splitlines()
+        assert [json.loads(line) for line in lines] == sample_feed["posts"][:2]
+        mock_request.assert_called_once()
+
+    def test_errors_are_json(self, mock_request, mock_api_key):
+        response = Mock(ok=False, status_code=404, headers={})
+        response.json.return_value = {"error": "Submolt not found"}
+        mock_request.return_value = response
+
+        result = self.run(["--ndjson", "submolts", "feed", "nope"], mock_api_key)
+
+        assert result.exit_code == 1
+        assert json.loads(result.output)["status"] == "error"
@@ -0,0 +1,193 @@
+"""Tests for memory module."""
+import json
+
+import pytest
+
+
+@pytest.fixture(params=["jsonl", "sqlite"])
+def store(request, tmp_path):
+    from moltcli.utils.memory import MemoryStore
+
+    return MemoryStore(str(tmp_path), backend=request.param)
+
+
+class TestMemoryStore:
+    """Test MemoryStore on both backends."""
+
+    def test_add_and_search(self, store):
+        store.add("Learned about DID identity", tags=["identity"])
+        store.add("Unrelated note")
+
+        results = store.search("identity")
+
+        assert [r.content for r in results] == ["Learned about DID identity"]
+
+    def test_search_filters(self, store):
+        store.add("posted hello", category="interactions", tags=["moltbook", "post"], source="moltbook")
+        store.add("posted again", category="interactions", tags=["moltbook"], source="cli")
+
+        by_tag = store.search("posted", tags=["post"])
+        by_source = store.search("posted", source="cli")
+        by_category = store.search("posted", category="learnings")
+
+        assert [r.content for r in by_tag] == ["posted hello"]
+        assert [r.content for r in by_source] == ["posted again"]
+        assert by_category == []
+
+    def test_search_date_range(self, store):
+        entry = store.add("dated note")
+        day = entry.created_at[:10]
+
+        assert store.search("dated", since=day)
+        assert not store.search("dated", until=day)
+
+    def test_view_and_export(self, store):
+        store.add("remember this", category="context", tags=["x"])
+
+        assert "remember this" in store.view(category="context")
+        exported = json.loads(store.export(format="json"))
+        assert exported["context"][0]["content"] == "remember this"
+
+
+class TestSQLiteBackend:
+    """Test SQLite-specific behaviour."""
+
+    def test_ranked_prefix_search(self, tmp_path):
+        from moltcli.utils.memory import MemoryStore
+
+        store = MemoryStore(str(tmp_path), backend="sqlite")
+        store.add("agents talk about identity once")
+        store.add("identity identity identity everywhere")
+
+        results = store.search("ident")
+
+        assert len(results) == 2
+        assert results[0].content.startswith("identity identity")
+
+    def test_quotes_in_query(self, tmp_path):
+        from moltcli.utils.memory import MemoryStore
+
+        store = MemoryStore(str(tmp_path), backend="sqlite")
+        store.add('he said "hello"')
+
+        assert len(store.search('"hello')) == 1
+
+    def test_unknown_backend(self, tmp_path):
+        from moltcli.utils.memory import MemoryStore
+
+        with pytest.raises(ValueError):
+            MemoryStore(str(tmp_path), backend="redis")
+
+
+class TestMigrate:
+    """Test JSONL to SQLite migration."""
+
+    def test_migrate_ingests_jsonl(self, tmp_path):
+        from moltcli.utils.memory import MemoryStore
+
+        jsonl = MemoryStore(str(tmp_path), backend="jsonl")
+        jsonl.add("first learning", tags=["a"])
+        jsonl.record_interaction("moltbook", "post", "p1")
+        # Legacy record without id or category
+        with open(tmp_path / "learnings.jsonl", "a") as f:
+            f.write(json.dumps({
+                "content": "legacy", "tags": [], "source": "cli", "created_at": "2025-01-01",
+            }) + "\n")
+
+        counts = jsonl.migrate()
+
+        assert counts == {"interactions": 1, "learnings": 2}
+        migrated = MemoryStore(str(tmp_path))
+        assert migrated.backend == "sqlite"
+        assert [r.content for r in migrated.search("legacy")] == ["legacy"]
+        assert migrated.search("", category="interactions", tags=["moltbook"])
+
+    def test_migrate_is_idempotent(self, tmp_path):
+        from moltcli.utils.memory import MemoryStore
+
+        store = MemoryStore(str(tmp_path), backend="jsonl")
+        store.add("only once")
+
+        store.migrate()
+        assert store.migrate() == {"learnings": 0}
+
+
+class TestInvertedIndex:
+    """Test the JSONL sidecar index."""
+
+    def test_tag_and_or(self, store):
+        store.add("a", tags=["x", "y"])
+        store.add("b", tags=["x"])
+        store.add("c", tags=["z"])
+
+        both = store.search("", tags=["x", "y"])
+        either = store.search("", tags=["y", "z"], match_any=True)
+
+        assert [r.content for r in both] == ["a"]
+        assert sorted(r.content for r in either) == ["a", "c"]
+
+    def test_incremental_update_after_build(self, tmp_path):
+        from moltcli.utils.memory import MemoryStore
+
+        store = MemoryStore(str(tmp_path), backend="jsonl")
+        store.add("first entry")
+        assert store.search("first")  # builds the index
+
+        store.add("second entry")
+
+        assert (tmp_path / "learnings.jsonl.idx.log").exists()
+        assert [r.content for r in store.search("second")] == ["second entry"]
+
+    def test_rebuilds_when_jsonl_changed_externally(self, tmp_path):
+        from moltcli.utils.memory import MemoryStore
+
+        store = MemoryStore(str(tmp_path), backend="jsonl")
+        store.add("indexed entry")
+        assert store.search("indexed")
+
+        with open(tmp_path / "learnings.jsonl", "a") as f:
+            f.write(json.dumps({
+                "id": "ext", "category": "learnings", "content": "external write",
+                "tags": [], "source": "cli", "created_at": "2026-01-01",
+            }) + "\n")
+
+        fresh = MemoryStore(str(tmp_path), backend="jsonl")
+        assert [r.content for r in fresh.search("external")] == ["external write"]
+
+    @pytest.mark.parametrize("query", ["abc123", "dentity", "2026", "learnings", "xyz789", "did id"])
+    def test_substring_anywhere_in_line(self, tmp_path, query):
+        from moltcli.utils.memory import MemoryStore
+
+        entry = {
+            "id": "post_abc123", "category": "learnings", "content": "Learned about DID identity",
+            "tags": [], "source": "cli", "created_at": "2026-01-01T10:00:00",
+            "metadata": {"post_id": "xyz789"},
+        }
+        (tmp_path / "learnings.jsonl").write_text(json.dumps(entry) + "\n")
+        store = MemoryStore(str(tmp_path), backend="jsonl")
+
+        assert [r.content for r in store.search(query)] == ["Learned about DID identity"]
+
+        # Entries reaching the index through the delta log match the same way
+        store.add("Another note", metadata={"thread": f"reply_{query}_x"})
+        assert [r.content for r in store.search(query)] == [
+            "Learned about DID identity", "Another note"
+        ]
+
+    def test_prefix_lookup(self, tmp_path):
+        from moltcli.utils.memory_index import InvertedIndex
+
+        path = tmp_path / "notes.jsonl"
+        lines = [
+            {"content": "identity systems", "tags": ["did"]},
+            {"content": "identical twins", "tags": []},
+            {"content": "other", "tags": ["DID"]},
+        ]
+        path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+        index = InvertedIndex(path)
+
+        assert index.candidates("") is None
+        assert len(index.candidates("ident")) == 2
+        assert len(index.candidates("identity")) == 1
+        assert len(index.candidates("", tags=["did"])) == 2
+        index.close()
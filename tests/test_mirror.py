@@ -0,0 +1,185 @@
+"""Tests for mirror module."""
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+
+def post(post_id, created_at, upvotes=0, comment_count=0):
+    return {
+        "id": post_id,
+        "title": f"Post {post_id}",
+        "submolt": {"name": "general"},
+        "upvotes": upvotes,
+        "comment_count": comment_count,
+        "created_at": created_at,
+    }
+
+
+def page(*posts):
+    response = Mock(ok=True, status_code=200, headers={})
+    response.json.return_value = {"posts": list(posts), "has_more": False}
+    return response
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    from moltcli.utils.mirror import Mirror
+
+    mirror = Mirror(str(tmp_path / "mirror.db"))
+    yield mirror
+    mirror.close()
+
+
+class TestMirror:
+    """Test Mirror storage and reads."""
+
+    def test_upsert_tracks_changes(self, mirror):
+        mirror.store_listing("feed:hot", [post("p1", "2026-01-01", upvotes=1)], replace=True)
+
+        counts = mirror.store_listing(
+            "feed:hot",
+            [post("p1", "2026-01-01", upvotes=5, comment_count=2), post("p2", "2026-01-02")],
+            replace=True,
+        )
+
+        assert counts == {"new": 1, "changed": 1}
+        assert mirror.post("p1")["upvotes"] == 5
+        assert [(h["upvotes"], h["comment_count"]) for h in mirror.history("p1")] == [
+            (1, 0),
+            (5, 2),
+        ]
+
+    def test_unchanged_post_adds_no_history(self, mirror):
+        for _ in range(2):
+            mirror.store_listing("feed:hot", [post("p1", "2026-01-01")], replace=True)
+
+        assert len(mirror.history("p1")) == 1
+
+    def test_ranked_listing_keeps_order(self, mirror):
+        mirror.store_listing(
+            "feed:hot", [post("p2", "2026-01-02"), post("p1", "2026-01-01")], replace=True
+        )
+        mirror.store_listing(
+            "feed:hot", [post("p1", "2026-01-01"), post("p3", "2026-01-03")], replace=True
+        )
+
+        assert [p["id"] for p in mirror.listing("feed:hot")] == ["p1", "p3"]
+
+    def test_new_listing_is_chronological(self, mirror):
+        mirror.store_listing("feed:new", [post("p1", "2026-01-01")], replace=False)
+        mirror.store_listing("feed:new", [post("p2", "2026-01-02")], replace=False)
+
+        assert [p["id"] for p in mirror.listing("feed:new")] == ["p2", "p1"]
+        assert mirror.high_water("feed:new") == "2026-01-02"
+
+    def test_unsynced_listing_raises(self, mirror):
+        from moltcli.utils.errors import MoltCLIError
+        from moltcli.utils.mirror import NOT_SYNCED
+
+        with pytest.raises(MoltCLIError) as exc_info:
+            mirror.listing("submolt/general:new")
+
+        assert exc_info.value.code == NOT_SYNCED
+        assert "sync submolt general --sort new" in exc_info.value.suggestion
+
+
+@patch("moltcli.utils.api_client.requests.Session.request")
+class TestSyncCore:
+    """Test SyncCore incremental sync."""
+
+    @pytest.fixture
+    def core(self, mirror, mock_api_key):
+        from moltcli.core.sync import SyncCore
+        from moltcli.utils.api_client import MoltbookClient
+
+        return SyncCore(MoltbookClient(mock_api_key, rate_limit=False), mirror)
+
+    def test_new_stops_at_high_water(self, mock_request, core):
+        mock_request.return_value = page(post("p2", "2026-01-02"), post("p1", "2026-01-01"))
+        assert core.sync_feed(sort="new")["new"] == 2
+
+        mock_request.return_value = page(
+            post("p3", "2026-01-03"), post("p2", "2026-01-02", upvotes=9), post("p1", "2026-01-01")
+        )
+        stats = core.sync_feed(sort="new")
+
+        assert stats == {"listing": "feed:new", "fetched": 1, "new": 1, "changed": 0}
+        assert core.mirror.post("p2")["upvotes"] == 0
+        assert [p["id"] for p in core.mirror.listing("feed:new")] == ["p3", "p2", "p1"]
+
+    def test_first_sync_reads_a_window(self, mock_request, core):
+        from moltcli.core.sync import DEFAULT_WINDOW
+
+        mock_request.return_value = page(post("p1", "2026-01-01"))
+
+        core.sync_feed(sort="hot", submolt="m/general")
+
+        assert mock_request.call_args[1]["params"]["limit"] <= DEFAULT_WINDOW
+        assert core.mirror.high_water("feed/general:hot") == "2026-01-01"
+
+    def test_comments(self, mock_request, core):
+        response = Mock(ok=True, status_code=200, headers={})
+        response.json.return_value = {
+            "comments": [{"id": "c1", "content": "hi"}],
+            "has_more": False,
+        }
+        mock_request.return_value = response
+
+        assert core.sync_comments("p1")["fetched"] == 1
+        assert core.mirror.comments("p1") == [{"id": "c1", "content": "hi"}]
+
+
+class TestOfflineCommands:
+    """Test --offline reads."""
+
+    def run(self, args, mirror):
+        from click.testing import CliRunner
+        from moltcli.cli import cli
+
+        return CliRunner().invoke(cli, args, obj={"mirror": mirror})
+
+    @pytest.fixture
+    def synced(self, mirror):
+        mirror.store_listing(
+            "feed:new", [post("p1", "2026-01-01"), post("p2", "2026-01-02")], replace=False
+        )
+        return mirror
+
+    def test_feed_new(self, synced):
+        result = self.run(["--json", "feed", "new", "--offline"], synced)
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["offline"] is True
+        assert [p["id"] for p in data["posts"]] == ["p2", "p1"]
+
+    def test_ndjson_streams(self, synced):
+        result = self.run(["--ndjson", "feed", "get", "--sort", "new", "--offline"], synced)
+
+        assert [json.loads(line)["id"] for line in result.output.splitlines()] == ["p2", "p1"]
+
+    def test_post_get(self, synced):
+        result = self.run(["--json", "post", "get", "p1", "--offline"], synced)
+
+        data = json.loads(result.output)
+        assert data["post"]["id"] == "p1"
+        assert len(data["history"]) == 1
+
+    def test_not_synced(self, mirror):
+        result = self.run(["--json", "comment", "list", "p1", "--offline"], mirror)
+
+        assert result.exit_code == 1
+        assert json.loads(result.output)["error_code"] == "NOT_SYNCED"
+
+    def test_comment_tree(self, mirror):
+        mirror.store_comments(
+            "p1",
+            [
+                {"id": "c1", "author": {"name": "a"}, "content": "top", "upvotes": 2},
+                {"id": "c2", "parent_id": "c1", "author": {"name": "b"}, "content": "reply"},
+            ],
+        )
+
+        result = self.run(["comment", "tree", "p1", "--offline"], mirror)
+
+        assert result.output.splitlines() == ["- a (2): top", "  - b (0): reply"]
@@ -0,0 +1,88 @@
+"""Tests for models module."""
+import sys
+
+import pytest
+from unittest.mock import Mock, patch
+
+
+@pytest.fixture
+def post_dict(sample_post):
+    return {**sample_post, "url": None, "is_pinned": False, "author": {"name": "a", "avatar": "x.png"}}
+
+
+class TestModels:
+    """Test slotted models."""
+
+    def test_round_trip_is_byte_compatible(self, post_dict):
+        from moltcli.models import Post
+        from moltcli.utils.formatter import OutputFormatter
+
+        post = Post.from_dict(post_dict)
+        formatter = OutputFormatter(json_mode=True)
+
+        assert post.to_dict() == post_dict
+        assert formatter.format(post.to_dict()) == formatter.format(post_dict)
+
+    def test_fields_and_nesting(self, post_dict):
+        from moltcli.models import Agent, Post, Submolt
+
+        post = Post.from_dict(post_dict)
+
+        assert post.title == "Test Post"
+        assert post.url is None
+        assert post.downvotes is None  # Absent from the response
+        assert isinstance(post.author, Agent) and post.author.name == "a"
+        assert isinstance(post.submolt, Submolt)
+        assert "downvotes" not in post.to_dict()
+
+    def test_bare_submolt_name(self):
+        from moltcli.models import Post
+
+        post = Post.from_dict({"id": "p", "submolt": "general"})
+
+        assert post.submolt == "general"
+        assert post.to_dict() == {"id": "p", "submolt": "general"}
+
+    def test_slotted(self, post_dict):
+        from moltcli.models import Comment, Post
+
+        post = Post.from_dict(post_dict)
+        comment = Comment(id="c1", content="hi")
+
+        assert not hasattr(post, "__dict__")
+        assert comment.to_dict() == {"id": "c1", "content": "hi"}
+        with pytest.raises(AttributeError):
+            post.nonsense = 1
+
+    def test_shapes_are_shared(self):
+        from moltcli.models import Comment
+
+        a = Comment.from_dict({"id": "1", "content": "x"})
+        b = Comment.from_dict({"id": "2", "content": "y"})
+
+        assert a._keys is b._keys
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need 3.10")
+    def test_memory_entry_slotted(self, tmp_path):
+        from moltcli.utils.memory import MemoryStore
+
+        entry = MemoryStore(str(tmp_path)).add("note")
+
+        assert not hasattr(entry, "__dict__")
+
+
+@patch("moltcli.utils.api_client.requests.Session.request")
+def test_iter_posts_models(mock_request, mock_api_key, sample_feed):
+    from moltcli.core.feed import FeedCore
+    from moltcli.models import Post
+    from moltcli.utils.api_client import MoltbookClient
+
+    response = Mock(ok=True, status_code=200, headers={})
+    response.json.return_value = sample_feed
+    mock_request.return_value = response
+
+    core = FeedCore(MoltbookClient(mock_api_key))
+    posts = list(core.iter_posts(page_size=2, max_items=2, models=True))
+
+    assert all(isinstance(p, Post) for p in posts)
+    assert [p.to_dict() for p in posts] == sample_feed["posts"]
@@ -0,0 +1,189 @@
+"""Tests for outbox module."""
+import pytest
+from unittest.mock import Mock, patch
+
+
+@pytest.fixture
+def queue(tmp_path):
+    from moltcli.utils.outbox import Outbox
+
+    return Outbox(str(tmp_path / "outbox"))
+
+
+def created(post_id, challenge="ThIrTy-TwO pLuS fOuR"):
+    response = Mock(ok=True, status_code=200, headers={})
+    response.json.return_value = {
+        "verification_required": True,
+        "post": {"id": post_id},
+        "verification": {"verification_code": f"v-{post_id}", "challenge": challenge},
+    }
+    return response
+
+
+def verified(post_id):
+    response = Mock(ok=True, status_code=200, headers={})
+    response.json.return_value = {"success": True, "post": {"id": post_id, "url": f"/p/{post_id}"}}
+    return response
+
+
+class TestOutbox:
+    """Test Outbox queue states."""
+
+    def test_fifo_order(self, queue):
+        first = queue.enqueue("general", "one", content="1")
+        queue.enqueue("general", "two", content="2")
+
+        assert [i["title"] for i in queue.items()] == ["one", "two"]
+        claimed = queue.claim()
+        assert claimed["id"] == first["id"]
+        assert claimed["attempts"] == 1
+        assert queue.counts() == {"pending": 1, "active": 1, "failed": 0}
+
+    def test_release_keeps_place(self, queue):
+        queue.enqueue("general", "one")
+        queue.enqueue("general", "two")
+
+        queue.release(queue.claim())
+
+        assert [i["title"] for i in queue.items()] == ["one", "two"]
+
+    def test_recover_after_crash(self, tmp_path, queue):
+        from moltcli.utils.outbox import Outbox
+
+        queue.enqueue("general", "one")
+        queue.claim()
+        (queue.path / "tmp" / "partial.json").write_text("{")
+
+        restarted = Outbox(str(tmp_path / "outbox"))
+
+        assert restarted.recover() == 1
+        assert [i["title"] for i in restarted.items()] == ["one"]
+        assert list((restarted.path / "tmp").iterdir()) == []
+
+    def test_lock_is_exclusive(self, queue):
+        from moltcli.utils.outbox import OutboxBusyError, fcntl
+
+        if fcntl is None:
+            pytest.skip("needs fcntl")
+        with queue.lock():
+            with pytest.raises(OutboxBusyError):
+                with queue.lock():
+                    pass
+
+
+@patch("moltcli.utils.api_client.requests.Session.request")
+class TestOutboxCore:
+    """Test draining the outbox."""
+
+    @pytest.fixture
+    def core(self, queue, tmp_path, mock_api_key):
+        from moltcli.core.outbox import OutboxCore
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.memory import MemoryStore
+        from moltcli.utils.retry import RetryPolicy
+
+        client = MoltbookClient(mock_api_key, rate_limit=False, retry=RetryPolicy.disabled())
+        self.sleeps = []
+        return OutboxCore(
+            client, outbox=queue, memory=MemoryStore(str(tmp_path / "memory")), sleep=self.sleeps.append
+        )
+
+    def test_publishes_and_records(self, mock_request, core):
+        core.outbox.enqueue("general", "one", content="1")
+        mock_request.side_effect = [created("p1"), verified("p1")]
+
+        results = list(core.drain())
+
+        assert [r["status"] for r in results] == ["published"]
+        assert results[0]["post_id"] == "p1"
+        assert core.outbox.counts() == {"pending": 0, "active": 0, "failed": 0}
+        (entry,) = core.memory.search("one", category="interactions")
+        assert "success" in entry.tags
+
+    def test_waits_out_rate_limit(self, mock_request, core):
+        core.outbox.enqueue("general", "one", content="1")
+        limited = Mock(ok=False, status_code=429, headers={"Retry-After": "1800"})
+        limited.json.return_value = {"error": "slow down"}
+        mock_request.side_effect = [limited, created("p1"), verified("p1")]
+
+        results = list(core.drain())
+
+        assert self.sleeps == [1800]
+        assert [r["status"] for r in results] == ["published"]
+
+    def test_once_defers_on_rate_limit(self, mock_request, core):
+        core.outbox.enqueue("general", "one", content="1")
+        limited = Mock(ok=False, status_code=429, headers={"Retry-After": "1800"})
+        limited.json.return_value = {}
+        mock_request.return_value = limited
+
+        results = list(core.drain(wait=False))
+
+        assert results[0]["status"] == "deferred"
+        assert self.sleeps == []
+        assert core.outbox.counts()["pending"] == 1
+
+    def test_rejected_post_is_parked(self, mock_request, core):
+        core.outbox.enqueue("missing", "one", content="1")
+        core.outbox.enqueue("general", "two", content="2")
+        not_found = Mock(ok=False, status_code=404, headers={})
+        not_found.json.return_value = {"error": "Submolt not found"}
+        mock_request.side_effect = [not_found, created("p2"), verified("p2")]
+
+        results = list(core.drain())
+
+        assert [r["status"] for r in results] == ["failed", "published"]
+        (failed,) = core.outbox.items("failed")
+        assert failed["title"] == "one"
+        assert failed["error"]["status"] == "error"
+
+    def test_bad_request_is_parked(self, mock_request, core):
+        core.outbox.enqueue("general", "", content="1")
+        core.outbox.enqueue("general", "two", content="2")
+        bad = Mock(ok=False, status_code=400, headers={})
+        bad.json.return_value = {"error": "Title is required"}
+        mock_request.side_effect = [bad, created("p2"), verified("p2")]
+
+        results = list(core.drain())
+
+        assert [r["status"] for r in results] == ["failed", "published"]
+        assert results[0]["message"] == "Title is required"
+        assert core.outbox.counts() == {"pending": 0, "active": 0, "failed": 1}
+
+    def test_possibly_sent_post_is_not_requeued(self, mock_request, core):
+        import requests
+
+        core.outbox.enqueue("general", "one", content="1")
+        core.outbox.enqueue("general", "two", content="2")
+        mock_request.side_effect = [
+            requests.exceptions.ReadTimeout("read timed out"), created("p2"), verified("p2")
+        ]
+
+        results = list(core.drain())
+
+        assert [r["status"] for r in results] == ["unknown", "published"]
+        (parked,) = core.outbox.items("failed")
+        assert parked["title"] == "one"
+        assert mock_request.call_count == 3
+
+    def test_unsent_post_is_requeued(self, mock_request, core):
+        import requests
+
+        core.outbox.enqueue("general", "one", content="1")
+        mock_request.side_effect = [
+            requests.exceptions.ConnectTimeout("connect timed out"), created("p1"), verified("p1")
+        ]
+
+        results = list(core.drain())
+
+        assert [r["status"] for r in results] == ["published"]
+        assert self.sleeps == [30.0]
+
+    def test_unsolved_challenge_is_reported(self, mock_request, core):
+        core.outbox.enqueue("general", "one", content="1")
+        mock_request.return_value = created("p1", challenge="seven eight")
+
+        (result,) = core.drain()
+
+        assert result["status"] == "unverified"
+        assert result["verification"]["verification_code"] == "v-p1"
@@ -0,0 +1,203 @@
+"""Tests for pagination module."""
+import asyncio
+import threading
+
+from unittest.mock import Mock, patch
+
+
+def make_fetch(pages, calls=None):
+    """fetch(offset, limit) serving items from a flat list of ids."""
+    def fetch(offset, limit):
+        if calls is not None:
+            calls.append((offset, limit))
+        return {"posts": [{"id": i} for i in pages[offset:offset + limit]]}
+    return fetch
+
+
+class TestIterPages:
+    """Test iter_pages function."""
+
+    def test_walks_all_pages(self):
+        from moltcli.core.pagination import iter_pages
+
+        calls = []
+        items = list(iter_pages(make_fetch(list(range(7)), calls), "posts", page_size=3))
+
+        assert [i["id"] for i in items] == list(range(7))
+        assert calls == [(0, 3), (3, 3), (6, 3)]
+
+    def test_max_items(self):
+        from moltcli.core.pagination import iter_pages
+
+        calls = []
+        items = list(iter_pages(
+            make_fetch(list(range(100)), calls), "posts", page_size=10, max_items=15
+        ))
+
+        assert len(items) == 15
+        assert len(calls) == 2
+
+    def test_no_prefetch_past_max_items(self):
+        from moltcli.core.pagination import iter_pages
+
+        calls = []
+        items = list(iter_pages(
+            make_fetch(list(range(100)), calls), "posts", page_size=10, max_items=10
+        ))
+
+        assert len(items) == 10
+        assert calls == [(0, 10)]
+
+    def test_dedupes_across_pages(self):
+        from moltcli.core.pagination import iter_pages
+
+        # A new post at the top shifts "2" onto the second page
+        pages = {0: [1, 2], 2: [2, 3], 4: []}
+        fetch = lambda offset, limit: {"posts": [{"id": i} for i in pages[offset]]}
+
+        items = list(iter_pages(fetch, "posts", page_size=2, prefetch=False))
+
+        assert [i["id"] for i in items] == [1, 2, 3]
+
+    def test_stops_on_page_of_repeats(self):
+        from moltcli.core.pagination import iter_pages
+
+        fetch = Mock(return_value={"posts": [{"id": 1}, {"id": 2}]})
+
+        items = list(iter_pages(fetch, "posts", page_size=2, prefetch=False))
+
+        assert len(items) == 2
+        assert fetch.call_count == 2
+
+    def test_respects_has_more(self):
+        from moltcli.core.pagination import iter_pages
+
+        fetch = Mock(return_value={"posts": [{"id": 1}, {"id": 2}], "has_more": False})
+
+        assert len(list(iter_pages(fetch, "posts", page_size=2))) == 2
+        assert fetch.call_count == 1
+
+    def test_prefetches_next_page(self):
+        from moltcli.core.pagination import iter_pages
+
+        second_requested = threading.Event()
+
+        def fetch(offset, limit):
+            if offset:
+                second_requested.set()
+                return {"posts": []}
+            return {"posts": [{"id": 1}, {"id": 2}]}
+
+        pages = iter_pages(fetch, "posts", page_size=2)
+        next(pages)
+
+        # The second page is requested before the first is fully consumed
+        assert second_requested.wait(1)
+        assert [i["id"] for i in pages] == [2]
+
+
+class TestAiterPages:
+    """Test aiter_pages function."""
+
+    def test_walks_all_pages(self):
+        from moltcli.core.pagination import aiter_pages
+
+        sync_fetch = make_fetch(list(range(5)))
+
+        async def fetch(offset, limit):
+            return sync_fetch(offset, limit)
+
+        async def collect():
+            return [i["id"] async for i in aiter_pages(fetch, "posts", page_size=2)]
+
+        assert asyncio.run(collect()) == list(range(5))
+
+
+class TestFetchPages:
+    """Test fetch_pages function."""
+
+    def test_uses_total_to_fetch_the_rest_at_once(self):
+        from moltcli.core.pagination import fetch_pages
+
+        calls = []
+        fetch = make_fetch(list(range(7)), calls)
+
+        def with_total(offset, limit):
+            return {**fetch(offset, limit), "total": 7}
+
+        items = fetch_pages(with_total, "posts", page_size=2, workers=4)
+
+        assert [i["id"] for i in items] == list(range(7))
+        assert sorted(calls) == [(0, 2), (2, 2), (4, 2), (6, 2)]
+
+    def test_without_total_fetches_in_batches(self):
+        from moltcli.core.pagination import fetch_pages
+
+        calls = []
+        items = fetch_pages(make_fetch(list(range(7)), calls), "posts", page_size=2, workers=2)
+
+        assert [i["id"] for i in items] == list(range(7))
+        # Offset 8 was requested alongside 6, before its page came back short
+        assert sorted(calls) == [(0, 2), (2, 2), (4, 2), (6, 2), (8, 2)]
+
+    def test_pages_run_concurrently(self):
+        from moltcli.core.pagination import fetch_pages
+
+        both_started = threading.Barrier(2, timeout=1)
+        fetch = make_fetch(list(range(6)))
+
+        def slow(offset, limit):
+            if offset:
+                both_started.wait()  # Deadlocks unless pages 2 and 3 overlap
+            return {**fetch(offset, limit), "total": 6}
+
+        items = fetch_pages(slow, "posts", page_size=2, workers=2)
+
+        assert len(items) == 6
+
+    def test_async(self):
+        from moltcli.core.pagination import afetch_pages
+
+        sync_fetch = make_fetch(list(range(5)))
+
+        async def fetch(offset, limit):
+            return sync_fetch(offset, limit)
+
+        items = asyncio.run(afetch_pages(fetch, "posts", page_size=2, workers=3))
+
+        assert [i["id"] for i in items] == list(range(5))
+
+
+@patch("moltcli.utils.api_client.requests.Session.request")
+class TestCoreIterators:
+    """Test iter_* methods on Core classes."""
+
+    def test_feed_iter_posts_sends_offset(self, mock_request, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.core.feed import FeedCore
+
+        first = Mock(ok=True, status_code=200, headers={})
+        first.json.return_value = {"posts": [{"id": "a"}, {"id": "b"}]}
+        last = Mock(ok=True, status_code=200, headers={})
+        last.json.return_value = {"posts": [{"id": "c"}]}
+        mock_request.side_effect = [first, last]
+
+        core = FeedCore(MoltbookClient(mock_api_key))
+        items = list(core.iter_posts(sort="new", page_size=2))
+
+        assert [i["id"] for i in items] == ["a", "b", "c"]
+        params = [c.kwargs["params"] for c in mock_request.call_args_list]
+        assert params[0] == {"sort": "new", "limit": 2}
+        assert params[1] == {"sort": "new", "limit": 2, "offset": 2}
+
+    def test_search_iter_uses_results_key(self, mock_request, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.core.search import SearchCore
+
+        response = Mock(ok=True, status_code=200, headers={})
+        response.json.return_value = {"results": [{"id": "r1"}]}
+        mock_request.return_value = response
+
+        core = SearchCore(MoltbookClient(mock_api_key))
+
+        assert list(core.iter_search("molt", page_size=5)) == [{"id": "r1"}]
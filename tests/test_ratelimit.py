@@ -0,0 +1,274 @@
+"""Tests for rate-limit governor module."""
+import pytest
+from unittest.mock import Mock, patch
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestClassifyEndpoint:
+    """Test classify_endpoint function."""
+
+    def test_classes(self):
+        from moltcli.utils.ratelimit import classify_endpoint
+
+        assert classify_endpoint("POST", "/posts") == "post"
+        assert classify_endpoint("POST", "/posts/abc/upvote") == "vote"
+        assert classify_endpoint("POST", "/comments/abc/downvote") == "vote"
+        assert classify_endpoint("POST", "/posts/abc/comments") == "comment"
+        assert classify_endpoint("GET", "/posts") == "general"
+        assert classify_endpoint("GET", "/posts/abc/comments") == "general"
+        assert classify_endpoint("POST", "/submolts/ai/subscribe?action=subscribe") == "general"
+
+
+class TestRateLimitGovernor:
+    """Test RateLimitGovernor class."""
+
+    def test_paces_after_bucket_is_empty(self):
+        from moltcli.utils.ratelimit import RateLimitGovernor
+
+        clock = FakeClock()
+        governor = RateLimitGovernor({"general": (2, 10)}, clock=clock)
+
+        assert governor.reserve("general") == 0
+        assert governor.reserve("general") == 0
+        assert governor.reserve("general") == pytest.approx(5)
+
+    def test_refills_over_time(self):
+        from moltcli.utils.ratelimit import RateLimitGovernor
+
+        clock = FakeClock()
+        governor = RateLimitGovernor({"general": (1, 10)}, clock=clock)
+        governor.reserve("general")
+
+        clock.now += 10
+        assert governor.reserve("general") == 0
+
+    def test_buckets_are_separate(self):
+        from moltcli.utils.ratelimit import RateLimitGovernor
+
+        clock = FakeClock()
+        governor = RateLimitGovernor(clock=clock)
+        governor.reserve("post")
+
+        assert governor.reserve("general") == 0
+        assert governor.reserve("vote") == 0
+
+    def test_raises_instead_of_long_wait(self):
+        from moltcli.utils.ratelimit import RateLimitGovernor
+        from moltcli.utils.errors import RateLimitError
+
+        clock = FakeClock()
+        governor = RateLimitGovernor(clock=clock, max_wait=60)
+        governor.reserve("post")
+
+        with pytest.raises(RateLimitError) as exc_info:
+            governor.reserve("post")
+
+        assert exc_info.value.retry_after == 1800
+        assert exc_info.value.endpoint_type == "post"
+
+    def test_update_from_headers(self):
+        from moltcli.utils.ratelimit import RateLimitGovernor
+
+        clock = FakeClock()
+        governor = RateLimitGovernor(clock=clock)
+        governor.update("general", {"X-RateLimit-Limit": "50", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"})
+
+        state = governor.snapshot()["general"]
+        assert state["limit"] == 50
+        assert state["available"] == 0
+        assert state["wait"] == pytest.approx(30)
+
+    def test_update_ignores_missing_headers(self):
+        from moltcli.utils.ratelimit import RateLimitGovernor
+
+        governor = RateLimitGovernor(clock=FakeClock())
+        governor.update("general", {})
+        governor.update("general", Mock())
+
+        assert governor.snapshot()["general"]["available"] == 100
+
+    def test_penalize_blocks_class(self):
+        from moltcli.utils.ratelimit import RateLimitGovernor
+
+        clock = FakeClock()
+        governor = RateLimitGovernor(clock=clock)
+        governor.penalize("vote", 7)
+
+        assert governor.reserve("vote") == pytest.approx(7)
+        assert governor.reserve("general") == 0
+
+
+class TestSharedRateLimitGovernor:
+    """Test SharedRateLimitGovernor across governors sharing a file."""
+
+    def make(self, tmp_path, clock, **kwargs):
+        from moltcli.utils.ratelimit import SharedRateLimitGovernor
+
+        return SharedRateLimitGovernor(str(tmp_path / "limits.json"), clock=clock, **kwargs)
+
+    def test_budget_is_shared(self, tmp_path):
+        clock = FakeClock()
+        first = self.make(tmp_path, clock, limits={"general": (2, 10)})
+        second = self.make(tmp_path, clock, limits={"general": (2, 10)})
+
+        assert first.reserve("general") == 0
+        assert second.reserve("general") == 0
+        assert first.reserve("general") == pytest.approx(5)
+
+    def test_concurrent_reserves(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        clock = FakeClock()
+        governors = [self.make(tmp_path, clock, limits={"general": (10, 10)}) for _ in range(4)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            waits = list(pool.map(lambda i: governors[i % 4].reserve("general"), range(20)))
+
+        assert waits.count(0) == 10
+        assert sorted(waits)[-1] == pytest.approx(10)
+
+    def test_penalty_and_retry_after_are_shared(self, tmp_path):
+        clock = FakeClock()
+        self.make(tmp_path, clock).penalize("vote", 7)
+
+        other = self.make(tmp_path, clock)
+        state = other.snapshot()["vote"]
+
+        assert other.reserve("vote") == pytest.approx(7)
+        assert state["last_retry_after"] == 7
+        assert state["blocked_until"] is not None
+
+    def test_headers_are_shared(self, tmp_path):
+        clock = FakeClock()
+        self.make(tmp_path, clock).update(
+            "general", {"X-RateLimit-Limit": "50", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}
+        )
+
+        state = self.make(tmp_path, clock).snapshot()["general"]
+        assert state["limit"] == 50
+        assert state["wait"] == pytest.approx(30)
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        (tmp_path / "limits.json").write_text('{"buckets": {"gen')
+
+        assert self.make(tmp_path, FakeClock()).reserve("general") == 0
+
+    def test_reset(self, tmp_path):
+        clock = FakeClock()
+        governor = self.make(tmp_path, clock)
+        governor.penalize("general", 30)
+
+        governor.reset()
+
+        assert not governor.path.exists()
+        assert self.make(tmp_path, clock).reserve("general") == 0
+
+    def test_state_path_is_per_key(self, tmp_path):
+        from moltcli.utils.ratelimit import state_path
+
+        assert state_path("a", str(tmp_path)) != state_path("b", str(tmp_path))
+        assert state_path("a", str(tmp_path)).parent == tmp_path
+
+    def test_limits_command(self, tmp_path, monkeypatch):
+        import json
+        from click.testing import CliRunner
+        from moltcli.cli import cli
+        from moltcli.utils import config
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        credentials = tmp_path / "credentials.json"
+        credentials.write_text('{"api_key": "test_api_key_12345"}')
+        monkeypatch.setattr(config, "_config", config.Config(str(credentials)))
+
+        result = CliRunner().invoke(cli, ["--json", "limits"], obj={})
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["limits"]["post"]["limit"] == 1
+        assert data["path"].startswith(str(tmp_path))
+
+
+class TestClientIntegration:
+    """Test MoltbookClient consults the governor."""
+
+    @patch("moltcli.utils.api_client.time.sleep")
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_client_sleeps_when_paced(self, mock_request, mock_sleep, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.ratelimit import RateLimitGovernor
+
+        mock_response = Mock(ok=True, headers={"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "0"})
+        mock_response.json.return_value = {}
+        mock_request.return_value = mock_response
+
+        clock = FakeClock()
+        client = MoltbookClient(mock_api_key, governor=RateLimitGovernor(clock=clock))
+        client.get("/feed")
+        client.get("/feed")
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(0.6)
+
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_rate_limit_error_carries_endpoint_type(self, mock_request, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.errors import RateLimitError
+        from moltcli.utils.retry import RetryPolicy
+
+        mock_response = Mock(ok=False, status_code=429, headers={"Retry-After": "5"})
+        mock_response.json.return_value = {}
+        mock_request.return_value = mock_response
+
+        client = MoltbookClient(mock_api_key, retry=RetryPolicy.disabled())
+        with pytest.raises(RateLimitError) as exc_info:
+            client.post("/posts/abc/upvote")
+
+        assert exc_info.value.endpoint_type == "vote"
+        assert client.governor.snapshot()["vote"]["wait"] == pytest.approx(5, abs=0.1)
+
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_rejected_post_keeps_its_slot(self, mock_request, mock_api_key, tmp_path):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.errors import NotFoundError
+        from moltcli.utils.ratelimit import SharedRateLimitGovernor
+        from moltcli.utils.retry import RetryPolicy
+
+        def client():
+            # A fresh governor per call, like a new moltcli process
+            governor = SharedRateLimitGovernor(str(tmp_path / "limits.json"))
+            return MoltbookClient(mock_api_key, governor=governor, retry=RetryPolicy.disabled())
+
+        missing = Mock(ok=False, status_code=404, headers={})
+        missing.json.return_value = {"error": "Submolt not found"}
+        created = Mock(ok=True, status_code=200, headers={})
+        created.json.return_value = {"success": True}
+        mock_request.side_effect = [missing, created]
+
+        with pytest.raises(NotFoundError):
+            client().post("/posts", json_data={"submolt": "nosuch"})
+        assert client().post("/posts", json_data={"submolt": "general"}) == {"success": True}
+        assert mock_request.call_count == 2
+
+    @patch("moltcli.utils.api_client.time.sleep")
+    @patch("moltcli.utils.api_client.requests.Session.request")
+    def test_rate_limit_disabled(self, mock_request, mock_sleep, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+
+        mock_response = Mock(ok=True)
+        mock_response.json.return_value = {}
+        mock_request.return_value = mock_response
+
+        client = MoltbookClient(mock_api_key, rate_limit=False)
+        for _ in range(3):
+            client.post("/posts", json_data={"title": "t"})
+
+        assert client.governor is None
+        mock_sleep.assert_not_called()
@@ -0,0 +1,150 @@
+"""Tests for retry policy module."""
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+
+def ok_response(body=None):
+    response = Mock(ok=True, status_code=200, headers={})
+    response.json.return_value = body or {}
+    return response
+
+
+def error_response(status, headers=None):
+    response = Mock(ok=False, status_code=status, headers=headers or {}, text="error")
+    response.json.return_value = {"error": f"HTTP {status}"}
+    return response
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy class."""
+
+    def test_backoff_is_capped_exponential(self):
+        from moltcli.utils.retry import RetryPolicy
+
+        policy = RetryPolicy(backoff_base=1, backoff_cap=5, jitter=False)
+
+        assert [policy.backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+
+    def test_jitter_stays_within_backoff(self):
+        from moltcli.utils.retry import RetryPolicy
+
+        policy = RetryPolicy(backoff_base=1, backoff_cap=5)
+
+        assert all(0 <= policy.backoff(3) <= 4 for _ in range(50))
+
+    def test_gives_up_after_max_attempts(self):
+        from moltcli.utils.retry import RetryPolicy
+
+        policy = RetryPolicy(max_attempts=3)
+
+        assert policy.delay_for("GET", 2, status=503) is not None
+        assert policy.delay_for("GET", 3, status=503) is None
+
+    def test_5xx_not_retried_for_post(self):
+        from moltcli.utils.retry import RetryPolicy
+
+        policy = RetryPolicy()
+
+        assert policy.delay_for("POST", 1, status=502) is None
+        assert policy.delay_for("DELETE", 1, status=502) is not None
+
+    def test_client_errors_not_retried(self):
+        from moltcli.utils.retry import RetryPolicy
+
+        assert RetryPolicy().delay_for("GET", 1, status=404) is None
+
+    def test_rate_limit_honours_retry_after(self):
+        from moltcli.utils.retry import RetryPolicy
+
+        policy = RetryPolicy(max_retry_after=30)
+
+        assert policy.delay_for("POST", 1, status=429, retry_after=12) == 12
+        assert policy.delay_for("POST", 1, status=429, retry_after=1800) is None
+
+    def test_unsent_post_is_retried(self):
+        from moltcli.utils.retry import RetryPolicy
+
+        policy = RetryPolicy()
+
+        assert policy.delay_for("POST", 1, sent=False) is not None
+        assert policy.delay_for("POST", 1, sent=True) is None
+
+
+@patch("moltcli.utils.api_client.time.sleep")
+@patch("moltcli.utils.api_client.requests.Session.request")
+class TestClientRetries:
+    """Test MoltbookClient retry loop."""
+
+    def test_retries_5xx_get(self, mock_request, mock_sleep, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+
+        mock_request.side_effect = [error_response(503), ok_response({"posts": []})]
+
+        client = MoltbookClient(mock_api_key)
+        result = client.get("/feed")
+
+        assert result == {"posts": []}
+        assert mock_request.call_count == 2
+        attempts = client.last_attempts
+        assert [a.status for a in attempts] == [503, 200]
+        assert attempts[0].retry_delay is not None
+        assert client.retry_stats["retries"] == 1
+
+    def test_post_create_not_duplicated_on_5xx(self, mock_request, mock_sleep, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+
+        mock_request.return_value = error_response(500)
+
+        client = MoltbookClient(mock_api_key)
+        with pytest.raises(Exception, match="HTTP 500"):
+            client.post("/posts", json_data={"title": "t"})
+
+        assert mock_request.call_count == 1
+
+    def test_connection_error_becomes_network_error(self, mock_request, mock_sleep, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.errors import NetworkError
+
+        mock_request.side_effect = requests.exceptions.ReadTimeout("read timed out")
+
+        client = MoltbookClient(mock_api_key)
+        with pytest.raises(NetworkError):
+            client.get("/feed")
+
+        assert mock_request.call_count == 3
+        assert client.last_attempts[-1].error == "ReadTimeout"
+
+    def test_connect_timeout_retried_for_post(self, mock_request, mock_sleep, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+
+        mock_request.side_effect = [requests.exceptions.ConnectTimeout("connect"), ok_response()]
+
+        client = MoltbookClient(mock_api_key)
+        client.post("/posts", json_data={"title": "t"})
+
+        assert mock_request.call_count == 2
+
+    def test_rate_limit_retried_through_governor(self, mock_request, mock_sleep, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+
+        mock_request.side_effect = [error_response(429, {"Retry-After": "3"}), ok_response()]
+
+        client = MoltbookClient(mock_api_key)
+        client.post("/posts/abc/upvote")
+
+        assert mock_request.call_count == 2
+        waits = [c.args[0] for c in mock_sleep.call_args_list if c.args[0]]
+        assert waits == [pytest.approx(3, abs=0.1)]
+
+    def test_disabled_policy(self, mock_request, mock_sleep, mock_api_key):
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.retry import RetryPolicy
+
+        mock_request.return_value = error_response(503)
+
+        client = MoltbookClient(mock_api_key, retry=RetryPolicy.disabled())
+        with pytest.raises(Exception):
+            client.get("/feed")
+
+        assert mock_request.call_count == 1
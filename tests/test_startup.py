@@ -0,0 +1,52 @@
+"""Tests for lazy command loading."""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+
+def loaded_modules(args, tmp_path):
+    """Run moltcli in a fresh interpreter; return the modules it imported."""
+    code = (
+        "import json, sys\n"
+        "from moltcli.cli import cli\n"
+        f"cli.main({args!r}, prog_name='moltcli', standalone_mode=False)\n"
+        "sys.stderr.write(json.dumps(sorted(sys.modules)))\n"
+    )
+    env = {**os.environ, "HOME": str(tmp_path), "PYTHONPATH": str(ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    return set(json.loads(result.stderr.splitlines()[-1]))
+
+
+class TestLazyLoading:
+    """Test that commands import only what they use."""
+
+    def test_help_skips_http_stack(self, tmp_path):
+        modules = loaded_modules(["--help"], tmp_path)
+
+        assert "requests" not in modules
+        assert "moltcli.commands.feed" not in modules
+
+    def test_memory_add_skips_http_stack(self, tmp_path):
+        modules = loaded_modules(["memory", "add", "note"], tmp_path)
+
+        assert "moltcli.commands.memory" in modules
+        assert "requests" not in modules
+        assert "moltcli.core.feed" not in modules
+
+    def test_lazy_commands_resolve(self):
+        import click
+        from moltcli.cli import cli, COMMANDS
+
+        ctx = click.Context(cli)
+        for name, (_, short_help) in COMMANDS.items():
+            command = cli.get_command(ctx, name)
+            assert command is not None, name
+            # The stored help must not drift from the command's docstring
+            assert command.get_short_help_str(200) == short_help, name
@@ -0,0 +1,170 @@
+"""Tests for stats module."""
+import json
+import time
+
+import pytest
+
+
+@pytest.fixture
+def store(tmp_path):
+    from moltcli.utils.stats import LatencyStats
+
+    return LatencyStats(str(tmp_path / "stats.ndjson"))
+
+
+class TestRouteStats:
+    """Test the fixed-size histogram."""
+
+    def test_percentiles_within_bucket_error(self):
+        from moltcli.utils.stats import RouteStats
+
+        stats = RouteStats()
+        for ms in range(1, 101):
+            stats.record(float(ms))
+
+        assert stats.count == 100
+        assert 50 <= stats.percentile(0.5) <= 50 * 1.1
+        assert 99 <= stats.percentile(0.99) <= 99 * 1.1
+
+    def test_round_trip_is_sparse(self):
+        from moltcli.utils.stats import RouteStats
+
+        stats = RouteStats()
+        stats.record(12.0, error=True)
+        stats.record(0.01, rate_limited=True, retries=2)
+
+        data = stats.to_dict()
+        restored = RouteStats.from_dict(json.loads(json.dumps(data)))
+
+        assert len(data["h"]) == 2
+        assert restored.summary() == stats.summary()
+
+
+class TestLatencyStats:
+    """Test the stats file."""
+
+    def test_flush_appends_one_line(self, store):
+        for _ in range(50):
+            store.record("GET /feed", 20.0)
+        store.record("GET /posts/{id}", 5.0, error=True)
+
+        store.flush()
+        store.flush()
+
+        assert len(store.path.read_text().splitlines()) == 1
+        summary = store.summary()
+        assert summary["GET /feed"]["count"] == 50
+        assert summary["GET /posts/{id}"]["errors"] == 1
+
+    def test_window(self, store):
+        store.record("GET /feed", 20.0)
+        store.flush()
+        old = {
+            "start": time.time() - 7200,
+            "end": time.time() - 7100,
+            "routes": {"GET /feed": {"n": 3, "h": {"40": 3}}},
+        }
+        with open(store.path, "a") as f:
+            f.write(json.dumps(old) + "\n")
+
+        assert store.summary(3600)["GET /feed"]["count"] == 1
+        assert store.summary()["GET /feed"]["count"] == 4
+
+    def test_compaction_merges_hourly(self, tmp_path):
+        from moltcli.utils.stats import LatencyStats
+
+        store = LatencyStats(str(tmp_path / "stats.ndjson"), max_bytes=200)
+        for _ in range(5):
+            store.record("GET /feed", 20.0)
+            store.flush()
+
+        assert len(store.path.read_text().splitlines()) == 1
+        assert store.summary()["GET /feed"]["count"] == 5
+
+    def test_compaction_keeps_concurrent_appends(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+        from moltcli.utils.stats import LatencyStats
+
+        path = str(tmp_path / "stats.ndjson")
+
+        def writer(_):
+            # One store per worker: separate descriptors, like separate processes
+            store = LatencyStats(path, max_bytes=300)
+            for _ in range(50):
+                store.record("GET /feed", 20.0)
+                store.flush()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(writer, range(4)))
+
+        assert LatencyStats(path).summary()["GET /feed"]["count"] == 200
+
+    def test_prometheus(self, store):
+        store.record("GET /feed", 20.0)
+        store.record("GET /feed", 2000.0, rate_limited=True)
+        store.flush()
+
+        text = store.prometheus()
+
+        assert 'moltcli_request_duration_seconds_bucket{route="GET /feed",le="0.025"} 1' in text
+        assert 'moltcli_request_duration_seconds_bucket{route="GET /feed",le="+Inf"} 2' in text
+        assert 'moltcli_request_duration_seconds_count{route="GET /feed"} 2' in text
+        assert 'moltcli_rate_limited_total{route="GET /feed"} 1' in text
+
+    def test_client_records_requests(self, store):
+        from moltcli.testing import StubServer
+        from moltcli.utils.api_client import MoltbookClient
+        from moltcli.utils.errors import NotFoundError
+
+        with StubServer() as server:
+            client = MoltbookClient(
+                "test_api_key_12345", base_url=server.base_url, rate_limit=False, stats=store
+            )
+            client.get("/feed")
+            client.get("/posts/post-1")
+            with pytest.raises(NotFoundError):
+                client.get("/posts/nope")
+        store.flush()
+
+        summary = store.summary()
+        assert summary["GET /feed"]["count"] == 1
+        assert summary["GET /posts/{id}"]["count"] == 2
+        assert summary["GET /posts/{id}"]["errors"] == 1
+
+
+class TestStatsCommand:
+    """Test moltcli stats."""
+
+    def run(self, args):
+        from click.testing import CliRunner
+        from moltcli.cli import cli
+
+        return CliRunner().invoke(cli, args, obj={})
+
+    def test_json_windows(self, store):
+        store.record("GET /feed", 20.0)
+        store.flush()
+
+        result = self.run(["--json", "stats", "--path", str(store.path), "-w", "15m", "-w", "all"])
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert set(data["windows"]) == {"15m", "all"}
+        assert data["windows"]["15m"]["GET /feed"]["count"] == 1
+
+    def test_prometheus_file(self, store, tmp_path):
+        store.record("GET /feed", 20.0)
+        store.flush()
+        target = tmp_path / "moltcli.prom"
+
+        result = self.run(
+            ["stats", "--path", str(store.path), "--prometheus", "-o", str(target)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "moltcli_request_duration_seconds_count" in target.read_text()
+
+    def test_bad_window(self, store):
+        result = self.run(["stats", "--path", str(store.path), "-w", "soon"])
+
+        assert result.exit_code != 0
@@ -0,0 +1,106 @@
+"""Tests for the moltcli.testing stub server."""
+import time
+
+import pytest
+
+
+@pytest.fixture
+def server():
+    from moltcli.testing import StubServer, StubState
+
+    with StubServer(StubState(posts=30, comments_per_post=5)) as server:
+        yield server
+
+
+def make_client(server, **kwargs):
+    from moltcli.utils.api_client import MoltbookClient
+    from moltcli.utils.retry import RetryPolicy
+
+    kwargs.setdefault("retry", RetryPolicy.disabled())
+    return MoltbookClient(
+        "test_api_key_12345", base_url=server.base_url, rate_limit=False, **kwargs
+    )
+
+
+class TestStubServer:
+    """Test the stub through the real HTTP client."""
+
+    def test_feed_pages(self, server):
+        from moltcli.core.feed import FeedCore
+
+        posts = list(FeedCore(make_client(server)).iter_posts(sort="new", page_size=7))
+
+        assert len(posts) == 30
+        assert posts[0]["created_at"] > posts[-1]["created_at"]
+        assert server.stats() == {"requests": 5, "200": 5}
+
+    def test_create_and_verify(self, server):
+        from moltcli.core.post import PostCore
+
+        core = PostCore(make_client(server))
+        result = core.create_and_verify("general", "Hello", content="World")
+
+        assert result["verified"] is True
+        assert core.get(result["post_id"])["post"]["title"] == "Hello"
+
+    def test_comment_tree(self, server):
+        from moltcli.core.comment import CommentCore
+
+        tree = list(CommentCore(make_client(server)).iter_tree("post-3", page_size=2))
+
+        assert len(tree) == 5
+        assert tree[0][0] == 0
+
+    def test_not_found(self, server):
+        from moltcli.core.post import PostCore
+        from moltcli.utils.errors import NotFoundError
+
+        with pytest.raises(NotFoundError):
+            PostCore(make_client(server)).get("nope")
+
+    def test_injected_errors_are_retried(self):
+        from moltcli.core.feed import FeedCore
+        from moltcli.testing import StubServer
+        from moltcli.utils.retry import RetryPolicy
+
+        with StubServer(error_rate=0.5, seed=1) as server:
+            client = make_client(server, retry=RetryPolicy(max_attempts=10, backoff_base=0))
+            for _ in range(5):
+                FeedCore(client).get_hot()
+            stats = server.stats()
+
+        assert stats["200"] == 5
+        assert stats["500"] > 0
+
+    def test_quota_sends_rate_limit_headers(self):
+        from moltcli.core.feed import FeedCore
+        from moltcli.testing import StubServer
+        from moltcli.utils.errors import RateLimitError
+
+        with StubServer(rate_limit=2, rate_window=60) as server:
+            core = FeedCore(make_client(server))
+            core.get_hot()
+            core.get_hot()
+            with pytest.raises(RateLimitError) as exc_info:
+                core.get_hot()
+
+        assert 0 < exc_info.value.retry_after <= 60
+
+    def test_latency(self):
+        from moltcli.core.feed import FeedCore
+        from moltcli.testing import StubServer
+
+        with StubServer(latency=0.05) as server:
+            start = time.perf_counter()
+            FeedCore(make_client(server)).get_hot()
+
+        assert time.perf_counter() - start >= 0.05
+
+    def test_requires_api_key(self):
+        from moltcli.core.auth import AuthCore
+        from moltcli.testing import StubServer
+        from moltcli.utils.errors import AuthError
+
+        with StubServer(api_key="other") as server:
+            with pytest.raises(AuthError):
+                AuthCore(make_client(server)).whoami()
@@ -0,0 +1,143 @@
+"""Tests for trace module."""
+import asyncio
+import io
+import json
+
+import pytest
+
+
+def make_client(server, spans, **kwargs):
+    from moltcli.utils.api_client import MoltbookClient
+    from moltcli.utils.retry import RetryPolicy
+
+    kwargs.setdefault("retry", RetryPolicy.disabled())
+    return MoltbookClient(
+        "test_api_key_12345",
+        base_url=server.base_url,
+        rate_limit=False,
+        trace=spans.append,
+        **kwargs,
+    )
+
+
+class TestClientTrace:
+    """Test spans emitted by the HTTP clients."""
+
+    def test_span_fields(self):
+        from moltcli.testing import StubServer
+        from moltcli.utils.trace import PHASES
+
+        spans = []
+        with StubServer(rate_limit=100) as server:
+            client = make_client(server, spans)
+            client.get("/feed", params={"limit": 5})
+            client.get("/feed", params={"limit": 5})
+
+        first, second = spans
+        assert first["method"] == "GET" and first["endpoint"] == "/feed"
+        assert first["status"] == 200 and first["attempts"] == 1
+        assert set(first["phases_ms"]) == set(PHASES)
+        assert first["phases_ms"]["connect"] > 0
+        # The second request reuses the keep-alive connection
+        assert second["phases_ms"]["connect"] == 0
+        assert first["bytes_in"] > 0
+        assert first["rate_limit"]["X-RateLimit-Remaining"] == "99"
+
+    def test_retries_and_errors(self):
+        from moltcli.testing import StubServer
+        from moltcli.utils.errors import NotFoundError
+        from moltcli.utils.retry import RetryPolicy
+
+        spans = []
+        with StubServer(error_rate=0.5, seed=1) as server:
+            client = make_client(
+                server, spans, retry=RetryPolicy(max_attempts=10, backoff_base=0)
+            )
+            for _ in range(5):
+                client.get("/feed")
+        with StubServer() as server:
+            with pytest.raises(NotFoundError):
+                make_client(server, spans).get("/posts/nope")
+
+        assert sum(span["retries"] for span in spans) > 0
+        assert all(span["attempts"] == span["retries"] + 1 for span in spans)
+        assert spans[-1]["status"] == 404
+        assert spans[-1]["error"] == "NotFoundError"
+
+    def test_post_counts_bytes_out(self):
+        from moltcli.testing import StubServer
+
+        spans = []
+        with StubServer() as server:
+            make_client(server, spans).post("/posts/post-1/comments", {"content": "hi"})
+
+        assert spans[0]["bytes_out"] == len(b'{"content": "hi"}')
+
+    def test_async_client(self):
+        pytest.importorskip("httpx")
+        from moltcli.testing import StubServer
+        from moltcli.utils.async_client import AsyncMoltbookClient
+
+        spans = []
+
+        async def fetch(url):
+            async with AsyncMoltbookClient(
+                "test_api_key_12345", base_url=url, rate_limit=False, trace=spans.append
+            ) as client:
+                await client.get("/feed")
+
+        with StubServer() as server:
+            asyncio.run(fetch(server.base_url))
+
+        assert spans[0]["status"] == 200
+        assert spans[0]["phases_ms"]["connect"] > 0
+        assert spans[0]["bytes_in"] > 0
+
+
+class TestTracer:
+    """Test the NDJSON sink and its summary."""
+
+    def test_route_folds_ids(self):
+        from moltcli.utils.trace import route
+
+        assert route("GET", "/posts/abc/comments") == "GET /posts/{id}/comments"
+        assert route("GET", "/submolts/general/feed") == "GET /submolts/{id}/feed"
+        assert route("GET", "/agents/me") == "GET /agents/me"
+
+    def test_summary(self):
+        from moltcli.utils.trace import RequestTrace, Tracer
+
+        out, table = io.StringIO(), io.StringIO()
+        tracer = Tracer(out)
+        for post_id in ("a", "b"):
+            tracer(RequestTrace("GET", f"/posts/{post_id}").span())
+
+        tracer.close(table)
+
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [line["type"] for line in lines] == ["request", "request", "summary"]
+        assert lines[-1]["routes"]["GET /posts/{id}"]["count"] == 2
+        assert "GET /posts/{id}" in table.getvalue()
+
+    def test_cli_trace_file(self, tmp_path, monkeypatch):
+        from click.testing import CliRunner
+        from moltcli.cli import cli
+        from moltcli.testing import StubServer
+        from moltcli.utils import config
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        credentials = tmp_path / "credentials.json"
+        credentials.write_text('{"api_key": "test_api_key_12345"}')
+        monkeypatch.setattr(config, "_config", config.Config(str(credentials)))
+        path = tmp_path / "trace.ndjson"
+        with StubServer() as server:
+            monkeypatch.setenv("MOLTCLI_BASE_URL", server.base_url)
+            result = CliRunner().invoke(
+                cli, ["--json", "--trace-file", str(path), "feed", "hot", "--limit", "3"]
+            )
+
+        assert result.exit_code == 0, result.output
+        spans = [json.loads(line) for line in path.read_text().splitlines()]
+        assert spans[0]["endpoint"] == "/feed"
+        assert spans[-1]["type"] == "summary"
+        assert "GET /feed" in result.stderr